@@ -1,6 +1,33 @@
-import darwin.dataset  # noqa
-import darwin.exceptions  # noqa
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-from .client import Client  # noqa
-from .datatypes import Team  # noqa
 from .version import __version__
+
+if TYPE_CHECKING:
+    import darwin.dataset  # noqa
+    import darwin.exceptions  # noqa
+
+    from .client import Client  # noqa
+    from .datatypes import Team  # noqa
+
+# Imported on first access (PEP 562), so that importing a submodule, e.g. for the CLI, doesn't
+# load the whole SDK
+_LAZY_ATTRIBUTES = {
+    "Client": "darwin.client",
+    "Team": "darwin.datatypes",
+}
+_LAZY_SUBMODULES = {"dataset", "exceptions"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES])
@@ -220,7 +220,10 @@ class BackendV2:
 
     @inject_default_team_slug
     def import_annotation(
-        self, item_id: ItemId, payload: Dict[str, Any], team_slug: Optional[str] = None
+        self,
+        item_id: ItemId,
+        payload: Union[Dict[str, Any], bytes],
+        team_slug: Optional[str] = None,
     ) -> None:
         """
         Imports the annotation for the item with the given id.
@@ -229,9 +232,9 @@ class BackendV2:
         ----------
         item_id: ItemId
             Identifier of the Item that we are import the annotation to.
-        payload: Dict[str, Any]
-            A dictionary with the annotation to import. The default format is:
-            `{"annotations": serialized_annotations, "overwrite": "false"}`
+        payload: Union[Dict[str, Any], bytes]
+            A dictionary with the annotation to import, or its JSON serialization. The default
+            format is: `{"annotations": serialized_annotations, "overwrite": "false"}`
         """
 
         return self._client._post_raw(
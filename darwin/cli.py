@@ -9,7 +9,7 @@ import requests.exceptions
 from rich.console import Console
 
 import darwin.cli_functions as f
-from darwin import __version__
+from darwin import __version__, instrumentation
 from darwin.datatypes import AnnotatorReportGrouping
 from darwin.exceptions import GracefulExit, InvalidTeam, Unauthenticated, Unauthorized
 from darwin.options import Options
@@ -33,6 +33,8 @@ def main() -> None:
         If there is a connection issue.
     """
     args, parser = Options().parse_args()
+    if args.metrics:
+        instrumentation.enable(args.metrics)
     try:
         _run(args, parser)
     except Unauthorized:
@@ -101,7 +103,13 @@ def _run(args: Namespace, parser: ArgumentParser) -> None:
         print(__version__)
 
     elif args.command == "convert":
-        f.convert(args.format, args.files, args.output_dir)
+        f.convert(
+            args.format,
+            args.files,
+            args.output_dir,
+            interpolate=args.interpolate,
+            cpu_limit=args.cpu_limit,
+        )
     elif args.command == "extract":
         if args.extract_type == "video-artifacts":
             f.extract_video_artifacts(
@@ -195,6 +203,8 @@ def _run(args: Namespace, parser: ArgumentParser) -> None:
                 args.dataset,
                 args.format,
                 args.output_dir,
+                interpolate=args.interpolate,
+                cpu_limit=args.cpu_limit,
             )
         elif args.action == "set-file-status":
             f.set_file_status(args.dataset, args.status, args.files)
@@ -221,6 +231,7 @@ def _run(args: Namespace, parser: ArgumentParser) -> None:
             pattern=args.pattern,
             silent=args.silent,
             output=args.output,
+            max_workers=args.cpu_limit,
         )
 
     # Report generation commands
@@ -1,15 +1,17 @@
 import argparse
 import concurrent.futures
 import datetime
+import inspect
 import json
 import logging
 import os
 import sys
 import traceback
+from functools import partial
 from glob import glob
 from itertools import tee
 from pathlib import Path
-from typing import Dict, Iterator, List, NoReturn, Optional, Set, Union
+from typing import Dict, Iterator, List, NoReturn, Optional, Set, Tuple, Union
 
 import humanize
 from rich.console import Console
@@ -32,7 +34,6 @@ from darwin.config import Config
 from darwin.dataset import RemoteDataset
 from darwin.dataset.identifier import DatasetIdentifier
 from darwin.dataset.release import Release
-from darwin.dataset.split_manager import split_dataset
 from darwin.dataset.upload_manager import LocalFile
 from darwin.dataset.utils import get_release_path
 from darwin.datatypes import (
@@ -60,10 +61,9 @@ from darwin.exceptions import (
     UnsupportedFileType,
     ValidationError,
 )
-from darwin.exporter import ExporterNotFoundError, export_annotations, get_exporter
+from darwin.exporter import ExporterNotFoundError, get_exporter
 from darwin.exporter.formats import supported_formats as export_formats
-from darwin.extractor import video
-from darwin.importer import ImporterNotFoundError, get_importer, import_annotations
+from darwin.importer import ImporterNotFoundError, get_importer
 from darwin.importer.formats import supported_formats as import_formats
 from darwin.item import DatasetItem
 from darwin.utils import (
@@ -74,6 +74,7 @@ from darwin.utils import (
     secure_continue_request,
     validate_file_against_schema,
 )
+from darwin.utils.concurrency import map_in_processes
 
 # Single source of truth for Darwin CLI configuration path.
 DARWIN_CONFIG_PATH: Path = Path.home() / ".darwin" / "config.yaml"
@@ -542,6 +543,8 @@ def split(
     seed: int
         Random seed. Defaults to 0.
     """
+    from darwin.dataset.split_manager import split_dataset
+
     identifier: DatasetIdentifier = DatasetIdentifier.parse(dataset_slug)
     client: Client = _load_client()
 
@@ -963,6 +966,7 @@ def dataset_import(
     cpu_limit : Optional[int], default: Core count - 2
         The maximum number of CPUs to use for the import process.
     """
+    from darwin.importer import import_annotations
 
     client: Client = _load_client(dataset_identifier=dataset_slug)
 
@@ -1171,10 +1175,14 @@ def validate_schemas(
     pattern: bool = False,
     silent: bool = False,
     output: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> None:
     """
     Validate function for the CLI. Takes one of 3 required key word arguments describing the location of files and prints and/or saves an output
 
+    Files are validated in a pool of processes, and their results are printed and written to
+    the output as soon as they are available.
+
     Parameters
     ----------
     location : str
@@ -1185,9 +1193,10 @@ def validate_schemas(
         flag to set silent console printing, only showing errors, by default False
     output : Optional[Path], optional
         filename for saving to output, by default None
+    max_workers : Optional[int], optional
+        number of processes validating files, by default the number of CPUs
     """
 
-    all_errors = {}
     if pattern:
         to_validate = [Path(filename) for filename in glob(location)]
     elif os.path.isfile(location):
@@ -1205,42 +1214,62 @@ def validate_schemas(
 
     console.print(f"Validating schemas for {len(to_validate)} files")
 
-    for file in to_validate:
-        try:
-            errors = [
-                {"message": e.message, "location": e.json_path}
-                for e in validate_file_against_schema(file)
-            ]
-        except MissingSchema as e:
-            errors = [{"message": e.message, "location": "schema link"}]
-
-        all_errors[str(file)] = errors
-        if not errors:
-            if not silent:
-                console.print(f"{str(file)}: No Errors", style="success")
-            continue
-        console.print(f"{str(file)}: {len(errors)} errors", style="error")
-        for error in errors:
-            console.print(f"\t- Problem found in {error['location']}", style="error")
-            console.print(f"\t\t- {error['message']}", style="error")
-
+    report = None
     if output:
+        filename: Path = output
+        if os.path.isdir(output):
+            filename = Path(os.path.join(output, "report.json"))
         try:
-            filename: Path = output
-            if os.path.isdir(output):
-                filename = Path(os.path.join(output, "report.json"))
-            with open(filename, "w") as outfile:
-                json.dump(all_errors, outfile, indent=2)
-            console.print(f"Writing report to {filename}", style="success")
+            report = open(filename, "w")
         except Exception as e:
             console.print(f"Error writing output file with {e}", style="error")
             console.print("Did you supply an invalid filename?")
 
+    try:
+        if report:
+            report.write("{")
+        for i, (file, errors) in enumerate(
+            map_in_processes(_validate_schema, to_validate, max_workers)
+        ):
+            if report:
+                report.write(
+                    f"{',' if i else ''}\n  {json.dumps(file)}: {json.dumps(errors)}"
+                )
+            if not errors:
+                if not silent:
+                    console.print(f"{file}: No Errors", style="success")
+                continue
+            console.print(f"{file}: {len(errors)} errors", style="error")
+            for error in errors:
+                console.print(
+                    f"\t- Problem found in {error['location']}", style="error"
+                )
+                console.print(f"\t\t- {error['message']}", style="error")
+        if report:
+            report.write("\n}\n")
+            console.print(f"Writing report to {filename}", style="success")
+    finally:
+        if report:
+            report.close()
+
+
+def _validate_schema(file: Path) -> Tuple[str, List[Dict[str, str]]]:
+    try:
+        errors = [
+            {"message": e.message, "location": e.json_path}
+            for e in validate_file_against_schema(file)
+        ]
+    except MissingSchema as e:
+        errors = [{"message": e.message, "location": "schema link"}]
+    return str(file), errors
+
 
 def dataset_convert(
     dataset_identifier: str,
     format: str,
     output_dir: Optional[PathLike] = None,
+    interpolate: bool = False,
+    cpu_limit: int = 1,
 ) -> None:
     """
     Converts the annotations from the given dataset to the given format.
@@ -1256,12 +1285,20 @@ def dataset_convert(
     output_dir : Optional[PathLike], default: None
         The folder where the exported annotation files will be. If None it will be the inside the
         annotations folder of the dataset under 'other_formats/{format}'.
+    interpolate : bool, default: False
+        Whether to export an annotation for every frame of the video annotations' segments,
+        interpolating between keyframes.
+    cpu_limit : int, default: 1
+        Number of processes the formats that support it (e.g. nifti) export items with. With
+        ``1`` they are exported in the current process.
     """
+    from darwin.exporter import export_annotations
+
     identifier: DatasetIdentifier = DatasetIdentifier.parse(dataset_identifier)
     client: Client = _load_client(team_slug=identifier.team_slug)
 
     try:
-        parser: ExportParser = get_exporter(format)
+        parser: ExportParser = _with_cpu_limit(get_exporter(format), cpu_limit)
 
         dataset: RemoteDataset = client.get_remote_dataset(
             dataset_identifier=identifier
@@ -1281,7 +1318,11 @@ def dataset_convert(
         output_dir.mkdir(parents=True, exist_ok=True)
 
         export_annotations(
-            parser, [annotations_path], output_dir, split_sequences=(format != "nifti")
+            parser,
+            [annotations_path],
+            output_dir,
+            split_sequences=(format != "nifti"),
+            interpolate=interpolate,
         )
     except ExporterNotFoundError:
         _error(
@@ -1299,6 +1340,8 @@ def convert(
     format: str,
     files: List[PathLike],
     output_dir: Path,
+    interpolate: bool = False,
+    cpu_limit: int = 1,
 ) -> None:
     """
     Converts the given files to the specified format.
@@ -1311,9 +1354,17 @@ def convert(
         List of files to be converted.
     output_dir: Path
         Folder where the exported annotations will be placed.
+    interpolate: bool, default: False
+        Whether to export an annotation for every frame of the video annotations' segments,
+        interpolating between keyframes.
+    cpu_limit: int, default: 1
+        Number of processes the formats that support it (e.g. nifti) export items with. With
+        ``1`` they are exported in the current process.
     """
+    from darwin.exporter import export_annotations
+
     try:
-        parser: ExportParser = get_exporter(format)
+        parser: ExportParser = _with_cpu_limit(get_exporter(format), cpu_limit)
     except ExporterNotFoundError:
         _error(f"Unsupported export format, currently supported: {export_formats}")
     except AttributeError:
@@ -1324,9 +1375,17 @@ def convert(
         files,
         output_dir,
         split_sequences=(format != "nifti"),
+        interpolate=interpolate,
     )
 
 
+def _with_cpu_limit(parser: ExportParser, cpu_limit: int) -> ExportParser:
+    # Only the formats that export items in a pool of processes take ``max_workers``
+    if "max_workers" in inspect.signature(parser).parameters:
+        return partial(parser, max_workers=cpu_limit)
+    return parser
+
+
 def post_comment(
     dataset_slug: str,
     filename: str,
@@ -1623,6 +1682,7 @@ def extract_video_artifacts(
     primary_frames_quality : Optional[int], optional
         Quality for primary display frames (2=best JPEG, 31=worst). If 1, uses PNG, by default 1
     """
+    from darwin.extractor import video
 
     video.extract_artifacts(
         source_file=source_file,
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import os
@@ -21,6 +22,7 @@ from tenacity import (
 )
 from tenacity.wait import wait_exponential
 
+from darwin import instrumentation
 from darwin.backend_v2 import BackendV2
 from darwin.config import Config
 from darwin.dataset.identifier import DatasetIdentifier
@@ -56,6 +58,7 @@ from darwin.future.core.properties import (
 from darwin.future.core.properties import update_property as update_property_future
 from darwin.future.core.types.common import JSONDict
 from darwin.future.data_objects.properties import FullProperty
+from darwin.metadata_cache import DEFAULT_METADATA_CACHE_TTL, MetadataCache
 from darwin.utils import (
     describe_response_for_log,
     has_json_content_type,
@@ -67,6 +70,7 @@ from darwin.utils.get_item_count import get_item_count
 INITIAL_WAIT = int(os.getenv("DARWIN_RETRY_INITIAL_WAIT", "60"))
 MAX_WAIT = int(os.getenv("DARWIN_RETRY_MAX_WAIT", "300"))
 MAX_RETRIES = int(os.getenv("DARWIN_RETRY_MAX_ATTEMPTS", "10"))
+METADATA_CACHE_DIR = os.getenv("DARWIN_METADATA_CACHE_DIR")
 
 HOUR = 60 * 60
 
@@ -132,6 +136,7 @@ def log_retry_error(retry_state: RetryCallState) -> None:
     exception = retry_state.outcome.exception()
     if isinstance(exception, HTTPError):
         response: Response = exception.response
+        instrumentation.record_retry("client", response.status_code)
         if response.status_code == 429:
             print(f"Rate limit exceeded. Retrying in {wait_time:.2f} seconds...")
         else:
@@ -152,10 +157,20 @@ class Client:
         self.base_url: str = config.get("global/base_url")
         self.default_team: str = default_team or config.get("global/default_team")
         self.features: Dict[str, List[Feature]] = {}
+        # Metadata is only cached when enabled, as changes made elsewhere (e.g. in the UI)
+        # aren't seen until the cached entries expire
+        self.metadata_cache: MetadataCache = MetadataCache(
+            ttl=float(
+                os.getenv("DARWIN_METADATA_CACHE_TTL")
+                or config.get("global/metadata_cache_ttl", DEFAULT_METADATA_CACHE_TTL)
+            ),
+            cache_dir=Path(METADATA_CACHE_DIR) if METADATA_CACHE_DIR else None,
+        )
         self._newer_version: Optional[DarwinVersionNumber] = None
         self.session = requests.Session()
         adapter = HTTPAdapter(pool_maxsize=100)
         self.session.mount("https://", adapter)
+        self.session.hooks.update(instrumentation.hooks("client"))
 
         if log is None:
             self.log: Logger = logging.getLogger("darwin")
@@ -393,7 +408,10 @@ class Client:
         the_team_slug: str = the_team.slug
         response: Dict[str, UnknownType] = cast(
             Dict[str, UnknownType],
-            self._get(f"/teams/{the_team_slug}/annotation_classes?include_tags=true"),
+            self._get_cached(
+                f"/teams/{the_team_slug}/annotation_classes?include_tags=true",
+                self._metadata_cache_key("annotation_classes", the_team_slug),
+            ),
         )
 
         return response["annotation_classes"]
@@ -420,6 +438,7 @@ class Client:
             Dict[str, UnknownType],
             self._put(f"/annotation_classes/{class_id}", payload),
         )
+        self.metadata_cache.invalidate(self._metadata_cache_key("annotation_classes"))
         return response
 
     def create_annotation_class(
@@ -455,6 +474,7 @@ class Client:
                 },
             ),
         )
+        self.metadata_cache.invalidate(self._metadata_cache_key("annotation_classes"))
         return response
 
     def fetch_remote_attributes(self, dataset_id: int) -> List[Dict[str, UnknownType]]:
@@ -474,7 +494,10 @@ class Client:
         """
         response: List[Dict[str, UnknownType]] = cast(
             List[Dict[str, UnknownType]],
-            self._get(f"/datasets/{dataset_id}/attributes"),
+            self._get_cached(
+                f"/datasets/{dataset_id}/attributes",
+                self._metadata_cache_key("attributes", str(dataset_id)),
+            ),
         )
         return response
 
@@ -511,7 +534,11 @@ class Client:
             List of Features for the given team.
         """
         response: List[Dict[str, UnknownType]] = cast(
-            List[Dict[str, UnknownType]], self._get(f"/teams/{team_slug}/features")
+            List[Dict[str, UnknownType]],
+            self._get_cached(
+                f"/teams/{team_slug}/features",
+                self._metadata_cache_key("features", team_slug),
+            ),
         )
 
         features: List[Feature] = []
@@ -909,10 +936,17 @@ class Client:
         team_slug: Optional[str] = None,
         stream: bool = False,
         auth_token: Optional[bool] = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Response:
+        request_headers: Dict[str, str] = self._get_headers(
+            team_slug, auth_token=auth_token
+        )
+        if headers:
+            request_headers.update(headers)
+
         response: Response = self.session.get(
             url,
-            headers=self._get_headers(team_slug, auth_token=auth_token),
+            headers=request_headers,
             stream=stream,
         )
 
@@ -935,9 +969,10 @@ class Client:
         endpoint: str,
         team_slug: Optional[str] = None,
         stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Response:
         return self._get_raw_from_full_url(
-            urljoin(self.url, endpoint), team_slug, stream=stream
+            urljoin(self.url, endpoint), team_slug, stream=stream, headers=headers
         )
 
     def _get(
@@ -946,6 +981,55 @@ class Client:
         response = self._get_raw(endpoint, team_slug)
         return self._decode_response(response)
 
+    def _get_cached(
+        self, endpoint: str, cache_key: str, team_slug: Optional[str] = None
+    ) -> Union[Dict[str, UnknownType], List[Dict[str, UnknownType]]]:
+        """
+        Same as ``_get``, but serves the response from the metadata cache while it is fresh.
+        Stale entries with an ``ETag`` are revalidated with a conditional request, so an
+        unchanged resource is not downloaded again.
+
+        Parameters
+        ----------
+        endpoint: str
+            The endpoint to fetch.
+        cache_key: str
+            The key the response is stored under, see ``_metadata_cache_key``.
+        team_slug: Optional[str]
+            Team slug of the team the request is made for. Defaults to None.
+
+        Returns
+        -------
+        Union[Dict[str, UnknownType], List[Dict[str, UnknownType]]]
+            A copy of the decoded response, which callers are free to mutate.
+        """
+        entry = self.metadata_cache.get(cache_key)
+        if entry is not None and self.metadata_cache.is_fresh(entry):
+            return copy.deepcopy(entry.value)
+
+        headers: Optional[Dict[str, str]] = None
+        if entry is not None and entry.etag:
+            headers = {"If-None-Match": entry.etag}
+
+        response = self._get_raw(endpoint, team_slug, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            entry = self.metadata_cache.touch(cache_key) or entry
+            return copy.deepcopy(entry.value)
+
+        value = self._decode_response(response)
+        if has_json_content_type(response):
+            self.metadata_cache.set(
+                cache_key, copy.deepcopy(value), etag=response.headers.get("ETag")
+            )
+        return value
+
+    def _metadata_cache_key(self, kind: str, *parts: str) -> str:
+        """
+        Builds a metadata cache key scoped to this client's API endpoint. Calling it with only
+        ``kind`` returns the prefix shared by every key of that kind, for invalidation.
+        """
+        return "|".join([self.url, kind, *parts]) + "|"
+
     @retry(
         wait=wait_exponential_jitter(initial=INITIAL_WAIT, max=MAX_WAIT),
         stop=stop_after_attempt(MAX_RETRIES),
@@ -997,7 +1081,7 @@ class Client:
     def _post_raw(
         self,
         endpoint: str,
-        payload: Optional[Dict[str, UnknownType]] = None,
+        payload: Optional[Union[Dict[str, UnknownType], bytes]] = None,
         team_slug: Optional[str] = None,
     ) -> Response:
         if payload is None:
@@ -1007,7 +1091,18 @@ class Client:
             self.config.get("global/payload_compression_level", "0")
         )
 
-        if compression_level > 0:
+        # Payloads can be serialized ahead of time, e.g. to size the annotation imports
+        if isinstance(payload, bytes):
+            body = payload
+            if compression_level > 0:
+                body = zlib.compress(body, level=compression_level)
+            response: Response = requests.post(
+                urljoin(self.url, endpoint),
+                data=body,
+                headers=self._get_headers(team_slug, compressed=compression_level > 0),
+                hooks=self.session.hooks,
+            )
+        elif compression_level > 0:
             compressed_payload = zlib.compress(
                 json.dumps(payload).encode("utf-8"), level=compression_level
             )
@@ -1016,12 +1111,14 @@ class Client:
                 urljoin(self.url, endpoint),
                 data=compressed_payload,
                 headers=self._get_headers(team_slug, compressed=True),
+                hooks=self.session.hooks,
             )
         else:
             response: Response = requests.post(
                 urljoin(self.url, endpoint),
                 json=payload,
                 headers=self._get_headers(team_slug),
+                hooks=self.session.hooks,
             )
 
         if self.log.isEnabledFor(logging.DEBUG):
@@ -1186,19 +1283,32 @@ class Client:
     def get_team_properties(
         self, team_slug: Optional[str] = None, include_property_values: bool = True
     ) -> List[FullProperty]:
+        the_team_slug: str = team_slug or self.default_team
+        cache_key = self._metadata_cache_key(
+            "properties", the_team_slug, str(include_property_values)
+        )
+        entry = self.metadata_cache.get(cache_key)
+        if entry is not None and self.metadata_cache.is_fresh(entry):
+            return [FullProperty.model_validate(prop) for prop in entry.value]
+
         darwin_config = DarwinConfig.from_old(self.config, team_slug)
         future_client = ClientCore(darwin_config)
 
         if not include_property_values:
-            return get_team_properties_future(
+            properties = get_team_properties_future(
                 client=future_client,
-                team_slug=team_slug or self.default_team,
+                team_slug=the_team_slug,
+            )
+        else:
+            properties = get_team_full_properties_future(
+                client=future_client,
+                team_slug=the_team_slug,
             )
 
-        return get_team_full_properties_future(
-            client=future_client,
-            team_slug=team_slug or self.default_team,
+        self.metadata_cache.set(
+            cache_key, [prop.model_dump(mode="json") for prop in properties]
         )
+        return properties
 
     def create_property(
         self, team_slug: Optional[str], params: Union[FullProperty, JSONDict]
@@ -1206,11 +1316,13 @@ class Client:
         darwin_config = DarwinConfig.from_old(self.config, team_slug)
         future_client = ClientCore(darwin_config)
 
-        return create_property_future(
+        created_property = create_property_future(
             client=future_client,
             team_slug=team_slug or self.default_team,
             params=params,
         )
+        self.metadata_cache.invalidate(self._metadata_cache_key("properties"))
+        return created_property
 
     def update_property(
         self, team_slug: Optional[str], params: Union[FullProperty, JSONDict]
@@ -1218,11 +1330,13 @@ class Client:
         darwin_config = DarwinConfig.from_old(self.config, team_slug)
         future_client = ClientCore(darwin_config)
 
-        return update_property_future(
+        updated_property = update_property_future(
             client=future_client,
             team_slug=team_slug or self.default_team,
             params=params,
         )
+        self.metadata_cache.invalidate(self._metadata_cache_key("properties"))
+        return updated_property
 
     def get_external_storage(
         self, team_slug: Optional[str] = None, name: Optional[str] = None
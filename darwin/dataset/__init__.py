@@ -1,2 +1,25 @@
-from darwin.dataset.local_dataset import LocalDataset  # noqa
-from darwin.dataset.remote_dataset import RemoteDataset  # noqa
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from darwin.dataset.local_dataset import LocalDataset  # noqa
+    from darwin.dataset.remote_dataset import RemoteDataset  # noqa
+
+# Imported on first access (PEP 562), as they load NumPy, PIL and the upload and download
+# managers
+_LAZY_ATTRIBUTES = {
+    "LocalDataset": "darwin.dataset.local_dataset",
+    "RemoteDataset": "darwin.dataset.remote_dataset",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
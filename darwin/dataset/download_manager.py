@@ -20,13 +20,12 @@ from typing import (
     TYPE_CHECKING,
 )
 
-import numpy as np
 import orjson as json
 import requests
-from PIL import Image
 from rich.console import Console
 
 import darwin.datatypes as dt
+from darwin import instrumentation
 from darwin.dataset.utils import (
     sanitize_filename,
     SUPPORTED_IMAGE_EXTENSIONS,
@@ -412,9 +411,7 @@ def _update_local_path(annotation: AnnotationFile, url, local_path):
             if source_file["url"] == url:
                 source_file["local_path"] = str(local_path)
 
-    with annotation.path.open(mode="w") as file:
-        op = json.dumps(raw_annotation, json.OPT_INDENT_2).decode("utf-8")
-        file.write(op)
+    annotation.path.write_bytes(json.dumps(raw_annotation, option=json.OPT_INDENT_2))
 
 
 def _download_image(
@@ -475,7 +472,9 @@ def _fetch_multiple_files(
         # get filename which is last http path segment
         filename = urllib.parse.urlparse(url).path.rsplit("/", 1)[-1]
         path = dir_path / filename
-        response = requests.get(url, stream=True)
+        response = requests.get(
+            url, stream=True, hooks=instrumentation.hooks("storage")
+        )
         if response.ok:
             _write_file(path, response, transform_file_function)
         else:
@@ -498,6 +497,9 @@ def _rg16_to_grayscale(path):
     # Custom 16bit grayscale encoded on (RG)B channels
     # into regular 8bit grayscale
 
+    import numpy as np
+    from PIL import Image
+
     image = Image.open(path)
     image_2d_rgb = np.asarray(image)
 
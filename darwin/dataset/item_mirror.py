@@ -0,0 +1,385 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from darwin.item import DatasetItem
+from darwin.item_sorter import ItemSorter
+
+if TYPE_CHECKING:
+    from darwin.dataset.remote_dataset_v2 import RemoteDatasetV2
+
+ITEM_MIRROR_ENABLED = os.getenv("DARWIN_ITEM_MIRROR", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+ITEM_MIRROR_MAX_AGE = float(os.getenv("DARWIN_ITEM_MIRROR_MAX_AGE", "0"))
+ITEM_MIRROR_FULL_SYNC_INTERVAL = float(
+    os.getenv("DARWIN_ITEM_MIRROR_FULL_SYNC_INTERVAL", "86400")
+)
+
+# Items updated this many seconds before the newest known update are listed again on
+# every incremental sync, to catch updates committed while the previous sync was running
+SYNC_OVERLAP = 60.0
+
+# Columns the ``ItemSorter`` fields are sorted by
+SORT_COLUMNS = {
+    "inserted_at": "inserted_at",
+    "updated_at": "updated_at",
+    "file_size": "file_size",
+    "filename": "name",
+    "priority": "priority",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    status TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    slot_types TEXT NOT NULL DEFAULT '[]',
+    file_size INTEGER NOT NULL DEFAULT 0,
+    priority INTEGER,
+    inserted_at REAL,
+    updated_at REAL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (name);
+CREATE INDEX IF NOT EXISTS items_path ON items (path);
+CREATE INDEX IF NOT EXISTS items_status ON items (status);
+CREATE INDEX IF NOT EXISTS items_updated_at ON items (updated_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _filter_values(value: Union[str, List[str]]) -> List[str]:
+    # Non-list filters are sent verbatim to the API, which splits them by comma
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return str(value).split(",")
+
+
+class ItemMirror:
+    """
+    Local copy of the items of a ``RemoteDatasetV2``, stored in a SQLite database.
+
+    The mirror is populated by listing every item once and is then kept up to date by
+    listing the items sorted by ``updated_at``, newest first, until reaching the ones that
+    were already mirrored. Items deleted outside of this SDK are only noticed by full
+    syncs, which are repeated every ``full_sync_interval`` seconds.
+
+    Parameters
+    ----------
+    dataset : RemoteDatasetV2
+        The dataset whose items are mirrored.
+    path : Optional[Path], default: None
+        Location of the SQLite database, defaults to ``.v7/items.sqlite`` inside the local
+        dataset directory.
+    max_age : float, default: ITEM_MIRROR_MAX_AGE
+        Number of seconds after a sync during which the mirror is used without syncing
+        again.
+    full_sync_interval : float, default: ITEM_MIRROR_FULL_SYNC_INTERVAL
+        Number of seconds after which the mirror is rebuilt from scratch.
+    """
+
+    def __init__(
+        self,
+        dataset: "RemoteDatasetV2",
+        path: Optional[Path] = None,
+        max_age: float = ITEM_MIRROR_MAX_AGE,
+        full_sync_interval: float = ITEM_MIRROR_FULL_SYNC_INTERVAL,
+    ):
+        self.dataset = dataset
+        self._path = path
+        self.max_age = max_age
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Path:
+        """Returns the Path to the SQLite database."""
+        return self._path or self.dataset.local_path / ".v7" / "items.sqlite"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def is_fresh(self) -> bool:
+        """
+        Whether the mirror was synced less than ``max_age`` seconds ago.
+
+        Returns
+        -------
+        bool
+            ``True`` if the mirror can be queried without syncing it first.
+        """
+        last_sync = self._get_meta("last_sync")
+        return last_sync is not None and time.time() - float(last_sync) < self.max_age
+
+    def invalidate(
+        self, item_ids: Optional[Iterable[str]] = None, archived: Optional[bool] = None
+    ) -> None:
+        """
+        Forces the next query to sync the mirror first, optionally updating some items.
+
+        Incremental syncs don't list archived items, so items deleted, archived or
+        restored through the SDK are updated here in the same transaction.
+
+        Parameters
+        ----------
+        item_ids : Optional[Iterable[str]], default: None
+            Ids of the items that changed. They are removed from the mirror unless
+            ``archived`` is given.
+        archived : Optional[bool], default: None
+            Whether the given items were archived (``True``) or restored (``False``).
+        """
+        with self._lock, self.connection as connection:
+            if item_ids is not None and archived is None:
+                connection.executemany(
+                    "DELETE FROM items WHERE id = ?", [(i,) for i in item_ids]
+                )
+            elif item_ids is not None:
+                rows = []
+                for item_id in item_ids:
+                    row = connection.execute(
+                        "SELECT raw FROM items WHERE id = ?", (item_id,)
+                    ).fetchone()
+                    if row is not None:
+                        raw = json.loads(row[0])
+                        raw["archived"] = archived
+                        rows.append((archived, json.dumps(raw), item_id))
+                connection.executemany(
+                    "UPDATE items SET archived = ?, raw = ? WHERE id = ?", rows
+                )
+            connection.execute("DELETE FROM meta WHERE key = 'last_sync'")
+
+    def sync(self, full: bool = False) -> int:
+        """
+        Brings the mirror up to date with the server.
+
+        Parameters
+        ----------
+        full : bool, default: False
+            Lists every item again instead of only the recently updated ones. Full syncs are
+            also run when the mirror is empty, belongs to another dataset or the last full
+            sync is older than ``full_sync_interval``.
+
+        Returns
+        -------
+        int
+            The number of items listed from the server.
+        """
+        with self._lock:
+            last_full_sync = self._get_meta("last_full_sync")
+            if (
+                full
+                or last_full_sync is None
+                or self._get_meta("dataset_id") != str(self.dataset.dataset_id)
+                or time.time() - float(last_full_sync) >= self.full_sync_interval
+            ):
+                return self._full_sync()
+            return self._incremental_sync()
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Union[str, List[str]]]] = None,
+        sort: Optional[Union[str, ItemSorter]] = None,
+    ) -> Iterator[DatasetItem]:
+        """
+        Answers a ``fetch_remote_files`` query from the mirror, syncing it first unless it
+        is fresh.
+
+        Parameters
+        ----------
+        filters : Optional[Dict[str, Union[str, List[str]]]], default: None
+            The ``item_names``, ``statuses``, ``item_ids``, ``slot_types`` and ``item_paths``
+            filters, with the same semantics as ``fetch_remote_files``.
+        sort : Optional[Union[str, ItemSorter]], default: None
+            A sorting direction.
+
+        Returns
+        -------
+        Iterator[DatasetItem]
+            The matching items.
+        """
+        if not self.is_fresh():
+            self.sync()
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        slot_types: Optional[List[str]] = None
+        for key, value in (filters or {}).items():
+            values = _filter_values(value)
+            if key in ("item_names", "filenames"):
+                clauses.append(self._in_clause("name", values))
+                params.extend(values)
+            elif key == "item_ids":
+                clauses.append(self._in_clause("id", values))
+                params.extend(values)
+            elif key == "statuses":
+                clauses.append(
+                    f"({self._in_clause('status', values)} OR (archived AND ?))"
+                )
+                params.extend(values)
+                params.append("archived" in values)
+            elif key == "item_paths":
+                clauses.append(
+                    "("
+                    + " OR ".join(["path = ? OR path LIKE ? ESCAPE '\\'"] * len(values))
+                    + ")"
+                )
+                for item_path in values:
+                    prefix = item_path.rstrip("/")
+                    escaped = (
+                        prefix.replace("\\", "\\\\")
+                        .replace("%", "\\%")
+                        .replace("_", "\\_")
+                    )
+                    params.extend([prefix or "/", f"{escaped}/%"])
+            elif key == "slot_types":
+                slot_types = values
+
+        query = "SELECT raw, slot_types FROM items"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        if sort:
+            item_sorter = ItemSorter.parse(sort)
+            query += f" ORDER BY {SORT_COLUMNS[item_sorter.field]} {item_sorter.direction.value.upper()}"
+        else:
+            query += " ORDER BY rowid"
+
+        with self._lock:
+            rows = self.connection.execute(query, params).fetchall()
+        for raw, item_slot_types in rows:
+            if slot_types is not None and not set(json.loads(item_slot_types)) & set(
+                slot_types
+            ):
+                continue
+            yield DatasetItem.parse(json.loads(raw), dataset_slug=self.dataset.slug)
+
+    def _full_sync(self) -> int:
+        started_at = time.time()
+        count = 0
+        newest: Optional[float] = None
+        with self.connection as connection:
+            connection.execute("DELETE FROM items")
+            for raw in self.dataset._fetch_remote_items_raw([], {}):
+                newest = self._upsert(connection, raw, newest)
+                count += 1
+            self._set_meta(connection, "dataset_id", str(self.dataset.dataset_id))
+            self._set_meta(connection, "last_full_sync", str(started_at))
+            self._set_meta(connection, "last_sync", str(started_at))
+            if newest is not None:
+                self._set_meta(connection, "newest_update", str(newest))
+        return count
+
+    def _incremental_sync(self) -> int:
+        started_at = time.time()
+        count = 0
+        newest_update = self._get_meta("newest_update")
+        newest: Optional[float] = float(newest_update) if newest_update else None
+        threshold = newest - SYNC_OVERLAP if newest is not None else None
+        with self.connection as connection:
+            items = self.dataset._fetch_remote_items_raw(
+                [], {"sort[updated_at]": "desc"}
+            )
+            try:
+                for raw in items:
+                    updated_at = _parse_timestamp(raw.get("updated_at"))
+                    if (
+                        threshold is not None
+                        and updated_at is not None
+                        and updated_at < threshold
+                    ):
+                        break
+                    newest = self._upsert(connection, raw, newest)
+                    count += 1
+            finally:
+                items.close()
+            self._set_meta(connection, "last_sync", str(started_at))
+            if newest is not None:
+                self._set_meta(connection, "newest_update", str(newest))
+        return count
+
+    @staticmethod
+    def _upsert(
+        connection: sqlite3.Connection, raw: Dict[str, Any], newest: Optional[float]
+    ) -> Optional[float]:
+        updated_at = _parse_timestamp(raw.get("updated_at"))
+        slots = raw.get("slots", [])
+        connection.execute(
+            "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                raw["id"],
+                raw["name"],
+                raw["path"],
+                raw.get("status"),
+                bool(raw.get("archived")),
+                json.dumps(
+                    raw.get("slot_types") or [slot.get("type") for slot in slots]
+                ),
+                sum(slot.get("size_bytes") or 0 for slot in slots),
+                raw.get("priority"),
+                _parse_timestamp(raw.get("inserted_at")),
+                updated_at,
+                json.dumps(raw),
+            ),
+        )
+        if updated_at is not None and (newest is None or updated_at > newest):
+            return updated_at
+        return newest
+
+    @staticmethod
+    def _in_clause(column: str, values: List[str]) -> str:
+        return f"{column} IN ({', '.join('?' * len(values))})"
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row: Optional[Tuple[str]] = self.connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(connection: sqlite3.Connection, key: str, value: str) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
@@ -10,9 +10,8 @@ from darwin.utils import (
     SUPPORTED_IMAGE_EXTENSIONS,
     get_annotation_files_from_dir,
     get_image_path_from_stream,
-    is_stream_list_empty,
+    load_darwin_json_header,
     parse_darwin_json,
-    stream_darwin_json,
 )
 
 
@@ -145,14 +144,12 @@ class LocalDataset:
 
         for annotation_filepath in annotation_filepaths:
             annotation_filepath = Path(annotation_filepath)
-            darwin_json = stream_darwin_json(annotation_filepath)
+            darwin_json = load_darwin_json_header(annotation_filepath)
             image_path = get_image_path_from_stream(
                 darwin_json, images_dir, annotation_filepath, with_folders
             )
             if image_path.exists():
-                if not keep_empty_annotations and is_stream_list_empty(
-                    darwin_json["annotations"]
-                ):
+                if not keep_empty_annotations and not darwin_json["annotations"]:
                     continue
                 self.images_path.append(image_path)
                 self.annotations_path.append(annotation_filepath)
@@ -0,0 +1,103 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from darwin.datatypes import PathLike
+
+
+class RegistrationJournal:
+    """
+    Append-only record of the progress of a registration, so that an interrupted run can
+    be resumed without processing again the items that were already uploaded or
+    registered.
+
+    Each line of the journal file is a JSON object, either ``{"key": ..., "item": ...}``
+    once the files of an item have been uploaded, or ``{"registered": [...], "results":
+    ...}`` once a batch of items has been registered. A truncated last line, e.g. when the
+    process was killed while writing it, is ignored.
+
+    Parameters
+    ----------
+    path : Optional[PathLike]
+        The journal file, created if it doesn't exist. With ``None``, progress is only
+        kept in memory.
+
+    Attributes
+    ----------
+    items : Dict[str, Dict]
+        Payload of the items whose files have been uploaded, keyed by their key.
+    registered : Dict[str, None]
+        Keys of the items that have been registered, in order.
+    results : Dict[str, List[str]]
+        The ``registered`` and ``blocked`` messages of the registered items.
+    """
+
+    def __init__(self, path: Optional[PathLike] = None):
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.items: Dict[str, Dict] = {}
+        self.registered: Dict[str, None] = {}
+        self.results: Dict[str, List[str]] = {"registered": [], "blocked": []}
+        self._lock = threading.Lock()
+        self._truncated = False
+        if self.path is not None and self.path.exists():
+            content = self.path.read_text()
+            for line in content.splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._apply(entry)
+            # Entries appended after a truncated line must start on a line of their own
+            self._truncated = bool(content) and not content.endswith("\n")
+
+    def pending(self) -> Dict[str, Dict]:
+        """Returns the uploaded items that haven't been registered yet."""
+        return {
+            key: item for key, item in self.items.items() if key not in self.registered
+        }
+
+    def record_item(self, key: str, item: Dict) -> None:
+        """
+        Records that the files of an item have been uploaded.
+
+        Parameters
+        ----------
+        key : str
+            The key of the item, stable across runs.
+        item : Dict
+            The registration payload of the item.
+        """
+        self._append({"key": key, "item": item})
+
+    def record_registered(self, keys: List[str], results: Dict[str, List[str]]) -> None:
+        """
+        Records that a batch of items has been registered.
+
+        Parameters
+        ----------
+        keys : List[str]
+            The keys of the registered items.
+        results : Dict[str, List[str]]
+            The ``registered`` and ``blocked`` messages of the batch.
+        """
+        self._append({"registered": keys, "results": results})
+
+    def _append(self, entry: Dict) -> None:
+        with self._lock:
+            self._apply(entry)
+            if self.path is None:
+                return
+            with open(self.path, "a") as f:
+                if self._truncated:
+                    f.write("\n")
+                    self._truncated = False
+                f.write(json.dumps(entry) + "\n")
+
+    def _apply(self, entry: Dict) -> None:
+        if "item" in entry:
+            self.items[entry["key"]] = entry["item"]
+        else:
+            self.registered.update(dict.fromkeys(entry["registered"]))
+            for status in ("registered", "blocked"):
+                self.results[status].extend(entry["results"].get(status, []))
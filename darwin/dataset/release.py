@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 
 import requests
 
+from darwin import instrumentation
 from darwin.dataset.identifier import DatasetIdentifier
 
 
@@ -216,7 +217,9 @@ class Release:
         if not self.url:
             raise ValueError("Release must have a valid url to download the zip.")
 
-        with requests.get(self.url, stream=True) as response:
+        with requests.get(
+            self.url, stream=True, hooks=instrumentation.hooks("storage")
+        ) as response:
             with open(path, "wb") as download_file:
                 shutil.copyfileobj(response.raw, download_file)
 
@@ -0,0 +1,260 @@
+import multiprocessing as mp
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import orjson as json
+
+from darwin.datatypes import PathLike
+from darwin.importer.formats.darwin import parse_path
+from darwin.utils import get_annotation_files_from_dir
+
+INDEX_VERSION = 1
+
+# Below this number of files to parse, starting worker processes isn't worth it
+PARALLEL_THRESHOLD = 256
+
+# (class name, annotation type) of every annotation in a file, in order
+AnnotationSummary = List[Tuple[str, str]]
+
+
+@dataclass
+class AnnotationFileEntry:
+    """
+    Summary of a single annotation file of a release.
+
+    Attributes
+    ----------
+    mtime : int
+        Modification time of the file, in nanoseconds, when it was parsed.
+    size : int
+        Size of the file, in bytes, when it was parsed.
+    annotations : Optional[AnnotationSummary]
+        Class name and annotation type of every annotation, ``None`` if the file couldn't be
+        parsed into an ``AnnotationFile``.
+    density : int
+        Number of polygon annotations (annotations with a ``path`` or ``paths``).
+    """
+
+    mtime: int
+    size: int
+    annotations: Optional[AnnotationSummary]
+    density: int = 0
+
+
+def _summarize(path: str) -> Tuple[Optional[AnnotationSummary], int]:
+    annotation_file = parse_path(Path(path))
+    if annotation_file is None:
+        return None, 0
+    annotations: AnnotationSummary = []
+    density = 0
+    for annotation in annotation_file.annotations:
+        annotation_class = annotation.annotation_class
+        annotations.append((annotation_class.name, annotation_class.annotation_type))
+        data = getattr(annotation, "data", {})
+        if "path" in data or "paths" in data:
+            density += 1
+    return annotations, density
+
+
+@dataclass
+class ReleaseIndex:
+    """
+    Index of the annotation files of a release, built by parsing every file once and
+    persisted next to the annotations directory, so that class lists, splits and
+    statistics don't need to parse the annotations again.
+
+    Attributes
+    ----------
+    annotations_dir : Path
+        Directory with the annotation files of the release.
+    entries : Dict[str, AnnotationFileEntry]
+        Summary of each annotation file, keyed by its path relative to ``annotations_dir``,
+        sorted like ``get_annotation_files_from_dir``.
+    """
+
+    annotations_dir: Path
+    entries: Dict[str, AnnotationFileEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, annotations_dir: Path, max_workers: Optional[int] = None
+    ) -> "ReleaseIndex":
+        """
+        Loads the index of the given annotations directory, parsing the files that were
+        added or modified since it was last persisted.
+
+        Parameters
+        ----------
+        annotations_dir : Path
+            Directory with the annotation files.
+        max_workers : Optional[int], default: None
+            Number of processes used to parse the annotation files. Defaults to the number
+            of CPUs.
+
+        Returns
+        -------
+        ReleaseIndex
+            The up to date index.
+        """
+        annotations_dir = Path(annotations_dir)
+        index = cls(annotations_dir)
+        if not annotations_dir.is_dir():
+            return index
+
+        persisted = index._read()
+        to_parse: List[Tuple[str, os.stat_result]] = []
+        for file_name in get_annotation_files_from_dir(annotations_dir):
+            relative_path = Path(file_name).relative_to(annotations_dir).as_posix()
+            stat = os.stat(file_name)
+            entry = persisted.get(relative_path)
+            if entry and entry.mtime == stat.st_mtime_ns and entry.size == stat.st_size:
+                index.entries[relative_path] = entry
+            else:
+                to_parse.append((relative_path, stat))
+                # Keep the position of the file, it is filled once it has been parsed
+                index.entries[relative_path] = AnnotationFileEntry(0, 0, None)
+
+        if to_parse or len(index.entries) != len(persisted):
+            paths = [str(annotations_dir / path) for path, _ in to_parse]
+            for (relative_path, stat), (annotations, density) in zip(
+                to_parse, cls._summarize_all(paths, max_workers)
+            ):
+                index.entries[relative_path] = AnnotationFileEntry(
+                    stat.st_mtime_ns, stat.st_size, annotations, density
+                )
+            index._write()
+        return index
+
+    @staticmethod
+    def _summarize_all(
+        paths: List[str], max_workers: Optional[int]
+    ) -> Iterable[Tuple[Optional[AnnotationSummary], int]]:
+        if len(paths) < PARALLEL_THRESHOLD or max_workers == 1:
+            return [_summarize(path) for path in paths]
+        workers = max_workers or mp.cpu_count()
+        with mp.Pool(workers) as pool:
+            return pool.map(
+                _summarize, paths, chunksize=max(1, len(paths) // (workers * 4))
+            )
+
+    def get(self, path: PathLike) -> Optional[AnnotationFileEntry]:
+        """
+        Returns the entry of the given annotation file, if it is indexed.
+
+        Parameters
+        ----------
+        path : PathLike
+            Path of the annotation file, either absolute or relative to ``annotations_dir``.
+
+        Returns
+        -------
+        Optional[AnnotationFileEntry]
+            The entry of the file or ``None`` if it isn't in the index.
+        """
+        path = Path(path)
+        if path.is_absolute():
+            if not path.is_relative_to(self.annotations_dir):
+                return None
+            path = path.relative_to(self.annotations_dir)
+        return self.entries.get(path.as_posix())
+
+    def extract_classes(
+        self, annotation_types: List[str]
+    ) -> Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]:
+        """
+        Maps classes to the indices of the files containing them and vice versa, see
+        ``darwin.dataset.utils.extract_classes``.
+
+        Parameters
+        ----------
+        annotation_types : List[str]
+            Types of annotation to consider.
+
+        Returns
+        -------
+        Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]
+            Files containing each class, and classes contained in each file.
+        """
+        classes: Dict[str, Set[int]] = defaultdict(set)
+        indices_to_classes: Dict[int, Set[str]] = defaultdict(set)
+        for i, entry in enumerate(self.entries.values()):
+            for class_name, annotation_type in entry.annotations or []:
+                if annotation_type not in annotation_types:
+                    continue
+                indices_to_classes[i].add(class_name)
+                classes[class_name].add(i)
+        return classes, indices_to_classes
+
+    def max_density(self) -> int:
+        """Returns the maximum number of polygon annotations in a single file."""
+        return max((entry.density for entry in self.entries.values()), default=0)
+
+    @property
+    def path(self) -> Path:
+        """
+        Returns the Path where the index is persisted. It is kept outside of the annotations
+        directory so that it isn't picked up as an annotation file, e.g.
+        ``releases/latest/.annotations.index.json``.
+        """
+        return self.annotations_dir.parent / f".{self.annotations_dir.name}.index.json"
+
+    def _read(self) -> Dict[str, AnnotationFileEntry]:
+        try:
+            data = json.loads(self.path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        class_names: List[str] = data["class_names"]
+        annotation_types: List[str] = data["annotation_types"]
+        return {
+            path: AnnotationFileEntry(
+                mtime,
+                size,
+                (
+                    [(class_names[c], annotation_types[t]) for c, t in annotations]
+                    if annotations is not None
+                    else None
+                ),
+                density,
+            )
+            for path, (mtime, size, annotations, density) in data["files"].items()
+        }
+
+    def _write(self) -> None:
+        # Class names and annotation types are stored once and referenced by position
+        class_ids: Dict[str, int] = {}
+        type_ids: Dict[str, int] = {}
+        files = {}
+        for path, entry in self.entries.items():
+            annotations = (
+                [
+                    (
+                        class_ids.setdefault(class_name, len(class_ids)),
+                        type_ids.setdefault(annotation_type, len(type_ids)),
+                    )
+                    for class_name, annotation_type in entry.annotations
+                ]
+                if entry.annotations is not None
+                else None
+            )
+            files[path] = (entry.mtime, entry.size, annotations, entry.density)
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(
+                json.dumps(
+                    {
+                        "version": INDEX_VERSION,
+                        "class_names": list(class_ids),
+                        "annotation_types": list(type_ids),
+                        "files": files,
+                    }
+                )
+            )
+            tmp_path.replace(self.path)
+        except OSError:
+            # The index is only an optimisation, it is rebuilt when it can't be persisted
+            pass
@@ -22,10 +22,10 @@ from typing import (
 import orjson as json
 from rich.console import Console
 
+from darwin import instrumentation
 from darwin.dataset.download_manager import download_all_images_from_annotations
 from darwin.dataset.identifier import DatasetIdentifier
 from darwin.dataset.release import Release
-from darwin.dataset.split_manager import split_dataset
 from darwin.dataset.upload_manager import (
     FileUploadCallback,
     LocalFile,
@@ -161,8 +161,9 @@ class RemoteDataset(ABC):
             if not darwin_annotation or not darwin_annotation.is_video:
                 continue
 
-            frame_annotations = split_video_annotation(darwin_annotation)
-            for frame_annotation in frame_annotations:
+            video_frame_annotations_path = annotations_path / annotation_file.stem
+            video_frame_annotations_path.mkdir(exist_ok=True, parents=True)
+            for frame_annotation in split_video_annotation(darwin_annotation):
                 annotation = self._build_image_annotation(frame_annotation, self.team)
 
                 # When splitting into frames, we need to read each frame individually
@@ -179,8 +180,6 @@ class RemoteDataset(ABC):
                     annotation["item"]["path"] += item_name
                 else:
                     annotation["item"]["path"] += "/" + item_name
-                video_frame_annotations_path = annotations_path / annotation_file.stem
-                video_frame_annotations_path.mkdir(exist_ok=True, parents=True)
 
                 stem = Path(frame_annotation.filename).stem
                 output_path = video_frame_annotations_path / f"{stem}.json"
@@ -194,6 +193,7 @@ class RemoteDataset(ABC):
         # Update class list, which is used when loading local annotations in a dataset
         make_class_lists(release_dir)
 
+    @instrumentation.span("pull")
     def pull(
         self,
         *,
@@ -302,8 +302,11 @@ class RemoteDataset(ABC):
         with tempfile.TemporaryDirectory() as tmp_dir_str:
             tmp_dir = Path(tmp_dir_str)
             # Download the release from Darwin
-            zip_file_path = release.download_zip(tmp_dir / "dataset.zip")
-            with zipfile.ZipFile(zip_file_path) as z:
+            with instrumentation.span("pull.download_release", release=release.name):
+                zip_file_path = release.download_zip(tmp_dir / "dataset.zip")
+            with instrumentation.span("pull.extract_annotations"), zipfile.ZipFile(
+                zip_file_path
+            ) as z:
                 # Extract annotations
                 z.extractall(tmp_dir)
                 # If a filtering function is provided, apply it
@@ -366,7 +369,8 @@ class RemoteDataset(ABC):
                     shutil.move(str(annotation_path), str(destination_name))
 
         # Extract the list of classes and create the text files
-        make_class_lists(release_dir)
+        with instrumentation.span("pull.make_class_lists"):
+            make_class_lists(release_dir)
 
         if release.latest and is_unix_like_os():
             try:
@@ -386,17 +390,18 @@ class RemoteDataset(ABC):
             return None, 0
 
         # Create the generator with the download instructions
-        progress, count = download_all_images_from_annotations(
-            client=self.client,
-            annotations_path=annotations_dir,
-            images_path=self.local_images_path,
-            force_replace=force_replace,
-            remove_extra=remove_extra,
-            use_folders=use_folders,
-            video_frames=video_frames,
-            force_slots=force_slots,
-            ignore_slots=ignore_slots,
-        )
+        with instrumentation.span("pull.plan_downloads"):
+            progress, count = download_all_images_from_annotations(
+                client=self.client,
+                annotations_path=annotations_dir,
+                images_path=self.local_images_path,
+                force_replace=force_replace,
+                remove_extra=remove_extra,
+                use_folders=use_folders,
+                video_frames=video_frames,
+                force_slots=force_slots,
+                ignore_slots=ignore_slots,
+            )
         if count == 0:
             return None, count
 
@@ -410,12 +415,15 @@ class RemoteDataset(ABC):
             console.print(
                 f"Going to download {str(count)} files to {self.local_images_path.as_posix()} ."
             )
-            successes, errors = exhaust_generator(
-                progress=progress(),
-                count=count,
-                multi_processed=multi_processed,
-                worker_count=max_workers,
-            )
+            with instrumentation.span(
+                "pull.download_files", count=count, multi_processed=multi_processed
+            ):
+                successes, errors = exhaust_generator(
+                    progress=progress(),
+                    count=count,
+                    multi_processed=multi_processed,
+                    worker_count=max_workers,
+                )
             if errors:
                 self.console.print(
                     f"Encountered errors downloading {len(errors)} files"
@@ -448,6 +456,7 @@ class RemoteDataset(ABC):
         self,
         filters: Optional[Dict[str, Union[str, List[str]]]] = None,
         sort: Optional[Union[str, ItemSorter]] = None,
+        max_workers: int = 1,
     ) -> Iterator[DatasetItem]:
         """
         Fetch and lists all files on the remote dataset.
@@ -459,6 +468,8 @@ class RemoteDataset(ABC):
         sort : Optional[Union[str, ItemSorter]], default: None
             A sorting direction. It can be a string with the values 'asc', 'ascending', 'desc',
             'descending' or an ``ItemSorter`` instance.
+        max_workers : int, default: 1
+            The maximum number of filter partitions listed concurrently.
 
         Yields
         -------
@@ -814,6 +825,8 @@ class RemoteDataset(ABC):
         NotFound
             If this ``RemoteDataset`` is not found locally.
         """
+        from darwin.dataset.split_manager import split_dataset
+
         if not self.local_path.exists():
             raise NotFound(
                 "Local dataset not found: the split is performed on the local copy of the dataset. \
@@ -949,7 +962,9 @@ class RemoteDataset(ABC):
         """
 
     @abstractmethod
-    def import_annotation(self, item_id: ItemId, payload: Dict[str, Any]) -> None:
+    def import_annotation(
+        self, item_id: ItemId, payload: Union[Dict[str, Any], bytes]
+    ) -> None:
         """
         Imports the annotation for the item with the given id.
 
@@ -957,9 +972,9 @@ class RemoteDataset(ABC):
         ----------
         item_id: ItemId
             Identifier of the Item that we are import the annotation to.
-        payload: Dict[str, Any]
-            A dictionary with the annotation to import. The default format is:
-            `{"annotations": serialized_annotations, "overwrite": "false"}`
+        payload: Union[Dict[str, Any], bytes]
+            A dictionary with the annotation to import, or its JSON serialization. The default
+            format is: `{"annotations": serialized_annotations, "overwrite": "false"}`
         """
         ...
 
@@ -1,24 +1,41 @@
 import json
+import os
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
     Iterable,
     Iterator,
     List,
     Optional,
     Sequence,
+    Sized,
     Tuple,
     Union,
 )
 from uuid import uuid4
 
+import requests
 from pydantic import ValidationError
+from tenacity import (
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from darwin import instrumentation
 from darwin.dataset import RemoteDataset
+from darwin.dataset.item_mirror import ITEM_MIRROR_ENABLED, ItemMirror
+from darwin.dataset.registration_journal import RegistrationJournal
 from darwin.dataset.release import Release
-from darwin.dataset.storage_uploader import upload_artifacts
+from darwin.dataset.storage_uploader import upload_artifacts, upload_source_file
 from darwin.dataset.upload_manager import (
     FileUploadCallback,
     ItemMergeMode,
@@ -57,10 +74,26 @@ from darwin.utils import (
     find_files,
     urljoin,
 )
+from darwin.utils.concurrency import interleave, prefetch_pages
 
 if TYPE_CHECKING:
     from darwin.client import Client
 
+# Filters whose values select disjoint sets of items, listed in parallel by fetch_remote_files
+PARTITIONABLE_FILTERS = ["statuses", "item_paths"]
+
+# Items from external storage registered in a single request, and requests sent at once
+REGISTRATION_CHUNK_SIZE = 10
+REGISTRATION_MAX_WORKERS = 4
+REGISTRATION_MAX_ATTEMPTS = 5
+REGISTRATION_RETRY_WAIT = 1.0
+
+
+def _is_connection_error(exception: BaseException) -> bool:
+    # Rate limiting and server errors are already retried by the client. Read
+    # timeouts aren't retried either, as the request may have reached the server.
+    return isinstance(exception, (requests.ConnectionError, requests.ConnectTimeout))
+
 
 class RemoteDatasetV2(RemoteDataset):
     """
@@ -105,6 +138,9 @@ class RemoteDatasetV2(RemoteDataset):
         Dataset size (number of items).
     progress : float, default: 0
         How much of the dataset has been annotated 0.0 to 1.0 (1.0 == 100%).
+    item_mirror : Optional[ItemMirror]
+        Local copy of the items used to answer ``fetch_remote_files``, only set when the
+        ``DARWIN_ITEM_MIRROR`` environment variable is enabled.
     """
 
     def __init__(
@@ -128,6 +164,9 @@ class RemoteDatasetV2(RemoteDataset):
             progress=progress,
             version=2,
         )
+        self.item_mirror: Optional[ItemMirror] = (
+            ItemMirror(self) if ITEM_MIRROR_ENABLED else None
+        )
 
     def get_releases(self, include_unavailable: bool = False) -> List["Release"]:
         """
@@ -165,6 +204,7 @@ class RemoteDatasetV2(RemoteDataset):
             reverse=True,
         )
 
+    @instrumentation.span("push")
     def push(
         self,
         files_to_upload: Optional[Sequence[Union[PathLike, LocalFile]]],
@@ -292,14 +332,16 @@ class RemoteDatasetV2(RemoteDataset):
                 self, local_files, handle_as_slices=handle_as_slices
             )
         if blocking:
-            handler.upload(
-                max_workers=max_workers,
-                multi_threaded=multi_threaded,
-                progress_callback=progress_callback,
-                file_upload_callback=file_upload_callback,
-            )
+            with instrumentation.span("push.upload_files", count=handler.pending_count):
+                handler.upload(
+                    max_workers=max_workers,
+                    multi_threaded=multi_threaded,
+                    progress_callback=progress_callback,
+                    file_upload_callback=file_upload_callback,
+                )
         else:
             handler.prepare_upload()
+        self._invalidate_item_mirror()
 
         return handler
 
@@ -307,10 +349,19 @@ class RemoteDatasetV2(RemoteDataset):
         self,
         filters: Optional[Dict[str, Union[str, List[str]]]] = None,
         sort: Optional[Union[str, ItemSorter]] = None,
+        max_workers: int = 1,
     ) -> Iterator[DatasetItem]:
         """
         Fetch and lists all files on the remote dataset.
 
+        The next page of results is requested while the current one is being consumed. When
+        ``max_workers`` is greater than 1, no ``sort`` is given and the ``statuses`` or
+        ``item_paths`` filters have several values, each value is listed in parallel as its own
+        partition. Partitioned results are yielded as soon as they arrive, in no particular order.
+
+        When the dataset has an ``item_mirror``, the query is answered from it instead, after
+        bringing it up to date unless it was synced recently.
+
         Parameters
         ----------
         filters : Optional[Dict[str, Union[str, List[str]]]], default: None
@@ -318,6 +369,8 @@ class RemoteDatasetV2(RemoteDataset):
         sort : Optional[Union[str, ItemSorter]], default: None
             A sorting direction. It can be a string with the values 'asc', 'ascending', 'desc',
             'descending' or an ``ItemSorter`` instance.
+        max_workers : int, default: 1
+            The maximum number of partitions listed concurrently.
 
         Yields
         -------
@@ -347,24 +400,77 @@ class RemoteDatasetV2(RemoteDataset):
                     else:
                         post_filters.append((list_type, str(filters[list_type])))
 
+        if self.item_mirror is not None:
+            yield from self.item_mirror.query(filters, sort)
+            return
+
         if sort:
             item_sorter = ItemSorter.parse(sort)
             post_sort[f"sort[{item_sorter.field}]"] = item_sorter.direction.value
-        cursor = {"page[size]": 500, "include_workflow_data": "true"}
-        while True:
+
+        partition_key: Optional[str] = next(
+            (
+                f"{list_type}[]"
+                for list_type in PARTITIONABLE_FILTERS
+                if filters
+                and isinstance(filters.get(list_type), list)
+                and len(filters[list_type]) > 1
+            ),
+            None,
+        )
+        if sort or max_workers <= 1 or partition_key is None:
+            yield from self._fetch_remote_files_partition(post_filters, post_sort)
+            return
+
+        shared_filters = [f for f in post_filters if f[0] != partition_key]
+        partitions = [
+            partial(
+                self._fetch_remote_files_partition,
+                shared_filters + [partition_filter],
+                post_sort,
+            )
+            for partition_filter in post_filters
+            if partition_filter[0] == partition_key
+        ]
+        seen_ids = set()
+        for item in interleave(partitions, max_workers=max_workers):
+            # Folder partitions may overlap, make sure each item is only yielded once
+            if item.id in seen_ids:
+                continue
+            seen_ids.add(item.id)
+            yield item
+
+    def _fetch_remote_files_partition(
+        self, post_filters: List[Tuple[str, Any]], post_sort: Dict[str, str]
+    ) -> Iterator[DatasetItem]:
+        for item in self._fetch_remote_items_raw(post_filters, post_sort):
+            yield DatasetItem.parse(item, dataset_slug=self.slug)
+
+    def _fetch_remote_items_raw(
+        self, post_filters: List[Tuple[str, Any]], post_sort: Dict[str, str]
+    ) -> Iterator[Dict[str, Any]]:
+        def fetch_page(
+            cursor: Optional[Dict[str, Any]],
+        ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+            assert cursor is not None
             query = post_filters + list(post_sort.items()) + list(cursor.items())
             response = self.client.api_v2.fetch_items(
                 self.dataset_id, query, team_slug=self.team
             )
-            yield from [
-                DatasetItem.parse(item, dataset_slug=self.slug)
-                for item in response["items"]
-            ]
+            next_page = response["page"]["next"]
+            return response["items"], (
+                {**cursor, "page[from]": next_page} if next_page else None
+            )
 
-            if response["page"]["next"]:
-                cursor["page[from]"] = response["page"]["next"]
-            else:
-                return
+        cursor = {"page[size]": 500, "include_workflow_data": "true"}
+        for items in prefetch_pages(fetch_page, cursor):
+            yield from items
+
+    def _invalidate_item_mirror(
+        self, item_ids: Optional[List[str]] = None, archived: Optional[bool] = None
+    ) -> None:
+        if self.item_mirror is not None:
+            self.item_mirror.invalidate(item_ids, archived)
 
     def archive(self, items: Iterable[DatasetItem]) -> None:
         """
@@ -375,13 +481,15 @@ class RemoteDatasetV2(RemoteDataset):
         items : Iterable[DatasetItem]
             The ``DatasetItem``\\s to be archived.
         """
+        item_ids = [item.id for item in items]
         payload: Dict[str, Any] = {
             "filters": {
-                "item_ids": [item.id for item in items],
+                "item_ids": item_ids,
                 "dataset_ids": [self.dataset_id],
             }
         }
         self.client.api_v2.archive_items(payload, team_slug=self.team)
+        self._invalidate_item_mirror(item_ids, archived=True)
 
     def restore_archived(self, items: Iterable[DatasetItem]) -> None:
         """
@@ -392,13 +500,15 @@ class RemoteDatasetV2(RemoteDataset):
         items : Iterable[DatasetItem]
             The ``DatasetItem``\\s to be restored.
         """
+        item_ids = [item.id for item in items]
         payload: Dict[str, Any] = {
             "filters": {
-                "item_ids": [item.id for item in items],
+                "item_ids": item_ids,
                 "dataset_ids": [self.dataset_id],
             }
         }
         self.client.api_v2.restore_archived_items(payload, team_slug=self.team)
+        self._invalidate_item_mirror(item_ids, archived=False)
 
     def move_to_new(self, items: Iterable[DatasetItem]) -> None:
         """
@@ -420,6 +530,7 @@ class RemoteDatasetV2(RemoteDataset):
             workflow_id,
             team_slug=self.team,
         )
+        self._invalidate_item_mirror()
 
     def complete(self, items: Iterable[DatasetItem]) -> None:
         """
@@ -440,6 +551,7 @@ class RemoteDatasetV2(RemoteDataset):
             workflow_id,
             team_slug=self.team,
         )
+        self._invalidate_item_mirror()
 
     def delete_items(self, items: Iterable[DatasetItem]) -> None:
         """
@@ -450,11 +562,14 @@ class RemoteDatasetV2(RemoteDataset):
         items : Iterable[DatasetItem]
             The ``DatasetItem``\\s to be deleted.
         """
+        item_ids = [item.id for item in items]
         self.client.api_v2.delete_items(
-            {"dataset_ids": [self.dataset_id], "item_ids": [item.id for item in items]},
+            {"dataset_ids": [self.dataset_id], "item_ids": item_ids},
             team_slug=self.team,
         )
+        self._invalidate_item_mirror(item_ids)
 
+    @instrumentation.span("export")
     def export(
         self,
         name: str,
@@ -551,7 +666,9 @@ class RemoteDatasetV2(RemoteDataset):
             item.id, text, x, y, w, h, slot_name, team_slug=self.team
         )
 
-    def import_annotation(self, item_id: ItemId, payload: Dict[str, Any]) -> None:
+    def import_annotation(
+        self, item_id: ItemId, payload: Union[Dict[str, Any], bytes]
+    ) -> None:
         """
         Imports the annotation for the item with the given id.
 
@@ -559,9 +676,9 @@ class RemoteDatasetV2(RemoteDataset):
         ----------
         item_id: ItemId
             Identifier of the Item that we are import the annotation to.
-        payload: Dict[str, Any]
-            A dictionary with the annotation to import. The default format is:
-            `{"annotations": serialized_annotations, "overwrite": "false"}`
+        payload: Union[Dict[str, Any], bytes]
+            A dictionary with the annotation to import, or its JSON serialization. The default
+            format is: `{"annotations": serialized_annotations, "overwrite": "false"}`
         """
 
         self.client.api_v2.import_annotation(
@@ -594,6 +711,8 @@ class RemoteDatasetV2(RemoteDataset):
         multi_planar_view: bool = False,
         preserve_folders: bool = False,
         multi_slotted: bool = False,
+        chunk_size: int = REGISTRATION_CHUNK_SIZE,
+        max_workers: int = REGISTRATION_MAX_WORKERS,
     ) -> Dict[str, List[str]]:
         """
         Register files from external storage in a Darwin dataset.
@@ -614,11 +733,15 @@ class RemoteDatasetV2(RemoteDataset):
             Specify whether or not to preserve folder paths when uploading.
         multi_slotted : bool, default: False
             Specify whether the items are multi-slotted or not.
+        chunk_size : int, default: REGISTRATION_CHUNK_SIZE
+            Number of items registered in a single request.
+        max_workers : int, default: REGISTRATION_MAX_WORKERS
+            Number of requests sent at the same time.
 
         Returns
         -------
         Dict[str, List[str]]
-            A dictionary with the list of registered files.
+            A dictionary with the list of registered, blocked and failed files.
 
         Raises
         ------
@@ -641,7 +764,10 @@ class RemoteDatasetV2(RemoteDataset):
                 fps,
                 multi_planar_view,
                 preserve_folders,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
             )
+            self._invalidate_item_mirror()
             return results
         else:
             try:
@@ -657,7 +783,10 @@ class RemoteDatasetV2(RemoteDataset):
                 fps,
                 multi_planar_view,
                 preserve_folders,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
             )
+            self._invalidate_item_mirror()
             return results
 
     def register_locally_processed(
@@ -671,6 +800,8 @@ class RemoteDatasetV2(RemoteDataset):
         multi_slotted: bool = False,
         extract_preview_frames: bool = True,
         primary_frames_quality: int = 1,
+        max_workers: Optional[int] = None,
+        resume_file: Optional[PathLike] = None,
     ) -> Dict[str, List[str]]:
         """
         Register locally preprocessed files to Darwin dataset using external storage.
@@ -706,6 +837,12 @@ class RemoteDatasetV2(RemoteDataset):
             Quality setting for primary display frames.
             1 (default) means use PNG format (lossless).
             2-31 means use JPEG with that quality (2=best, 31=worst).
+        max_workers : Optional[int], default: None
+            Maximum number of items processed at the same time. Defaults to a quarter
+            of the CPUs.
+        resume_file : Optional[PathLike], default: None
+            File where the progress of the registration is recorded, to resume it if it
+            is interrupted.
 
         Returns
         -------
@@ -778,6 +915,8 @@ class RemoteDatasetV2(RemoteDataset):
                 repair=repair,
                 extract_preview_frames=extract_preview_frames,
                 primary_frames_quality=primary_frames_quality,
+                max_workers=max_workers,
+                resume_file=resume_file,
             )
         else:
             if not isinstance(files, list):
@@ -795,6 +934,8 @@ class RemoteDatasetV2(RemoteDataset):
                 repair=repair,
                 extract_preview_frames=extract_preview_frames,
                 primary_frames_quality=primary_frames_quality,
+                max_workers=max_workers,
+                resume_file=resume_file,
             )
 
         return results
@@ -833,10 +974,12 @@ class RemoteDatasetV2(RemoteDataset):
     def register_single_slotted(
         self,
         object_store: ObjectStore,
-        storage_keys: List[str],
+        storage_keys: Iterable[str],
         fps: Optional[Union[str, float]] = None,
         multi_planar_view: bool = False,
         preserve_folders: bool = False,
+        chunk_size: int = REGISTRATION_CHUNK_SIZE,
+        max_workers: int = REGISTRATION_MAX_WORKERS,
     ) -> Dict[str, List[str]]:
         """
         Register files in the dataset in a single slot.
@@ -845,27 +988,34 @@ class RemoteDatasetV2(RemoteDataset):
         ----------
         object_store : ObjectStore
             Object store to use for the registration.
-        storage_keys : List[str]
-            List of storage keys to register.
+        storage_keys : Iterable[str]
+            Storage keys to register. They can be produced lazily, e.g. by a generator or
+            by ``iter_storage_keys`` from a file listing, in which case items are
+            registered while the keys are still being read.
         fps : Optional[str], default: None
             When the uploading file is a video, specify its framerate.
         multi_planar_view : bool, default: False
             Uses multiplanar view when uploading files.
         preserve_folders : bool, default: False
             Specify whether or not to preserve folder paths when uploading
+        chunk_size : int, default: REGISTRATION_CHUNK_SIZE
+            Number of items registered in a single request.
+        max_workers : int, default: REGISTRATION_MAX_WORKERS
+            Number of requests sent at the same time.
 
         Returns
         -------
         Dict[str, List[str]]
-            A dictionary with the list of registered files.
+            A dictionary with the list of registered, blocked and failed files.
 
         Raises
         ------
         TypeError
-            If the file type of any storage keyis not supported.
+            If the file type of any storage keyis not supported. When ``storage_keys``
+            isn't a sequence, the items before it may already be registered.
         """
-        items = []
-        for storage_key in storage_keys:
+
+        def build_item(storage_key: str) -> Dict[str, Any]:
             file_type = get_external_file_type(storage_key)
             if not file_type:
                 raise TypeError(
@@ -883,48 +1033,23 @@ class RemoteDatasetV2(RemoteDataset):
                 item["fps"] = fps
             if multi_planar_view and file_type == "dicom":
                 item["extract_views"] = "true"
-            items.append(item)
+            return item
 
-        # Do not register more than 10 items in a single request
-        chunk_size = 10
-        chunked_items = chunk_items(items, chunk_size)
-        print(f"Registering {len(items)} items in chunks of {chunk_size} items...")
-        results = {
-            "registered": [],
-            "blocked": [],
-        }
-
-        for chunk in chunked_items:
-            payload = {
-                "items": chunk,
-                "dataset_slug": self.slug,
-                "storage_slug": object_store.name,
-            }
-            print(f"Registering {len(chunk)} items...")
-            response = self.client.api_v2.register_items(payload, team_slug=self.team)
-            for item in json.loads(response.text)["items"]:
-                item_info = f"Item {item['name']} registered with item ID {item['id']}"
-                results["registered"].append(item_info)
-            for item in json.loads(response.text)["blocked_items"]:
-                item_info = f"Item {item['name']} was blocked for the reason: {item['slots'][0]['reason']}"
-                results["blocked"].append(item_info)
-        print(
-            f"{len(results['registered'])} of {len(storage_keys)} items registered successfully"
-        )
-        if results["blocked"]:
-            print("The following items were blocked:")
-            for item in results["blocked"]:
-                print(f"  - {item}")
-        print(f"Reistration complete. Check your items in the dataset: {self.slug}")
-        return results
+        items: Iterable[Dict[str, Any]] = map(build_item, storage_keys)
+        # Keys that are all known up front are validated before anything is registered
+        if isinstance(storage_keys, Sequence):
+            items = list(items)
+        return self._register_in_chunks(items, object_store, chunk_size, max_workers)
 
     def register_multi_slotted(
         self,
         object_store: ObjectStore,
-        storage_keys: Dict[str, List[str]],
+        storage_keys: Union[Dict[str, List[str]], Iterable[Tuple[str, List[str]]]],
         fps: Optional[Union[str, float]] = None,
         multi_planar_view: bool = False,
         preserve_folders: bool = False,
+        chunk_size: int = REGISTRATION_CHUNK_SIZE,
+        max_workers: int = REGISTRATION_MAX_WORKERS,
     ) -> Dict[str, List[str]]:
         """
         Register files in the dataset in multiple slots.
@@ -933,29 +1058,35 @@ class RemoteDatasetV2(RemoteDataset):
         ----------
         object_store : ObjectStore
             Object store to use for the registration.
-        storage_keys : Dict[str, List[str]
+        storage_keys : Dict[str, List[str]] | Iterable[Tuple[str, List[str]]]
             Storage keys to register. The keys are the item names and the values are lists of storage keys.
+            They can also be given as ``(item name, storage keys)`` pairs produced lazily,
+            in which case items are registered while the pairs are still being produced.
         fps : Optional[str], default: None
             When the uploading file is a video, specify its framerate.
         multi_planar_view : bool, default: False
             Uses multiplanar view when uploading files.
         preserve_folders : bool, default: False
             Specify whether or not to preserve folder paths when uploading
+        chunk_size : int, default: REGISTRATION_CHUNK_SIZE
+            Number of items registered in a single request.
+        max_workers : int, default: REGISTRATION_MAX_WORKERS
+            Number of requests sent at the same time.
 
         Returns
         -------
         Dict[str, List[str]]
-            A dictionary with the list of registered files.
+            A dictionary with the list of registered, blocked and failed files.
 
         Raises
         ------
         TypeError
             If the file type of any storage key is not supported.
         """
-        items = []
-        for item in storage_keys:
+
+        def build_item(item: str, item_storage_keys: List[str]) -> Dict[str, Any]:
             slots = []
-            for storage_key in storage_keys[item]:
+            for storage_key in item_storage_keys:
                 file_name = get_external_file_name(storage_key)
                 file_type = get_external_file_type(storage_key)
                 if not file_type:
@@ -973,47 +1104,136 @@ class RemoteDatasetV2(RemoteDataset):
                 if multi_planar_view and file_type == "dicom":
                     slot["extract_views"] = "true"
                 slots.append(slot)
-            items.append(
-                {
-                    "slots": slots,
-                    "name": item,
-                    "path": parse_external_file_path(
-                        storage_keys[item][0], preserve_folders
-                    ),
-                }
-            )
+            return {
+                "slots": slots,
+                "name": item,
+                "path": parse_external_file_path(
+                    item_storage_keys[0], preserve_folders
+                ),
+            }
 
-        # Do not register more than 10 items in a single request
-        chunk_size = 10
-        chunked_items = chunk_items(items, chunk_size)
-        print(f"Registering {len(items)} items in chunks of {chunk_size} items...")
-        results = {
+        items: Iterable[Dict[str, Any]]
+        if isinstance(storage_keys, dict):
+            items = [build_item(*pair) for pair in storage_keys.items()]
+        else:
+            items = (build_item(*pair) for pair in storage_keys)
+        return self._register_in_chunks(items, object_store, chunk_size, max_workers)
+
+    def _register_in_chunks(
+        self,
+        items: Iterable[Dict[str, Any]],
+        object_store: ObjectStore,
+        chunk_size: int,
+        max_workers: int,
+    ) -> Dict[str, List[str]]:
+        """
+        Registers items from external storage, in chunks submitted concurrently as soon as
+        enough items are available.
+
+        A chunk whose request fails because of a connection error or a timeout is sent
+        again with exponential backoff, rate limiting and server errors being retried by
+        the client. If it still fails, the other chunks are registered anyway and its
+        items are reported as failed.
+
+        Parameters
+        ----------
+        items : Iterable[Dict[str, Any]]
+            Payload of the items to register, consumed lazily.
+        object_store : ObjectStore
+            Object store to use for the registration.
+        chunk_size : int
+            Number of items registered in a single request.
+        max_workers : int
+            Number of requests sent at the same time.
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            A dictionary with the list of registered, blocked and failed files.
+
+        Raises
+        ------
+        Exception
+            The error of the first chunk if every chunk failed.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        max_workers = max(1, max_workers)
+        if isinstance(items, Sized):
+            print(f"Registering {len(items)} items in chunks of {chunk_size} items...")
+        else:
+            print(f"Registering items in chunks of {chunk_size} items...")
+        results: Dict[str, List[str]] = {
             "registered": [],
             "blocked": [],
+            "failed": [],
         }
+        errors: List[Exception] = []
+        item_count = 0
 
-        for chunk in chunked_items:
+        def send(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
             payload = {
                 "items": chunk,
                 "dataset_slug": self.slug,
                 "storage_slug": object_store.name,
             }
             print(f"Registering {len(chunk)} items...")
-            response = self.client.api_v2.register_items(payload, team_slug=self.team)
-            for item in json.loads(response.text)["items"]:
+            for attempt in Retrying(
+                retry=retry_if_exception(_is_connection_error),
+                stop=stop_after_attempt(REGISTRATION_MAX_ATTEMPTS),
+                wait=wait_exponential_jitter(
+                    initial=REGISTRATION_RETRY_WAIT, max=60 * REGISTRATION_RETRY_WAIT
+                ),
+                reraise=True,
+            ):
+                with attempt:
+                    response = self.client.api_v2.register_items(
+                        payload, team_slug=self.team
+                    )
+            return response.json()
+
+        def collect(chunk: List[Dict[str, Any]], future: Future) -> None:
+            try:
+                body = future.result()
+            except Exception as e:
+                errors.append(e)
+                for item in chunk:
+                    results["failed"].append(
+                        f"Item {item['name']} failed to register: {e}"
+                    )
+                return
+            for item in body["items"]:
                 item_info = f"Item {item['name']} registered with item ID {item['id']}"
                 results["registered"].append(item_info)
-            for item in json.loads(response.text)["blocked_items"]:
+            for item in body["blocked_items"]:
                 item_info = f"Item {item['name']} was blocked for the reason: {item['slots'][0]['reason']}"
                 results["blocked"].append(item_info)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Bound the number of pending chunks so that items are not read far ahead
+            pending: Deque[Tuple[List[Dict[str, Any]], Future]] = deque()
+            for chunk in chunk_items(items, chunk_size):
+                item_count += len(chunk)
+                pending.append((chunk, executor.submit(send, chunk)))
+                if len(pending) >= 2 * max_workers:
+                    collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+
+        if errors and not results["registered"] and not results["blocked"]:
+            raise errors[0]
         print(
-            f"{len(results['registered'])} of {len(storage_keys)} items registered successfully"
+            f"{len(results['registered'])} of {item_count} items registered successfully"
         )
         if results["blocked"]:
             print("The following items were blocked:")
             for item in results["blocked"]:
                 print(f"  - {item}")
-        print(f"Reistration complete. Check your items in the dataset: {self.slug}")
+        if results["failed"]:
+            print("The following items failed to register:")
+            for item in results["failed"]:
+                print(f"  - {item}")
+        print(f"Registration complete. Check your items in the dataset: {self.slug}")
         return results
 
     def register_single_slotted_readonly_videos(
@@ -1026,11 +1246,16 @@ class RemoteDatasetV2(RemoteDataset):
         repair: bool = False,
         extract_preview_frames: bool = True,
         primary_frames_quality: int = 1,
+        max_workers: Optional[int] = None,
+        resume_file: Optional[PathLike] = None,
     ) -> Dict[str, List[str]]:
         """
         Register videos as single-slotted items from readonly storage.
         Creates one item per video file.
 
+        Videos are extracted and uploaded concurrently, and items are registered in
+        batches as soon as they are uploaded.
+
         Parameters
         ----------
         object_store : ObjectStore
@@ -1053,6 +1278,13 @@ class RemoteDatasetV2(RemoteDataset):
             Quality setting for primary display frames.
             1 means use PNG format (lossless).
             2-31 means use JPEG with that quality (2=best, 31=worst).
+        max_workers : Optional[int], default: None
+            Maximum number of videos extracted at the same time. Defaults to a quarter
+            of the CPUs, as ffmpeg already uses several threads per video.
+        resume_file : Optional[PathLike], default: None
+            File where the progress of the registration is recorded. When the same file
+            is given again after an interruption, the videos that were already uploaded
+            or registered are skipped.
 
         Returns
         -------
@@ -1087,22 +1319,20 @@ class RemoteDatasetV2(RemoteDataset):
             if not video_path.exists():
                 raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        items_to_register = []
-
-        # Process each video as a separate item
+        # Process each video as a separate item, keyed by its path so that it can be
+        # found in the journal when the registration is resumed
+        jobs = {}
+        occurrences: Dict[str, int] = {}
         for video_path in video_paths:
-            # Generate new UUIDs for each video
-            item_uuid = str(uuid4())
-            slot_uuid = str(uuid4())
-            storage_key_prefix = self._build_storage_key_prefix(
-                object_store, item_uuid, slot_uuid
-            )
-
-            # Extract, upload, and get metadata
-            slot_metadata = self._process_video_file_for_readonly(
+            key = str(video_path.absolute())
+            occurrences[key] = occurrences.get(key, 0) + 1
+            if occurrences[key] > 1:
+                key = f"{key}#{occurrences[key] - 1}"
+            jobs[key] = partial(
+                self._build_single_slotted_readonly_item,
                 video_path=video_path,
                 object_store=object_store,
-                storage_key_prefix=storage_key_prefix,
+                path=path,
                 fps=fps,
                 segment_length=segment_length,
                 repair=repair,
@@ -1110,27 +1340,68 @@ class RemoteDatasetV2(RemoteDataset):
                 primary_frames_quality=primary_frames_quality,
             )
 
-            # Build item payload
-            slot_dict = {
-                "slot_name": video_path.name,
-                "storage_key": f"{storage_key_prefix}/{video_path.name}",
-                "file_name": video_path.name,
-                **slot_metadata,
-            }
+        return self._register_readonly_items_as_completed(
+            jobs=jobs,
+            object_store=object_store,
+            max_workers=max_workers,
+            resume_file=resume_file,
+        )
 
-            item_dict = {
-                "name": video_path.name,
-                "path": path,
-                "slots": [slot_dict],
-            }
-            items_to_register.append(item_dict)
+    def _build_single_slotted_readonly_item(
+        self,
+        video_path: Path,
+        object_store: ObjectStore,
+        path: str,
+        **extraction_options: Any,
+    ) -> Dict:
+        """
+        Extract and upload the artifacts of a video, and build the payload of its item.
 
-        # Submit registration
-        return self._submit_readonly_registration(
-            items_to_register=items_to_register,
+        Parameters
+        ----------
+        video_path : Path
+            Path to video file
+        object_store : ObjectStore
+            Storage configuration
+        path : str
+            Path in dataset where the item will be stored
+        **extraction_options : Any
+            Options passed to ``_process_video_file_for_readonly``
+
+        Returns
+        -------
+        Dict
+            The item payload
+        """
+        # Generate new UUIDs for each video
+        item_uuid = str(uuid4())
+        slot_uuid = str(uuid4())
+        storage_key_prefix = self._build_storage_key_prefix(
+            object_store, item_uuid, slot_uuid
+        )
+
+        # Extract, upload, and get metadata
+        slot_metadata = self._process_video_file_for_readonly(
+            video_path=video_path,
             object_store=object_store,
+            storage_key_prefix=storage_key_prefix,
+            **extraction_options,
         )
 
+        # Build item payload
+        slot_dict = {
+            "slot_name": video_path.name,
+            "storage_key": f"{storage_key_prefix}/{video_path.name}",
+            "file_name": video_path.name,
+            **slot_metadata,
+        }
+
+        return {
+            "name": video_path.name,
+            "path": path,
+            "slots": [slot_dict],
+        }
+
     def register_multi_slotted_readonly_videos(
         self,
         object_store: ObjectStore,
@@ -1141,6 +1412,8 @@ class RemoteDatasetV2(RemoteDataset):
         repair: bool = False,
         extract_preview_frames: bool = True,
         primary_frames_quality: int = 1,
+        max_workers: Optional[int] = None,
+        resume_file: Optional[PathLike] = None,
     ) -> Dict[str, List[str]]:
         """
         Register videos as multi-slotted items from readonly storage.
@@ -1149,6 +1422,9 @@ class RemoteDatasetV2(RemoteDataset):
         multiple times in an item, number suffixes are added (e.g., video.mp4,
         video.mp4_1, video.mp4_2).
 
+        Items are extracted and uploaded concurrently, and registered in batches as
+        soon as they are uploaded.
+
         Parameters
         ----------
         object_store : ObjectStore
@@ -1171,6 +1447,13 @@ class RemoteDatasetV2(RemoteDataset):
             Quality setting for primary display frames.
             1 means use PNG format (lossless).
             2-31 means use JPEG with that quality (2=best, 31=worst).
+        max_workers : Optional[int], default: None
+            Maximum number of items extracted at the same time. Defaults to a quarter
+            of the CPUs, as ffmpeg already uses several threads per video.
+        resume_file : Optional[PathLike], default: None
+            File where the progress of the registration is recorded. When the same file
+            is given again after an interruption, the items that were already uploaded
+            or registered are skipped.
 
         Returns
         -------
@@ -1210,80 +1493,118 @@ class RemoteDatasetV2(RemoteDataset):
                         f"Video file not found for item {item_name}: {video_path}"
                     )
 
-        items_to_register = []
+        jobs = {
+            item_name: partial(
+                self._build_multi_slotted_readonly_item,
+                item_name=item_name,
+                video_paths=video_paths,
+                object_store=object_store,
+                path=path,
+                fps=fps,
+                segment_length=segment_length,
+                repair=repair,
+                extract_preview_frames=extract_preview_frames,
+                primary_frames_quality=primary_frames_quality,
+            )
+            for item_name, video_paths in video_paths_by_item.items()
+        }
 
-        for item_name, video_paths in video_paths_by_item.items():
-            # Build slot name mapping with deduplication suffixes
-            slot_name_counts = {}  # Track filename occurrences
-            slot_info_list = []  # [(video_path, slot_name)]
+        return self._register_readonly_items_as_completed(
+            jobs=jobs,
+            object_store=object_store,
+            max_workers=max_workers,
+            resume_file=resume_file,
+        )
 
-            for video_path in video_paths:
-                base_slot_name = video_path.name
-                if base_slot_name not in slot_name_counts:
-                    slot_name_counts[base_slot_name] = 0
-                    slot_name = base_slot_name
-                else:
-                    slot_name_counts[base_slot_name] += 1
-                    slot_name = f"{base_slot_name}_{slot_name_counts[base_slot_name]}"
+    def _build_multi_slotted_readonly_item(
+        self,
+        item_name: str,
+        video_paths: List[Path],
+        object_store: ObjectStore,
+        path: str,
+        **extraction_options: Any,
+    ) -> Dict:
+        """
+        Extract and upload the artifacts of the videos of an item, and build its payload.
 
-                slot_info_list.append((video_path, slot_name))
+        Parameters
+        ----------
+        item_name : str
+            Name of the item
+        video_paths : List[Path]
+            Path to the video file of each slot
+        object_store : ObjectStore
+            Storage configuration
+        path : str
+            Path in dataset where the item will be stored
+        **extraction_options : Any
+            Options passed to ``_process_video_file_for_readonly``
 
-            # Generate new item_uuid
-            item_uuid = str(uuid4())
+        Returns
+        -------
+        Dict
+            The item payload
+        """
+        # Build slot name mapping with deduplication suffixes
+        slot_name_counts = {}  # Track filename occurrences
+        slot_info_list = []  # [(video_path, slot_name)]
 
-            # Build unique files map with slot UUIDs using absolute path as key
-            unique_files = {}  # {absolute_path: (video_path, slot_uuid)}
-            path_to_metadata = {}  # {absolute_path: metadata}
+        for video_path in video_paths:
+            base_slot_name = video_path.name
+            if base_slot_name not in slot_name_counts:
+                slot_name_counts[base_slot_name] = 0
+                slot_name = base_slot_name
+            else:
+                slot_name_counts[base_slot_name] += 1
+                slot_name = f"{base_slot_name}_{slot_name_counts[base_slot_name]}"
 
-            for video_path, slot_name in slot_info_list:
-                abs_path = str(video_path.absolute())
+            slot_info_list.append((video_path, slot_name))
 
-                if abs_path not in unique_files:
-                    slot_uuid = str(uuid4())
-                    unique_files[abs_path] = (video_path, slot_uuid)
+        # Generate new item_uuid
+        item_uuid = str(uuid4())
 
-            # Process each unique file
-            for abs_path, (video_path, slot_uuid) in unique_files.items():
-                storage_key_prefix = self._build_storage_key_prefix(
-                    object_store, item_uuid, slot_uuid
-                )
-                slot_metadata = self._process_video_file_for_readonly(
-                    video_path=video_path,
-                    object_store=object_store,
-                    storage_key_prefix=storage_key_prefix,
-                    fps=fps,
-                    segment_length=segment_length,
-                    repair=repair,
-                    extract_preview_frames=extract_preview_frames,
-                    primary_frames_quality=primary_frames_quality,
-                )
-                path_to_metadata[abs_path] = slot_metadata
+        # Build unique files map with slot UUIDs using absolute path as key
+        unique_files = {}  # {absolute_path: (video_path, slot_uuid)}
+        path_to_metadata = {}  # {absolute_path: metadata}
 
-            # Build slots for this item
-            slots = []
-            for video_path, slot_name in slot_info_list:
-                abs_path = str(video_path.absolute())
-                _, slot_uuid = unique_files[abs_path]
-                storage_key_prefix = self._build_storage_key_prefix(
-                    object_store, item_uuid, slot_uuid
-                )
+        for video_path, slot_name in slot_info_list:
+            abs_path = str(video_path.absolute())
 
-                slot_dict = {
-                    "slot_name": slot_name,
-                    "storage_key": f"{storage_key_prefix}/{video_path.name}",
-                    "file_name": video_path.name,
-                    **path_to_metadata[abs_path],
-                }
-                slots.append(slot_dict)
+            if abs_path not in unique_files:
+                slot_uuid = str(uuid4())
+                unique_files[abs_path] = (video_path, slot_uuid)
 
-            item_dict = {"name": item_name, "path": path, "slots": slots}
-            items_to_register.append(item_dict)
+        # Process each unique file
+        for abs_path, (video_path, slot_uuid) in unique_files.items():
+            storage_key_prefix = self._build_storage_key_prefix(
+                object_store, item_uuid, slot_uuid
+            )
+            slot_metadata = self._process_video_file_for_readonly(
+                video_path=video_path,
+                object_store=object_store,
+                storage_key_prefix=storage_key_prefix,
+                **extraction_options,
+            )
+            path_to_metadata[abs_path] = slot_metadata
 
-        # Submit registration
-        return self._submit_readonly_registration(
-            items_to_register=items_to_register,
-            object_store=object_store,
-        )
+        # Build slots for this item
+        slots = []
+        for video_path, slot_name in slot_info_list:
+            abs_path = str(video_path.absolute())
+            _, slot_uuid = unique_files[abs_path]
+            storage_key_prefix = self._build_storage_key_prefix(
+                object_store, item_uuid, slot_uuid
+            )
+
+            slot_dict = {
+                "slot_name": slot_name,
+                "storage_key": f"{storage_key_prefix}/{video_path.name}",
+                "file_name": video_path.name,
+                **path_to_metadata[abs_path],
+            }
+            slots.append(slot_dict)
+
+        return {"name": item_name, "path": path, "slots": slots}
 
     def _validate_object_store_provider(self, object_store: ObjectStore) -> None:
         """
@@ -1394,9 +1715,20 @@ class RemoteDatasetV2(RemoteDataset):
         Dict
             Slot metadata from registration payload
         """
-        with tempfile.TemporaryDirectory(prefix="darwin_video_") as tmp_dir:
+        with tempfile.TemporaryDirectory(
+            prefix="darwin_video_"
+        ) as tmp_dir, ThreadPoolExecutor(max_workers=1) as executor:
             artifacts_dir = Path(tmp_dir)
 
+            # The source file doesn't change, it is uploaded while artifacts are extracted
+            print(f"\nUploading {video_path.name}...")
+            source_upload = executor.submit(
+                upload_source_file,
+                object_store=object_store,
+                source_file=str(video_path),
+                storage_key_prefix=storage_key_prefix,
+            )
+
             # Extract artifacts
             print(f"\nExtracting artifacts for {video_path.name}...")
             extract_artifacts(
@@ -1416,9 +1748,10 @@ class RemoteDatasetV2(RemoteDataset):
             upload_artifacts(
                 object_store=object_store,
                 local_artifacts_dir=str(artifacts_dir),
-                source_file=str(video_path),
+                source_file=None,
                 storage_key_prefix=storage_key_prefix,
             )
+            source_upload.result()
 
             # Load metadata before temp directory is cleaned up
             metadata_file = artifacts_dir / "metadata.json"
@@ -1428,59 +1761,85 @@ class RemoteDatasetV2(RemoteDataset):
             registration_payload = metadata["registration_payload"]
             return self._extract_slot_metadata(registration_payload)
 
-    def _submit_readonly_registration(
+    def _register_readonly_items_as_completed(
         self,
-        items_to_register: List[Dict],
+        jobs: Dict[str, Callable[[], Dict]],
         object_store: ObjectStore,
+        max_workers: Optional[int] = None,
+        resume_file: Optional[PathLike] = None,
     ) -> Dict[str, List[str]]:
         """
-        Submit readonly registration to Darwin.
+        Build readonly items concurrently and register them in batches as they complete.
 
         Parameters
         ----------
-        items_to_register : List[Dict]
-            List of item dictionaries to register
+        jobs : Dict[str, Callable[[], Dict]]
+            Function extracting and uploading the files of each item and returning its
+            payload, keyed by a key that identifies the item across runs.
         object_store : ObjectStore
             Storage configuration
+        max_workers : Optional[int], default: None
+            Maximum number of items built at the same time, defaults to a quarter of
+            the CPUs.
+        resume_file : Optional[PathLike], default: None
+            Journal of the progress of the registration, items it records as uploaded
+            or registered are not built again.
 
         Returns
         -------
         Dict[str, List[str]]
             Registration results with registered and blocked items
         """
-        results = {"registered": [], "blocked": []}
-
-        # Register in chunks of 10
+        journal = RegistrationJournal(resume_file)
         chunk_size = 10
-        chunked_items = chunk_items(items_to_register, chunk_size)
-        print(
-            f"Registering {len(items_to_register)} items in chunks of {chunk_size}..."
-        )
-
-        for chunk in chunked_items:
-            payload = {
-                "items": chunk,
-                "dataset_slug": self.slug,
-                "storage_slug": object_store.name,
-            }
-
-            response = self.client.api_v2.register_readonly_items(
-                payload=payload, team_slug=self.team
+        # Items whose files were uploaded by an interrupted run only need to be registered
+        pending = [
+            (key, item) for key, item in journal.pending().items() if key in jobs
+        ]
+        remaining = {
+            key: job
+            for key, job in jobs.items()
+            if key not in journal.items and key not in journal.registered
+        }
+        skipped = sum(key in journal.registered for key in jobs)
+        if skipped or pending:
+            print(
+                f"Resuming registration: {skipped} items already registered, "
+                f"{len(pending)} items already uploaded"
             )
+        print(f"Registering {len(jobs)} items in chunks of {chunk_size}...")
 
-            for item in response.get("items", []):
-                results["registered"].append(
-                    f"Item {item['name']} registered with item ID {item['id']}"
-                )
+        def register(chunk: List[Tuple[str, Dict]]) -> None:
+            results = self._register_readonly_chunk(
+                [item for _, item in chunk], object_store
+            )
+            journal.record_registered([key for key, _ in chunk], results)
+
+        def build(key: str) -> Iterator[Tuple[str, Dict]]:
+            yield key, remaining[key]()
+
+        # ffmpeg already encodes each video with several threads
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) // 4)
+
+        for key, item in interleave(
+            [partial(build, key) for key in remaining], max_workers, buffer_size=1
+        ):
+            journal.record_item(key, item)
+            pending.append((key, item))
+            if len(pending) >= chunk_size:
+                register(pending)
+                pending = []
+        if pending:
+            register(pending)
 
-            for item in response.get("blocked_items", []):
-                slots = item.get("slots", [])
-                reason = slots[0].get("reason", "unknown") if slots else "unknown"
-                results["blocked"].append(f"Item {item['name']} was blocked: {reason}")
+        results = {
+            status: list(messages) for status, messages in journal.results.items()
+        }
 
         # Print results
         print(
-            f"{len(results['registered'])} of {len(items_to_register)} items registered successfully"
+            f"{len(results['registered'])} of {len(jobs)} items registered successfully"
         )
         if results["blocked"]:
             print("The following items were blocked:")
@@ -1489,6 +1848,49 @@ class RemoteDatasetV2(RemoteDataset):
 
         return results
 
+    def _register_readonly_chunk(
+        self,
+        chunk: List[Dict],
+        object_store: ObjectStore,
+    ) -> Dict[str, List[str]]:
+        """
+        Submit the readonly registration of a batch of items to Darwin.
+
+        Parameters
+        ----------
+        chunk : List[Dict]
+            List of item dictionaries to register
+        object_store : ObjectStore
+            Storage configuration
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            Registration results with registered and blocked items
+        """
+        results = {"registered": [], "blocked": []}
+        payload = {
+            "items": chunk,
+            "dataset_slug": self.slug,
+            "storage_slug": object_store.name,
+        }
+
+        response = self.client.api_v2.register_readonly_items(
+            payload=payload, team_slug=self.team
+        )
+
+        for item in response.get("items", []):
+            results["registered"].append(
+                f"Item {item['name']} registered with item ID {item['id']}"
+            )
+
+        for item in response.get("blocked_items", []):
+            slots = item.get("slots", [])
+            reason = slots[0].get("reason", "unknown") if slots else "unknown"
+            results["blocked"].append(f"Item {item['name']} was blocked: {reason}")
+
+        return results
+
     def _extract_slot_metadata(self, registration_payload: Dict) -> Dict:
         """
         Extract slot-specific metadata from registration payload.
@@ -1645,6 +2047,7 @@ class RemoteDatasetV2(RemoteDataset):
         return slot_payload
 
 
+@instrumentation.span("push.find_files")
 def _find_files_to_upload_as_multi_file_items(
     search_files: List[PathLike],
     files_to_exclude: List[PathLike],
@@ -1701,6 +2104,7 @@ def _find_files_to_upload_as_multi_file_items(
     return local_files, multi_file_items
 
 
+@instrumentation.span("push.find_files")
 def _find_files_to_upload_as_single_file_items(
     search_files: List[PathLike],
     files_to_upload: Optional[Sequence[Union[PathLike, LocalFile]]],
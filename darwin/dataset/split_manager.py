@@ -1,3 +1,4 @@
+import heapq
 import math
 from dataclasses import dataclass
 from pathlib import Path
@@ -5,7 +6,8 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 
-from darwin.dataset.utils import extract_classes, get_release_path
+from darwin.dataset.release_index import ReleaseIndex
+from darwin.dataset.utils import get_release_path
 from darwin.datatypes import PathLike
 from darwin.utils import get_annotation_files_from_dir
 
@@ -87,8 +89,6 @@ def split_dataset(
     The dataset is always split randomly, and can be additionally split according to the
     stratified strategy by providing a list of stratified types.
 
-    Requires ``scikit-learn`` to split a dataset.
-
     Parameters
     ----------
     dataset_path : PathLike
@@ -110,20 +110,7 @@ def split_dataset(
     -------
     Path
         Keys are the different splits (random, tags, ...) and values are the relative file names.
-
-    Raises
-    ------
-    ImportError
-        If ``sklearn`` is not installed.
     """
-    # Requirements: scikit-learn
-    try:
-        import sklearn  # noqa
-    except ImportError:
-        raise ImportError(
-            "Darwin requires scikit-learn to split a dataset. Install it using: pip install scikit-learn"
-        ) from None
-
     _validate_split(val_percentage, test_percentage)
 
     # Infer release path
@@ -228,13 +215,14 @@ def _stratified_split(
     if len(stratified_types) == 0:
         return
 
+    index = ReleaseIndex.load(annotation_path)
     for stratified_type in stratified_types:
         if stratified_type == "bounding_box":
             class_annotation_types = [stratified_type, "polygon"]
         else:
-            class_annotation_types = stratified_type
+            class_annotation_types = [stratified_type]
 
-        _, idx_to_classes = extract_classes(annotation_path, class_annotation_types)
+        _, idx_to_classes = index.extract_classes(class_annotation_types)
         if len(idx_to_classes) == 0:
             continue
 
@@ -246,17 +234,15 @@ def _stratified_split(
             test_size=test_size,
         )
 
-        stratified_indices = train_indices + val_indices + test_indices
-        for idx in range(train_size + val_size + test_size):
-            if idx in stratified_indices:
-                continue
-
-            if len(train_indices) < train_size:
-                train_indices.append(idx)
-            elif len(val_indices) < val_size:
-                val_indices.append(idx)
-            else:
-                test_indices.append(idx)
+        # Fill the partitions with the files that don't have any of the classes
+        stratified = np.zeros(train_size + val_size + test_size, dtype=bool)
+        stratified[train_indices + val_indices + test_indices] = True
+        remaining = np.flatnonzero(~stratified).tolist()
+        missing_train = max(0, train_size - len(train_indices))
+        missing_val = max(0, val_size - len(val_indices))
+        train_indices += remaining[:missing_train]
+        val_indices += remaining[missing_train : missing_train + missing_val]
+        test_indices += remaining[missing_train + missing_val :]
 
         _write_to_file(
             annotation_path,
@@ -287,6 +273,13 @@ def _stratify_samples(
 ) -> Tuple[List[int], List[int], List[int]]:
     """Splits the list of indices into train, val and test according to their labels (stratified)
 
+    Uses the iterative stratification algorithm for multi-label data (Sechidis et al., 2011):
+    the class with the fewest unassigned files is processed first, and each of its files is
+    assigned to the partition that most needs that class, so that rare classes are spread
+    across partitions before common ones. Every file is assigned exactly once, which makes
+    the split linear in the number of (file, class) pairs. A partition never receives more
+    files than its size. Ties are broken randomly, the result only depends on ``split_seed``.
+
     Parameters
     ----------
     idx_to_classes: dict
@@ -306,119 +299,75 @@ def _stratify_samples(
     X_train, X_val, X_test : list
         List of indices of the images for each split
     """
-
-    from sklearn.model_selection import train_test_split
-
-    # Expand the list of files with all the classes
-    expanded_list = [(k, c) for k, v in idx_to_classes.items() for c in v]
-    # Stratify
-    file_indices, labels = zip(*expanded_list)
-    file_indices, labels = np.array(file_indices), np.array(labels)
-    # Extract entries whose support set is 1 (it would make sklearn crash) and append the to train later
-    unique_labels, count = np.unique(labels, return_counts=True)
-    single_files = []
-    for label in unique_labels[count == 1]:
-        index = np.where(labels == label)[0][0]
-        single_files.append(file_indices[index])
-        labels = np.delete(labels, index)
-        file_indices = np.delete(file_indices, index)
-    # If file_indices or labels are empty, the following train_test_split will crash (empty train set)
-    if len(file_indices) == 0 or len(labels) == 0:
-        return [], [], []
-
-    dataset_size = train_size + val_size + test_size
-
-    X_train, X_tmp, y_train, y_tmp = _remove_cross_contamination(
-        *train_test_split(
-            np.array(file_indices),
-            np.array(labels),
-            test_size=(val_size + test_size) / dataset_size,
-            random_state=split_seed,
-            stratify=labels,
-        ),
-        val_size + test_size,
+    file_indices = np.array(
+        [k for k, v in sorted(idx_to_classes.items()) if v], dtype=np.int64
     )
-
-    # Append files whose support set is 1 to train
-    X_train = np.concatenate((X_train, np.array(single_files)), axis=0)
-    X_val, X_test, y_val, y_test = _remove_cross_contamination(
-        *train_test_split(
-            X_tmp,
-            y_tmp,
-            test_size=(test_size / (val_size + test_size)),
-            random_state=split_seed,
-            stratify=y_tmp,
-        ),
-        test_size,
+    if len(file_indices) == 0:
+        return [], [], []
+    # Sort the class names so that the result doesn't depend on set iteration order
+    class_names = sorted({c for v in idx_to_classes.values() for c in v})
+    class_ids = {name: i for i, name in enumerate(class_names)}
+    file_classes: List[List[int]] = [
+        sorted(class_ids[c] for c in idx_to_classes[int(k)]) for k in file_indices
+    ]
+
+    rng = np.random.default_rng(split_seed)
+    # Visit the files of each class in random order
+    order = rng.permutation(len(file_indices))
+    pair_files = np.repeat(order, [len(file_classes[f]) for f in order])
+    pair_classes = np.fromiter(
+        (c for f in order for c in file_classes[f]),
+        dtype=np.int64,
+        count=len(pair_files),
     )
+    by_class = np.argsort(pair_classes, kind="stable")
+    class_counts = np.bincount(pair_classes, minlength=len(class_names))
+    class_files = np.split(pair_files[by_class], np.cumsum(class_counts)[:-1])
+
+    sizes = np.array([train_size, val_size, test_size], dtype=np.float64)
+    ratios = sizes / sizes.sum()
+    # Number of files, overall and per class, that each partition still needs
+    desired = ratios * len(file_indices)
+    desired_per_class = np.outer(ratios, class_counts)
+    remaining_per_class = class_counts.copy()
+    # Partitions never receive more files than their size
+    capacity = np.array([train_size, val_size, test_size], dtype=np.int64)
+    tie_breakers = rng.random(len(file_indices))
+    assignment = np.full(len(file_indices), -1, dtype=np.int64)
+
+    heap = [(int(count), c) for c, count in enumerate(class_counts)]
+    heapq.heapify(heap)
+    while heap:
+        count, c = heapq.heappop(heap)
+        if count != remaining_per_class[c]:
+            # Stale entry, files of this class were assigned while processing others
+            if remaining_per_class[c] > 0:
+                heapq.heappush(heap, (int(remaining_per_class[c]), c))
+            continue
+        for f in class_files[c]:
+            if assignment[f] != -1:
+                continue
+            open_partitions = np.flatnonzero(capacity > 0)
+            need = desired_per_class[open_partitions, c]
+            candidates = open_partitions[need == need.max()]
+            if len(candidates) > 1:
+                overall = desired[candidates]
+                candidates = candidates[overall == overall.max()]
+            partition = candidates[int(tie_breakers[f] * len(candidates))]
+            assignment[f] = partition
+            classes = file_classes[f]
+            desired[partition] -= 1
+            capacity[partition] -= 1
+            desired_per_class[partition, classes] -= 1
+            remaining_per_class[classes] -= 1
 
-    # Remove duplicates within the same set
-    # NOTE: doing that earlier (e.g. in _remove_cross_contamination()) would produce mathematical
-    # mistakes in the class balancing between validation and test sets.
     return (
-        list(set(X_train.astype(int))),
-        list(set(X_val.astype(int))),
-        list(set(X_test.astype(int))),
+        file_indices[assignment == 0].tolist(),
+        file_indices[assignment == 1].tolist(),
+        file_indices[assignment == 2].tolist(),
     )
 
 
-def _remove_cross_contamination(
-    X_a: np.ndarray,
-    X_b: np.ndarray,
-    y_a: np.ndarray,
-    y_b: np.ndarray,
-    b_min_size: int,
-) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    """
-    Remove cross contamination present in X_a and X_b by selecting one or the other on a flip coin decision.
-
-    The reason of cross contamination existence is
-    expanded_list = [(k, c) for k, v in idx_to_classes.items() for c in v]
-    in _stratify_samples(). This line creates as many entries for an image as there are lables
-    attached to it. For this reason it can be that the stratification algorithm splits
-    the image in both sets, A and B.
-    This is very bad and this function addressed exactly that issue, removing duplicates from
-    either A or B.
-
-    Parameters
-    ----------
-    X_a : ndarray
-    X_b : ndarray
-        Arrays of elements to remove cross contamination from
-    y_a : ndarray
-    y_b : ndarray
-        Arrays of labels relative to X_a and X_b to be filtered in the same fashion
-    Returns
-    -------
-    X_a, X_b, y_a, y_b : ndarray
-        All input parameters filtered by removing cross contamination across A and B
-    """
-    for a in _unique(X_a):
-        # If a not in X_b, don't remove a from anywhere
-        if a not in X_b:
-            continue
-
-        # Remove a from X_b if it's large enough
-        keep_locations = X_b != a
-        if len(_unique(X_b[keep_locations])) >= b_min_size:
-            X_b = X_b[keep_locations]
-            y_b = y_b[keep_locations]
-            continue
-
-        # Remove from X_a otherwise
-        keep_locations = X_a != a
-        X_a = X_a[keep_locations]
-        y_a = y_a[keep_locations]
-
-    return X_a, X_b, y_a, y_b
-
-
-def _unique(array: np.ndarray) -> np.ndarray:
-    """Returns unique elements of numpy array, maintaining the occurrency order"""
-    indexes = np.unique(array, return_index=True)[1]
-    return array[sorted(indexes)]
-
-
 def _write_to_file(
     annotation_path: Path,
     annotation_files: List[Path],
@@ -8,14 +8,24 @@ Note on retry strategy:
   transient HTTP errors (429, 5xx) and internal timeouts.
 - We add a thin outer retry layer using `tenacity` ONLY for immediate network-level
   failures (ConnectionError, socket.timeout) that may occur before SDK logic engages.
+
+Note on resumability:
+- `upload_artifacts` can record the uploaded files in a local manifest, with their
+  size and MD5 checksum, so that a failed or interrupted upload only transfers the
+  missing files when it is run again.
 """
 
+import hashlib
+import json
 import mimetypes
 import os
+import shutil
 import socket
+import threading
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from tenacity import (
     retry,
@@ -49,6 +59,23 @@ class StorageClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_object_size(self, storage_key: str) -> Optional[int]:
+        """
+        Get the size of an object in cloud storage, with a HEAD request.
+
+        Parameters
+        ----------
+        storage_key : str
+            Storage key (path) of the object
+
+        Returns
+        -------
+        Optional[int]
+            Size of the object in bytes, None if it doesn't exist
+        """
+        pass
+
 
 class S3StorageClient(StorageClient):
     """AWS S3 storage client implementation.
@@ -110,6 +137,18 @@ class S3StorageClient(StorageClient):
             local_path, self.bucket, storage_key, ExtraArgs=extra_args
         )
 
+    def get_object_size(self, storage_key: str) -> Optional[int]:
+        """Get the size of an S3 object."""
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket, Key=storage_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return response["ContentLength"]
+
 
 class GCSStorageClient(StorageClient):
     """Google Cloud Storage client implementation.
@@ -153,6 +192,11 @@ class GCSStorageClient(StorageClient):
 
         blob.upload_from_filename(local_path)
 
+    def get_object_size(self, storage_key: str) -> Optional[int]:
+        """Get the size of a GCS blob."""
+        blob = self.bucket.get_blob(storage_key)
+        return blob.size if blob is not None else None
+
 
 class AzureStorageClient(StorageClient):
     """Azure Blob Storage client implementation.
@@ -246,6 +290,51 @@ class AzureStorageClient(StorageClient):
                 data, overwrite=True, content_settings=content_settings
             )
 
+    def get_object_size(self, storage_key: str) -> Optional[int]:
+        """Get the size of an Azure blob."""
+        from azure.core.exceptions import ResourceNotFoundError
+
+        blob_client = self.container_client.get_blob_client(storage_key)
+        try:
+            return blob_client.get_blob_properties().size
+        except ResourceNotFoundError:
+            return None
+
+
+class LocalStorageClient(StorageClient):
+    """Storage client copying files to a local directory.
+
+    Storage keys are paths relative to the directory. It can stand in for a cloud
+    storage in tests, or be used to inspect the artifacts of an upload.
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize local storage client.
+
+        Parameters
+        ----------
+        root_dir : str
+            Directory where the files are copied
+        """
+        self.root_dir = root_dir
+
+    def upload_file(self, local_path: str, storage_key: str) -> None:
+        """Copy file to the local directory."""
+        destination = Path(self.root_dir) / storage_key
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Copied under a temporary name first, so that partial copies are never visible
+        tmp_destination = destination.with_name(f".{destination.name}.tmp")
+        shutil.copyfile(local_path, tmp_destination)
+        tmp_destination.replace(destination)
+
+    def get_object_size(self, storage_key: str) -> Optional[int]:
+        """Get the size of a copied file."""
+        try:
+            return os.path.getsize(Path(self.root_dir) / storage_key)
+        except FileNotFoundError:
+            return None
+
 
 def create_storage_client(object_store: ObjectStore) -> StorageClient:
     """
@@ -367,18 +456,141 @@ def upload_with_retry(client: StorageClient, local_path: str, storage_key: str)
     client.upload_file(local_path, storage_key)
 
 
+def upload_source_file(
+    object_store: ObjectStore, source_file: str, storage_key_prefix: str
+) -> None:
+    """
+    Upload the source video file with retry logic.
+
+    The source file doesn't change during extraction, so it can be uploaded while the
+    artifacts are still being extracted.
+
+    Parameters
+    ----------
+    object_store : ObjectStore
+        ObjectStore configuration
+    source_file : str
+        Path to source video file
+    storage_key_prefix : str
+        Prefix for all storage keys (e.g., prefix/item_uuid/files/slot_uuid)
+
+    Raises
+    ------
+    Exception
+        If the upload fails after retries
+    """
+    client = create_storage_client(object_store)
+    source_filename = os.path.basename(source_file)
+    upload_with_retry(client, source_file, f"{storage_key_prefix}/{source_filename}")
+
+
+def _file_md5(local_path: str) -> str:
+    """Compute the MD5 checksum of a file, reading it in chunks."""
+    md5 = hashlib.md5()
+    with open(local_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class UploadManifest:
+    """
+    Local record of the files that were uploaded, with their size and MD5 checksum.
+
+    Each line of the manifest file is a JSON object ``{"key": ..., "size": ...,
+    "md5": ...}``, appended as soon as an upload completes, so that the manifest stays
+    valid if the process is interrupted. A truncated last line is ignored.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Load the manifest, if it exists.
+
+        Parameters
+        ----------
+        path : Optional[str]
+            Path to the manifest file. If None, uploads are only recorded in memory.
+        """
+        self.path = path
+        self.entries: Dict[str, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+        self._truncated = False
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                content = f.read()
+            for line in content.splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[entry["key"]] = (entry["size"], entry["md5"])
+            # Entries appended after a truncated line must start on a line of their own
+            self._truncated = bool(content) and not content.endswith("\n")
+
+    def is_uploaded(self, storage_key: str, size: int, md5: str) -> bool:
+        """
+        Check whether a file with the given size and checksum was uploaded to the key.
+
+        Parameters
+        ----------
+        storage_key : str
+            Storage key of the file
+        size : int
+            Size of the local file in bytes
+        md5 : str
+            MD5 checksum of the local file
+
+        Returns
+        -------
+        bool
+            True if the same file was uploaded to the key
+        """
+        return self.entries.get(storage_key) == (size, md5)
+
+    def record(self, storage_key: str, size: int, md5: str) -> None:
+        """
+        Record that a file was uploaded.
+
+        Parameters
+        ----------
+        storage_key : str
+            Storage key of the file
+        size : int
+            Size of the file in bytes
+        md5 : str
+            MD5 checksum of the file
+        """
+        with self._lock:
+            self.entries[storage_key] = (size, md5)
+            if self.path is None:
+                return
+            with open(self.path, "a") as f:
+                if self._truncated:
+                    f.write("\n")
+                    self._truncated = False
+                f.write(json.dumps({"key": storage_key, "size": size, "md5": md5}))
+                f.write("\n")
+
+
 def upload_artifacts(
     object_store: ObjectStore,
     local_artifacts_dir: str,
-    source_file: str,
+    source_file: Optional[str],
     storage_key_prefix: str,
     max_workers: int = 10,
-) -> None:
+    manifest_path: Optional[str] = None,
+    verify_uploaded: bool = False,
+    client: Optional[StorageClient] = None,
+) -> List[str]:
     """
     Upload all artifacts with retry logic.
 
     Uploads source video file and all extracted artifacts to cloud storage.
-    Aborts entire operation if any upload fails.
+    If any upload fails, the other files are still uploaded, and the first error is
+    raised once they are done.
+
+    With a manifest, files that were already uploaded by a previous run are skipped, so
+    that running it again after a failure only transfers the missing files.
 
     Parameters
     ----------
@@ -386,42 +598,83 @@ def upload_artifacts(
         ObjectStore configuration
     local_artifacts_dir : str
         Local directory containing extracted artifacts
-    source_file : str
-        Path to source video file
+    source_file : Optional[str]
+        Path to source video file, None if it was already uploaded with
+        ``upload_source_file``
     storage_key_prefix : str
         Prefix for all storage keys (e.g., prefix/item_uuid/files/slot_uuid)
     max_workers : int
         Number of ThreadPoolExecutor workers (default: 10)
+    manifest_path : Optional[str]
+        Path to the ``UploadManifest`` of the uploaded files, created if it doesn't
+        exist. It isn't uploaded if it is inside ``local_artifacts_dir``.
+    verify_uploaded : bool
+        If True, files recorded in the manifest are only skipped if an object of the
+        same size exists in storage (default: False)
+    client : Optional[StorageClient]
+        Storage client to upload with, e.g. a ``LocalStorageClient``. Created from
+        ``object_store`` if None.
+
+    Returns
+    -------
+    List[str]
+        Storage keys of the files that were transferred
 
     Raises
     ------
     Exception
         If any upload fails after retries
     """
-    client = create_storage_client(object_store)
+    if client is None:
+        client = create_storage_client(object_store)
+    manifest = UploadManifest(manifest_path)
+    manifest_abspath = os.path.abspath(manifest_path) if manifest_path else None
 
     # Collect all files to upload
     files_to_upload = []
 
     # Source file
-    source_filename = os.path.basename(source_file)
-    files_to_upload.append((source_file, f"{storage_key_prefix}/{source_filename}"))
+    if source_file is not None:
+        source_filename = os.path.basename(source_file)
+        files_to_upload.append((source_file, f"{storage_key_prefix}/{source_filename}"))
 
     # Walk artifacts directory
     for root, dirs, files in os.walk(local_artifacts_dir):
         for file in files:
             local_path = os.path.join(root, file)
+            if os.path.abspath(local_path) == manifest_abspath:
+                continue
             relative_path = os.path.relpath(local_path, local_artifacts_dir)
             storage_key = f"{storage_key_prefix}/{relative_path}".replace(os.sep, "/")
             files_to_upload.append((local_path, storage_key))
 
+    def upload(local_path: str, storage_key: str) -> bool:
+        size = os.path.getsize(local_path)
+        md5 = _file_md5(local_path) if manifest_path else ""
+        if manifest_path and manifest.is_uploaded(storage_key, size, md5):
+            if not verify_uploaded or client.get_object_size(storage_key) == size:
+                return False
+        upload_with_retry(client, local_path, storage_key)
+        manifest.record(storage_key, size, md5)
+        return True
+
+    uploaded_keys = []
+    errors = []
+
     # Upload with ThreadPoolExecutor
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(upload_with_retry, client, local, key)
-            for local, key in files_to_upload
-        ]
-
-        # Wait for all, abort on first failure
-        for future in futures:
-            future.result()  # Raises if upload failed
+        futures = {
+            executor.submit(upload, local, key): key for local, key in files_to_upload
+        }
+
+        # Wait for all, so that every successful upload is recorded in the manifest
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    uploaded_keys.append(futures[future])
+            except Exception as e:
+                errors.append(e)
+
+    if errors:
+        raise errors[0]
+    return uploaded_keys
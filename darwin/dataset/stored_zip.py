@@ -0,0 +1,349 @@
+"""
+Zip archives whose files are stored without compression and read from disk as the archive is
+read, so that the archive is never written anywhere. Their size is known from the sizes of their
+files alone, before anything is read, which makes them suitable as streamed upload bodies.
+"""
+
+import io
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Sizes, offsets and counts from which the zip64 extensions are needed
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+
+# Stored instead of the values that need the zip64 extensions, which then hold them
+_ZIP64_MARKER = 0xFFFFFFFF
+_ZIP64_COUNT_MARKER = 0xFFFF
+
+READ_SIZE = 1024 * 1024
+
+# The layouts of the zip records, as in the specification and the zipfile module
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_OF_ARCHIVE = struct.Struct("<4s4H2LH")
+_END_OF_ARCHIVE64 = struct.Struct("<4sQ2H2L4Q")
+_END_OF_ARCHIVE64_LOCATOR = struct.Struct("<4sLQL")
+
+_VERSION = 20
+_VERSION_ZIP64 = 45
+_UTF8_FLAG = 0x800
+_STORED = 0
+_CREATE_SYSTEM = 0 if os.name == "nt" else 3
+
+
+@dataclass
+class _Entry:
+    path: Path
+    name: bytes
+    flags: int
+    size: int
+    dos_time: int
+    dos_date: int
+    external_attr: int
+    offset: int
+    crc: Optional[int] = None
+
+    @property
+    def local_extra(self) -> bytes:
+        if self.size < ZIP64_LIMIT:
+            return b""
+        return struct.pack("<2H2Q", 1, 16, self.size, self.size)
+
+    @property
+    def central_extra(self) -> bytes:
+        values = [self.size, self.size] if self.size >= ZIP64_LIMIT else []
+        if self.offset >= ZIP64_LIMIT:
+            values.append(self.offset)
+        if not values:
+            return b""
+        return struct.pack(f"<2H{len(values)}Q", 1, 8 * len(values), *values)
+
+    @property
+    def version(self) -> int:
+        if self.size >= ZIP64_LIMIT or self.offset >= ZIP64_LIMIT:
+            return _VERSION_ZIP64
+        return _VERSION
+
+    @property
+    def local_header_size(self) -> int:
+        return _LOCAL_HEADER.size + len(self.name) + len(self.local_extra)
+
+    @property
+    def central_header_size(self) -> int:
+        return _CENTRAL_HEADER.size + len(self.name) + len(self.central_extra)
+
+    def local_header(self, crc: int) -> bytes:
+        size = _ZIP64_MARKER if self.size >= ZIP64_LIMIT else self.size
+        extra = self.local_extra
+        header = _LOCAL_HEADER.pack(
+            b"PK\x03\x04",
+            self.version,
+            0,
+            self.flags,
+            _STORED,
+            self.dos_time,
+            self.dos_date,
+            crc,
+            size,
+            size,
+            len(self.name),
+            len(extra),
+        )
+        return header + self.name + extra
+
+    def central_header(self, crc: int) -> bytes:
+        size = _ZIP64_MARKER if self.size >= ZIP64_LIMIT else self.size
+        extra = self.central_extra
+        header = _CENTRAL_HEADER.pack(
+            b"PK\x01\x02",
+            self.version,
+            _CREATE_SYSTEM,
+            self.version,
+            0,
+            self.flags,
+            _STORED,
+            self.dos_time,
+            self.dos_date,
+            crc,
+            size,
+            size,
+            len(self.name),
+            len(extra),
+            0,
+            0,
+            0,
+            self.external_attr,
+            _ZIP64_MARKER if self.offset >= ZIP64_LIMIT else self.offset,
+        )
+        return header + self.name + extra
+
+
+class StoredZip:
+    """
+    A zip archive of local files, stored without compression. Nothing is read until the archive
+    is, see ``open``, and then each file is read twice: once to compute its CRC-32, which its
+    header holds, and once for its content.
+
+    Parameters
+    ----------
+    files : Sequence[Tuple[Path, str]]
+        The path of each file and its name in the archive.
+
+    Attributes
+    ----------
+    size : int
+        The size of the archive in bytes.
+    """
+
+    def __init__(self, files: Sequence[Tuple[Path, str]]):
+        self._entries: List[_Entry] = []
+        offset = 0
+        for path, name in files:
+            stat = path.stat()
+            dos_time, dos_date = _dos_date_time(stat.st_mtime)
+            encoded = name.encode("utf-8")
+            entry = _Entry(
+                path=path,
+                name=encoded,
+                flags=0 if encoded.isascii() else _UTF8_FLAG,
+                size=stat.st_size,
+                dos_time=dos_time,
+                dos_date=dos_date,
+                external_attr=(stat.st_mode & 0xFFFF) << 16,
+                offset=offset,
+            )
+            self._entries.append(entry)
+            offset += entry.local_header_size + entry.size
+
+        self._central_directory_offset = offset
+        self._central_directory_size = sum(
+            entry.central_header_size for entry in self._entries
+        )
+        self.size = (
+            self._central_directory_offset
+            + self._central_directory_size
+            + len(self._end_of_archive())
+        )
+
+    def open(self) -> "StoredZipReader":
+        """
+        Returns a new reader of the archive.
+
+        Returns
+        -------
+        StoredZipReader
+            The reader, positioned at the start of the archive.
+        """
+        return StoredZipReader(self)
+
+    def chunks(self) -> Iterator[bytes]:
+        """
+        Yields the content of the archive, from its start.
+
+        Raises
+        ------
+        ValueError
+            If the size of a file changed since the archive was created.
+        """
+        for entry in self._entries:
+            if entry.crc is None:
+                entry.crc = _crc32(entry.path)
+            yield entry.local_header(entry.crc)
+
+            read = 0
+            with entry.path.open("rb") as f:
+                while read <= entry.size:
+                    data = f.read(READ_SIZE)
+                    if not data:
+                        break
+                    read += len(data)
+                    yield data
+            if read != entry.size:
+                raise ValueError(f"{entry.path} changed while it was being read")
+
+        for entry in self._entries:
+            yield entry.central_header(entry.crc or 0)
+        yield self._end_of_archive()
+
+    def _end_of_archive(self) -> bytes:
+        count = len(self._entries)
+        offset = self._central_directory_offset
+        size = self._central_directory_size
+        end = b""
+        zip64 = (
+            count >= ZIP64_COUNT_LIMIT or offset >= ZIP64_LIMIT or size >= ZIP64_LIMIT
+        )
+        if zip64:
+            end += _END_OF_ARCHIVE64.pack(
+                b"PK\x06\x06",
+                _END_OF_ARCHIVE64.size - 12,
+                _VERSION_ZIP64,
+                _VERSION_ZIP64,
+                0,
+                0,
+                count,
+                count,
+                size,
+                offset,
+            )
+            end += _END_OF_ARCHIVE64_LOCATOR.pack(b"PK\x06\x07", 0, offset + size, 1)
+        end += _END_OF_ARCHIVE.pack(
+            b"PK\x05\x06",
+            0,
+            0,
+            _ZIP64_COUNT_MARKER if zip64 else count,
+            _ZIP64_COUNT_MARKER if zip64 else count,
+            _ZIP64_MARKER if zip64 else size,
+            _ZIP64_MARKER if zip64 else offset,
+            0,
+        )
+        return end
+
+
+class StoredZipReader(io.RawIOBase):
+    """
+    Reads a ``StoredZip`` as a binary file. Seeking reads the archive again from its start,
+    unless it seeks to the current position.
+
+    Parameters
+    ----------
+    archive : StoredZip
+        The archive to read.
+    """
+
+    def __init__(self, archive: StoredZip):
+        super().__init__()
+        self._archive = archive
+        self._rewind()
+
+    def __len__(self) -> int:
+        return self._archive.size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._archive.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        if offset != self._position:
+            if offset < self._position:
+                self._rewind()
+            while self._position < offset and self.read(
+                min(offset - self._position, READ_SIZE)
+            ):
+                pass
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._archive.size - self._position
+
+        parts = []
+        remaining = size
+        while remaining > 0:
+            if self._offset >= len(self._chunk):
+                self._chunk = next(self._chunks, b"")
+                self._offset = 0
+                if not self._chunk:
+                    break
+            part = self._chunk[self._offset : self._offset + remaining]
+            self._offset += len(part)
+            remaining -= len(part)
+            parts.append(part)
+
+        data = parts[0] if len(parts) == 1 else b"".join(parts)
+        self._position += len(data)
+        return data
+
+    def close(self) -> None:
+        if not self.closed:
+            self._chunks.close()
+        super().close()
+
+    def _rewind(self) -> None:
+        chunks = getattr(self, "_chunks", None)
+        if chunks is not None:
+            chunks.close()
+        self._chunks = self._archive.chunks()
+        self._chunk = b""
+        self._offset = 0
+        self._position = 0
+
+
+def _crc32(path: Path) -> int:
+    crc = 0
+    with path.open("rb") as f:
+        while data := f.read(READ_SIZE):
+            crc = zlib.crc32(data, crc)
+    return crc
+
+
+def _dos_date_time(timestamp: float) -> Tuple[int, int]:
+    # Zip timestamps start in 1980, as zipfile.ZipFile.write does earlier ones are clamped
+    year, month, day, hour, minute, second = time.localtime(timestamp)[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    dos_time = hour << 11 | minute << 5 | second // 2
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    return dos_time, dos_date
@@ -5,8 +5,6 @@ import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path, PurePosixPath
-import zipfile
-import tempfile
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +19,8 @@ from typing import (
 )
 import requests
 
+from darwin import instrumentation
+from darwin.dataset.stored_zip import StoredZip
 from darwin.datatypes import PathLike, Slot, SourceFile
 from darwin.doc_enum import DocEnum
 from darwin.path_utils import construct_full_path
@@ -202,6 +202,54 @@ class LocalFile:
         """The full ``Path`` (with filename inclduded) to the item."""
         return construct_full_path(self.data["path"], self.data["filename"])
 
+    @property
+    def size(self) -> int:
+        """The number of bytes uploaded for this file."""
+        return self.local_path.stat().st_size
+
+    def open(self) -> BinaryIO:
+        """Opens the content uploaded for this file, for reading in binary mode."""
+        return self.local_path.open("rb")
+
+
+class SeriesFile(LocalFile):
+    """
+    The DICOM slices of a series, uploaded as a single zip file. The slices are stored without
+    compression, which they barely benefit from, and the zip is read from them as it's
+    uploaded rather than written to disk first.
+
+    Parameters
+    ----------
+    directory : PathLike
+        The directory of the series, the zip is named after it.
+    slices : List[Path]
+        The ``.dcm`` files of the slices.
+    kwargs : Any
+        Data relative to this file, see ``LocalFile``.
+
+    Attributes
+    ----------
+    slices : List[Path]
+        The ``.dcm`` files of the slices.
+    archive : StoredZip
+        The zip of the slices.
+    """
+
+    def __init__(self, directory: PathLike, slices: List[Path], **kwargs):
+        kwargs.setdefault("filename", f"{Path(directory).name}.dcm")
+        super().__init__(directory, **kwargs)
+        self.slices = slices
+        self.archive = StoredZip([(path, path.name) for path in slices])
+
+    @property
+    def size(self) -> int:
+        """The number of bytes uploaded for this file, the size of the zip."""
+        return self.archive.size
+
+    def open(self) -> BinaryIO:
+        """Opens the zip of the slices, for reading in binary mode."""
+        return self.archive.open()
+
 
 class MultiFileItem:
     def __init__(
@@ -220,8 +268,8 @@ class MultiFileItem:
         - Creates a LayoutV3 object for `ItemMergeMode.SLOTS` & `ItemMergeMode.CHANNELS` items
 
         For `ItemMergeMode.SERIES` items:
-        - Every slice is zipped into a single source file. This is necessary to upload
-        individual DICOM slices as volumetric series
+        - Every slice is zipped into a single source file, see `SeriesFile`. This is necessary
+        to upload individual DICOM slices as volumetric series
         - Layout is set to `None` because the files are zipped into a single source file
 
         Raises
@@ -291,18 +339,14 @@ class MultiFileItem:
 
     def _create_series_zip(self):
         """
-        For a given series `MultiFileItem`:
-        - Zip all `.dcm` files into a temporary zip file
-        - Replace all `.dcm` files with the zip file
+        For a given series `MultiFileItem`, replaces all `.dcm` files with a single zip of them,
+        which is streamed from the files when uploaded.
 
         This is necessary to upload individual DICOM slices as volumetric series
         """
-        self._temp_zip_dir = tempfile.TemporaryDirectory()
-        zip_path = Path(self._temp_zip_dir.name) / f"{self.name}.dcm"
-        with zipfile.ZipFile(zip_path, "w") as zip_file:
-            for local_file in self.files:
-                zip_file.write(local_file.local_path, local_file.local_path.name)
-        self.files = [LocalFile(zip_path)]
+        self.files = [
+            SeriesFile(self.directory, [file.local_path for file in self.files])
+        ]
 
     @property
     def full_path(self) -> str:
@@ -556,6 +600,7 @@ class UploadHandlerV2(UploadHandler):
             handle_as_slices=handle_as_slices,
         )
 
+    @instrumentation.span("push.register_items")
     def _request_upload(
         self, handle_as_slices: Optional[bool] = False
     ) -> Tuple[List[ItemPayload], List[ItemPayload]]:
@@ -613,10 +658,10 @@ class UploadHandlerV2(UploadHandler):
 
     def _upload_files(self) -> Iterator[Callable[[Optional[ByteReadCallback]], None]]:
         def upload_function(
-            dataset_slug, local_path, upload_id
+            dataset_slug, local_file, upload_id
         ) -> Callable[[Optional[ByteReadCallback]], None]:
             return lambda byte_read_callback=None: self._upload_file(
-                dataset_slug, local_path, upload_id, byte_read_callback
+                dataset_slug, local_file, upload_id, byte_read_callback
             )
 
         file_lookup = {file.full_path: file for file in self.local_files}
@@ -632,35 +677,38 @@ class UploadHandlerV2(UploadHandler):
                         f"Cannot match {slot_path} from payload with files to upload"
                     )
                 yield upload_function(
-                    self.dataset.identifier.dataset_slug, file.local_path, upload_id
+                    self.dataset.identifier.dataset_slug, file, upload_id
                 )
 
     def _upload_file(
         self,
         dataset_slug: str,
-        file_path: Path,
+        local_file: LocalFile,
         upload_id: str,
         byte_read_callback: Optional[ByteReadCallback],
     ) -> None:
         try:
-            self._do_upload_file(dataset_slug, file_path, upload_id, byte_read_callback)
+            self._do_upload_file(
+                dataset_slug, local_file, upload_id, byte_read_callback
+            )
         except UploadRequestError as e:
             self.errors.append(e)
         except Exception as e:
             self.errors.append(
                 UploadRequestError(
-                    file_path=file_path, stage=UploadStage.OTHER, error=e
+                    file_path=local_file.local_path, stage=UploadStage.OTHER, error=e
                 )
             )
 
     def _do_upload_file(
         self,
         dataset_slug: str,
-        file_path: Path,
+        local_file: LocalFile,
         upload_id: str,
         byte_read_callback: Optional[ByteReadCallback] = None,
     ) -> None:
         team_slug: Optional[str] = self.dataset_identifier.team_slug
+        file_path = local_file.local_path
 
         try:
             sign_response: Dict[str, Any] = self.client.api_v2.sign_upload(
@@ -674,7 +722,7 @@ class UploadHandlerV2(UploadHandler):
         upload_url = sign_response["upload_url"]
 
         try:
-            file_size = file_path.stat().st_size
+            file_size = local_file.size
             if byte_read_callback:
                 byte_read_callback(str(file_path), file_size, 0)
 
@@ -682,16 +730,25 @@ class UploadHandlerV2(UploadHandler):
                 if byte_read_callback:
                     byte_read_callback(str(file_path), file_size, monitor.bytes_read)
 
-            with file_path.open("rb") as m:
+            with local_file.open() as m:
                 monitor = FileMonitor(m, file_size, callback)
 
                 retries = 0
                 while retries < 5:
-                    upload_response = requests.put(f"{upload_url}", data=monitor)
+                    # Retries send the file again, from its start
+                    m.seek(0)
+                    monitor.bytes_read = 0
+                    upload_response = requests.put(
+                        f"{upload_url}",
+                        data=monitor,
+                        hooks=instrumentation.hooks("storage"),
+                    )
                     # If s3 is getting to many request it will return 503, we will sleep and retry
                     if upload_response.status_code != 503:
                         break
 
+                    instrumentation.record_retry("storage", 503)
+
                     time.sleep(2**retries)
                     retries += 1
 
@@ -1,17 +1,27 @@
 import itertools
 import multiprocessing as mp
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import numpy as np
-from PIL import Image as PILImage
-from PIL import ImageOps
 from rich.live import Live
 from rich.progress import ProgressBar, track
 
 import darwin.datatypes as dt
 
+from darwin.dataset.release_index import ReleaseIndex
 from darwin.datatypes import PathLike
 from darwin.exceptions import NotFound
 from darwin.importer.formats.darwin import parse_path
@@ -23,9 +33,15 @@ from darwin.utils import (
     get_annotation_files_from_dir,
     get_image_path_from_stream,
     is_unix_like_os,
+    load_darwin_json_header,
     parse_darwin_json,
 )
-from darwin.utils.utils import stream_darwin_json
+
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+
+# NumPy and PIL are imported by the functions using them, as this module is loaded by every
+# command of the CLI
 
 # E.g.: {"partition" => {"class_name" => 123}}
 AnnotationDistribution = Dict[str, Counter]
@@ -97,26 +113,7 @@ def extract_classes(
     for atype in annotation_types_to_load:
         assert atype in ["bounding_box", "polygon", "tag"]
 
-    classes: Dict[str, Set[int]] = defaultdict(set)
-    indices_to_classes: Dict[int, Set[str]] = defaultdict(set)
-
-    for i, file_name in enumerate(get_annotation_files_from_dir(annotations_path)):
-        annotation_file = parse_path(Path(file_name))
-        if not annotation_file:
-            continue
-
-        for annotation in annotation_file.annotations:
-            if (
-                annotation.annotation_class.annotation_type
-                not in annotation_types_to_load
-            ):
-                continue
-
-            class_name = annotation.annotation_class.name
-            indices_to_classes[i].add(class_name)
-            classes[class_name].add(i)
-
-    return classes, indices_to_classes
+    return ReleaseIndex.load(annotations_path).extract_classes(annotation_types_to_load)
 
 
 def make_class_lists(release_path: Path) -> None:
@@ -137,9 +134,10 @@ def make_class_lists(release_path: Path) -> None:
     lists_path = release_path / "lists"
     lists_path.mkdir(exist_ok=True)
 
+    index = ReleaseIndex.load(annotations_path)
     for annotation_type in ["tag", "polygon", "bounding_box"]:
         fname = lists_path / f"classes_{annotation_type}.txt"
-        classes, _ = extract_classes(annotations_path, annotation_type=annotation_type)
+        classes, _ = index.extract_classes([annotation_type])
         classes_names = list(classes.keys())
         if len(classes_names) > 0:
             classes_names.sort()
@@ -344,6 +342,8 @@ def get_coco_format_record(
 
 
 def create_polygon_object(obj, box_mode, classes=None):
+    import numpy as np
+
     if "paths" in obj.data:
         paths = obj.data["paths"]
     elif "path" in obj.data:
@@ -593,7 +593,7 @@ def _map_annotations_to_images(
     invalid_annotation_paths = []
     with_folders = any(item.is_dir() for item in images_dir.iterdir())
     for annotation_path in annotation_filepaths:
-        darwin_json = stream_darwin_json(Path(annotation_path))
+        darwin_json = load_darwin_json_header(Path(annotation_path))
         image_path = get_image_path_from_stream(
             darwin_json, images_dir, Path(annotation_path), with_folders
         )
@@ -659,7 +659,7 @@ def _load_and_format_annotations(
             yield record
 
 
-def load_pil_image(path: Path, to_rgb: Optional[bool] = True) -> PILImage.Image:
+def load_pil_image(path: Path, to_rgb: Optional[bool] = True) -> "PILImage.Image":
     """
     Loads a PIL image and converts it into RGB (optional).
 
@@ -675,6 +675,9 @@ def load_pil_image(path: Path, to_rgb: Optional[bool] = True) -> PILImage.Image:
     PILImage.Image
         The loaded image.
     """
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+
     pic = PILImage.open(path)
     pic = ImageOps.exif_transpose(pic)
     if to_rgb:
@@ -682,7 +685,7 @@ def load_pil_image(path: Path, to_rgb: Optional[bool] = True) -> PILImage.Image:
     return pic
 
 
-def convert_to_rgb(pic: PILImage.Image) -> PILImage.Image:
+def convert_to_rgb(pic: "PILImage.Image") -> "PILImage.Image":
     """
     Converts a PIL image to RGB.
 
@@ -701,6 +704,9 @@ def convert_to_rgb(pic: PILImage.Image) -> PILImage.Image:
     TypeError
         If the image given via ``pic`` has an unsupported type.
     """
+    import numpy as np
+    from PIL import Image as PILImage
+
     if pic.mode == "RGB":
         pass
     elif pic.mode in ("CMYK", "RGBA", "P"):
@@ -739,17 +745,7 @@ def compute_max_density(annotations_dir: Path) -> int:
     int
         The maximum density.
     """
-    max_density = 0
-    for annotation_path in get_annotation_files_from_dir(annotations_dir):
-        annotation_density = 0
-        darwin_json = parse_darwin_json(Path(annotation_path))
-        for annotation in darwin_json.annotations:
-            if "path" not in annotation.data and "paths" not in annotation.data:
-                continue
-            annotation_density += 1
-        if annotation_density > max_density:
-            max_density = annotation_density
-    return max_density
+    return ReleaseIndex.load(annotations_dir).max_density()
 
 
 def compute_distributions(
@@ -789,6 +785,7 @@ def compute_distributions(
     instance_distribution: AnnotationDistribution = {
         partition: Counter() for partition in partitions
     }
+    index = ReleaseIndex.load(annotations_dir)
 
     for partition in partitions:
         for annotation_type in annotation_types:
@@ -804,17 +801,23 @@ def compute_distributions(
             for annotation_filepath in annotation_filepaths:
                 if not annotation_filepath.endswith(".json"):
                     annotation_filepath = f"{annotation_filepath}.json"
-                annotation_path: Path = annotations_dir / annotation_filepath
-                annotation_file: Optional[dt.AnnotationFile] = parse_path(
-                    annotation_path
-                )
-                if annotation_file is None:
+                entry = index.get(annotation_filepath)
+                if entry is None:
+                    annotation_file: Optional[dt.AnnotationFile] = parse_path(
+                        annotations_dir / annotation_filepath
+                    )
+                    if annotation_file is None:
+                        continue
+                    annotation_class_names: List[str] = [
+                        annotation.annotation_class.name
+                        for annotation in annotation_file.annotations
+                    ]
+                elif entry.annotations is None:
                     continue
-
-                annotation_class_names: List[str] = [
-                    annotation.annotation_class.name
-                    for annotation in annotation_file.annotations
-                ]
+                else:
+                    annotation_class_names = [
+                        class_name for class_name, _ in entry.annotations
+                    ]
 
                 class_distribution[partition] += Counter(set(annotation_class_names))
                 instance_distribution[partition] += Counter(annotation_class_names)
@@ -940,14 +943,15 @@ def get_external_file_name(storage_key: str) -> str:
     return storage_key.split("/")[-1]
 
 
-def chunk_items(items: List[Any], chunk_size: int = 500) -> Iterator[List[Any]]:
+def chunk_items(items: Iterable[Any], chunk_size: int = 500) -> Iterator[List[Any]]:
     """
-    Splits the list of items into chunks of specified size.
+    Splits the items into chunks of specified size. Items are consumed lazily, so they
+    can be produced by a generator.
 
     Parameters
     ----------
-    items : List[Any]
-        The list of items to split.
+    items : Iterable[Any]
+        The items to split.
     chunk_size : int, default: 500
         The size of each chunk.
 
@@ -956,4 +960,27 @@ def chunk_items(items: List[Any], chunk_size: int = 500) -> Iterator[List[Any]]:
     Iterator[List[Any]]
         An iterator that yields lists of items, each of length ``chunk_size``.
     """
-    return (items[i : i + chunk_size] for i in range(0, len(items), chunk_size))
+    iterator = iter(items)
+    return iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+
+
+def iter_storage_keys(path: PathLike) -> Iterator[str]:
+    """
+    Reads storage keys from a file listing one key per line, such as a listing of the
+    objects of a bucket. Blank lines are skipped.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path to the file.
+
+    Returns
+    -------
+    Iterator[str]
+        The storage keys, read lazily.
+    """
+    with open(path) as f:
+        for line in f:
+            storage_key = line.strip()
+            if storage_key:
+                yield storage_key
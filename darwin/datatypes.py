@@ -20,12 +20,9 @@ from typing import (
 
 from pydantic import BaseModel
 
-try:
+if TYPE_CHECKING:
     from numpy.typing import NDArray
-except ImportError:
-    NDArray = Any  # type: ignore
 
-if TYPE_CHECKING:
     from darwin.client import Client
 
 from darwin.future.data_objects.properties import (
@@ -316,6 +313,7 @@ class VideoAnnotation:
         post_processing: Optional[
             Callable[[Annotation, UnknownType], UnknownType]
         ] = None,
+        interpolate: bool = False,
     ) -> Dict:
         """
         Return the post-processed frames and the additional information from this
@@ -340,6 +338,10 @@ class VideoAnnotation:
         post_processing: Optional[Callable[[Annotation, Any], Any]], default: None
             If given, it processes each frame through the given ``Callabale`` before adding it to the
             returned dictionary. Defaults to ``None``.
+        interpolate: bool, default: False
+            Whether or not to include every frame of the segments, with the data of interpolated
+            annotations linearly interpolated between keyframes, see
+            ``darwin.utils.interpolation``. Only useful with ``only_keyframes=False``.
 
         Returns
         -------
@@ -354,17 +356,24 @@ class VideoAnnotation:
             ) -> UnknownType:
                 return data  # type: ignore
 
+        frames, keyframes = self.frames, self.keyframes
+        if interpolate:
+            from darwin.utils.interpolation import interpolate_video_annotations
+
+            dense: VideoAnnotation = interpolate_video_annotations([self])[0]  # type: ignore
+            frames, keyframes = dense.frames, dense.keyframes
+
         output = {
             "frames": {
                 frame: {
                     **post_processing(
-                        self.frames[frame],  # type: ignore
-                        {self.frames[frame].annotation_class.annotation_type: self.frames[frame].data},  # type: ignore
+                        frames[frame],  # type: ignore
+                        {frames[frame].annotation_class.annotation_type: frames[frame].data},  # type: ignore
                     ),
-                    **{"keyframe": self.keyframes[frame]},  # type: ignore
+                    **{"keyframe": keyframes[frame]},  # type: ignore
                 }
-                for frame in self.frames
-                if not only_keyframes or self.keyframes[frame]
+                for frame in frames
+                if not only_keyframes or keyframes[frame]
             },
             "segments": self.segments,
             "interpolated": self.interpolated,
@@ -1560,7 +1569,7 @@ class MaskTypes:
     RgbColorList = List[RgbColors]
     RgbPalette = Dict[str, RgbColors]
 
-    RendererReturn = Tuple[ExceptionList, NDArray, CategoryList, ColoursDict]
+    RendererReturn = Tuple[ExceptionList, "NDArray", CategoryList, ColoursDict]
 
 
 @dataclass
@@ -1,13 +1,15 @@
 from pathlib import Path
 from pprint import pprint
 from textwrap import dedent
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from jsonschema.exceptions import ValidationError as jscValidationError
 from rich.console import Console
 
 from darwin.datatypes import AnnotationFileVersion, KeyValuePairDict, UnknownType
 
+if TYPE_CHECKING:
+    from jsonschema.exceptions import ValidationError as jscValidationError
+
 
 class DarwinException(Exception):
     """
@@ -282,7 +284,7 @@ class AnnotationFileValidationError(Exception):
     Used to indicate error while validation JSON annotation files.
     """
 
-    def __init__(self, parent_error: jscValidationError, file_path: Path):
+    def __init__(self, parent_error: "jscValidationError", file_path: Path):
         """
         Parameters
         ----------
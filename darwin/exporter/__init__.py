@@ -1,8 +1,20 @@
 from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from darwin.datatypes import ExportParser
 
-from .exporter import export_annotations  # noqa
+if TYPE_CHECKING:
+    from .exporter import export_annotations  # noqa
+
+
+def __getattr__(name: str) -> Any:
+    # ``export_annotations`` is imported on first access (PEP 562), as it loads the
+    # parsing and interpolation stacks
+    if name == "export_annotations":
+        value = getattr(import_module("darwin.exporter.exporter"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ExporterNotFoundError(ModuleNotFoundError):
@@ -7,10 +7,11 @@ from darwin.utils import (
     parse_darwin_json,
     split_video_annotation,
 )
+from darwin.utils.interpolation import interpolate_video_annotations
 
 
 def darwin_to_dt_gen(
-    file_paths: List[PathLike], split_sequences: bool
+    file_paths: List[PathLike], split_sequences: bool, interpolate: bool = False
 ) -> Iterator[AnnotationFile]:
     """
     Parses the given paths recursively and into an ``Iterator`` of ``AnnotationFile``\\s.
@@ -23,6 +24,10 @@ def darwin_to_dt_gen(
     split_sequences: bool
         When `True`, all videos will be split into individual frame images.
 
+    interpolate: bool, default: False
+        When `True`, the keyframes of video annotations are expanded to every frame of their
+        segments, linearly interpolated for interpolated annotations.
+
     Returns
     -------
     Iterator[AnnotationFile]
@@ -40,6 +45,8 @@ def darwin_to_dt_gen(
                 continue
             data = parse_darwin_json(f, count)
             if data:
+                if data.is_video and interpolate:
+                    data.annotations = interpolate_video_annotations(data.annotations)
                 if data.is_video and split_sequences:
                     for d in split_video_annotation(data):
                         d.seq = count
@@ -55,6 +62,7 @@ def export_annotations(
     file_paths: List[PathLike],
     output_directory: PathLike,
     split_sequences: bool = True,
+    interpolate: bool = False,
 ) -> None:
     """
     Converts a set of files to a different annotation format.
@@ -67,10 +75,17 @@ def export_annotations(
         The files we want to parse.
     output_directory : PathLike
         Where the parsed files will be placed after the operation is complete.
+    split_sequences : bool, default: True
+        Whether videos are split into individual frame images.
+    interpolate : bool, default: False
+        Whether the keyframes of video annotations are expanded to every frame of their
+        segments.
     """
     print("Converting annotations...")
     exporter(
-        darwin_to_dt_gen(file_paths, split_sequences=split_sequences),
+        darwin_to_dt_gen(
+            file_paths, split_sequences=split_sequences, interpolate=interpolate
+        ),
         Path(output_directory),
     )
     print(f"Converted annotations saved at {output_directory}")
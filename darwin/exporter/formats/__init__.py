@@ -7,6 +7,7 @@ supported_formats: List[str] = [
     "cvat",
     "dataloop",
     "instance_mask",
+    "instance_mask_npz",
     "pascalvoc",
     "semantic_mask",
     "semantic_mask_grey",
@@ -1,16 +1,25 @@
 import os
 import shutil
+import zipfile
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List, Optional, Tuple
 
 import numpy as np
 from PIL import Image
+from upolygon import draw_polygon
 
 import darwin.datatypes as dt
-from darwin.utils import convert_polygons_to_mask, get_progress_bar, ispolygon
+from darwin.utils import convert_polygons_to_sequences, get_progress_bar, ispolygon
+from darwin.utils.concurrency import map_in_processes
 
 
-def export(annotation_files: Iterable[dt.AnnotationFile], output_dir: Path) -> None:
+def export(
+    annotation_files: Iterable[dt.AnnotationFile],
+    output_dir: Path,
+    max_workers: Optional[int] = 1,
+    packed: bool = False,
+) -> None:
     """
     Exports the given ``AnnotationFile``\\s into instance masks format inside of the given
     ``output_dir``. Deletes everything within ``output_dir/masks`` before writting to it.
@@ -21,6 +30,12 @@ def export(annotation_files: Iterable[dt.AnnotationFile], output_dir: Path) -> N
         The ``AnnotationFile``\\s to be exported.
     output_dir : Path
         The folder where the new instance mask files will be.
+    max_workers : Optional[int], default: 1
+        Number of processes the images are exported with, ``None`` for the number of CPUs.
+        With ``1`` they are exported in the current process.
+    packed : bool, default: False
+        If ``True``, the masks of each image are written to a single ``{image_id}.npz``
+        archive, with one array per ``mask_id``, instead of a PNG per mask.
     """
     masks_dir = output_dir / "masks"
     if masks_dir.exists():
@@ -28,27 +43,94 @@ def export(annotation_files: Iterable[dt.AnnotationFile], output_dir: Path) -> N
     masks_dir.mkdir(parents=True, exist_ok=True)
     with open(output_dir / "instance_mask_annotations.csv", "w") as f:
         f.write("image_id,mask_id,class_name\n")
-        for annotation_file in get_progress_bar(
-            list(annotation_files), "Processing annotations"
+        for rows in get_progress_bar(
+            map_in_processes(
+                partial(export_masks, masks_dir=masks_dir, packed=packed),
+                annotation_files,
+                max_workers,
+            ),
+            "Processing annotations",
         ):
-            image_id = os.path.splitext(annotation_file.filename)[0]
-            height = annotation_file.image_height
-            width = annotation_file.image_width
-            annotations = [
-                a for a in annotation_file.annotations if ispolygon(a.annotation_class)
-            ]
-            for i, annotation in enumerate(annotations):
-                cat = annotation.annotation_class.name
-                if annotation.annotation_class.annotation_type == "polygon":
-                    polygon = annotation.data["paths"]
-                else:
-                    continue
-                mask = convert_polygons_to_mask(
-                    polygon, height=height, width=width, value=255
-                )
-                mask = Image.fromarray(mask.astype(np.uint8))
-                mask_id = f"{image_id}_{i:05}"
+            f.writelines(rows)
+
+
+def export_masks(
+    annotation_file: dt.AnnotationFile, masks_dir: Path, packed: bool = False
+) -> List[str]:
+    """
+    Writes the instance masks of the polygons of a single ``AnnotationFile``.
+
+    Every mask is drawn in the same image sized buffer, and only the area covered by its
+    polygon is cleared before the next one is drawn.
+
+    Parameters
+    ----------
+    annotation_file : dt.AnnotationFile
+        The ``AnnotationFile`` to be exported.
+    masks_dir : Path
+        The folder where the mask files will be.
+    packed : bool, default: False
+        If ``True``, the masks are written to a single ``.npz`` archive.
+
+    Returns
+    -------
+    List[str]
+        The ``image_id,mask_id,class_name`` rows of the written masks.
+    """
+    image_id = os.path.splitext(annotation_file.filename)[0]
+    height = annotation_file.image_height
+    width = annotation_file.image_width
+    annotations = [
+        a for a in annotation_file.annotations if ispolygon(a.annotation_class)
+    ]
+    buffer = np.zeros((height, width), dtype=np.uint8)
+    rows: List[str] = []
+    archive: Optional[zipfile.ZipFile] = None
+    if packed:
+        archive_path = masks_dir / f"{image_id}.npz"
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        archive = zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED)
+    try:
+        for i, annotation in enumerate(annotations):
+            cat = annotation.annotation_class.name
+            if annotation.annotation_class.annotation_type == "polygon":
+                polygon = annotation.data["paths"]
+            else:
+                continue
+            box = _draw_mask(buffer, polygon, value=255)
+            mask_id = f"{image_id}_{i:05}"
+            if archive is not None:
+                with archive.open(f"{Path(mask_id).name}.npy", "w") as array_file:
+                    np.lib.format.write_array(array_file, buffer)
+            else:
                 outfile = masks_dir / f"{mask_id}.png"
                 outfile.parent.mkdir(parents=True, exist_ok=True)
-                mask.save(outfile)
-                f.write(f"{image_id},{mask_id},{cat}\n")
+                Image.fromarray(buffer).save(outfile)
+            buffer[box] = 0
+            rows.append(f"{image_id},{mask_id},{cat}\n")
+    finally:
+        if archive is not None:
+            archive.close()
+    return rows
+
+
+def _draw_mask(buffer: np.ndarray, polygons: List, value: int) -> Tuple[slice, slice]:
+    """
+    Draws the given polygons in ``buffer``, like ``convert_polygons_to_mask``, touching only
+    their bounding box. Returns the bounding box.
+    """
+    height, width = buffer.shape
+    sequences = convert_polygons_to_sequences(polygons, height=height, width=width)
+    xs = [x for sequence in sequences for x in sequence[0::2]]
+    ys = [y for sequence in sequences for y in sequence[1::2]]
+    x0, y0 = min(xs), min(ys)
+    box = (slice(y0, max(ys) + 1), slice(x0, max(xs) + 1))
+    draw_polygon(
+        buffer[box],
+        [
+            [c - (x0 if j % 2 == 0 else y0) for j, c in enumerate(sequence)]
+            for sequence in sequences
+        ],
+        value,
+    )
+    return box
@@ -1,14 +1,16 @@
 import ast
 import json as native_json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from rich.console import Console
 from rich.theme import Theme
 
+from darwin.utils.concurrency import map_in_processes
 from darwin.utils.utils import get_annotations_in_slot
 
 
@@ -47,7 +49,27 @@ class Plane(Enum):
 
 @dataclass
 class Volume:
-    pixel_array: np.ndarray
+    """
+    An output volume of a single class. Its voxels are only materialized by ``to_array``
+    when the volume is written, until then they are kept either as the annotated slices
+    (polygons) or as a reference to the label volume shared by all the classes of a
+    raster layer.
+
+    Attributes
+    ----------
+    pixel_array : Optional[np.ndarray]
+        Dense voxels of the volume, takes precedence over ``slices`` and ``label_volume``
+        when set.
+    slices : Dict[int, np.ndarray]
+        Binary mask of each annotated slice along the primary plane, by frame index.
+    label_volume : Optional[np.ndarray]
+        Integer label volume the voxels of the volume are taken from.
+    labels : List[int]
+        Values of ``label_volume`` that belong to the volume. If empty, the label volume
+        itself is written.
+    """
+
+    pixel_array: Optional[np.ndarray]
     affine: Optional[np.ndarray]
     original_affine: Optional[np.ndarray]
     dims: List
@@ -56,6 +78,34 @@ class Volume:
     series_instance_uid: str
     from_raster_layer: bool
     primary_plane: str
+    slices: Dict[int, np.ndarray] = field(default_factory=dict)
+    label_volume: Optional[np.ndarray] = None
+    labels: List[int] = field(default_factory=list)
+
+    def to_array(self, dtype: np.dtype = np.uint8) -> np.ndarray:
+        """
+        Materializes the voxels of the volume.
+
+        Parameters
+        ----------
+        dtype : np.dtype, default=np.uint8
+            Type of the returned array.
+
+        Returns
+        -------
+        np.ndarray
+            Dense array of shape ``dims``.
+        """
+        if self.pixel_array is not None:
+            return self.pixel_array.astype(dtype)
+        if self.label_volume is not None:
+            if not self.labels:
+                return self.label_volume.astype(dtype)
+            return np.isin(self.label_volume, self.labels).astype(dtype)
+        pixel_array = np.zeros(self.dims, dtype=dtype)
+        for frame_idx, mask in self.slices.items():
+            pixel_array[_plane_slice(self.primary_plane, frame_idx)] = mask
+        return pixel_array
 
 
 # Unique ID and file suffix for the "All segments" volume
@@ -66,6 +116,7 @@ multi_segments_name = "Segments"
 def export(
     annotation_files: Iterable[dt.AnnotationFile],
     output_dir: Path,
+    max_workers: Optional[int] = 1,
 ) -> None:
     """
     Exports the given ``AnnotationFile``\\s into nifti format inside of the given
@@ -77,66 +128,128 @@ def export(
         The ``AnnotationFile``\\s to be exported.
     output_dir : Path
         The folder where the new instance mask files will be.
+    max_workers : Optional[int], default=1
+        Number of processes the items are exported with, ``None`` for the number of CPUs. With
+        ``1`` they are exported in the current process, which doesn't require the calling
+        script to be guarded by ``if __name__ == "__main__"`` on platforms that spawn processes.
 
     Returns
     -------
     sends output volumes, image_id and output_dir to the write_output_volume_to_disk function
 
     """
-    for annotation_file in annotation_files:
-        slot_map = {slot.name: slot for slot in annotation_file.slots}
-        image_id = check_for_error_and_return_imageid(annotation_file, output_dir)
-        if not isinstance(image_id, str):
-            continue
-
-        for slot in annotation_file.slots:
-            slot_name = slot.name
-            slot_annotations = get_annotations_in_slot(
-                slot_name, annotation_file.annotations
-            )
+    for _ in map_in_processes(
+        partial(export_annotation_file, output_dir=output_dir),
+        annotation_files,
+        max_workers,
+    ):
+        pass
 
-            try:
-                medical_metadata = slot.metadata
-                legacy = not medical_metadata.get("handler") == "MONAI"  # type: ignore
-                plane_map = medical_metadata.get("plane_map") or {slot_name: "AXIAL"}
-                primary_plane = medical_metadata.get(
-                    "primary_plane", plane_map.get(slot_name, "AXIAL")
-                )
-            except (KeyError, AttributeError):
-                legacy = True
-                primary_plane = "AXIAL"
 
-            polygon_class_names = [
-                ann.annotation_class.name
-                for ann in slot_annotations
-                if ann.annotation_class.annotation_type == "polygon"
-            ]
-            # Check if there are any rasters in the annotation, these are created with a _m suffix
-            # in addition to those created from polygons.
-            annotation_types = [
-                a.annotation_class.annotation_type for a in slot_annotations
-            ]
-            mask_present = (
-                "raster_layer" in annotation_types and "mask" in annotation_types
+def export_annotation_file(
+    annotation_file: dt.AnnotationFile, output_dir: Path
+) -> None:
+    """
+    Exports the given ``AnnotationFile`` into nifti format inside of the given
+    ``output_dir``, one volume per class and slot.
+
+    Parameters
+    ----------
+    annotation_file : dt.AnnotationFile
+        The ``AnnotationFile`` to be exported.
+    output_dir : Path
+        The folder where the new instance mask files will be.
+    """
+    slot_map = {slot.name: slot for slot in annotation_file.slots}
+    image_id = check_for_error_and_return_imageid(annotation_file, output_dir)
+    if not isinstance(image_id, str):
+        return
+
+    for slot in annotation_file.slots:
+        slot_name = slot.name
+        slot_annotations = get_annotations_in_slot(
+            slot_name, annotation_file.annotations
+        )
+
+        try:
+            medical_metadata = slot.metadata
+            legacy = not medical_metadata.get("handler") == "MONAI"  # type: ignore
+            plane_map = medical_metadata.get("plane_map") or {slot_name: "AXIAL"}
+            primary_plane = medical_metadata.get(
+                "primary_plane", plane_map.get(slot_name, "AXIAL")
+            )
+        except (KeyError, AttributeError):
+            legacy = True
+            primary_plane = "AXIAL"
+
+        polygon_class_names = [
+            ann.annotation_class.name
+            for ann in slot_annotations
+            if ann.annotation_class.annotation_type == "polygon"
+        ]
+        # Check if there are any rasters in the annotation, these are created with a _m suffix
+        # in addition to those created from polygons.
+        annotation_types = [
+            a.annotation_class.annotation_type for a in slot_annotations
+        ]
+        mask_present = "raster_layer" in annotation_types and "mask" in annotation_types
+        output_volumes = build_output_volumes(
+            slot,
+            class_names_to_export=polygon_class_names,
+            from_raster_layer=False,
+            mask_present=mask_present,
+            primary_plane=primary_plane,
+        )
+        polygon_annotations = [
+            ann
+            for ann in slot_annotations
+            if ann.annotation_class.annotation_type == "polygon"
+        ]
+        if polygon_annotations:
+            populate_output_volumes_from_polygons(
+                polygon_annotations, slot_map, output_volumes, legacy=legacy
             )
-            output_volumes = build_output_volumes(
+        write_output_volume_to_disk(
+            output_volumes,
+            image_id=image_id,
+            output_dir=output_dir,
+            legacy=legacy,
+            item_name=annotation_file.path.stem,
+            slot_name=slot.name,
+            filename=slot.source_files[0].file_name,
+        )
+        # Need to map raster layers to SeriesInstanceUIDs
+        if mask_present:
+            mask_id_to_classname = {
+                ann.id: ann.annotation_class.name
+                for ann in slot_annotations
+                if ann.annotation_class.annotation_type == "mask"
+            }
+            # Add a unique ID for the "All segments" volume
+            mask_id_to_classname[multi_segments_label] = multi_segments_name
+            raster_output_volumes = build_output_volumes(
                 slot,
-                class_names_to_export=polygon_class_names,
-                from_raster_layer=False,
-                mask_present=mask_present,
+                class_names_to_export=list(mask_id_to_classname.values()),
+                from_raster_layer=True,
                 primary_plane=primary_plane,
             )
-            polygon_annotations = [
+
+            # This assumes only one raster_layer annotation. If we allow multiple raster layers per annotation file we need to change this.
+            raster_layer_annotation = [
                 ann
                 for ann in slot_annotations
-                if ann.annotation_class.annotation_type == "polygon"
-            ]
-            if polygon_annotations:
-                populate_output_volumes_from_polygons(
-                    polygon_annotations, slot_map, output_volumes, legacy=legacy
+                if ann.annotation_class.annotation_type == "raster_layer"
+            ][0]
+            if raster_layer_annotation:
+                populate_output_volumes_from_raster_layer(
+                    annotation=raster_layer_annotation,
+                    mask_id_to_classname=mask_id_to_classname,
+                    slot_map=slot_map,
+                    output_volumes=raster_output_volumes,
+                    primary_plane=primary_plane,
                 )
             write_output_volume_to_disk(
-                output_volumes,
+                raster_output_volumes,
                 image_id=image_id,
                 output_dir=output_dir,
                 legacy=legacy,
@@ -144,45 +257,6 @@ def export(
                 slot_name=slot.name,
                 filename=slot.source_files[0].file_name,
             )
-            # Need to map raster layers to SeriesInstanceUIDs
-            if mask_present:
-                mask_id_to_classname = {
-                    ann.id: ann.annotation_class.name
-                    for ann in slot_annotations
-                    if ann.annotation_class.annotation_type == "mask"
-                }
-                # Add a unique ID for the "All segments" volume
-                mask_id_to_classname[multi_segments_label] = multi_segments_name
-                raster_output_volumes = build_output_volumes(
-                    slot,
-                    class_names_to_export=list(mask_id_to_classname.values()),
-                    from_raster_layer=True,
-                    primary_plane=primary_plane,
-                )
-
-                # This assumes only one raster_layer annotation. If we allow multiple raster layers per annotation file we need to change this.
-                raster_layer_annotation = [
-                    ann
-                    for ann in slot_annotations
-                    if ann.annotation_class.annotation_type == "raster_layer"
-                ][0]
-                if raster_layer_annotation:
-                    populate_output_volumes_from_raster_layer(
-                        annotation=raster_layer_annotation,
-                        mask_id_to_classname=mask_id_to_classname,
-                        slot_map=slot_map,
-                        output_volumes=raster_output_volumes,
-                        primary_plane=primary_plane,
-                    )
-                write_output_volume_to_disk(
-                    raster_output_volumes,
-                    image_id=image_id,
-                    output_dir=output_dir,
-                    legacy=legacy,
-                    item_name=annotation_file.path.stem,
-                    slot_name=slot.name,
-                    filename=slot.source_files[0].file_name,
-                )
 
 
 def build_output_volumes(
@@ -231,7 +305,7 @@ def build_output_volumes(
     return {
         series_instance_uid: {
             class_name: Volume(
-                pixel_array=np.zeros(volume_dims, dtype=np.uint8),
+                pixel_array=None,
                 affine=affine,
                 original_affine=original_affine,
                 dims=volume_dims,
@@ -335,18 +409,29 @@ def update_pixel_array(
     Dict
         Updated volume
     """
+    slice_ = _plane_slice(primary_plane, frame_idx)
+    if slice_ is None:
+        return volume
+    class_volume = volume[annotation_class_name]
+    if class_volume.pixel_array is not None:
+        class_volume.pixel_array[slice_] = np.logical_or(
+            im_mask, class_volume.pixel_array[slice_]
+        )
+    elif frame_idx in class_volume.slices:
+        class_volume.slices[frame_idx] |= im_mask.astype(bool)
+    else:
+        class_volume.slices[frame_idx] = im_mask.astype(bool)
+    return volume
+
+
+def _plane_slice(primary_plane: str, frame_idx: int) -> Optional[Tuple]:
+    """Returns the index of the slice ``frame_idx`` along ``primary_plane`` in a volume."""
     plane_to_slice = {
         "AXIAL": np.s_[:, :, frame_idx],
         "CORONAL": np.s_[:, frame_idx, :],
         "SAGITTAL": np.s_[frame_idx, :, :],
     }
-    if primary_plane in plane_to_slice:
-        slice_ = plane_to_slice[primary_plane]
-        volume[annotation_class_name].pixel_array[slice_] = np.logical_or(
-            im_mask,
-            volume[annotation_class_name].pixel_array[slice_],
-        )
-    return volume
+    return plane_to_slice.get(primary_plane)
 
 
 def populate_output_volumes_from_polygons(
@@ -494,20 +579,18 @@ def populate_output_volumes_from_raster_layer(
         elif primary_plane == "SAGITTAL":
             multilabel_volume[frame_idx, :, :] = converted_mask_2d.T
 
-    # Now we convert this multilabel array into this dictionary of output volumes
-    # in order to re-use the write_output_volume_to_disk function.
+    # Now we point the volume of each class to this multilabel array, the binary mask of
+    # each class is only created by write_output_volume_to_disk.
+    volume = output_volumes[series_instance_uid]
     for mask_id, class_name in mask_id_to_classname.items():
         if mask_id in global_mask_annotation_ids_mapping:
-            volume = output_volumes[series_instance_uid]
-            global_id = global_mask_annotation_ids_mapping[mask_id]
-            # We want to create a binary mask for each class
-            volume[class_name].pixel_array = np.where(
-                multilabel_volume == global_id, 1, volume[class_name].pixel_array
+            volume[class_name].label_volume = multilabel_volume
+            volume[class_name].labels.append(
+                global_mask_annotation_ids_mapping[mask_id]
             )
         elif mask_id == multi_segments_label:
             # Unique ID for "All segments":
-            volume = output_volumes[series_instance_uid]
-            volume[multi_segments_name].pixel_array = multilabel_volume
+            volume[multi_segments_name].label_volume = multilabel_volume
 
     return volume
 
@@ -559,7 +642,7 @@ def write_output_volume_to_disk(
     volumes = unnest_dict_to_list(output_volumes)
     for volume in volumes:
         img = nib.Nifti1Image(
-            dataobj=volume.pixel_array.astype(np.int16),
+            dataobj=volume.to_array(np.int16),
             affine=volume.affine,
         )
         img = _get_reoriented_nifti_image(img, volume, legacy, filename)
@@ -3,11 +3,14 @@ import json
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 
+from darwin import instrumentation
+
 console = Console()
 
 
@@ -267,73 +270,48 @@ def _calculate_avg_bitrate(index_data: str, segments: List[str]) -> Optional[flo
     return None
 
 
-def _extract_segments(source_file: str, dirs: Dict, segment_length: int) -> Dict:
-    """
-    Extract HLS segments in high and low quality
-    Returns segment info and frame counts per segment
-    """
-    qualities = {
-        "high": {"crf": 23, "gop": 15},
-        "low": {
-            "crf": 40,
-            "gop": 15,
-            "scale": "-2:'if(gt(ih,720),max(ceil(ih/4)*2,720),ih)'",
-        },
-    }
-
-    bitrates = {}
-
-    for quality, opts in qualities.items():
-        quality_dir = dirs["segments_" + quality]
-        segment_pattern = os.path.join(quality_dir, "%09d.ts")
-        index_path = os.path.join(quality_dir, "index.m3u8")
-
-        # Build ffmpeg command
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-v",
-            "error",
-            "-i",
-            source_file,
-            "-c:v",
-            "libx264",
-            "-crf",
-            str(opts["crf"]),
-            "-g",
-            str(opts["gop"]),
-            "-f",
-            "hls",
-            "-hls_time",
-            str(segment_length),
-            "-hls_list_size",
-            "0",
-            "-start_number",
-            "0",
-            "-hls_segment_filename",
-            segment_pattern,
-            "-vsync",
-            "passthrough",
-            "-max_muxing_queue_size",
-            "1024",
-        ]
-
-        # Add scale filter for low quality
-        if "scale" in opts:
-            cmd.extend(["-vf", f"scale={opts['scale']}"])
-
-        cmd.append(index_path)
-
-        subprocess.run(cmd, check=True)
+HLS_QUALITIES = {
+    "high": {"crf": 23, "gop": 15},
+    "low": {
+        "crf": 40,
+        "gop": 15,
+        "scale": "-2:'if(gt(ih,720),max(ceil(ih/4)*2,720),ih)'",
+    },
+}
+
+
+def _hls_output_args(quality_dir: str, opts: Dict, segment_length: int) -> List[str]:
+    """Output options of the HLS segments of a quality, without the scale filter"""
+    return [
+        "-c:v",
+        "libx264",
+        "-crf",
+        str(opts["crf"]),
+        "-g",
+        str(opts["gop"]),
+        "-f",
+        "hls",
+        "-hls_time",
+        str(segment_length),
+        "-hls_list_size",
+        "0",
+        "-start_number",
+        "0",
+        "-hls_segment_filename",
+        os.path.join(quality_dir, "%09d.ts"),
+        "-vsync",
+        "passthrough",
+        "-max_muxing_queue_size",
+        "1024",
+    ]
 
-        # Read index file and calculate bitrate
-        with open(index_path) as f:
-            index_data = f.read()
-            segments = sorted(Path(quality_dir).glob("*.ts"))
-            bitrate = _calculate_avg_bitrate(index_data, [str(s) for s in segments])
-            bitrates[quality] = bitrate
 
-    return {"bitrates": bitrates}
+def _get_segments_bitrate(quality_dir: str) -> Optional[float]:
+    """Read the HLS index of a quality and calculate its average bitrate"""
+    with open(os.path.join(quality_dir, "index.m3u8")) as f:
+        index_data = f.read()
+    segments = sorted(Path(quality_dir).glob("*.ts"))
+    return _calculate_avg_bitrate(index_data, [str(s) for s in segments])
 
 
 def _extract_thumbnail(source_file: str, output_path: str, total_frames: int) -> str:
@@ -389,82 +367,155 @@ def _get_frames_timestamps(source_file: str) -> List[float]:
     return frames
 
 
-def _extract_frames(
-    source_file: str,
-    output_dir: str,
-    downsampling_step: float,
-    quality: int,
-):
-    """Extract frames using ffmpeg with optional downsampling.
-
-    Parameters
-    ----------
-    source_file : str
-        Path to source video file
-    output_dir : str
-        Directory to store extracted frames
-    downsampling_step : float
-        Downsampling step for frame extraction
-    quality : int
-        Quality level: 1 for high quality png, 2-31 for lower quality jpeg
-    """
+def _frames_output_args(output_dir: str, quality: int) -> List[str]:
+    """Output options and pattern of the extracted frames, without the select filter"""
     # Determine extension based on quality settings
     if quality == 1:
         frame_ext = "png"
     else:
         frame_ext = "jpg"
 
-    frame_pattern = os.path.join(output_dir, f"%09d.{frame_ext}")
+    args = ["-start_number", "0", "-vsync", "passthrough", "-f", "image2"]
+
+    # Add quality flag for JPEG
+    if quality > 1:
+        args.extend(["-q", str(quality)])
+
+    return [*args, os.path.join(output_dir, f"%09d.{frame_ext}")]
+
+
+def _frames_select_filter(downsampling_step: float) -> Optional[str]:
+    """Select filter of the frames to extract, None if every frame is extracted"""
+    if downsampling_step > 1:
+        # Use select filter to precisely control what frames are extracted
+        # This matches the frame selection logic in the manifest
+        return f"select='eq(trunc(trunc((n+1)/{downsampling_step})*{downsampling_step})\\,n)'"
+    return None
+
+
+def _decode_source(
+    source_file: str,
+    dirs: Dict,
+    segment_length: int,
+    downsampling_step: float,
+    primary_frames_quality: int,
+    extract_preview_frames: bool,
+) -> Tuple[Dict, List[float]]:
+    """
+    Extract the HLS segments, the frames and the frame timestamps in a single decode.
+
+    Rather than decoding the whole source once per output, the decoded frames are split
+    between the outputs in one filter graph, and every output is encoded concurrently
+    by the same ffmpeg process.
+
+    Args:
+        source_file: Path to source video file
+        dirs: Directories of the artifacts, see ``_create_directories``
+        segment_length: Length of each segment in seconds
+        downsampling_step: Downsampling step for frame extraction
+        primary_frames_quality: Quality level of the high quality frames
+        extract_preview_frames: If True, also extract the low quality frames
+
+    Returns:
+        Tuple[Dict, List[float]]: (segments_metadata, frames_timestamps)
+    """
+    branches = []
+    outputs: List[str] = []
+
+    for quality, opts in HLS_QUALITIES.items():
+        quality_dir = dirs["segments_" + quality]
+        label = f"hls_{quality}"
+        branches.append(f"scale={opts['scale']}" if "scale" in opts else "null")
+        # Segments keep the audio of the source, like when no stream is mapped explicitly
+        outputs.extend(["-map", f"[{label}]", "-map", "0:a:0?"])
+        outputs.extend(_hls_output_args(quality_dir, opts, segment_length))
+        outputs.append(os.path.join(quality_dir, "index.m3u8"))
+
+    frames = [(dirs["sections_high"], primary_frames_quality)]
+    if extract_preview_frames:
+        frames.append((dirs["sections_low"], 5))
+    for i, (output_dir, quality) in enumerate(frames):
+        branches.append(_frames_select_filter(downsampling_step) or "null")
+        outputs.extend(["-map", f"[frames_{i}]"])
+        outputs.extend(_frames_output_args(output_dir, quality))
+
+    labels = [f"hls_{quality}" for quality in HLS_QUALITIES] + [
+        f"frames_{i}" for i in range(len(frames))
+    ]
+    graph = [
+        f"[0:v:0]split={len(labels) + 1}"
+        + "".join(f"[{i}]" for i in range(len(labels) + 1))
+    ]
+    graph.extend(
+        f"[{i}]{branch}[{label}]"
+        for i, (branch, label) in enumerate(zip(branches, labels))
+    )
+    # Frame timestamps are logged by showinfo, at info level
+    graph.append(f"[{len(labels)}]showinfo,nullsink")
 
     cmd = [
         "ffmpeg",
         "-hide_banner",
+        "-nostats",
         "-v",
-        "error",
+        "info",
         "-i",
         source_file,
-        "-start_number",
-        "0",
-        "-vsync",
-        "passthrough",
-        "-f",
-        "image2",
+        "-filter_complex",
+        ";".join(graph),
+        *outputs,
     ]
 
-    # Add quality flag for JPEG
-    if quality > 1:
-        cmd.extend(["-q", str(quality)])
-
-    if downsampling_step > 1:
-        # Use select filter to precisely control what frames are extracted
-        # This matches the frame selection logic in the manifest
-        select_expr = f"select='eq(trunc(trunc((n+1)/{downsampling_step})*{downsampling_step})\\,n)'"
-        cmd.extend(["-vf", select_expr])
-
-    cmd.extend([frame_pattern])
+    # Timestamps are parsed as they are logged, for long videos showinfo logs a lot
+    frames_timestamps = []
+    log = []
+    with subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True) as process:
+        assert process.stderr is not None
+        for line in process.stderr:
+            if "pts_time:" in line:
+                pts_time = line.split("pts_time:")[1].split()[0]
+                frames_timestamps.append(float(pts_time))
+            elif "showinfo" not in line:
+                log.append(line)
+    if process.returncode != 0:
+        console.print("".join(log))
+        raise subprocess.CalledProcessError(
+            process.returncode, cmd, stderr="".join(log)
+        )
 
-    subprocess.run(cmd, check=True)
+    bitrates = {
+        quality: _get_segments_bitrate(dirs["segments_" + quality])
+        for quality in HLS_QUALITIES
+    }
+    return {"bitrates": bitrates}, frames_timestamps
 
 
-def _get_segment_frame_counts(segments_dir: str) -> List[int]:
-    """Get frame counts for each segment in order"""
+def _get_segment_frame_counts(
+    segments_dir: str, max_workers: Optional[int] = None
+) -> List[int]:
+    """Get frame counts for each segment in order, probing the segments concurrently"""
     segments = sorted(Path(segments_dir).glob("*.ts"))
-    segment_frame_counts = []
-    for segment in segments:
-        count = _count_frames(str(segment))
-        segment_frame_counts.append(count)
-    return segment_frame_counts
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_count_frames, map(str, segments)))
 
 
 def _create_frames_manifest(
-    source_file: str, segments_dir: str, downsampling_step: float, manifest_path: str
+    source_file: str,
+    segments_dir: str,
+    downsampling_step: float,
+    manifest_path: str,
+    frames_timestamps: Optional[List[float]] = None,
+    max_workers: Optional[int] = None,
 ) -> Dict:
     """
     Create frames manifest mapping frames to segments
     Format: FRAME_NO_IN_SEGMENT:SEGMENT_NO:VISIBILITY_FLAG:TIMESTAMP
+
+    The frame timestamps are read from the source, unless they are given.
     """
-    frames_timestamps = _get_frames_timestamps(source_file)
-    segment_frame_counts = _get_segment_frame_counts(segments_dir)
+    if frames_timestamps is None:
+        frames_timestamps = _get_frames_timestamps(source_file)
+    segment_frame_counts = _get_segment_frame_counts(segments_dir, max_workers)
 
     file_lines = []
     visible_frames = 0
@@ -577,6 +628,7 @@ def _maybe_extract_audio_peaks(source_file: str, output_dir: str) -> Optional[st
         return None
 
 
+@instrumentation.span("extract_artifacts")
 def extract_artifacts(
     source_file: str,
     output_dir: str,
@@ -588,6 +640,7 @@ def extract_artifacts(
     save_metadata: bool = False,
     extract_preview_frames: bool = True,
     primary_frames_quality: int = 1,
+    max_workers: Optional[int] = None,
 ) -> Dict:
     """
     Extracts video artifacts including segments, frames, thumbnail for
@@ -607,6 +660,8 @@ def extract_artifacts(
         primary_frames_quality: Quality setting for primary display frames.
             1 (default) means use PNG format (lossless).
             2-31 means use JPEG with that quality (2=best, 31=worst).
+        max_workers: Maximum number of ffmpeg and ffprobe processes run at the same
+            time, defaults to the executor's default based on the number of CPUs.
 
     Returns:
         Dict containing metadata and paths to generated artifacts
@@ -626,52 +681,64 @@ def extract_artifacts(
 
     storage_key_prefix = storage_key_prefix.strip("/")
 
-    console.print("\nExtracting video metadata...")
-
-    metadata = _get_video_metadata(source_file)
-    native_fps = float(metadata["native_fps"])
-    downsampling_step = round(max(native_fps / fps, 1.0), 4) if fps > 0 else 1.0
-    source_file_size = os.path.getsize(source_file)
+    # Passes that don't depend on each other run concurrently, ffmpeg and ffprobe
+    # spend their time in subprocesses so threads are enough
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        console.print("\nExtracting audio peaks...")
 
-    console.print(f"\nVideo resolution: {metadata['width']}x{metadata['height']}")
-    console.print(f"Native FPS: {native_fps}")
-    console.print(f"Downsampling step: {downsampling_step}")
-    console.print(f"Source file size: {source_file_size} bytes")
+        audio_peaks = executor.submit(
+            _maybe_extract_audio_peaks, source_file, dirs["base_dir"]
+        )
 
-    console.print("\nExtracting video segments...")
+        console.print("\nExtracting video metadata...")
 
-    segments_metadata = _extract_segments(
-        source_file=source_file, dirs=dirs, segment_length=segment_length
-    )
+        metadata = _get_video_metadata(source_file)
+        native_fps = float(metadata["native_fps"])
+        downsampling_step = round(max(native_fps / fps, 1.0), 4) if fps > 0 else 1.0
+        source_file_size = os.path.getsize(source_file)
 
-    console.print("\nExtracting frames...")
+        console.print(f"\nVideo resolution: {metadata['width']}x{metadata['height']}")
+        console.print(f"Native FPS: {native_fps}")
+        console.print(f"Downsampling step: {downsampling_step}")
+        console.print(f"Source file size: {source_file_size} bytes")
 
-    _extract_frames(
-        source_file, dirs["sections_high"], downsampling_step, primary_frames_quality
-    )
-    if extract_preview_frames:
-        _extract_frames(source_file, dirs["sections_low"], downsampling_step, 5)
+        console.print("\nExtracting video segments and frames...")
 
-    console.print("\nCreating frames manifest...")
+        with instrumentation.span("extract_artifacts.decode_source"):
+            segments_metadata, frames_timestamps = _decode_source(
+                source_file=source_file,
+                dirs=dirs,
+                segment_length=segment_length,
+                downsampling_step=downsampling_step,
+                primary_frames_quality=primary_frames_quality,
+                extract_preview_frames=extract_preview_frames,
+            )
 
-    manifest_metadata = _create_frames_manifest(
-        source_file=source_file,
-        segments_dir=dirs["segments_high"],
-        downsampling_step=downsampling_step,
-        manifest_path=os.path.join(dirs["base_dir"], "frames_manifest.txt"),
-    )
+        console.print("\nExtracting thumbnail...")
 
-    console.print("\nExtracting thumbnail...")
+        thumbnail = executor.submit(
+            _extract_thumbnail,
+            source_file=source_file,
+            output_path=os.path.join(dirs["base_dir"], "thumbnail.jpg"),
+            total_frames=len(frames_timestamps),
+        )
 
-    _extract_thumbnail(
-        source_file=source_file,
-        output_path=os.path.join(dirs["base_dir"], "thumbnail.jpg"),
-        total_frames=manifest_metadata["total_frames"],
-    )
+        console.print("\nCreating frames manifest...")
 
-    console.print("\nExtracting audio peaks...")
+        with instrumentation.span("extract_artifacts.create_frames_manifest"):
+            manifest_metadata = _create_frames_manifest(
+                source_file=source_file,
+                segments_dir=dirs["segments_high"],
+                downsampling_step=downsampling_step,
+                manifest_path=os.path.join(dirs["base_dir"], "frames_manifest.txt"),
+                frames_timestamps=frames_timestamps,
+                max_workers=max_workers,
+            )
 
-    _maybe_extract_audio_peaks(source_file, dirs["base_dir"])
+        # Audio peaks and the thumbnail are extracted alongside the passes above
+        with instrumentation.span("extract_artifacts.wait_for_audio_and_thumbnail"):
+            thumbnail.result()
+            audio_peaks.result()
 
     console.print("\nProcessing segment indices...")
 
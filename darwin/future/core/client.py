@@ -9,6 +9,7 @@ import yaml
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 from requests.adapters import HTTPAdapter, Retry
 
+from darwin import instrumentation
 from darwin.config import Config as OldConfig
 from darwin.future.core.types.common import JSONType, QueryString
 from darwin.future.exceptions import (
@@ -184,6 +185,7 @@ class ClientCore:
 
     def _setup_session(self, retries: Retry) -> None:
         self.session.headers.update(self.headers)
+        self.session.hooks.update(instrumentation.hooks("client_core"))
         self.session.mount("http://", HTTPAdapter(max_retries=retries))
         self.session.mount("https://", HTTPAdapter(max_retries=retries))
 
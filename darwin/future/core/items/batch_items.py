@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Tuple
+
+import requests
+from tenacity import (
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from darwin.future.core.types.common import JSONType
+from darwin.future.data_objects.typing import UnknownType
+from darwin.future.exceptions import DarwinException
+from darwin.future.pydantic_base import DefaultDarwin
+
+BATCH_SIZE = 1000
+MAX_WORKERS = 4
+MAX_ATTEMPTS = 3
+
+TRANSIENT_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+class BatchResult(DefaultDarwin):
+    """
+    Aggregated outcome of an action applied to items in batches.
+
+    Attributes
+    ----------
+    item_ids: List[str]
+        Ids of the items whose batch succeeded.
+    failed_item_ids: List[str]
+        Ids of the items whose batch failed after every retry.
+    responses: List[JSONType]
+        The response of each successful batch, in submission order.
+    """
+
+    item_ids: List[str] = []
+    failed_item_ids: List[str] = []
+    responses: List[JSONType] = []
+
+
+class BatchActionFailed(DarwinException):
+    """Raised when some batches of an item action failed after every retry."""
+
+    result: BatchResult
+
+
+def _is_transient(exc: BaseException) -> bool:
+    # ``RetryError`` is raised once the session's own retries of 5xx responses are exhausted
+    if isinstance(
+        exc,
+        (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError),
+    ):
+        return True
+    return (
+        isinstance(exc, requests.HTTPError)
+        and exc.response is not None
+        and exc.response.status_code in TRANSIENT_STATUS_CODES
+    )
+
+
+def _chunks(item_ids: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    iterator = iter(item_ids)
+    while chunk := list(islice(iterator, batch_size)):
+        yield chunk
+
+
+def apply_in_batches(
+    action: Callable[[Dict[str, UnknownType]], JSONType],
+    item_ids: Iterable[str],
+    batch_size: int = BATCH_SIZE,
+    max_workers: int = MAX_WORKERS,
+    max_attempts: int = MAX_ATTEMPTS,
+    retry_wait: float = 1.0,
+) -> BatchResult:
+    """
+    Applies an item action to the given ids, split into batches that are submitted
+    concurrently as soon as enough ids are available.
+
+    Parameters
+    ----------
+    action: Callable[[Dict[str, UnknownType]], JSONType]
+        Function sending the action for the given filters, e.g. ``delete_list_of_items``
+        with every argument but ``filters`` bound.
+    item_ids: Iterable[str]
+        Ids of the items to apply the action to. It is consumed lazily, so that listing
+        the ids overlaps with submitting the first batches.
+    batch_size: int
+        Maximum number of ids sent in a single request.
+    max_workers: int
+        Maximum number of batches submitted at the same time.
+    max_attempts: int
+        Number of times a batch is sent before it is considered failed. Only connection
+        errors, timeouts, rate limiting and server errors are retried.
+    retry_wait: float
+        Initial number of seconds to wait between attempts, doubled on each retry.
+
+    Returns
+    -------
+    BatchResult
+        The ids of the affected items and the response of each batch.
+
+    Raises
+    ------
+    BatchActionFailed
+        If some batches failed and others succeeded, with the errors in
+        ``combined_exceptions`` and the partial outcome in ``result``. When every batch
+        failed, the error of the first one is raised instead.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    def send(chunk: List[str]) -> JSONType:
+        for attempt in Retrying(
+            retry=retry_if_exception(_is_transient),
+            stop=stop_after_attempt(max_attempts),
+            wait=wait_exponential_jitter(initial=retry_wait, max=60 * retry_wait),
+            reraise=True,
+        ):
+            with attempt:
+                return action({"item_ids": chunk})
+
+    result = BatchResult()
+    errors: List[Exception] = []
+
+    def collect(chunk: List[str], future: Future) -> None:
+        try:
+            result.responses.append(future.result())
+            result.item_ids.extend(chunk)
+        except Exception as e:
+            errors.append(e)
+            result.failed_item_ids.extend(chunk)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        # Bound the number of pending batches so that ids are not listed far ahead
+        pending: Deque[Tuple[List[str], Future]] = deque()
+        for chunk in _chunks(item_ids, batch_size):
+            pending.append((chunk, executor.submit(send, chunk)))
+            if len(pending) >= 2 * max(1, max_workers):
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+
+    if errors and not result.item_ids:
+        raise errors[0]
+    if errors:
+        exception = BatchActionFailed(
+            f"{len(result.failed_item_ids)} items failed: "
+            + ", ".join(str(e) for e in errors)
+        )
+        exception.combined_exceptions = errors
+        exception.result = result
+        raise exception
+    return result
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
@@ -300,15 +301,61 @@ class PaginatedQuery(Query[T]):
             self.page.increment()
         return self._unwrap(self.results)
 
-    def collect_all(self, force: bool = False) -> List[T]:
+    def collect_all(self, force: bool = False, max_workers: int = 1) -> List[T]:
+        """
+        Collects every page of the query.
+
+        Args:
+            force (bool): Discard the results collected so far and start from the first page.
+            max_workers (int): Number of pages requested concurrently. Pages past the last
+                one may be requested speculatively when greater than 1.
+
+        Returns:
+            List[T]: All the results of the query.
+        """
         if force:
             self.page = Page()
             self.completed = False
             self.results = {}
+        if max_workers > 1 and not self.completed:
+            if self._changed_since_last:
+                self.page = Page()
+                self.results = {}
+                self._changed_since_last = False
+            self._collect_pages_concurrently(max_workers)
         while not self.completed:
             self.collect()
         return self._unwrap(self.results)
 
+    def _collect_pages_concurrently(self, max_workers: int) -> None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not self.completed:
+                pages = [
+                    Page(
+                        offset=self.page.offset + i * self.page.size,
+                        size=self.page.size,
+                    )
+                    for i in range(max_workers)
+                ]
+                for page, new_results in zip(
+                    pages, executor.map(self._collect_page, pages)
+                ):
+                    self.results = {**self.results, **new_results}
+                    if len(new_results) < page.size or len(new_results) == 0:
+                        self.completed = True
+                        break
+                    self.page.increment()
+
+    def _collect(self) -> Dict[int, T]:
+        return self._collect_page(self.page)
+
+    def _collect_page(self, page: Page) -> Dict[int, T]:
+        """
+        Collects the results of the given page, keyed by their absolute index. Subclasses
+        implement this instead of ``_collect`` so pages can be fetched concurrently.
+        """
+        raise NotImplementedError("Not implemented")
+
     def __getitem__(self, index: int) -> T:
         if index not in self.results:
             temp_page = self.page
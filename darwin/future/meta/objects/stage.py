@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Literal, Optional, Set
 from uuid import UUID
 
-from darwin.future.core.items import get_item, move_items_to_stage
+from darwin.future.core.items import move_items_to_stage
+from darwin.future.core.items.get import list_items
+from darwin.future.core.types.common import QueryString
 from darwin.future.core.types.query import QueryFilter
 from darwin.future.data_objects.workflow import WFEdgeCore, WFStageCore
 from darwin.future.exceptions import MaxRetriesError
@@ -12,6 +16,9 @@ from darwin.future.meta.objects.base import MetaBase
 from darwin.future.meta.queries.item import ItemQuery
 from darwin.future.meta.queries.item_id import ItemIDQuery
 
+# Number of item ids whose processing status is checked with a single request
+COMPLETION_CHECK_BATCH_SIZE = 100
+
 
 class Stage(MetaBase[WFStageCore]):
     """
@@ -84,32 +91,65 @@ class Stage(MetaBase[WFStageCore]):
         item_ids: list[str],
         wait_max_attempts: int = 5,
         wait_time: float = 0.5,
+        batch_size: int = COMPLETION_CHECK_BATCH_SIZE,
+        max_workers: int = 4,
+        backoff: Optional[Callable[[int], float]] = None,
     ) -> bool:
         """
         Checks if all items are complete. If not, waits and tries again. Raises error if max attempts reached.
 
+        The processing status of the items is listed in batches of ``batch_size`` ids,
+        sent concurrently, and only the items that are still pending are checked again on
+        the following attempts. Completed items are removed from ``item_ids``.
+
         Args:
             slug (str): Team slug
             item_ids (list[str]): List of item ids
             max_attempts (int, optional): Max number of attempts. Defaults to 5.
             wait_time (float, optional): Wait time between attempts. Defaults to 0.5.
+            batch_size (int, optional): Number of items checked per request. Defaults to 100.
+            max_workers (int, optional): Number of concurrent requests. Defaults to 4.
+            backoff (Callable[[int], float], optional): Returns the number of seconds to
+                wait after the given failed attempt. Defaults to ``wait_time * attempt``.
         """
-        for attempt in range(1, wait_max_attempts + 1):
-            # check if all items are complete
-            for item_id in item_ids[:]:
-                if get_item(self.client, slug, item_id).processing_status != "complete":
-                    break
-                item_ids.remove(item_id)
-            else:
-                # if all items are complete, return.
-                return True
-            # if not complete, wait
-            time.sleep(wait_time * attempt)
-        else:
-            # if max attempts reached, raise error
-            raise MaxRetriesError(
-                f"Max attempts reached. {len(item_ids)} items pending completion check."
-            )
+        dataset_ids: int | list[int] | Literal["all"] = self.meta_params.get(
+            "dataset_id", "all"
+        )
+        check = partial(self._complete_item_ids, slug, dataset_ids)
+        pending: Set[str] = set(item_ids)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for attempt in range(1, wait_max_attempts + 1):
+                ordered = sorted(pending)
+                batches = [
+                    ordered[i : i + batch_size]
+                    for i in range(0, len(ordered), batch_size)
+                ]
+                for complete in executor.map(check, batches):
+                    pending -= complete
+                item_ids[:] = [item_id for item_id in item_ids if item_id in pending]
+                if not pending:
+                    # if all items are complete, return.
+                    return True
+                # if not complete, wait
+                time.sleep(backoff(attempt) if backoff else wait_time * attempt)
+        # if max attempts reached, raise error
+        raise MaxRetriesError(
+            f"Max attempts reached. {len(pending)} items pending completion check."
+        )
+
+    def _complete_item_ids(
+        self,
+        slug: str,
+        dataset_ids: int | list[int] | Literal["all"],
+        item_ids: List[str],
+    ) -> Set[str]:
+        items, _ = list_items(
+            self.client,
+            slug,
+            dataset_ids,
+            QueryString({"item_ids": item_ids, "page[size]": len(item_ids)}),
+        )
+        return {str(item.id) for item in items if item.processing_status == "complete"}
 
     def move_attached_files_to_stage(
         self,
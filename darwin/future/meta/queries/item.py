@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from functools import reduce
-from typing import Dict, Literal, Protocol, Union
+from functools import partial, reduce
+from typing import Callable, Dict, Iterable, Literal, Protocol, Union
 
 from darwin.future.core.items.archive_items import archive_list_of_items
 from darwin.future.core.items.assign_items import assign_items
+from darwin.future.core.items.batch_items import (
+    BATCH_SIZE,
+    MAX_WORKERS,
+    BatchResult,
+    apply_in_batches,
+)
 from darwin.future.core.items.delete_items import delete_list_of_items
 from darwin.future.core.items.get import list_items, list_items_unstable
 from darwin.future.core.items.move_items_to_folder import move_list_of_items_to_folder
@@ -14,11 +20,13 @@ from darwin.future.core.items.set_item_priority import set_item_priority
 from darwin.future.core.items.set_stage_to_items import set_stage_to_items
 from darwin.future.core.items.tag_items import tag_items
 from darwin.future.core.items.untag_items import untag_items
-from darwin.future.core.types.common import JSONDict, QueryString
+from darwin.future.core.types.common import JSONDict, JSONType, QueryString
 from darwin.future.core.types.query import PaginatedQuery, QueryFilter
 from darwin.future.data_objects.advanced_filters import GroupFilter, SubjectFilter
 from darwin.future.data_objects.item import ItemLayout
+from darwin.future.data_objects.page import Page
 from darwin.future.data_objects.sorting import SortingMethods
+from darwin.future.data_objects.typing import UnknownType
 from darwin.future.data_objects.workflow import WFStageCore
 from darwin.future.exceptions import BadRequest
 from darwin.future.meta.objects.item import Item
@@ -30,7 +38,24 @@ class hasStage(Protocol):
 
 
 class ItemQuery(PaginatedQuery[Item]):
-    def _collect(self) -> Dict[int, Item]:
+    """
+    Query over the items of a dataset.
+
+    Bulk actions (``delete``, ``archive``, ``set_stage``, ...) are sent for the ids of
+    the matching items, split into batches of at most ``batch_size`` ids that are
+    submitted by up to ``max_workers`` threads and retried on transient errors. They
+    return a ``BatchResult`` aggregating every batch and raise ``BatchActionFailed`` if
+    only some of the batches failed.
+
+    Actions that don't remove items from the results of the query (``tag``,
+    ``set_priority``, ...) accept ``stream=True`` to submit the first batches while the
+    remaining pages are still being listed. Actions that may remove items from them
+    (``delete``, ``archive``, ``restore``, ``move_to_folder`` and ``set_stage``) always
+    list every matching item first: listing is paginated by offset, so removing items
+    while listing would skip others.
+    """
+
+    def _collect_page(self, page: Page) -> Dict[int, Item]:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -45,14 +70,14 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        params = self._build_params()
+        params = self._build_params(page)
         if isinstance(params, QueryString):
             items_core, errors = list_items(self.client, team_slug, dataset_ids, params)
         else:
             items_core, errors = list_items_unstable(
                 api_client=self.client, team_slug=team_slug, params=params
             )
-        offset = self.page.offset
+        offset = page.offset
         items = {
             i
             + offset: Item(
@@ -62,6 +87,22 @@ class ItemQuery(PaginatedQuery[Item]):
         }
         return items
 
+    def _apply_in_batches(
+        self,
+        action: Callable[[Dict[str, UnknownType]], JSONType],
+        batch_size: int,
+        max_workers: int,
+        stream: bool = False,
+    ) -> BatchResult:
+        if stream:
+            item_ids: Iterable[str] = (str(item.id) for item in self)
+        else:
+            self.collect_all()
+            item_ids = [str(item.id) for item in self]
+        return apply_in_batches(
+            action, item_ids, batch_size=batch_size, max_workers=max_workers
+        )
+
     def sort(self, **kwargs: str) -> ItemQuery:
         valid_values = {"asc", "desc"}
         for value in kwargs.values():
@@ -76,7 +117,11 @@ class ItemQuery(PaginatedQuery[Item]):
                 self.filters.append(filter)
         return self
 
-    def delete(self) -> None:
+    def delete(
+        self,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -91,12 +136,18 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        delete_list_of_items(self.client, team_slug, dataset_ids, filters)
+        return self._apply_in_batches(
+            partial(delete_list_of_items, self.client, team_slug, dataset_ids),
+            batch_size,
+            max_workers,
+        )
 
-    def move_to_folder(self, path: str) -> None:
+    def move_to_folder(
+        self,
+        path: str,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -114,17 +165,21 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        move_list_of_items_to_folder(self.client, team_slug, dataset_ids, path, filters)
+        return self._apply_in_batches(
+            partial(
+                move_list_of_items_to_folder, self.client, team_slug, dataset_ids, path
+            ),
+            batch_size,
+            max_workers,
+        )
 
-    def _build_params(self) -> Union[QueryString, JSONDict]:
+    def _build_params(self, page: Page | None = None) -> Union[QueryString, JSONDict]:
+        page = page or self.page
         if self._advanced_filters is None:
             return reduce(
                 lambda s1, s2: s1 + s2,
                 [
-                    self.page.to_query_string(),
+                    page.to_query_string(),
                     *[QueryString(f.to_dict()) for f in self.filters],
                 ],
             )
@@ -137,11 +192,17 @@ class ItemQuery(PaginatedQuery[Item]):
         )
         return {
             "dataset_ids": [dataset_id],
-            "page": self.page.model_dump(),
+            "page": page.model_dump(),
             "filter": self._advanced_filters.model_dump(),
         }
 
-    def set_priority(self, priority: int) -> None:
+    def set_priority(
+        self,
+        priority: int,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        stream: bool = False,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -159,12 +220,18 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        set_item_priority(self.client, team_slug, dataset_ids, priority, filters)
+        return self._apply_in_batches(
+            partial(set_item_priority, self.client, team_slug, dataset_ids, priority),
+            batch_size,
+            max_workers,
+            stream,
+        )
 
-    def restore(self) -> None:
+    def restore(
+        self,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -179,12 +246,17 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        restore_list_of_items(self.client, team_slug, dataset_ids, filters)
+        return self._apply_in_batches(
+            partial(restore_list_of_items, self.client, team_slug, dataset_ids),
+            batch_size,
+            max_workers,
+        )
 
-    def archive(self) -> None:
+    def archive(
+        self,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -199,12 +271,19 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        archive_list_of_items(self.client, team_slug, dataset_ids, filters)
+        return self._apply_in_batches(
+            partial(archive_list_of_items, self.client, team_slug, dataset_ids),
+            batch_size,
+            max_workers,
+        )
 
-    def set_layout(self, layout: ItemLayout) -> None:
+    def set_layout(
+        self,
+        layout: ItemLayout,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        stream: bool = False,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
 
@@ -221,12 +300,20 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        set_item_layout(self.client, team_slug, dataset_ids, layout, filters)
+        return self._apply_in_batches(
+            partial(set_item_layout, self.client, team_slug, dataset_ids, layout),
+            batch_size,
+            max_workers,
+            stream,
+        )
 
-    def tag(self, tag_id: int) -> None:
+    def tag(
+        self,
+        tag_id: int,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        stream: bool = False,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
         if (
@@ -244,12 +331,20 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        tag_items(self.client, team_slug, dataset_ids, tag_id, filters)
+        return self._apply_in_batches(
+            partial(tag_items, self.client, team_slug, dataset_ids, tag_id),
+            batch_size,
+            max_workers,
+            stream,
+        )
 
-    def untag(self, tag_id: int) -> None:
+    def untag(
+        self,
+        tag_id: int,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        stream: bool = False,
+    ) -> BatchResult:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query items")
         if (
@@ -267,12 +362,21 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        untag_items(self.client, team_slug, dataset_ids, tag_id, filters)
+        return self._apply_in_batches(
+            partial(untag_items, self.client, team_slug, dataset_ids, tag_id),
+            batch_size,
+            max_workers,
+            stream,
+        )
 
-    def assign(self, assignee_id: int, workflow_id: str | None = None) -> None:
+    def assign(
+        self,
+        assignee_id: int,
+        workflow_id: str | None = None,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        stream: bool = False,
+    ) -> BatchResult:
         if not assignee_id:
             raise ValueError("Must specify assignee to assign items to")
 
@@ -298,17 +402,27 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-
-        assign_items(
-            self.client, team_slug, dataset_ids, assignee_id, workflow_id, filters
+        return self._apply_in_batches(
+            partial(
+                assign_items,
+                self.client,
+                team_slug,
+                dataset_ids,
+                assignee_id,
+                workflow_id,
+            ),
+            batch_size,
+            max_workers,
+            stream,
         )
 
     def set_stage(
-        self, stage_or_stage_id: hasStage | str, workflow_id: str | None = None
-    ) -> None:
+        self,
+        stage_or_stage_id: hasStage | str,
+        workflow_id: str | None = None,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> BatchResult:
         if not stage_or_stage_id:
             raise ValueError(
                 "Must specify stage (either Stage object or stage_id string) to set items to"
@@ -344,12 +458,17 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-
-        set_stage_to_items(
-            self.client, team_slug, dataset_ids, stage_id, workflow_id, filters
+        return self._apply_in_batches(
+            partial(
+                set_stage_to_items,
+                self.client,
+                team_slug,
+                dataset_ids,
+                stage_id,
+                workflow_id,
+            ),
+            batch_size,
+            max_workers,
         )
 
     def where(
@@ -4,12 +4,13 @@ from typing import Dict
 from darwin.future.core.items.get import get_item_ids
 from darwin.future.core.types.common import QueryString
 from darwin.future.core.types.query import PaginatedQuery, QueryFilter
+from darwin.future.data_objects.page import Page
 from darwin.future.data_objects.sorting import SortingMethods
 from darwin.future.meta.objects.v7_id import V7ID
 
 
 class ItemIDQuery(PaginatedQuery[V7ID]):
-    def _collect(self) -> Dict[int, V7ID]:
+    def _collect_page(self, page: Page) -> Dict[int, V7ID]:
         if "team_slug" not in self.meta_params:
             raise ValueError("Must specify team_slug to query item ids")
         if (
@@ -26,7 +27,7 @@ class ItemIDQuery(PaginatedQuery[V7ID]):
         params: QueryString = reduce(
             lambda s1, s2: s1 + s2,
             [
-                self.page.to_query_string(),
+                page.to_query_string(),
                 *[QueryString(f.to_dict()) for f in self.filters],
             ],
         )
@@ -34,7 +35,7 @@ class ItemIDQuery(PaginatedQuery[V7ID]):
 
         results = {
             i
-            + self.page.offset: V7ID(
+            + page.offset: V7ID(
                 client=self.client, element=uuid, meta_params=self.meta_params
             )
             for i, uuid in enumerate(uuids)
@@ -0,0 +1,120 @@
+from functools import partial
+from typing import List
+
+import pytest
+import requests
+import responses
+from responses.matchers import json_params_matcher
+
+from darwin.future.core.client import ClientCore
+from darwin.future.core.items.batch_items import BatchActionFailed, apply_in_batches
+from darwin.future.core.items.delete_items import delete_list_of_items
+from darwin.future.exceptions import BadRequest
+from darwin.future.tests.core.fixtures import *
+
+
+@pytest.fixture
+def item_ids() -> List[str]:
+    return [f"00000000-0000-0000-0000-00000000000{i}" for i in range(5)]
+
+
+def add_delete(base_client: ClientCore, item_ids: List[str], status: int = 200):
+    responses.add(
+        responses.DELETE,
+        base_client.config.api_endpoint + "v2/teams/test-team/items",
+        json={"affected_item_count": len(item_ids)},
+        status=status,
+        match=[
+            json_params_matcher({"filters": {"dataset_ids": [1], "item_ids": item_ids}})
+        ],
+    )
+
+
+@responses.activate
+def test_apply_in_batches_splits_ids(
+    base_client: ClientCore, item_ids: List[str]
+) -> None:
+    for chunk in [item_ids[:2], item_ids[2:4], item_ids[4:]]:
+        add_delete(base_client, chunk)
+
+    result = apply_in_batches(
+        partial(delete_list_of_items, base_client, "test-team", 1),
+        iter(item_ids),
+        batch_size=2,
+        max_workers=2,
+    )
+
+    assert result.item_ids == item_ids
+    assert result.failed_item_ids == []
+    assert [r["affected_item_count"] for r in result.responses] == [2, 2, 1]
+
+
+@responses.activate
+def test_apply_in_batches_retries_transient_errors(
+    base_client: ClientCore, item_ids: List[str]
+) -> None:
+    add_delete(base_client, item_ids, status=503)
+    add_delete(base_client, item_ids)
+
+    result = apply_in_batches(
+        partial(delete_list_of_items, base_client, "test-team", 1),
+        item_ids,
+        retry_wait=0,
+    )
+
+    assert result.item_ids == item_ids
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_apply_in_batches_retries_exhausted_session_retries(
+    base_client: ClientCore, item_ids: List[str]
+) -> None:
+    responses.add(
+        responses.DELETE,
+        base_client.config.api_endpoint + "v2/teams/test-team/items",
+        body=requests.exceptions.RetryError("too many 503 error responses"),
+    )
+    add_delete(base_client, item_ids)
+
+    result = apply_in_batches(
+        partial(delete_list_of_items, base_client, "test-team", 1),
+        item_ids,
+        retry_wait=0,
+    )
+
+    assert result.item_ids == item_ids
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_apply_in_batches_reports_partial_failures(
+    base_client: ClientCore, item_ids: List[str]
+) -> None:
+    add_delete(base_client, item_ids[:3])
+    add_delete(base_client, item_ids[3:], status=400)
+
+    with pytest.raises(BatchActionFailed) as exc_info:
+        apply_in_batches(
+            partial(delete_list_of_items, base_client, "test-team", 1),
+            item_ids,
+            batch_size=3,
+        )
+
+    assert exc_info.value.result.item_ids == item_ids[:3]
+    assert exc_info.value.result.failed_item_ids == item_ids[3:]
+    assert isinstance(exc_info.value.combined_exceptions[0], BadRequest)
+
+
+@responses.activate
+def test_apply_in_batches_raises_original_error_if_nothing_succeeded(
+    base_client: ClientCore, item_ids: List[str]
+) -> None:
+    add_delete(base_client, item_ids, status=400)
+
+    with pytest.raises(BadRequest):
+        apply_in_batches(
+            partial(delete_list_of_items, base_client, "test-team", 1), item_ids
+        )
+
+    assert len(responses.calls) == 1
@@ -1,11 +1,13 @@
 from typing import List
 from uuid import UUID
 
+import pytest
 import responses
 from pytest import fixture
 from responses.matchers import query_param_matcher
 
 from darwin.future.data_objects.workflow import WFEdgeCore, WFStageCore, WFTypeCore
+from darwin.future.exceptions import MaxRetriesError
 from darwin.future.meta.client import Client
 from darwin.future.meta.objects.stage import Stage
 from darwin.future.meta.queries.item import ItemQuery
@@ -15,6 +17,21 @@ from darwin.future.tests.core.items.fixtures import *
 from darwin.future.tests.meta.fixtures import *
 
 
+def item_json(item_id: str, processing_status: str) -> dict:
+    return {
+        "archived": False,
+        "dataset_id": 1337,
+        "id": item_id,
+        "layout": None,
+        "name": f"test_{item_id}",
+        "path": "test_path",
+        "priority": 0,
+        "processing_status": processing_status,
+        "slots": [],
+        "tags": [],
+    }
+
+
 @fixture
 def uuid_str() -> str:
     return "00000000-0000-0000-0000-000000000000"
@@ -128,30 +145,93 @@ def test_move_attached_files_to_stage_wait(
             json={"success": UUIDs_str},
             status=200,
         )
-        for uuid in stage_meta.item_ids.collect_all():
-            rsps.add(
-                rsps.GET,
-                base_meta_client.config.api_endpoint
-                + f"v2/teams/default-team/items/{uuid}",
-                json={
-                    "archived": False,
-                    "dataset_id": 1337,
-                    "id": "00000000-0000-0000-0000-000000000000",
-                    "layout": None,
-                    "name": "test_0",
-                    "path": "test_path",
-                    "priority": 0,
-                    "processing_status": "complete",
-                    "slots": [],
-                    "tags": [],
-                },
-                status=200,
-            )
+        rsps.add(
+            rsps.GET,
+            base_meta_client.config.api_endpoint + "v2/teams/default-team/items",
+            json={
+                "items": [item_json(uuid, "complete") for uuid in UUIDs_str],
+                "errors": [],
+            },
+            match=[
+                query_param_matcher(
+                    {"page[size]": "10", "dataset_ids": "1337"}, strict_match=False
+                )
+            ],
+            status=200,
+        )
         stage_meta.move_attached_files_to_stage(
             stage_meta.id, wait=True, wait_max_attempts=5, wait_time=0.5
         )
 
 
+def test_check_all_items_complete_only_rechecks_pending_items(
+    base_meta_client: Client, stage_meta: Stage, UUIDs_str: List[str]
+) -> None:
+    url = base_meta_client.config.api_endpoint + "v2/teams/default-team/items"
+    first, second = sorted(UUIDs_str)[:5], sorted(UUIDs_str)[5:]
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.GET,
+            url,
+            json={
+                "items": [item_json(uuid, "complete") for uuid in first],
+                "errors": [],
+            },
+            match=[query_param_matcher({"item_ids": first}, strict_match=False)],
+        )
+        rsps.add(
+            rsps.GET,
+            url,
+            json={
+                "items": [item_json(second[0], "processing")]
+                + [item_json(uuid, "complete") for uuid in second[1:]],
+                "errors": [],
+            },
+            match=[query_param_matcher({"item_ids": second}, strict_match=False)],
+        )
+        rsps.add(
+            rsps.GET,
+            url,
+            json={"items": [item_json(second[0], "complete")], "errors": []},
+            match=[query_param_matcher({"item_ids": second[0]}, strict_match=False)],
+        )
+        item_ids = list(UUIDs_str)
+        waits: List[int] = []
+
+        def backoff(attempt: int) -> float:
+            waits.append(attempt)
+            return 0
+
+        assert stage_meta.check_all_items_complete(
+            "default-team", item_ids, batch_size=5, backoff=backoff
+        )
+        assert item_ids == []
+        assert waits == [1]
+        assert len(rsps.calls) == 3
+
+
+def test_check_all_items_complete_raises_after_max_attempts(
+    base_meta_client: Client, stage_meta: Stage, UUIDs_str: List[str]
+) -> None:
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.GET,
+            base_meta_client.config.api_endpoint + "v2/teams/default-team/items",
+            json={
+                "items": [item_json(uuid, "processing") for uuid in UUIDs_str],
+                "errors": [],
+            },
+        )
+        item_ids = list(UUIDs_str)
+
+        with pytest.raises(MaxRetriesError):
+            stage_meta.check_all_items_complete(
+                "default-team", item_ids, wait_max_attempts=2, wait_time=0
+            )
+        assert item_ids == UUIDs_str
+        assert len(rsps.calls) == 2
+
+
 def test_get_stage_id(stage_meta: Stage) -> None:
     assert stage_meta.id == UUID("00000000-0000-0000-0000-000000000000")
 
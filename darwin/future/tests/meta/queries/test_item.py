@@ -380,6 +380,57 @@ def test_tag(item_query: ItemQuery, items_json: List[dict], items: List[Item]) -
         item_query.tag(tag_id)
 
 
+def test_tag_streams_batches(
+    item_query: ItemQuery, items_json: List[dict], items: List[Item]
+) -> None:
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.GET,
+            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            match=[
+                query_param_matcher(
+                    {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
+                )
+            ],
+            json={"items": items_json, "errors": []},
+        )
+        team_slug = items[0].meta_params["team_slug"]
+        dataset_id = items[0].meta_params["dataset_id"]
+        tag_id = 123456
+        item_ids = [str(item.id) for item in items]
+        for chunk in [item_ids[:2], item_ids[2:4], item_ids[4:]]:
+            rsps.add(
+                rsps.POST,
+                items[0].client.config.api_endpoint
+                + f"v2/teams/{team_slug}/items/slots/tags",
+                status=200,
+                match=[
+                    json_params_matcher(
+                        {
+                            "filters": {
+                                "item_ids": chunk,
+                                "dataset_ids": [dataset_id],
+                            },
+                            "annotation_class_id": tag_id,
+                        }
+                    )
+                ],
+                json={},
+            )
+        result = item_query.tag(tag_id, batch_size=2, stream=True)
+        assert result.item_ids == item_ids
+        assert len(result.responses) == 3
+
+
+@pytest.mark.parametrize("action", ["delete", "archive", "restore"])
+def test_actions_removing_items_do_not_stream(
+    item_query: ItemQuery, action: str
+) -> None:
+    # Listing by offset while items are removed from the results would skip items
+    with pytest.raises(TypeError):
+        getattr(item_query, action)(stream=True)
+
+
 def test_tag_bad_request(
     item_query: ItemQuery, items_json: List[dict], items: List[Item]
 ) -> None:
@@ -225,3 +225,37 @@ def test_sort_method(base_client: ClientCore):
     assert len(item_id_query.filters) == 2
     assert item_id_query.filters[0].name == "sort[accuracy]"
     assert item_id_query.filters[0].param == "desc"
+
+
+def test_pagination_collects_all_concurrently(
+    base_client: ClientCore, base_ItemIDQuery: ItemIDQuery, list_of_uuids: List[UUID]
+) -> None:
+    base_ItemIDQuery.page = Page(size=4)
+    team_slug = base_ItemIDQuery.meta_params["team_slug"]
+    dataset_id = base_ItemIDQuery.meta_params["dataset_id"]
+    str_ids = [str(uuid) for uuid in list_of_uuids]
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        endpoint = (
+            base_client.config.api_endpoint + f"v2/teams/{team_slug}/items/list_ids"
+        )
+        for offset in range(0, 16, 4):
+            rsps.add(
+                responses.GET,
+                endpoint,
+                match=[
+                    query_param_matcher(
+                        {
+                            "page[offset]": str(offset),
+                            "page[size]": "4",
+                            "dataset_ids": str(dataset_id),
+                        }
+                    )
+                ],
+                json={"item_ids": str_ids[offset : offset + 4]},
+            )
+
+        ids = base_ItemIDQuery.collect_all(max_workers=2)
+
+        assert [x.id for x in ids] == list_of_uuids
+        assert base_ItemIDQuery.page.offset == 8
+        assert base_ItemIDQuery.completed is True
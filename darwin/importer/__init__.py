@@ -1,8 +1,20 @@
 from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from darwin.datatypes import ImportParser
 
-from .importer import import_annotations  # noqa
+if TYPE_CHECKING:
+    from .importer import import_annotations  # noqa
+
+
+def __getattr__(name: str) -> Any:
+    # ``import_annotations`` is imported on first access (PEP 562), as it loads the
+    # multiprocessing and NumPy stacks
+    if name == "import_annotations":
+        value = getattr(import_module("darwin.importer.importer"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ImporterNotFoundError(ModuleNotFoundError):
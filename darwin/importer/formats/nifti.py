@@ -294,42 +294,41 @@ def get_mask_video_annotations(
     elif primary_plane == "SAGITTAL":
         view_idx = 0
 
+    # Slices are read as uint8, like the labels of the raster layer
+    slices = np.moveaxis(volume, view_idx, 0).astype(np.uint8)
+    # Whether each label value is present in each slice
+    label_presence = np.zeros((len(slices), 256), dtype=bool)
+    for i, slice_mask in enumerate(slices):
+        label_presence[i] = np.bincount(slice_mask.ravel(), minlength=256) > 0
+
     mask_annotation_ids_mapping = {}
-    map_from_nifti_idx_to_raster_idx = {0: 0}  # 0 is the background class
-    for i in range(volume.shape[view_idx]):
-        if view_idx == 2:
-            slice_mask = volume[:, :, i].astype(np.uint8)
-        elif view_idx == 1:
-            slice_mask = volume[:, i, :].astype(np.uint8)
-        elif view_idx == 0:
-            slice_mask = volume[i, :, :].astype(np.uint8)
-        for raster_idx, (class_name, class_idxs) in enumerate(
-            processed_class_map.items()
-        ):
-            if class_name == "background":
-                continue
-            class_mask = np.isin(slice_mask, class_idxs).astype(np.uint8).copy()
-            if class_mask.sum() == 0:
-                continue
+    # Lookup table from nifti_idx to raster_idx, 0 is the background class
+    raster_idx_lut = np.zeros(256, dtype=np.int64)
+    class_frames = {}
+    for raster_idx, (class_name, class_idxs) in enumerate(processed_class_map.items()):
+        if class_name == "background":
+            continue
+        valid_idxs = [idx for idx in class_idxs if 0 <= idx < 256]
+        frames = np.flatnonzero(label_presence[:, valid_idxs].any(axis=1))
+        if len(frames) == 0:
+            continue
+        class_frames[class_name] = (raster_idx + 1, frames)
+        raster_idx_lut[valid_idxs] = raster_idx + 1
+    # Classes are listed in the order they first appear in, then in class map order
+    for class_name, (raster_idx, frames) in sorted(
+        class_frames.items(), key=lambda x: x[1][1][0]
+    ):
+        mask_annotation_ids_mapping[mask_annotation_ids[class_name]] = raster_idx
+        for i in frames.tolist():
             all_mask_annotations[class_name][i] = dt.make_mask(
                 class_name, subs=None, slot_names=slot_names
             )
             all_mask_annotations[class_name][i].id = mask_annotation_ids[class_name]
-            mask_annotation_ids_mapping[mask_annotation_ids[class_name]] = (
-                raster_idx + 1
-            )
-            for class_idx in class_idxs:
-                map_from_nifti_idx_to_raster_idx[class_idx] = raster_idx + 1
+
     # Now that we've created all the mask annotations, we need to create the raster layer
     # We only map the mask_annotation_ids which appear in any given frame.
     axial_size_after_isotropic_scaling = get_new_axial_size(volume, pixdims)
-    for i in range(volume.shape[view_idx]):
-        if view_idx == 2:
-            slice_mask = volume[:, :, i].astype(np.uint8)
-        elif view_idx == 1:
-            slice_mask = volume[:, i, :].astype(np.uint8)
-        elif view_idx == 0:
-            slice_mask = volume[i, :, :].astype(np.uint8)
+    for i, slice_mask in enumerate(slices):
         if isotropic:
             slice_mask = zoom(
                 slice_mask,
@@ -340,9 +339,7 @@ def get_mask_video_annotations(
             )
 
         # We need to convert from nifti_idx to raster_idx
-        slice_mask = np.vectorize(
-            lambda key: map_from_nifti_idx_to_raster_idx.get(key, 0)
-        )(slice_mask)
+        slice_mask = raster_idx_lut[slice_mask]
         dense_rle = convert_to_dense_rle(slice_mask)
         raster_annotation = dt.make_raster_layer(
             class_name="__raster_layer__",
@@ -626,16 +623,13 @@ def process_nifti(
 
 
 def convert_to_dense_rle(raster: np.ndarray) -> List[int]:
-    dense_rle, prev_val, cnt = [], None, 0
-    for val in raster.T.flat:
-        if val == prev_val:
-            cnt += 1
-        else:
-            if prev_val is not None:
-                dense_rle.extend([int(prev_val), int(cnt)])
-            prev_val, cnt = val, 1
-    dense_rle.extend([int(prev_val), int(cnt)])
-    return dense_rle
+    values = raster.T.ravel()
+    # Index of the first value of each run
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    dense_rle = np.empty(2 * len(starts), dtype=np.int64)
+    dense_rle[0::2] = values[starts]
+    dense_rle[1::2] = np.diff(np.append(starts, len(values)))
+    return dense_rle.tolist()
 
 
 def get_new_axial_size(
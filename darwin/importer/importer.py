@@ -1,6 +1,4 @@
 import concurrent.futures
-import copy
-import json
 import uuid
 from collections import defaultdict
 from logging import getLogger
@@ -12,8 +10,8 @@ from typing import (
     Any,
     Callable,
     Dict,
-    Generator,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -52,6 +50,7 @@ from darwin.utils.utils import _parse_annotators
 
 Unknown = Any  # type: ignore
 import numpy as np
+import orjson
 from tqdm import tqdm
 
 if TYPE_CHECKING:
@@ -62,6 +61,7 @@ from rich.console import Console
 from rich.theme import Theme
 
 import darwin.datatypes as dt
+from darwin import instrumentation
 from darwin.datatypes import PathLike
 from darwin.exceptions import IncompatibleOptions, RequestEntitySizeExceeded
 from darwin.utils import secure_continue_request
@@ -79,6 +79,11 @@ except ImportError:
 # Classes missing import support on backend side
 UNSUPPORTED_CLASSES = ["string", "graph"]
 
+# The maximum size of the body of an annotation import request
+MAX_PAYLOAD_SIZE = 32_000_000
+# Video annotations have frame indices as keys
+_PAYLOAD_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 # Classes that are defined on team level automatically and available in all datasets
 GLOBAL_CLASSES = ["__raster_layer__"]
 
@@ -143,6 +148,7 @@ def _build_main_annotations_lookup_table(
     return lookup
 
 
+@instrumentation.span("import_annotations.parse")
 def _find_and_parse(  # noqa: C901
     importer: Callable[[Path], Union[List[dt.AnnotationFile], dt.AnnotationFile, None]],
     file_paths: List[PathLike],
@@ -158,19 +164,14 @@ def _find_and_parse(  # noqa: C901
 
     logger = getLogger(__name__)
 
-    def perf_time(reset: bool = False) -> Generator[float, float, None]:
-        start = perf_counter()
-        yield start
-        while True:
-            if reset:
-                start = perf_counter()
-            yield perf_counter() - start
+    start = perf_counter()
 
     def maybe_console(*args: Union[str, int, float]) -> None:
+        elapsed = perf_counter() - start
         if console is not None:
-            console.print(*[f"[{str(next(perf_time()))} seconds elapsed]", *args])
+            console.print(*[f"[{elapsed:.2f} seconds elapsed]", *args])
         else:
-            logger.info(*[f"[{str(next(perf_time()))}]", *args])
+            logger.info(*[f"[{elapsed:.2f}]", *args])
 
     maybe_console("Parsing files... ")
 
@@ -253,6 +254,7 @@ def _build_attribute_lookup(dataset: "RemoteDataset") -> Dict[str, Unknown]:
     return lookup
 
 
+@instrumentation.span("import_annotations.fetch_remote_files")
 def _get_remote_files_ready_for_import(
     dataset: "RemoteDataset",
     filenames: List[str],
@@ -1426,6 +1428,7 @@ def _assign_item_properties_to_dataset(
                         client.update_property(dataset.team, property_copy)
 
 
+@instrumentation.span("import_annotations")
 def import_annotations(  # noqa: C901
     dataset: "RemoteDataset",
     importer: Callable[[Path], Union[List[dt.AnnotationFile], dt.AnnotationFile, None]],
@@ -1841,32 +1844,42 @@ def import_annotations(  # noqa: C901
             team_property_lookups,
         )
 
-    team_property_lookups = TeamPropertyLookups.from_team(dataset.client, dataset.team)
-    annotation_id_property_map = {}
-    for local_file in tqdm(
-        local_files, desc="Processing properties from local annotation files"
-    ):
-        process_local_file(local_file, import_properties, force_single_thread=True)
+    with instrumentation.span("import_annotations.import_properties"):
+        team_property_lookups = TeamPropertyLookups.from_team(
+            dataset.client, dataset.team
+        )
+        annotation_id_property_map = {}
+        for local_file in tqdm(
+            local_files, desc="Processing properties from local annotation files"
+        ):
+            process_local_file(local_file, import_properties, force_single_thread=True)
 
-    if use_multi_cpu:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpu_limit) as executor:
-            futures = [
-                executor.submit(process_local_file, local_file, import_annotation)
-                for local_file in local_files
-            ]
-            for _ in tqdm(
-                concurrent.futures.as_completed(futures),
-                total=len(futures),
-                desc="Processing local annotation files",
+    with instrumentation.span(
+        "import_annotations.import_annotations", count=len(local_files)
+    ):
+        if use_multi_cpu:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=cpu_limit
+            ) as executor:
+                futures = [
+                    executor.submit(process_local_file, local_file, import_annotation)
+                    for local_file in local_files
+                ]
+                for _ in tqdm(
+                    concurrent.futures.as_completed(futures),
+                    total=len(futures),
+                    desc="Processing local annotation files",
+                ):
+                    future = next(concurrent.futures.as_completed(futures))
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        console.print(f"Generated an exception: {exc}", style="error")
+        else:
+            for local_file in tqdm(
+                local_files, desc="Processing local annotation files"
             ):
-                future = next(concurrent.futures.as_completed(futures))
-                try:
-                    future.result()
-                except Exception as exc:
-                    console.print(f"Generated an exception: {exc}", style="error")
-    else:
-        for local_file in tqdm(local_files, desc="Processing local annotation files"):
-            process_local_file(local_file, import_annotation)
+                process_local_file(local_file, import_annotation)
 
 
 def _get_multi_cpu_settings(
@@ -2255,24 +2268,15 @@ def _import_annotations(
         item_properties_lookup,
     )
 
-    payload: dt.DictFreeForm = {"annotations": serialized_annotations}
-    if serialized_item_level_properties:
-        payload["properties"] = serialized_item_level_properties
-    payload["overwrite"] = _get_overwrite_value(append)
-
+    payloads = _serialize_payloads(
+        serialized_annotations,
+        _get_overwrite_value(append),
+        serialized_item_level_properties,
+    )
     try:
-        dataset.import_annotation(id, payload=payload)
-    except RequestEntitySizeExceeded:
-        logger.warning(
-            "Annotation payload exceeds request entity size. Splitting payload into smaller chunks for import."
-        )
-        payloads = _split_payloads(payload)
-        for chunked_payload in payloads:
-            try:
-                dataset.import_annotation(id, payload=chunked_payload)
-            except Exception as e:
-                errors.append(e)
-                success = dt.Success.FAILURE
+        # Later payloads append to the first one, so the import stops at the first failure
+        for payload in payloads:
+            dataset.import_annotation(id, payload=payload)
     except Exception as e:
         errors.append(e)
         success = dt.Success.FAILURE
@@ -2292,6 +2296,7 @@ def _console_theme() -> Theme:
     )
 
 
+@instrumentation.span("import_annotations.check_overwrites")
 def _overwrite_warning(
     client: "Client",
     dataset: "RemoteDataset",
@@ -2592,59 +2597,74 @@ def _warn_for_annotations_with_multiple_instance_ids(
             )
 
 
-def _split_payloads(
-    payload: Dict[str, Any], max_payload_size: int = 32_000_000
-) -> List[Dict[str, Any]]:
+def _serialize_payloads(
+    annotations: List[dt.DictFreeForm],
+    overwrite: Union[str, bool],
+    properties: Optional[List[dt.DictFreeForm]] = None,
+    max_payload_size: int = MAX_PAYLOAD_SIZE,
+) -> Iterator[bytes]:
     """
-    This function takes an input payload and splits it into smaller payloads, ensuring each chunk does not exceed the specified maximum size.
-    This is useful when importing annotations, as it prevents HTTP 413 errors (`RequestEntitySizeExceeded`) from occurring due to large request entity sizes.
+    Serializes the bodies of the requests importing the given annotations of an item. Each
+    annotation is serialized once, and the annotations are split across as many requests as
+    needed for no body to exceed ``max_payload_size``, which would fail with HTTP 413
+    (``RequestEntitySizeExceeded``).
+
+    Only the first request overwrites the existing annotations, as requested by the user, and
+    sets the item level properties, the others append to it.
 
     Parameters
     ----------
-    payload : Dict[str, Any]
-        The input payload to be split.
-    max_payload_size : int, optional
-        The maximum size of each split payload. Defaults to 32,000,000 bytes.
-
-    Returns
-    -------
-    List[Dict[str, Any]]
-        A list of split payloads, each not exceeding the specified maximum size.
+    annotations : List[dt.DictFreeForm]
+        The serialized annotations to import.
+    overwrite : Union[str, bool]
+        The ``overwrite`` value of the first request.
+    properties : Optional[List[dt.DictFreeForm]], default: None
+        The serialized item level properties, if any.
+    max_payload_size : int, default: MAX_PAYLOAD_SIZE
+        The maximum size of a request body, in bytes.
+
+    Yields
+    ------
+    Iterator[bytes]
+        The JSON body of each request. There is always at least one, so that importing no
+        annotations clears the existing ones when overwriting.
 
     Raises
     ------
     ValueError
-        If any single annotation exceeds the `max_payload_size` limit
+        If any single annotation exceeds the ``max_payload_size`` limit.
     """
-    payloads = []
-    base_payload = {"annotations": [], "overwrite": payload["overwrite"]}
-    current_payload = copy.deepcopy(base_payload)
-    current_payload_size = 0
-
-    for annotation in payload["annotations"]:
-        annotation_size = len(json.dumps({"annotations": [annotation]}).encode("utf-8"))
-        if current_payload_size + annotation_size < max_payload_size:
-            current_payload["annotations"].append(annotation)
-            current_payload_size += annotation_size
-        else:
-            if annotation_size > max_payload_size:
-                raise ValueError(
-                    f"One or more annotations exceed the maximum allowed size of 32 MiB ({max_payload_size})"
-                )
-            payloads.append(current_payload)
-            current_payload = copy.deepcopy(base_payload)
-            current_payload["overwrite"] = (
-                False  # Required to make sure subsequent payloads don't overwrite previous ones
+    head = b'{"annotations":['
+    first_fields: dt.DictFreeForm = {"overwrite": overwrite}
+    if properties:
+        first_fields["properties"] = properties
+    # The closing bracket of the annotations, followed by the other fields of the object
+    tail = b"]," + orjson.dumps(first_fields, option=_PAYLOAD_OPTIONS)[1:]
+    append_tail = b'],"overwrite":false}'
+
+    chunk: List[bytes] = []
+    # Size of the body of the current chunk, counting a separator after each annotation
+    size = len(head) + len(tail)
+    yielded = False
+    for annotation in annotations:
+        serialized = orjson.dumps(annotation, option=_PAYLOAD_OPTIONS)
+        if chunk and size + len(serialized) > max_payload_size:
+            yield head + b",".join(chunk) + tail
+            yielded = True
+            chunk, tail = [], append_tail
+            size = len(head) + len(tail)
+        size += len(serialized) + 1
+        if size - 1 > max_payload_size:
+            raise ValueError(
+                f"One or more annotations exceed the maximum allowed size of 32 MiB ({max_payload_size})"
             )
-            current_payload["annotations"].append(annotation)
-            current_payload_size = annotation_size
-
-    if current_payload["annotations"]:
-        payloads.append(current_payload)
+        chunk.append(serialized)
 
-    return payloads
+    if chunk or not yielded:
+        yield head + b",".join(chunk) + tail
 
 
+@instrumentation.span("import_annotations.fetch_targeted_files")
 def _get_remote_files_targeted_by_import(
     importer: Callable[[Path], Union[List[dt.AnnotationFile], dt.AnnotationFile, None]],
     file_paths: List[PathLike],
@@ -0,0 +1,471 @@
+"""
+Opt-in instrumentation of the SDK: named spans around the stages of long running operations,
+such as ``pull``, ``push``, ``import_annotations``, ``export`` and ``extract_artifacts``, and
+metrics of the HTTP requests made by ``Client``, ``ClientCore`` and to the storage.
+
+It is disabled by default, and is enabled either with the ``DARWIN_METRICS`` environment
+variable, the ``--metrics`` option of the CLI or ``enable``, all of which take the path of the
+file the measurements are written to when the process exits. Paths ending in ``.prom`` are
+written as a Prometheus textfile (e.g. for the node exporter's textfile collector), any other
+path as JSON lines, with one line per span followed by one line per metric.
+
+Measurements are kept in the memory of the process that made them, so downloads made in other
+processes (see ``multi_processed`` in ``RemoteDataset.pull``) are not included.
+"""
+
+import atexit
+import os
+import re
+import threading
+import time
+from functools import partial, wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
+from urllib.parse import urlsplit
+
+import orjson as json
+from requests import Response
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+    3600.0,
+)
+
+# Name -> (type, help) of every metric recorded
+METRICS: Dict[str, Tuple[str, str]] = {
+    "darwin_span_duration_seconds": ("histogram", "Duration of the SDK's stages."),
+    "darwin_http_requests_total": ("counter", "HTTP requests, by final status."),
+    "darwin_http_request_duration_seconds": (
+        "histogram",
+        "Time from sending HTTP requests to receiving their response headers.",
+    ),
+    "darwin_http_retries_total": ("counter", "HTTP requests retried, by cause."),
+    "darwin_http_request_bytes_total": (
+        "counter",
+        "Bytes sent in HTTP request bodies.",
+    ),
+    "darwin_http_response_bytes_total": (
+        "counter",
+        "Bytes received in HTTP response bodies, as announced by their Content-Length.",
+    ),
+}
+
+# Path segments replaced in the endpoint label, to keep the number of label values bounded
+_NAMED_SEGMENTS: Dict[str, str] = {
+    "teams": ":team",
+    "datasets": ":dataset",
+    "exports": ":export",
+    "releases": ":release",
+}
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,})$",
+    re.IGNORECASE,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+# Not darwin.datatypes.PathLike, which would import this module circularly from ClientCore
+PathLike = Union[str, Path]
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Registry:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.spans: List[Dict[str, Any]] = []
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        # (name, labels) -> [count per bucket, sum, count]
+        self.histograms: Dict[Tuple[str, Labels], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, labels: Dict[str, str], value: float = 1) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[0][i] += 1
+                    break
+            histogram[1] += value
+            histogram[2] += 1
+
+    def add_span(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.spans.append(record)
+
+    def _cumulative(self, counts: List[int]) -> List[int]:
+        total, cumulative = 0, []
+        for count in counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def to_json_lines(self) -> bytes:
+        with self._lock:
+            lines = [{"type": "span", **record} for record in self.spans]
+            for (name, labels), value in sorted(self.counters.items()):
+                lines.append(
+                    {
+                        "type": "counter",
+                        "name": name,
+                        "labels": dict(labels),
+                        "value": value,
+                    }
+                )
+            for (name, labels), (counts, total, count) in sorted(
+                self.histograms.items()
+            ):
+                buckets = dict(zip(map(str, self.buckets), self._cumulative(counts)))
+                lines.append(
+                    {
+                        "type": "histogram",
+                        "name": name,
+                        "labels": dict(labels),
+                        "buckets": {**buckets, "+Inf": count},
+                        "sum": total,
+                        "count": count,
+                    }
+                )
+        return b"".join(json.dumps(line) + b"\n" for line in lines)
+
+    def to_prometheus(self) -> bytes:
+        with self._lock:
+            samples: Dict[str, List[str]] = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                samples.setdefault(name, []).append(
+                    f"{name}{_format_labels(labels)} {_format_value(value)}"
+                )
+            for (name, labels), (counts, total, count) in sorted(
+                self.histograms.items()
+            ):
+                lines = samples.setdefault(name, [])
+                for bound, cumulative in zip(self.buckets, self._cumulative(counts)):
+                    le = (("le", _format_value(bound)),)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels + le)} {cumulative}"
+                    )
+                le = (("le", "+Inf"),)
+                lines.append(f"{name}_bucket{_format_labels(labels + le)} {count}")
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_value(total)}"
+                )
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+        text = []
+        for name, lines in samples.items():
+            kind, description = METRICS.get(name, ("untyped", ""))
+            text += [f"# HELP {name} {description}", f"# TYPE {name} {kind}", *lines]
+        return "".join(f"{line}\n" for line in text).encode("utf-8")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_registry = _Registry()
+_path: Optional[Path] = None
+_local = threading.local()
+
+
+def enable(path: PathLike) -> None:
+    """
+    Starts recording spans and HTTP metrics, and writes them to ``path`` when the process exits.
+
+    Parameters
+    ----------
+    path : PathLike
+        The file to write the measurements to. Paths ending in ``.prom`` are written in the
+        Prometheus text format, any other path as JSON lines.
+    """
+    global _path
+    if _path is None:
+        atexit.register(_write_at_exit)
+    _path = Path(path)
+
+
+def disable() -> None:
+    """Stops recording, and forgets what was recorded without writing it."""
+    global _path
+    _path = None
+    reset()
+
+
+def is_enabled() -> bool:
+    return _path is not None
+
+
+def reset() -> None:
+    """Forgets every span and metric recorded so far."""
+    global _registry
+    _registry = _Registry()
+
+
+def write(path: PathLike) -> None:
+    """
+    Writes every span and metric recorded so far to ``path``, replacing it atomically.
+
+    Parameters
+    ----------
+    path : PathLike
+        The file to write the measurements to. Paths ending in ``.prom`` are written in the
+        Prometheus text format, any other path as JSON lines.
+    """
+    path = Path(path)
+    if path.suffix == ".prom":
+        data = _registry.to_prometheus()
+    else:
+        data = _registry.to_json_lines()
+
+    # Written next to the destination and renamed, so that collectors never read a partial file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def _write_at_exit() -> None:
+    if _path is None:
+        return
+    try:
+        write(_path)
+    except OSError as e:
+        print(f"Could not write the metrics to {_path}: {e}")
+
+
+class Span:
+    """
+    A named stage of an operation, timed when used as a context manager or as a decorator.
+    Spans started while another one is running in the same thread record it as their parent.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage, e.g. ``pull.download_release``.
+    **attributes : Any
+        JSON compatible values recorded along with the span, e.g. the number of files.
+    """
+
+    def __init__(self, name: str, **attributes: Any):
+        self.name = name
+        self.attributes = attributes
+        self._start: Optional[float] = None
+        self._started_at: float = 0.0
+        self._parent: Optional[str] = None
+
+    def __enter__(self) -> "Span":
+        if not is_enabled():
+            return self
+        stack = _span_stack()
+        self._parent = stack[-1] if stack else None
+        stack.append(self.name)
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if self._start is None:
+            return
+        duration = time.perf_counter() - self._start
+        self._start = None
+        _span_stack().pop()
+
+        status = "ok" if exc_type is None else "error"
+        _registry.observe(
+            "darwin_span_duration_seconds",
+            {"span": self.name, "status": status},
+            duration,
+        )
+        _registry.add_span(
+            {
+                "name": self.name,
+                "parent": self._parent,
+                "start": self._started_at,
+                "duration": duration,
+                "status": status,
+                "attributes": self.attributes,
+            }
+        )
+
+    def __call__(self, func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # A new span per call, so that the decorated function can run concurrently
+            with Span(self.name, **self.attributes):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+
+def span(name: str, **attributes: Any) -> Span:
+    """
+    Times the named stage of an operation, see ``Span``. Does nothing unless instrumentation
+    is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage, e.g. ``pull.download_release``.
+    **attributes : Any
+        JSON compatible values recorded along with the span, e.g. the number of files.
+
+    Returns
+    -------
+    Span
+        The span, to use as a context manager or a decorator.
+    """
+    return Span(name, **attributes)
+
+
+def _span_stack() -> List[str]:
+    stack = getattr(_local, "spans", None)
+    if stack is None:
+        stack = _local.spans = []
+    return stack
+
+
+def endpoint_label(url: str) -> str:
+    """
+    Returns the label of the endpoint of ``url``: its path under ``/api/`` without the query
+    string, and with team, dataset, export and release slugs and ids replaced by placeholders.
+    URLs outside of the API are labelled ``storage``.
+
+    Parameters
+    ----------
+    url : str
+        The requested URL.
+
+    Returns
+    -------
+    str
+        The label, e.g. ``v2/teams/:team/items/:id/annotations``.
+    """
+    path = f"{urlsplit(url).path}/"
+    if "/api/" not in path:
+        return "storage"
+
+    segments = [segment for segment in path.split("/api/", 1)[1].split("/") if segment]
+    label: List[str] = []
+    for i, segment in enumerate(segments):
+        previous = segments[i - 1] if i > 0 else ""
+        if previous in _NAMED_SEGMENTS and not _ID_SEGMENT.match(segment):
+            label.append(_NAMED_SEGMENTS[previous])
+        elif _ID_SEGMENT.match(segment):
+            label.append(":id")
+        else:
+            label.append(segment)
+    return "/".join(label)
+
+
+def record_retry(client: str, cause: Any) -> None:
+    """
+    Counts a retried HTTP request.
+
+    Parameters
+    ----------
+    client : str
+        What made the request: ``client``, ``client_core`` or ``storage``.
+    cause : Any
+        The status code of the response that caused the retry, or ``error``.
+    """
+    if is_enabled():
+        _registry.increment(
+            "darwin_http_retries_total", {"client": client, "cause": str(cause)}
+        )
+
+
+def record_response(client: str, response: Response, *args: Any, **kwargs: Any) -> None:
+    """
+    Records the metrics of an HTTP response. Meant as a ``requests`` response hook, see
+    ``hooks``.
+
+    Parameters
+    ----------
+    client : str
+        What made the request: ``client``, ``client_core`` or ``storage``.
+    response : Response
+        The response received.
+    """
+    if not is_enabled():
+        return
+
+    request = response.request
+    labels = {
+        "client": client,
+        "method": request.method or "",
+        "endpoint": endpoint_label(request.url or response.url),
+    }
+    _registry.observe(
+        "darwin_http_request_duration_seconds",
+        labels,
+        response.elapsed.total_seconds(),
+    )
+    _registry.increment(
+        "darwin_http_requests_total", {**labels, "status": str(response.status_code)}
+    )
+
+    sent = request.headers.get("Content-Length")
+    if sent is None and isinstance(request.body, (bytes, str)):
+        sent = len(request.body)
+    if sent:
+        _registry.increment("darwin_http_request_bytes_total", labels, int(sent))
+    received = response.headers.get("Content-Length")
+    if received:
+        _registry.increment("darwin_http_response_bytes_total", labels, int(received))
+
+    # Retries made by urllib3, as ClientCore's session does, only show in the final response
+    retries = getattr(response.raw, "retries", None)
+    for attempt in getattr(retries, "history", None) or ():
+        record_retry(client, attempt.status or "error")
+
+
+def hooks(client: str) -> Dict[str, List[Callable[..., Any]]]:
+    """
+    Returns the ``requests`` hooks that record the metrics of the responses received, to pass
+    as the ``hooks`` of a request or to add to those of a session.
+
+    Parameters
+    ----------
+    client : str
+        What makes the requests: ``client``, ``client_core`` or ``storage``.
+
+    Returns
+    -------
+    Dict[str, List[Callable[..., Any]]]
+        The hooks by event.
+    """
+    # A partial rather than a closure, sessions are pickled along with their clients
+    return {"response": [partial(record_response, client)]}
+
+
+if os.getenv("DARWIN_METRICS"):
+    enable(os.environ["DARWIN_METRICS"])
@@ -0,0 +1,225 @@
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson as json
+
+DEFAULT_METADATA_CACHE_TTL = float(os.getenv("DARWIN_METADATA_CACHE_TTL", "0"))
+
+
+@dataclass
+class MetadataCacheEntry:
+    """
+    A single cached metadata response.
+
+    Attributes
+    ----------
+    value : Any
+        The decoded (JSON compatible) response body.
+    fetched_at : float
+        Epoch time of the last time the value was fetched or revalidated.
+    etag : Optional[str], default: None
+        The ``ETag`` the server returned alongside the value, if any.
+    """
+
+    value: Any
+    fetched_at: float
+    etag: Optional[str] = None
+
+
+class MetadataCache:
+    """
+    Client side cache for team metadata lookups, such as annotation classes, attributes, features
+    and properties.
+
+    Entries are kept in memory and, when a ``cache_dir`` is given, persisted on disk so that
+    subsequent CLI invocations can reuse them. Entries older than ``ttl`` seconds are considered
+    stale: they are still returned by ``get`` so that the caller can revalidate them with a
+    conditional request using their ``etag``.
+
+    Parameters
+    ----------
+    ttl : float, default: DEFAULT_METADATA_CACHE_TTL
+        Number of seconds an entry is considered fresh. A ``ttl`` of ``0`` disables caching.
+    cache_dir : Optional[Path], default: None
+        Directory where entries are persisted. If ``None`` entries are kept in memory only.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_METADATA_CACHE_TTL, cache_dir: Optional[Path] = None
+    ):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._entries: Dict[str, MetadataCacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Clients, and so their cache, are pickled to download files in other processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def is_fresh(self, entry: MetadataCacheEntry) -> bool:
+        """
+        Returns whether the given entry can be used without revalidation.
+
+        Parameters
+        ----------
+        entry : MetadataCacheEntry
+            The entry to check.
+
+        Returns
+        -------
+        bool
+            ``True`` if the entry is younger than the ``ttl``, ``False`` otherwise.
+        """
+        return self.enabled and time.time() - entry.fetched_at < self.ttl
+
+    def get(self, key: str) -> Optional[MetadataCacheEntry]:
+        """
+        Returns the entry stored under ``key``, fresh or stale.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        Optional[MetadataCacheEntry]
+            The entry or ``None`` if nothing is cached under ``key`` or caching is disabled.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._read(key)
+                if entry is not None:
+                    self._entries[key] = entry
+            return entry
+
+    def set(
+        self, key: str, value: Any, etag: Optional[str] = None
+    ) -> MetadataCacheEntry:
+        """
+        Stores ``value`` under ``key``.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        value : Any
+            The JSON compatible value to store.
+        etag : Optional[str], default: None
+            The ``ETag`` returned by the server for this value.
+
+        Returns
+        -------
+        MetadataCacheEntry
+            The stored entry.
+        """
+        entry = MetadataCacheEntry(value=value, fetched_at=time.time(), etag=etag)
+        if not self.enabled:
+            return entry
+
+        with self._lock:
+            self._entries[key] = entry
+            self._write(key, entry)
+        return entry
+
+    def touch(self, key: str) -> Optional[MetadataCacheEntry]:
+        """
+        Marks the entry under ``key`` as fresh, after the server confirmed it didn't change.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        Optional[MetadataCacheEntry]
+            The refreshed entry or ``None`` if nothing is cached under ``key``.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        return self.set(key, entry.value, entry.etag)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Removes every entry whose key starts with ``prefix``, both in memory and on disk.
+
+        Parameters
+        ----------
+        prefix : str, default: ""
+            The key prefix. An empty prefix clears the whole cache.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+            if not self.cache_dir or not self.cache_dir.exists():
+                return
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stored_key = json.loads(path.read_bytes())["key"]
+                except (OSError, ValueError, KeyError, TypeError):
+                    stored_key = ""
+                if stored_key.startswith(prefix):
+                    path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read(self, key: str) -> Optional[MetadataCacheEntry]:
+        if not self.cache_dir:
+            return None
+
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        return MetadataCacheEntry(
+            value=data["value"], fetched_at=data["fetched_at"], etag=data.get("etag")
+        )
+
+    def _write(self, key: str, entry: MetadataCacheEntry) -> None:
+        if not self.cache_dir:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        data = {
+            "key": key,
+            "value": entry.value,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json.dumps(data))
+            tmp_path.replace(path)
+        except OSError:
+            # Persisting is best effort, the in-memory entry is still valid
+            tmp_path.unlink(missing_ok=True)
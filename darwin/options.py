@@ -17,6 +17,14 @@ class Options:
         self.parser: ArgumentParser = ArgumentParser(
             description="Command line tool to create/upload/download datasets on darwin."
         )
+        self.parser.add_argument(
+            "--metrics",
+            type=str,
+            default=None,
+            help="Records the duration of each stage and the HTTP requests made, and writes "
+            "them to this file on exit: as a Prometheus textfile if it ends in '.prom', as "
+            "JSON lines otherwise. Defaults to the DARWIN_METRICS environment variable.",
+        )
 
         subparsers = self.parser.add_subparsers(dest="command")
         subparsers.add_parser("help", help="Show this help message and exit.")
@@ -66,6 +74,19 @@ class Options:
         parser_convert.add_argument(
             "output_dir", type=str, help="Where to store output files."
         )
+        parser_convert.add_argument(
+            "--interpolate",
+            action="store_true",
+            help="Export every frame of video annotations, interpolating between keyframes.",
+        )
+        parser_convert.add_argument(
+            "--cpu-limit",
+            "--cpu_limit",
+            type=int,
+            required=False,
+            default=1,
+            help="Number of cores used to export items in formats that support it (e.g. nifti), defaults to a single core",
+        )
 
         # VALIDATE SCHEMA
         parser_validate_schema = subparsers.add_parser(
@@ -89,6 +110,14 @@ class Options:
         parser_validate_schema.add_argument(
             "--output", help="name of file to write output json to"
         )
+        parser_validate_schema.add_argument(
+            "--cpu-limit",
+            "--cpu_limit",
+            type=int,
+            required=False,
+            default=None,
+            help="Limits amount of cores used on machine to validate files, defaults to all cores",
+        )
         # DATASET
         dataset = subparsers.add_parser(
             "dataset",
@@ -401,6 +430,19 @@ class Options:
         parser_convert.add_argument(
             "-o", "--output_dir", type=str, help="Where to store output files."
         )
+        parser_convert.add_argument(
+            "--interpolate",
+            action="store_true",
+            help="Export every frame of video annotations, interpolating between keyframes.",
+        )
+        parser_convert.add_argument(
+            "--cpu-limit",
+            "--cpu_limit",
+            type=int,
+            required=False,
+            default=1,
+            help="Number of cores used to export items in formats that support it (e.g. nifti), defaults to a single core",
+        )
 
         # Split
         parser_split = dataset_action.add_parser(
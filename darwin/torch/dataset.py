@@ -81,6 +81,27 @@ def get_dataset(
     )
 
 
+def _get_converted_target(
+    dataset: Union["InstanceSegmentationDataset", "SemanticSegmentationDataset"],
+    img: PILImage.Image,
+    index: int,
+) -> Dict[str, Any]:
+    """
+    Returns the target of the item at the given index with its polygons converted to masks,
+    from the cache of the dataset if ``cache_masks`` is set. Cached tensors are copied, so
+    that transforms can't modify them.
+    """
+    if index not in dataset._target_cache:
+        _, target = dataset.convert_polygons(img, dataset.get_target(index))
+        if not dataset.cache_masks:
+            return target
+        dataset._target_cache[index] = target
+    return {
+        key: value.clone() if isinstance(value, Tensor) else value
+        for key, value in dataset._target_cache[index].items()
+    }
+
+
 class ClassificationDataset(LocalDataset):
     """
     Represents a LocalDataset used for training on classification tasks.
@@ -252,10 +273,18 @@ class InstanceSegmentationDataset(LocalDataset):
         Whether the dataset is multilabel or not.
     convert_polygons : ConvertPolygonsToInstanceMasks
         Object used to convert polygons to instance masks.
+    cache_masks : bool, default: False
+        Whether the instance masks of each item are kept in memory after they are first
+        rasterized, before any transform is applied.
 
     """
 
-    def __init__(self, transform: Optional[Union[Callable, List]] = None, **kwargs):
+    def __init__(
+        self,
+        transform: Optional[Union[Callable, List]] = None,
+        cache_masks: bool = False,
+        **kwargs,
+    ):
         super().__init__(annotation_type="polygon", **kwargs)
 
         if transform is not None and isinstance(transform, list):
@@ -264,6 +293,8 @@ class InstanceSegmentationDataset(LocalDataset):
         self.transform: Optional[Callable] = transform
 
         self.convert_polygons = ConvertPolygonsToInstanceMasks()
+        self.cache_masks = cache_masks
+        self._target_cache: Dict[int, Dict[str, Any]] = {}
 
     def __getitem__(self, index: int) -> Tuple[Tensor, Dict[str, Any]]:
         """
@@ -284,9 +315,8 @@ class InstanceSegmentationDataset(LocalDataset):
                 Area in pixels of each one of the instances
         """
         img: PILImage.Image = self.get_image(index)
-        target: Dict[str, Any] = self.get_target(index)
+        target: Dict[str, Any] = _get_converted_target(self, img, index)
 
-        img, target = self.convert_polygons(img, target)
         if self.transform is not None:
             img_tensor, target = self.transform(img, target)
         else:
@@ -418,10 +448,16 @@ class SemanticSegmentationDataset(LocalDataset):
         torchvision transform function(s) to run on the dataset.
     convert_polygons : ConvertPolygonsToSemanticMask
         Object used to convert polygons to semantic masks.
+    cache_masks : bool, default: False
+        Whether the semantic mask of each item is kept in memory after it is first
+        rasterized, before any transform is applied.
     """
 
     def __init__(
-        self, transform: Optional[Union[List[Callable], Callable]] = None, **kwargs
+        self,
+        transform: Optional[Union[List[Callable], Callable]] = None,
+        cache_masks: bool = False,
+        **kwargs,
     ):
         super().__init__(annotation_type="polygon", **kwargs)
         if "__background__" not in self.classes:
@@ -432,6 +468,8 @@ class SemanticSegmentationDataset(LocalDataset):
 
         self.transform: Optional[Callable] = transform
         self.convert_polygons = ConvertPolygonsToSemanticMask()
+        self.cache_masks = cache_masks
+        self._target_cache: Dict[int, Dict[str, Any]] = {}
 
     def __getitem__(self, index: int) -> Tuple[Tensor, Dict[str, Any]]:
         """
@@ -448,9 +486,8 @@ class SemanticSegmentationDataset(LocalDataset):
                 Segmentation mask where each pixel encodes a class label
         """
         img: PILImage.Image = self.get_image(index)
-        target: Dict[str, Any] = self.get_target(index)
+        target: Dict[str, Any] = _get_converted_target(self, img, index)
 
-        img, target = self.convert_polygons(img, target)
         if self.transform is not None:
             img_tensor, target = self.transform(img, target)
         else:
@@ -31,18 +31,14 @@ def flatten_masks_by_category(masks: torch.Tensor, cats: List[int]) -> torch.Ten
     assert isinstance(masks, torch.Tensor)
     assert isinstance(cats, List)
     assert masks.shape[0] == len(cats)
-    order_of_polygons = list(range(1, len(cats) + 1))
-    polygon_mapping = {order: cat for cat, order in zip(cats, order_of_polygons)}
+    # Index (starting at 1) of the top most mask of each pixel, 0 for the background
+    order = torch.zeros(masks.shape[1:], dtype=torch.int64)
+    for i, mask in enumerate(masks, start=1):
+        order.masked_fill_(mask != 0, i)
+    # Lookup table from the order of the masks to their category id's
     BACKGROUND: int = 0
-    polygon_mapping[BACKGROUND] = 0
-    # Uses matrix multiplication here with `masks` being a binary array of same dimensions as image
-    # and polygon orders being overlaid onto the relevant mask
-    order_tensor = torch.as_tensor(order_of_polygons, dtype=masks.dtype)
-    flattened, _ = (masks * order_tensor[:, None, None]).max(dim=0)
-    # The mask is now flattened in order of the polygons but needs to be converted back to the categories
-    # vectorize the dictionary to return the original category id's
-    mapped = np.vectorize(polygon_mapping.__getitem__)(flattened)
-    return torch.as_tensor(mapped, dtype=masks.dtype)
+    category_lut = torch.as_tensor([BACKGROUND] + cats, dtype=torch.int64)
+    return category_lut[order].to(masks.dtype)
 
 
 def convert_segmentation_to_mask(
@@ -65,14 +61,42 @@ def convert_segmentation_to_mask(
     torch.tensor
         A ``Tensor`` representing a segmentation mask.
     """
-    if not segmentations:
-        return torch.zeros((0, height, width), dtype=torch.uint8)
-
-    masks = []
-    for contour in segmentations:
-        mask = torch.zeros((height, width)).numpy().astype(np.uint8)
-        masks.append(torch.from_numpy(np.asarray(draw_polygon(mask, contour, 1))))
-    return torch.stack(masks)
+    masks = np.zeros((len(segmentations), height, width), dtype=np.uint8)
+    for mask, contour in zip(masks, segmentations):
+        draw_polygon(mask, contour, 1)
+    return torch.from_numpy(masks)
+
+
+def convert_segmentation_to_label_map(
+    segmentations: List[Segment], cats: List[int], height: int, width: int
+) -> torch.Tensor:
+    """
+    Converts polygons represented as sequences of coordinates into a single mask of category
+    id's. Polygons are drawn in order, so overlapping sections belong to the top most one,
+    like ``flatten_masks_by_category(convert_segmentation_to_mask(...), cats)`` but without
+    rasterizing a mask per polygon.
+
+    Parameters
+    ----------
+    segmentations : List[Segment]
+        List of float values -> ``[[x11, y11, x12, y12], ..., [xn1, yn1, xn2, yn2]]``.
+    cats : List[int]
+        Category id of each polygon, lower than 256.
+    height : int
+        Image's height.
+    width : int
+        Image's width.
+
+    Returns
+    -------
+    torch.Tensor
+        A ``uint8`` ``Tensor`` of shape ``(height, width)`` with the category id of each pixel.
+    """
+    assert len(segmentations) == len(cats)
+    label_map = np.zeros((height, width), dtype=np.uint8)
+    for contour, cat in zip(segmentations, cats):
+        draw_polygon(label_map, contour, cat)
+    return torch.from_numpy(label_map)
 
 
 def polygon_area(x: ArrayLike, y: ArrayLike) -> float:
@@ -0,0 +1,183 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice
+from multiprocessing import cpu_count
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+C = TypeVar("C")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+def prefetch_pages(
+    fetch_page: Callable[[Optional[C]], Tuple[Sequence[T], Optional[C]]],
+    cursor: Optional[C] = None,
+) -> Iterator[Sequence[T]]:
+    """
+    Iterates over cursor paginated results, requesting the next page in a background thread
+    while the caller is still processing the current one.
+
+    Parameters
+    ----------
+    fetch_page : Callable[[Optional[C]], Tuple[Sequence[T], Optional[C]]]
+        Function that fetches the page starting at the given cursor and returns its results
+        together with the cursor of the next page, or ``None`` if it was the last one.
+    cursor : Optional[C], default: None
+        The cursor of the first page.
+
+    Yields
+    ------
+    Iterator[Sequence[T]]
+        The results of each page, in order.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: Optional[Future] = executor.submit(fetch_page, cursor)
+        try:
+            while pending is not None:
+                page, next_cursor = pending.result()
+                pending = (
+                    executor.submit(fetch_page, next_cursor)
+                    if next_cursor is not None
+                    else None
+                )
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def interleave(
+    partitions: Sequence[Callable[[], Iterator[T]]],
+    max_workers: int,
+    buffer_size: int = 1000,
+) -> Iterator[T]:
+    """
+    Consumes several iterators concurrently, yielding their values as soon as they are
+    produced. The order of the values of different partitions is not preserved.
+
+    Parameters
+    ----------
+    partitions : Sequence[Callable[[], Iterator[T]]]
+        Factories for the iterators to consume, each one is run in its own worker thread.
+    max_workers : int
+        The maximum number of partitions consumed at the same time.
+    buffer_size : int, default: 1000
+        The maximum number of values kept in memory before the workers are paused.
+
+    Yields
+    ------
+    Iterator[T]
+        The values of all the partitions.
+
+    Raises
+    ------
+    Exception
+        The first exception raised by any of the partitions.
+    """
+    if not partitions:
+        return
+    if max_workers <= 1 or len(partitions) == 1:
+        for partition in partitions:
+            yield from partition()
+        return
+
+    results: "queue.Queue[object]" = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def _put(value: object) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _consume(partition: Callable[[], Iterator[T]]) -> None:
+        try:
+            for value in partition():
+                if not _put((value, None)):
+                    return
+        except BaseException as e:
+            _put((_DONE, e))
+            return
+        _put((_DONE, None))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(partitions))) as executor:
+        futures: List[Future] = [
+            executor.submit(_consume, partition) for partition in partitions
+        ]
+        remaining = len(futures)
+        try:
+            while remaining:
+                value, error = results.get()  # type: ignore[misc]
+                if error is not None:
+                    raise error
+                if value is _DONE:
+                    remaining -= 1
+                    continue
+                yield value  # type: ignore[misc]
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+
+
+def map_in_processes(
+    fn: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None
+) -> Iterator[R]:
+    """
+    Applies ``fn`` to the given items in a pool of processes, yielding the results in the
+    order of the items. Items are consumed lazily: at most two per worker are pending at any
+    time. Processes are only started when there is more than one item.
+
+    Parameters
+    ----------
+    fn : Callable[[T], R]
+        The function to apply, it must be picklable (e.g. a module level function or a
+        ``functools.partial`` of one).
+    items : Iterable[T]
+        The items to apply the function to, they must be picklable.
+    max_workers : Optional[int], default: None
+        The number of processes, defaults to the number of CPUs. With ``1``, the items are
+        processed in the current process.
+
+    Yields
+    ------
+    Iterator[R]
+        The result of each item, in order.
+    """
+    items = iter(items)
+    head = list(islice(items, 2))
+    items = chain(head, items)
+    max_workers = max_workers or cpu_count()
+    if len(head) < 2 or max_workers == 1:
+        yield from map(fn, items)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(fn, item))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
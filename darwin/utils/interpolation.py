@@ -0,0 +1,238 @@
+"""
+Expands the keyframes of video annotations into an annotation for every frame in which they
+are visible.
+"""
+
+from bisect import bisect_right
+from dataclasses import replace
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import darwin.datatypes as dt
+
+# Annotation types whose coordinates can be linearly interpolated between two keyframes, the
+# others keep the data of the previous keyframe
+INTERPOLATED_TYPES = {
+    "bounding_box",
+    "complex_polygon",
+    "cuboid",
+    "ellipse",
+    "keypoint",
+    "line",
+    "polygon",
+    "skeleton",
+}
+
+# Placeholder for the numbers of an annotation's data in its template
+_NUMBER = object()
+
+# The data of an annotation, with its numbers replaced by ``_NUMBER``, and its numbers
+Template = Tuple[Any, List[float]]
+
+
+def interpolate_video_annotations(
+    annotations: Iterable[dt.AnnotationLike],
+) -> List[dt.AnnotationLike]:
+    """
+    Returns the given annotations with the frames of every ``VideoAnnotation`` expanded to
+    every frame of its segments, except for its hidden areas.
+
+    The frames of interpolated annotations lying between two keyframes with the same shape
+    (e.g. polygons with the same number of points) are linearly interpolated, in a single
+    vectorised operation for all the annotations. Other frames keep the data of the previous
+    keyframe. Frames that weren't in the original annotation are marked as not keyframes.
+
+    Parameters
+    ----------
+    annotations : Iterable[dt.AnnotationLike]
+        The annotations of a file, those that aren't a ``VideoAnnotation`` are returned as is.
+
+    Returns
+    -------
+    List[dt.AnnotationLike]
+        The annotations, with the ``VideoAnnotation``\\s expanded.
+    """
+    output: List[dt.AnnotationLike] = []
+    # Vectors of the keyframes to interpolate between and builders of their data, and the
+    # (interval, t) of every interpolated frame together with the annotation it fills
+    starts: List[List[float]] = []
+    ends: List[List[float]] = []
+    rows: List[Tuple[int, float]] = []
+    builders: List[Callable[[List[float]], Any]] = []
+    targets: List[dt.Annotation] = []
+
+    for annotation in annotations:
+        if not isinstance(annotation, dt.VideoAnnotation) or not annotation.frames:
+            output.append(annotation)
+            continue
+        anchors = sorted(annotation.frames)
+        interpolate = (
+            annotation.interpolated
+            and annotation.annotation_class.annotation_type in INTERPOLATED_TYPES
+        )
+        templates: Dict[int, Template] = {}
+        intervals: Dict[int, Optional[int]] = {}
+        frames: Dict[int, dt.Annotation] = {}
+        for frame in _visible_frames(annotation, anchors):
+            if frame in annotation.frames:
+                frames[frame] = annotation.frames[frame]
+                continue
+            position = bisect_right(anchors, frame)
+            previous = anchors[max(position - 1, 0)]
+            frames[frame] = replace(annotation.frames[previous])
+            if not interpolate or position == 0 or position == len(anchors):
+                continue
+            if previous not in intervals:
+                intervals[previous] = _interval(
+                    annotation,
+                    templates,
+                    previous,
+                    anchors[position],
+                    starts,
+                    ends,
+                    builders,
+                )
+            interval = intervals[previous]
+            if interval is None:
+                continue
+            following = anchors[position]
+            rows.append((interval, (frame - previous) / (following - previous)))
+            targets.append(frames[frame])
+        output.append(
+            replace(
+                annotation,
+                frames=frames,
+                keyframes={
+                    frame: annotation.keyframes.get(frame, False) for frame in frames
+                },
+            )
+        )
+
+    for frame_annotation, (interval, _), values in zip(
+        targets, rows, _lerp(starts, ends, rows)
+    ):
+        frame_annotation.data = builders[interval](values)
+    return output
+
+
+def _interval(
+    annotation: dt.VideoAnnotation,
+    templates: Dict[int, Template],
+    previous: int,
+    following: int,
+    starts: List[List[float]],
+    ends: List[List[float]],
+    builders: List[Callable[[List[float]], Any]],
+) -> Optional[int]:
+    """
+    Registers the vectors of the given keyframes in ``starts`` and ``ends``, and the builder of
+    their data in ``builders``, and returns their position, or ``None`` if their data can't be
+    interpolated.
+    """
+    for anchor in (previous, following):
+        if anchor not in templates:
+            templates[anchor] = _template(annotation.frames[anchor].data)
+    (template, start), (following_template, end) = (
+        templates[previous],
+        templates[following],
+    )
+    # ``_NUMBER`` is only equal to itself, so equal templates only differ in their numbers
+    if not start or template != following_template:
+        return None
+    starts.append(start)
+    ends.append(end)
+    builders.append(partial(_build, template))
+    return len(starts) - 1
+
+
+def _visible_frames(
+    annotation: dt.VideoAnnotation, anchors: List[int]
+) -> Iterator[int]:
+    segments = [
+        (start, end if end is not None else anchors[-1] + 1)
+        for start, end in annotation.segments or [[anchors[0], anchors[-1] + 1]]
+    ]
+    hidden = [
+        (start, end if end is not None else segments[-1][1])
+        for start, end in annotation.hidden_areas or []
+    ]
+    for start, end in segments:
+        for frame in range(start, end):
+            if not any(h_start <= frame < h_end for h_start, h_end in hidden):
+                yield frame
+
+
+def _lerp(
+    starts: List[List[float]], ends: List[List[float]], rows: List[Tuple[int, float]]
+) -> List[List[float]]:
+    """
+    Computes ``start + (end - start) * t`` for every ``(interval, t)`` row, where the start
+    and end vectors of each interval may have a different length.
+    """
+    if not rows:
+        return []
+    lengths = np.fromiter(map(len, starts), dtype=np.int64, count=len(starts))
+    offsets = np.cumsum(lengths) - lengths
+    start = np.fromiter(chain.from_iterable(starts), dtype=np.float64)
+    end = np.fromiter(chain.from_iterable(ends), dtype=np.float64)
+    intervals = np.fromiter((i for i, _ in rows), dtype=np.int64, count=len(rows))
+    weights = np.fromiter((t for _, t in rows), dtype=np.float64, count=len(rows))
+
+    row_lengths = lengths[intervals]
+    row_offsets = np.cumsum(row_lengths) - row_lengths
+    # Position in ``start`` and ``end`` of every value of every row
+    index = np.repeat(offsets[intervals] - row_offsets, row_lengths) + np.arange(
+        row_lengths.sum()
+    )
+    values = start[index] + (end[index] - start[index]) * np.repeat(
+        weights, row_lengths
+    )
+
+    flat = values.tolist()
+    return [
+        flat[offset : offset + length]
+        for offset, length in zip(row_offsets.tolist(), row_lengths.tolist())
+    ]
+
+
+def _template(data: Any) -> Template:
+    """
+    Returns the template of the given data and its numbers. Dictionaries are walked in the
+    order of their keys, so that data whose keys are in another order has the same template
+    and its numbers in the same order.
+    """
+    numbers: List[float] = []
+
+    def _walk(value: Any) -> Any:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            numbers.append(value)
+            return _NUMBER
+        if isinstance(value, dict):
+            return {key: _walk(value[key]) for key in sorted(value)}
+        if isinstance(value, (list, tuple)):
+            return [_walk(item) for item in value]
+        return value
+
+    return _walk(data), numbers
+
+
+def _build(template: Any, values: List[float]) -> Any:
+    """
+    Returns the data of ``template`` with its numbers replaced by the given values, in the
+    order ``_template`` collected them.
+    """
+    numbers = iter(values)
+
+    def _fill(value: Any) -> Any:
+        if value is _NUMBER:
+            return next(numbers)
+        if isinstance(value, dict):
+            return {key: _fill(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [_fill(item) for item in value]
+        return value
+
+    return _fill(template)
@@ -0,0 +1,243 @@
+"""
+Loading of JSON files from their bytes, read once, with their encoding detected from their
+first bytes.
+"""
+
+import codecs
+import locale
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Collection, Dict, Iterator, Tuple, Union
+
+import orjson as json
+
+from darwin.datatypes import PathLike
+
+# Files of at least this size are memory mapped instead of read into memory
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+Buffer = Union[bytes, mmap.mmap]
+
+# UTF-32 LE before UTF-16 LE, as the BOM of the latter is a prefix of the former's
+_BOMS = [
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+_SCALAR_END = re.compile(rb"[^,}\]\s]*")
+
+
+def detect_encoding(head: bytes) -> Tuple[str, int]:
+    """
+    Detects the encoding of a JSON document from its first bytes, either from its byte order
+    mark or, as JSON text starts with an ASCII character, from the position of its null
+    bytes (RFC 4627).
+
+    Parameters
+    ----------
+    head : bytes
+        The first bytes of the document, at least 4 unless the document is shorter.
+
+    Returns
+    -------
+    Tuple[str, int]
+        The encoding of the document and the length of its byte order mark.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    if len(head) >= 4:
+        if head[:3] == b"\x00\x00\x00":
+            return "utf-32-be", 0
+        if head[1:4] == b"\x00\x00\x00":
+            return "utf-32-le", 0
+    if len(head) >= 2:
+        if head[0] == 0:
+            return "utf-16-be", 0
+        if head[1] == 0:
+            return "utf-16-le", 0
+    return "utf-8", 0
+
+
+def read_json(path: PathLike) -> Any:
+    """
+    Parses the given JSON file. The file is read once, or memory mapped if it is larger than
+    ``MMAP_THRESHOLD``, and UTF-8 files are parsed directly from their bytes.
+
+    UTF-16 and UTF-32 files, with or without a byte order mark, are decoded first. UTF-8 files
+    that can't be parsed are decoded with the locale's encoding, as files written with it
+    (e.g. ``cp1252`` on Windows) are common.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path to the file to parse.
+
+    Returns
+    -------
+    Any
+        The parsed JSON.
+
+    Raises
+    ------
+    orjson.JSONDecodeError
+        If the file isn't valid JSON in any of the encodings it was tried with.
+    """
+    with _open_buffer(path) as buffer:
+        return _parse(buffer)
+
+
+def read_json_header(
+    path: PathLike,
+    keys: Collection[str],
+    non_empty: Collection[str] = (),
+) -> Dict[str, Any]:
+    """
+    Reads some of the top level values of a JSON object, without parsing the rest of the file.
+    The file is scanned until all the given keys have been found, so it is fastest when they
+    come first, as the ``item`` of a Darwin JSON file does before its ``annotations``.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path to the file to read, which must contain a JSON object.
+    keys : Collection[str]
+        The keys whose values are parsed.
+    non_empty : Collection[str], default: ()
+        The keys of arrays or objects that are only checked for emptiness, without being
+        parsed.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The values of the given keys that were found in the object. The keys in ``non_empty``
+        are mapped to whether their array or object has any element.
+
+    Raises
+    ------
+    ValueError
+        If the file doesn't contain a JSON object.
+    """
+    with _open_buffer(path) as buffer:
+        encoding, offset = detect_encoding(buffer[:4])
+        if encoding != "utf-8":
+            # Rare enough not to scan the decoded text
+            data = _parse(buffer)
+            return {
+                key: bool(data[key]) if key in non_empty else data[key]
+                for key in (*keys, *non_empty)
+                if key in data
+            }
+        return _scan_object(buffer, offset, set(keys), set(non_empty))
+
+
+def _parse(buffer: Buffer) -> Any:
+    encoding, offset = detect_encoding(buffer[:4])
+    if encoding != "utf-8":
+        return json.loads(buffer[offset:].decode(encoding))
+    # The view is released before a memory mapped buffer is closed
+    with memoryview(buffer)[offset:] as view:
+        try:
+            return json.loads(view)
+        except json.JSONDecodeError as e:
+            error = e
+    fallback = locale.getpreferredencoding(False)
+    if codecs.lookup(fallback).name != "utf-8":
+        try:
+            return json.loads(buffer[offset:].decode(fallback))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            pass
+    raise error
+
+
+def _scan_object(
+    buffer: Buffer, position: int, keys: Collection[str], non_empty: Collection[str]
+) -> Dict[str, Any]:
+    header: Dict[str, Any] = {}
+    remaining = len({*keys, *non_empty})
+    position = _skip_whitespace(buffer, position)
+    if buffer[position : position + 1] != b"{":
+        raise ValueError("Expected a JSON object")
+    position += 1
+    while remaining:
+        position = _skip_whitespace(buffer, position)
+        if buffer[position : position + 1] in (b"}", b""):
+            break
+        key_end = _skip_value(buffer, position)
+        key = json.loads(buffer[position:key_end])
+        position = _skip_whitespace(buffer, key_end)
+        position = _skip_whitespace(buffer, position + 1)  # the ':'
+        if key in non_empty and key not in keys:
+            header[key] = _is_non_empty(buffer, position)
+            remaining -= 1
+            if not remaining:
+                break
+        value_end = _skip_value(buffer, position)
+        if key in keys:
+            header[key] = json.loads(buffer[position:value_end])
+            remaining -= 1
+        position = _skip_whitespace(buffer, value_end)
+        if buffer[position : position + 1] == b",":
+            position += 1
+    return header
+
+
+def _is_non_empty(buffer: Buffer, position: int) -> bool:
+    if buffer[position : position + 1] not in (b"[", b"{"):
+        return bool(json.loads(buffer[position : _skip_value(buffer, position)]))
+    start = _skip_whitespace(buffer, position + 1)
+    return buffer[start : start + 1] not in (b"]", b"}")
+
+
+def _skip_whitespace(buffer: Buffer, position: int) -> int:
+    match = _WHITESPACE.match(buffer, position)
+    return match.end() if match else position
+
+
+def _skip_value(buffer: Buffer, position: int) -> int:
+    """Returns the position right after the JSON value starting at ``position``."""
+    first = buffer[position : position + 1]
+    if first == b'"':
+        return _string_end(buffer, position + 1)
+    if first not in (b"[", b"{"):
+        match = _SCALAR_END.match(buffer, position)
+        return match.end() if match else position
+    depth = 0
+    while True:
+        match = _STRUCTURE.search(buffer, position)
+        if match is None:
+            raise ValueError("Unterminated JSON value")
+        char = match.group()
+        if char == b'"':
+            position = _string_end(buffer, match.end())
+            continue
+        position = match.end()
+        depth += 1 if char in (b"[", b"{") else -1
+        if depth == 0:
+            return position
+
+
+def _string_end(buffer: Buffer, position: int) -> int:
+    match = _STRING_END.match(buffer, position)
+    if match is None:
+        raise ValueError("Unterminated JSON string")
+    return match.end()
+
+
+@contextmanager
+def _open_buffer(path: PathLike) -> Iterator[Buffer]:
+    with Path(path).open("rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
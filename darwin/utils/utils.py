@@ -2,8 +2,10 @@
 Contains several unrelated utility functions used across the SDK.
 """
 
+import os
 import platform
 import re
+from collections import defaultdict
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -19,17 +21,12 @@ from typing import (
     Union,
     cast,
 )
+from urllib.parse import urlparse
 
-import json_stream
-import numpy as np
 import orjson as json
 import requests
-from json_stream.base import PersistentStreamingJSONList, PersistentStreamingJSONObject
-from jsonschema import validators
-from natsort import natsorted
 from requests import Response
 from rich.progress import ProgressType, track
-from upolygon import draw_polygon
 
 import darwin.datatypes as dt
 from darwin.config import Config
@@ -40,10 +37,21 @@ from darwin.exceptions import (
     UnsupportedFileType,
 )
 from darwin.future.data_objects.properties import SelectedProperty
+from darwin.utils.json_loading import read_json, read_json_header
 
 if TYPE_CHECKING:
+    import numpy as np
+    from json_stream.base import (
+        PersistentStreamingJSONList,
+        PersistentStreamingJSONObject,
+    )
+    from jsonschema import validators
+
     from darwin.client import Client
 
+# NumPy, upolygon, jsonschema, json_stream and natsort are imported by the functions using
+# them, as this module is loaded by every command of the CLI
+
 
 SUPPORTED_IMAGE_EXTENSIONS = [
     ".png",
@@ -149,6 +157,13 @@ SLOTS_GRID_MAP = {
 
 
 _darwin_schema_cache = {}
+_darwin_validator_cache: Dict[str, "validators.Draft202012Validator"] = {}
+
+# Schemas are kept here once downloaded, under their host and path, so that validation works
+# without network access afterwards
+SCHEMAS_CACHE_DIR = Path(
+    os.getenv("DARWIN_SCHEMAS_CACHE_DIR") or Path.home() / ".darwin" / "schemas"
+)
 
 
 def is_extension_allowed_by_filename(filename: str) -> bool:
@@ -336,6 +351,8 @@ def find_files(
         f for f in found_files if str(f) not in files_to_exclude_full_paths
     ]
     if sort:
+        from natsort import natsorted
+
         return natsorted(filtered_files)
     return filtered_files
 
@@ -403,53 +420,122 @@ def _get_local_filename(metadata: Dict[str, Any]) -> str:
 
 
 def _get_schema(data: dict) -> Optional[dict]:
-    version = _parse_version(data)
-    schema_url = data.get("schema_ref") or _default_schema(version)
+    schema_url = _get_schema_url(data)
     if not schema_url:
         return None
     if schema_url not in _darwin_schema_cache:
-        response = requests.get(schema_url)
-        response.raise_for_status()
-        schema = response.json()
-        _darwin_schema_cache[schema_url] = schema
+        _darwin_schema_cache[schema_url] = _load_schema(schema_url)
     return _darwin_schema_cache[schema_url]
 
 
+def _get_schema_url(data: dict) -> Optional[str]:
+    return data.get("schema_ref") or _default_schema(_parse_version(data))
+
+
+def _cached_schema_path(schema_url: str) -> Path:
+    url = urlparse(schema_url)
+    return SCHEMAS_CACHE_DIR / url.netloc / url.path.lstrip("/")
+
+
+def _load_schema(schema_url: str) -> dict:
+    """
+    Loads the schema with the given URL from the local cache of schemas. Otherwise, it is
+    downloaded and added to the cache.
+    """
+    path = _cached_schema_path(schema_url)
+    if path.is_file():
+        return json.loads(path.read_bytes())
+
+    response = requests.get(schema_url)
+    response.raise_for_status()
+    schema = response.json()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(json.dumps(schema))
+        tmp_path.replace(path)
+    except OSError:
+        # The cache is only an optimisation, the schema is downloaded again next time
+        pass
+    return schema
+
+
+def _get_validator(data: dict) -> Optional["validators.Draft202012Validator"]:
+    schema_url = _get_schema_url(data)
+    if not schema_url:
+        return None
+    if schema_url not in _darwin_validator_cache:
+        from jsonschema import validators
+
+        schema = _get_schema(data)
+        if not schema:
+            return None
+        _darwin_validator_cache[schema_url] = validators.Draft202012Validator(schema)
+    return _darwin_validator_cache[schema_url]
+
+
 def validate_file_against_schema(path: Path) -> List:
     data, _ = load_data_from_file(path)
     return validate_data_against_schema(data)
 
 
 def validate_data_against_schema(data) -> List:
+    """
+    Validates the given Darwin JSON data against the schema it references, or the schema of its
+    version. The validator of each schema is built once and reused.
+
+    Parameters
+    ----------
+    data : dict
+        The Darwin JSON data.
+
+    Returns
+    -------
+    List[ValidationError]
+        The validation errors, empty if the data is valid.
+
+    Raises
+    ------
+    MissingSchema
+        If the data has no schema, or its schema couldn't be loaded.
+    """
     try:
-        schema = _get_schema(data)
+        validator = _get_validator(data)
     except requests.exceptions.RequestException as e:
         raise MissingSchema(f"Error retrieving schema from url: {e}")
-    if not schema:
+    if not validator:
         raise MissingSchema("Schema not found")
-    validator = validators.Draft202012Validator(schema)
     errors = list(validator.iter_errors(data))
     return errors
 
 
 def attempt_decode(path: Path) -> dict:
+    """
+    Parses the given JSON file, detecting whether it is encoded in UTF-8, UTF-16 or UTF-32, and
+    falling back to the system's encoding.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file to parse.
+
+    Returns
+    -------
+    dict
+        The parsed JSON.
+
+    Raises
+    ------
+    UnrecognizableFileEncoding
+        If the file can't be parsed.
+    """
     try:
-        with path.open() as infile:
-            data = json.loads(infile.read())
-        return data
-    except Exception:
-        pass
-    encodings = ["utf-8", "utf-16", "utf-32", "ascii"]
-    for encoding in encodings:
-        try:
-            with path.open(encoding=encoding) as infile:
-                data = json.loads(infile.read())
-            return data
-        except Exception:
-            continue
-    raise UnrecognizableFileEncoding(
-        f"Unable to load file {path} with any encodings: {encodings}"
-    )
+        return read_json(path)
+    except Exception as e:
+        raise UnrecognizableFileEncoding(
+            f"Unable to load file {path} with any encodings: "
+            "['utf-8', 'utf-16', 'utf-32', system default]"
+        ) from e
 
 
 def load_data_from_file(path: Path) -> Tuple[dict, dt.AnnotationFileVersion]:
@@ -494,7 +580,7 @@ def parse_darwin_json(
     return _parse_darwin_v2(path, data)
 
 
-def stream_darwin_json(path: Path) -> PersistentStreamingJSONObject:
+def stream_darwin_json(path: Path) -> "PersistentStreamingJSONObject":
     """
     Returns a Darwin JSON file as a persistent stream. This allows for parsing large files without
     loading them entirely into memory.
@@ -510,12 +596,34 @@ def stream_darwin_json(path: Path) -> PersistentStreamingJSONObject:
         A stream of the JSON file.
     """
 
+    import json_stream
+
     with path.open() as infile:
         return json_stream.load(infile, persistent=True)
 
 
+def load_darwin_json_header(path: Path) -> Dict[str, Any]:
+    """
+    Returns the ``item`` of a Darwin JSON file and whether it has any ``annotations``, without
+    parsing the rest of the file. This is much faster than ``stream_darwin_json`` for large
+    files, e.g. of long videos, when only the item is needed.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file to read.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The ``item`` of the file, and ``annotations`` mapped to whether it has any, if it has
+        them.
+    """
+    return read_json_header(path, ["item"], non_empty=["annotations"])
+
+
 def get_image_path_from_stream(
-    darwin_json: PersistentStreamingJSONObject,
+    darwin_json: "PersistentStreamingJSONObject",
     images_dir: Path,
     annotation_filepath: Path,
     with_folders: bool = True,
@@ -527,7 +635,7 @@ def get_image_path_from_stream(
     Parameters
     ----------
     darwin_json : PersistentStreamingJSONObject
-        A stream of the JSON file.
+        A stream of the JSON file, or its header as returned by ``load_darwin_json_header``.
     images_dir : Path
         Path to the directory containing the images.
     with_folders: bool
@@ -563,7 +671,7 @@ def get_image_path_from_stream(
             return images_dir / Path(darwin_json.full_path.lstrip("/\\"))
 
 
-def is_stream_list_empty(json_list: PersistentStreamingJSONList) -> bool:
+def is_stream_list_empty(json_list: "PersistentStreamingJSONList") -> bool:
     try:
         json_list[0]
     except IndexError:
@@ -1264,20 +1372,25 @@ def _parse_properties(
     return selected_properties or None
 
 
-def split_video_annotation(annotation: dt.AnnotationFile) -> List[dt.AnnotationFile]:
+def split_video_annotation(
+    annotation: dt.AnnotationFile,
+) -> Iterator[dt.AnnotationFile]:
     """
     Splits the given video ``AnnotationFile`` into several video ``AnnotationFile``s, one for each
     ``frame_url``.
 
+    The frames of every ``VideoAnnotation`` are indexed once, and the ``AnnotationFile`` of each
+    frame is only built when it is requested, so that long videos can be streamed into exporters.
+
     Parameters
     ----------
     annotation : dt.AnnotationFile
         The video ``AnnotationFile`` we want to split.
 
-    Returns
-    -------
-    List[dt.AnnotationFile]
-        A list with the split video ``AnnotationFile``\\s.
+    Yields
+    ------
+    Iterator[dt.AnnotationFile]
+        The split video ``AnnotationFile``\\s, in frame order.
 
     Raises
     ------
@@ -1294,40 +1407,44 @@ def split_video_annotation(annotation: dt.AnnotationFile) -> List[dt.AnnotationF
     if not annotation.frame_count and not annotation.frame_urls:
         raise AttributeError("This Annotation has no frames")
     urls = annotation.frame_urls or [None] * (annotation.frame_count or 1)
-    frame_annotations = []
+    return _split_video_annotation(annotation, urls)
+
+
+def _split_video_annotation(
+    annotation: dt.AnnotationFile, urls: List[Optional[str]]
+) -> Iterator[dt.AnnotationFile]:
+    # Annotations of each frame, in the order of the video annotations they belong to
+    frames_index: Dict[int, List[dt.Annotation]] = defaultdict(list)
+    for video_annotation in annotation.annotations:
+        if not isinstance(video_annotation, dt.VideoAnnotation):
+            continue
+        for i, frame in video_annotation.frames.items():
+            frames_index[i].append(frame)
+
+    stem = Path(annotation.filename).stem
     for i, frame_url in enumerate(urls):
-        print(i)
-        annotations = [
-            a.frames[i]
-            for a in annotation.annotations
-            if isinstance(a, dt.VideoAnnotation) and i in a.frames
-        ]
+        annotations = frames_index.pop(i, [])
         annotation_classes: Set[dt.AnnotationClass] = {
             annotation.annotation_class for annotation in annotations
         }
-        filename: str = f"{Path(annotation.filename).stem}/{i:07d}.png"
-        frame_annotations.append(
-            dt.AnnotationFile(
-                annotation.path,
-                filename,
-                annotation_classes,
-                annotations,
-                [],
-                False,
-                annotation.image_width,
-                annotation.image_height,
-                frame_url,
-                annotation.workview_url,
-                annotation.seq,
-                dataset_name=annotation.dataset_name,
-                item_id=annotation.item_id,
-                slots=annotation.slots,
-                remote_path=annotation.remote_path,
-            )
+        yield dt.AnnotationFile(
+            annotation.path,
+            f"{stem}/{i:07d}.png",
+            annotation_classes,
+            annotations,
+            [],
+            False,
+            annotation.image_width,
+            annotation.image_height,
+            frame_url,
+            annotation.workview_url,
+            annotation.seq,
+            dataset_name=annotation.dataset_name,
+            item_id=annotation.item_id,
+            slots=annotation.slots,
+            remote_path=annotation.remote_path,
         )
 
-    return frame_annotations
-
 
 def parse_slot_names(annotation: dict) -> List[str]:
     return annotation.get("slot_names", [])
@@ -1445,7 +1562,7 @@ def convert_xyxy_to_bounding_box(box: List[Union[int, float]]) -> dt.BoundingBox
 
 def convert_polygons_to_mask(
     polygons: List, height: int, width: int, value: Optional[int] = 1
-) -> np.ndarray:
+) -> "np.ndarray":
     """
     Converts a list of polygons, encoded as a list of dictionaries into an ``nd.array`` mask.
 
@@ -1466,6 +1583,9 @@ def convert_polygons_to_mask(
     ndarray
         ``ndarray`` mask of the polygon(s).
     """
+    import numpy as np
+    from upolygon import draw_polygon
+
     sequence = convert_polygons_to_sequences(polygons, height=height, width=width)
     mask = np.zeros((height, width)).astype(np.uint8)
     draw_polygon(mask, sequence, value)
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks import hot_paths
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("name", list(hot_paths.BENCHMARKS))
+def test_hot_path(benchmark, tmp_path: Path, name: str) -> None:
+    try:
+        fn = hot_paths.BENCHMARKS[name](tmp_path, hot_paths.SCALES["default"])
+    except ImportError as e:
+        pytest.skip(str(e))
+    benchmark(fn)
@@ -0,0 +1,64 @@
+"""
+Startup time benchmark of the package and the CLI.
+
+Times, in fresh interpreters, the import of the modules every ``darwin`` command goes
+through and the ``--help`` of the CLI, and reports the median of several runs. It isn't
+collected by pytest, run it with::
+
+    python -m tests.benchmarks.cli_startup --runs 10 --max-seconds 0.5
+
+With ``--max-seconds``, it exits with an error if any median is above the threshold, so
+that it can be used to catch import time regressions in CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+TARGETS = {
+    "import darwin": ["-c", "import darwin"],
+    "import darwin.client": ["-c", "import darwin.client"],
+    "import darwin.cli_functions": ["-c", "import darwin.cli_functions"],
+    "darwin --help": [
+        "-c",
+        "from darwin.cli import main; main()",
+        "--help",
+    ],
+}
+
+
+def time_command(args: List[str], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    # The baseline is the cost of starting the interpreter itself
+    baseline = time_command(["-c", "pass"], args.runs)
+    print(f"{'target':<30} {'seconds':>8} {'+python':>8}")
+    print(f"{'python -c pass':<30} {baseline:>8.3f} {0:>8.3f}")
+    slow = []
+    for name, command in TARGETS.items():
+        elapsed = time_command(command, args.runs)
+        print(f"{name:<30} {elapsed:>8.3f} {elapsed - baseline:>8.3f}")
+        if args.max_seconds is not None and elapsed > args.max_seconds:
+            slow.append(name)
+
+    if slow:
+        sys.exit(f"Slower than {args.max_seconds}s: {', '.join(slow)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Micro-benchmarks of the SDK's hot paths.
+
+Prepares the functions that dominate the runtime of pulls, imports, exports and training
+on deterministic synthetic data (see ``tests.benchmarks.synthetic``), offline. They are
+timed with pytest-benchmark by ``tests/benchmarks/bench_hot_paths.py``, which isn't
+collected by default, run it with::
+
+    python -m pytest tests/benchmarks/bench_hot_paths.py --benchmark-save=baseline
+    python -m pytest tests/benchmarks/bench_hot_paths.py \\
+        --benchmark-compare=0001 --benchmark-compare-fail=median:30%
+
+Timings depend on the machine, so baselines should be saved and compared on the same one,
+as the ``benchmarks`` CI job does with the target branch of a pull request.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+import orjson
+
+from tests.benchmarks.synthetic import darwin_json, write_release
+
+# Factories of the benchmarks: they prepare their inputs in the given folder, at the given
+# scale, and return the function to time
+Benchmark = Callable[[Path, "Scale"], Callable[[], Any]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+@dataclass
+class Scale:
+    polygons: int
+    polygon_points: int
+    image_size: int
+    masks: int
+    frames: int
+    files: int
+
+
+SCALES = {
+    "quick": Scale(
+        polygons=5, polygon_points=10, image_size=64, masks=2, frames=3, files=4
+    ),
+    "default": Scale(
+        polygons=500,
+        polygon_points=100,
+        image_size=1024,
+        masks=10,
+        frames=100,
+        files=200,
+    ),
+}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def _register(factory: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = factory
+        return factory
+
+    return _register
+
+
+def _write(directory: Path, name: str, data: Dict[str, Any]) -> Path:
+    path = directory / name
+    path.write_bytes(orjson.dumps(data))
+    return path
+
+
+def _image_file(directory: Path, scale: Scale, **kwargs: Any):
+    from darwin.utils import parse_darwin_json
+
+    data = darwin_json(
+        width=scale.image_size,
+        height=scale.image_size,
+        polygons=scale.polygons,
+        polygon_points=scale.polygon_points,
+        **kwargs,
+    )
+    return parse_darwin_json(_write(directory, "image.json", data))
+
+
+@benchmark("parse_darwin_json[image]")
+def parse_image(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.utils import parse_darwin_json
+
+    data = darwin_json(polygons=scale.polygons, polygon_points=scale.polygon_points)
+    path = _write(directory, "image.json", data)
+    return lambda: parse_darwin_json(path)
+
+
+@benchmark("parse_darwin_json[video]")
+def parse_video(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.utils import parse_darwin_json
+
+    data = darwin_json(
+        polygons=max(scale.polygons // 10, 1),
+        polygon_points=scale.polygon_points,
+        frames=scale.frames,
+    )
+    path = _write(directory, "video.json", data)
+    return lambda: parse_darwin_json(path)
+
+
+@benchmark("convert_polygons_to_sequences")
+def polygons_to_sequences(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.utils import convert_polygons_to_sequences
+
+    annotation_file = _image_file(directory, scale)
+    paths = [a.data["paths"] for a in annotation_file.annotations]
+    size = scale.image_size
+    return lambda: [
+        convert_polygons_to_sequences(path, height=size, width=size) for path in paths
+    ]
+
+
+@benchmark("rle_decode")
+def rle_decode(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.exporter.formats.mask import rle_decode
+
+    data = darwin_json(
+        width=scale.image_size,
+        height=scale.image_size,
+        polygons=0,
+        masks=scale.masks,
+    )
+    dense_rle = data["annotations"][-1]["raster_layer"]["dense_rle"]
+    label_colours = {i: i * 10 for i in range(scale.masks + 1)}
+    return lambda: rle_decode(dense_rle, label_colours)
+
+
+@benchmark("convert_to_dense_rle")
+def dense_rle(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.importer.formats.nifti import convert_to_dense_rle
+
+    raster = _volume(scale)[0]
+    return lambda: convert_to_dense_rle(raster)
+
+
+@benchmark("render_polygons")
+def render_polygons(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.exporter.formats.mask import render_polygons
+
+    annotation_file = _image_file(directory, scale)
+    size = scale.image_size
+    return lambda: render_polygons(
+        np.zeros((size, size), dtype=np.uint8),
+        {"__background__": 0},
+        ["__background__"],
+        annotation_file.annotations,
+        annotation_file,
+        size,
+        size,
+    )
+
+
+@benchmark("render_raster")
+def render_raster(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.exporter.formats.mask import render_raster
+
+    annotation_file = _image_file(directory, scale, masks=scale.masks)
+    annotations = [
+        a
+        for a in annotation_file.annotations
+        if a.annotation_class.annotation_type in ("mask", "raster_layer")
+    ]
+    size = scale.image_size
+    return lambda: render_raster(
+        np.zeros((size, size), dtype=np.uint8),
+        {"__background__": 0},
+        ["__background__"],
+        annotations,
+        annotation_file,
+        size,
+        size,
+    )
+
+
+@benchmark("coco._build_json")
+def coco_build_json(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.exporter.formats.coco import _build_json
+    from darwin.utils import parse_darwin_json
+
+    release_path = write_release(
+        directory / "dataset",
+        scale.files,
+        polygons=max(scale.polygons // 10, 1),
+        polygon_points=scale.polygon_points,
+        bounding_boxes=max(scale.polygons // 10, 1),
+        tags=1,
+    )
+    annotation_files = [
+        parse_darwin_json(path)
+        for path in sorted((release_path / "annotations").glob("*.json"))
+    ]
+    return lambda: _build_json(annotation_files)
+
+
+@benchmark("split_dataset")
+def split_dataset(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.dataset.split_manager import split_dataset
+
+    dataset_path = directory / "dataset"
+    write_release(
+        dataset_path,
+        scale.files,
+        polygons=3,
+        polygon_points=4,
+        bounding_boxes=2,
+        tags=1,
+        classes=max(scale.files // 10, 3),
+    )
+    return lambda: split_dataset(dataset_path, val_percentage=0.2, test_percentage=0.2)
+
+
+@benchmark("get_mask_video_annotations")
+def mask_video_annotations(directory: Path, scale: Scale) -> Callable[[], Any]:
+    from darwin.importer.formats.nifti import (
+        get_mask_video_annotations,
+        process_class_map,
+    )
+
+    volume = _volume(scale)
+    class_map = process_class_map(
+        {str(i): f"class_{i}" for i in range(1, scale.masks + 1)}
+    )
+    return lambda: get_mask_video_annotations(
+        volume,
+        class_map,
+        ["0"],
+        pixdims_and_primary_planes={},
+        remote_file_path=Path("/volume.nii"),
+    )
+
+
+def _torch_get_target(dataset_class: str, **kwargs: Any) -> Benchmark:
+    def _factory(directory: Path, scale: Scale) -> Callable[[], Any]:
+        from darwin.torch import dataset as torch_dataset
+
+        dataset_path = directory / "dataset"
+        write_release(
+            dataset_path,
+            scale.files // 10 or 1,
+            image_size=scale.image_size // 2,
+            polygons=max(scale.polygons // 10, 1),
+            polygon_points=scale.polygon_points,
+            **kwargs,
+        )
+        dataset = getattr(torch_dataset, dataset_class)(dataset_path=dataset_path)
+        return lambda: [dataset.get_target(i) for i in range(len(dataset))]
+
+    return _factory
+
+
+for _name, _kwargs in (
+    ("ClassificationDataset", {"tags": 1}),
+    ("InstanceSegmentationDataset", {}),
+    ("SemanticSegmentationDataset", {}),
+    ("ObjectDetectionDataset", {"bounding_boxes": 5}),
+):
+    benchmark(f"torch.{_name}.get_target")(_torch_get_target(_name, **_kwargs))
+
+
+def _volume(scale: Scale) -> np.ndarray:
+    # Slices with a band of each label, moving along the volume
+    size = scale.image_size // 2
+    volume = np.zeros((scale.frames, size, size), dtype=np.uint8)
+    for label in range(1, scale.masks + 1):
+        for frame in range(scale.frames):
+            row = (label * 7 + frame) % size
+            volume[frame, row : row + size // 8, label % size :] = label
+    return volume
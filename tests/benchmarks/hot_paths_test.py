@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks import hot_paths
+from tests.benchmarks.synthetic import darwin_json
+
+
+@pytest.mark.parametrize("name", list(hot_paths.BENCHMARKS))
+def test_benchmarks_run_on_quick_scale(tmp_path: Path, name: str) -> None:
+    try:
+        fn = hot_paths.BENCHMARKS[name](tmp_path, hot_paths.SCALES["quick"])
+    except ImportError as e:
+        pytest.skip(str(e))
+    fn()
+
+
+def test_synthetic_files_are_deterministic() -> None:
+    assert darwin_json(masks=2, frames=2) == darwin_json(masks=2, frames=2)
+    assert darwin_json(seed=1) != darwin_json(seed=2)
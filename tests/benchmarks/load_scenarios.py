@@ -0,0 +1,208 @@
+"""
+Throughput of ``darwin dataset push``, ``pull`` and ``import`` at scale, against the local
+stand-in of the Darwin API (see ``tests.benchmarks.stand_in_server``).
+
+Each scenario prepares the stand-in and the local files, runs the CLI in a subprocess with a
+temporary home directory, checks what it did, and reports its throughput and the requests it
+made. It isn't collected by pytest, run it with::
+
+    python -m tests.benchmarks.load_scenarios push pull import --items 1000
+    python -m tests.benchmarks.load_scenarios pull --items 5000 --latency 0.05 --throttle 0.01
+
+Arguments after ``--`` are passed on to the CLI, e.g. ``-- --extract_views``, and the
+environment is too, e.g. ``DARWIN_DOWNLOAD_FILES_CONCURRENCY=32``. The SDK waits a minute
+before retrying throttled API requests by default, which ``DARWIN_RETRY_INITIAL_WAIT`` and
+``DARWIN_RETRY_MAX_WAIT`` shorten.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from PIL import Image
+
+from tests.benchmarks.stand_in_server import Faults, StandInServer
+from tests.benchmarks.synthetic import darwin_json
+
+CLI = "from darwin.cli import main; main()"
+
+# Scenarios by name, which prepare the stand-in and the files in the given folder, and return
+# the arguments of the CLI and a check of its results, returning the number of items processed
+Prepared = Tuple[List[str], Callable[[], int]]
+Scenario = Callable[[StandInServer, Path, argparse.Namespace], Prepared]
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+@dataclass
+class Result:
+    scenario: str
+    items: int
+    seconds: float
+    stats: Dict[str, Any]
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+def scenario(name: str) -> Callable[[Scenario], Scenario]:
+    def _register(factory: Scenario) -> Scenario:
+        SCENARIOS[name] = factory
+        return factory
+
+    return _register
+
+
+@scenario("push")
+def push(server: StandInServer, directory: Path, args: argparse.Namespace) -> Prepared:
+    dataset = server.create_dataset("push")
+    images = directory / "images"
+    images.mkdir()
+    image = Image.new("RGB", (args.image_size, args.image_size))
+    for i in range(args.items):
+        image.save(images / f"item_{i}.jpg")
+
+    def check() -> int:
+        uploaded = [i for i in server.items.values() if i["status"] == "new"]
+        assert len(uploaded) == args.items, f"{len(uploaded)} items uploaded"
+        return len(uploaded)
+
+    return ["dataset", "push", f"{server.team}/{dataset['slug']}", str(images)], check
+
+
+@scenario("pull")
+def pull(server: StandInServer, directory: Path, args: argparse.Namespace) -> Prepared:
+    dataset = server.create_dataset("pull")
+    server.add_items(
+        dataset["slug"], args.items, image_size=args.image_size, polygons=args.polygons
+    )
+    server.create_export(dataset["slug"], "latest")
+
+    def check() -> int:
+        images = directory / "home" / ".darwin" / "datasets" / server.team / "pull"
+        pulled = list((images / "images").glob("*.jpg"))
+        assert len(pulled) == args.items, f"{len(pulled)} images pulled"
+        return len(pulled)
+
+    return ["dataset", "pull", f"{server.team}/{dataset['slug']}:latest"], check
+
+
+@scenario("import")
+def import_(
+    server: StandInServer, directory: Path, args: argparse.Namespace
+) -> Prepared:
+    dataset = server.create_dataset("import")
+    items = server.add_items(
+        dataset["slug"], args.items, image_size=args.image_size, polygons=0
+    )
+    annotations = directory / "annotations"
+    annotations.mkdir()
+    for item in items:
+        data = darwin_json(
+            item["name"], args.image_size, args.image_size, polygons=args.polygons
+        )
+        (annotations / f"{item['name']}.json").write_bytes(orjson.dumps(data))
+
+    def check() -> int:
+        imported = [i for i in items if len(i["annotations"]) == args.polygons]
+        assert len(imported) == args.items, f"{len(imported)} items imported"
+        return len(imported)
+
+    return [
+        "dataset",
+        "import",
+        f"{server.team}/{dataset['slug']}",
+        "darwin",
+        str(annotations),
+        "--yes",
+    ], check
+
+
+def run(name: str, args: argparse.Namespace, cli_args: List[str]) -> Result:
+    """Runs a scenario against a new stand-in, and returns its throughput."""
+    server = StandInServer(
+        api_faults=Faults(latency=args.latency, throttle_rate=args.throttle),
+        storage_faults=Faults(
+            latency=args.storage_latency,
+            throttle_rate=args.storage_throttle,
+            throttle_status=503,
+        ),
+    )
+    with server, tempfile.TemporaryDirectory() as directory:
+        home = Path(directory) / "home"
+        home.mkdir()
+        arguments, check = SCENARIOS[name](server, Path(directory), args)
+        env = {
+            **os.environ,
+            "HOME": str(home),
+            "USERPROFILE": str(home),
+            "DARWIN_API_KEY": "load-test",
+            "DARWIN_BASE_URL": server.url,
+        }
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, "-c", CLI, *arguments, *cli_args],
+            env=env,
+            capture_output=not args.verbose,
+            text=True,
+        )
+        seconds = time.perf_counter() - start
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"'{name}' exited with {process.returncode}:\n{process.stdout}{process.stderr}"
+            )
+        return Result(name, check(), seconds, server.stats())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    cli_args: List[str] = []
+    if "--" in argv:
+        argv, cli_args = argv[: argv.index("--")], argv[argv.index("--") + 1 :]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("scenarios", nargs="+", choices=list(SCENARIOS))
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--image-size", type=int, default=256)
+    parser.add_argument("--polygons", type=int, default=20, help="Per item")
+    parser.add_argument("--latency", type=float, default=0.0, help="API latency (s)")
+    parser.add_argument("--throttle", type=float, default=0.0, help="API 429 rate")
+    parser.add_argument("--storage-latency", type=float, default=0.0)
+    parser.add_argument("--storage-throttle", type=float, default=0.0)
+    parser.add_argument("--verbose", action="store_true", help="Show the CLI output")
+    parser.add_argument("--save", type=Path, help="Save the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.scenarios:
+        result = run(name, args, cli_args)
+        results.append(result)
+        print(
+            f"{name:<8} {result.items:>7} items {result.seconds:>8.2f}s "
+            f"{result.items_per_second:>9.1f} items/s"
+        )
+        for request, count in result.stats["requests"].items():
+            print(f"    {request:<40} {count:>7}")
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                [
+                    {**vars(result), "items_per_second": result.items_per_second}
+                    for result in results
+                ],
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+
+import pytest
+
+from tests.benchmarks import load_scenarios
+
+
+def _args(**kwargs) -> argparse.Namespace:
+    defaults = {
+        "items": 3,
+        "image_size": 32,
+        "polygons": 2,
+        "latency": 0.0,
+        "throttle": 0.0,
+        "storage_latency": 0.0,
+        "storage_throttle": 0.0,
+        "verbose": False,
+    }
+    return argparse.Namespace(**{**defaults, **kwargs})
+
+
+@pytest.mark.parametrize("name", list(load_scenarios.SCENARIOS))
+def test_scenarios_run_against_the_stand_in(name: str) -> None:
+    result = load_scenarios.run(name, _args(), [])
+
+    assert result.items == 3
+    assert not any(" 404" in request for request in result.stats["requests"])
+
+
+@pytest.mark.parametrize("name", ["push", "pull"])
+def test_scenarios_recover_from_throttling(
+    name: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DARWIN_RETRY_INITIAL_WAIT", "0")
+    monkeypatch.setenv("DARWIN_RETRY_MAX_WAIT", "0")
+
+    result = load_scenarios.run(name, _args(storage_throttle=0.3), [])
+
+    assert result.items == 3
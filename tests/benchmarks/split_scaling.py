@@ -0,0 +1,63 @@
+"""
+Scaling benchmark of the stratified split.
+
+Times ``_stratify_samples`` on synthetic releases of growing size, with a long tailed
+(Zipf) class distribution and a few classes per file. It isn't collected by pytest, run
+it with::
+
+    python -m tests.benchmarks.split_scaling --max-files 2000000 --classes 5000
+"""
+
+import argparse
+import time
+from typing import Dict, Set
+
+import numpy as np
+
+from darwin.dataset.split_manager import _stratify_samples
+
+
+def synthetic_release(
+    num_files: int, num_classes: int, max_classes_per_file: int = 4, seed: int = 0
+) -> Dict[int, Set[str]]:
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(1, max_classes_per_file + 1, num_files)
+    labels = np.minimum(rng.zipf(1.3, counts.sum()), num_classes) - 1
+    return {
+        idx: {f"class_{label}" for label in file_labels}
+        for idx, file_labels in enumerate(np.split(labels, np.cumsum(counts)[:-1]))
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--min-files", type=int, default=10_000)
+    parser.add_argument("--max-files", type=int, default=1_000_000)
+    parser.add_argument("--classes", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'files':>10} {'classes':>8} {'seconds':>8} {'us/file':>8}")
+    num_files = args.min_files
+    while num_files <= args.max_files:
+        idx_to_classes = synthetic_release(num_files, args.classes, seed=args.seed)
+        train_size = int(num_files * 0.7)
+        val_size = int(num_files * 0.2)
+        start = time.perf_counter()
+        _stratify_samples(
+            idx_to_classes,
+            args.seed,
+            train_size,
+            val_size,
+            num_files - train_size - val_size,
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{num_files:>10} {args.classes:>8} {elapsed:>8.2f} "
+            f"{elapsed / num_files * 1e6:>8.2f}"
+        )
+        num_files *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,712 @@
+"""
+A local stand-in of the Darwin API and of the storage it signs URLs for, to load test
+``darwin dataset push``, ``pull`` and ``import`` without the real service.
+
+It implements, in memory, the endpoints those commands use: authentication, datasets, annotation
+classes, ``register_upload``, ``sign``/``confirm`` uploads, the cursor paged items listing,
+``import``, exports and their zip download, plus a blob storage for the signed URLs. Latency and
+throttling (429 for the API, 503 for the storage, as S3 does) can be injected to reproduce
+production conditions. It isn't collected by pytest, run it on its own with::
+
+    python -m tests.benchmarks.stand_in_server --port 8765 --latency 0.05 --throttle 0.01
+
+and point the CLI at it with ``DARWIN_BASE_URL=http://127.0.0.1:8765 DARWIN_API_KEY=key``.
+``tests.benchmarks.load_scenarios`` does this to measure throughput.
+"""
+
+import argparse
+import io
+import re
+import threading
+import time
+import uuid
+import zipfile
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import PurePosixPath
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import orjson as json
+from PIL import Image
+
+from tests.benchmarks.synthetic import darwin_json
+
+ANNOTATION_TYPES = [
+    "bounding_box",
+    "polygon",
+    "tag",
+    "keypoint",
+    "line",
+    "ellipse",
+    "cuboid",
+    "skeleton",
+    "mask",
+    "raster_layer",
+    "attributes",
+    "text",
+    "instance_id",
+    "directional_vector",
+]
+
+SLOT_TYPES = {
+    ".mp4": "video",
+    ".avi": "video",
+    ".mov": "video",
+    ".dcm": "dicom",
+    ".nii": "dicom",
+    ".pdf": "pdf",
+}
+
+# What the handlers return: a status, a JSON serializable body or raw bytes, extra headers
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+@dataclass
+class Faults:
+    """
+    Faults injected in the responses of the API or of the storage.
+
+    Attributes
+    ----------
+    latency : float, default: 0.0
+        Seconds every response is delayed by.
+    throttle_rate : float, default: 0.0
+        Probability of a request being rejected with ``throttle_status``.
+    throttle_status : int, default: 429
+        The status of throttled requests.
+    """
+
+    latency: float = 0.0
+    throttle_rate: float = 0.0
+    throttle_status: int = 429
+
+
+class StandInServer:
+    """
+    The stand-in, serving on a background thread. Use it as a context manager, or call
+    ``start`` and ``stop``.
+
+    Parameters
+    ----------
+    team : str, default: "team"
+        The slug of the only team, which every API key authenticates as.
+    api_faults : Optional[Faults], default: None
+        The faults injected in the API responses.
+    storage_faults : Optional[Faults], default: None
+        The faults injected in the responses of the storage. Export downloads are only delayed,
+        as the SDK doesn't retry them.
+    port : int, default: 0
+        The port to listen on, a free one by default.
+    seed : int, default: 0
+        The seed of the fault injection.
+    """
+
+    def __init__(
+        self,
+        team: str = "team",
+        api_faults: Optional[Faults] = None,
+        storage_faults: Optional[Faults] = None,
+        port: int = 0,
+        seed: int = 0,
+    ):
+        self.team = team
+        self.api_faults = api_faults or Faults()
+        self.storage_faults = storage_faults or Faults(throttle_status=503)
+        self.datasets: Dict[str, Dict[str, Any]] = {}
+        self.items: Dict[str, Dict[str, Any]] = {}
+        # Teams always have the class of the raster layers
+        self.classes: List[Dict[str, Any]] = [
+            {
+                "id": 1,
+                "name": "__raster_layer__",
+                "annotation_types": ["raster_layer"],
+                "datasets": [],
+                "metadata": {},
+                "description": None,
+            }
+        ]
+        self.exports: Dict[str, List[Dict[str, Any]]] = {}
+        self.blobs: Dict[str, bytes] = {}
+        self.uploads: Dict[str, Tuple[str, int]] = {}
+        # Requests and bytes received, by "<METHOD> <route> <status>"
+        self.requests: Counter = Counter()
+        self.bytes_received = 0
+        self.bytes_sent = 0
+
+        self._lock = threading.RLock()
+        self._random = Random(seed)
+        self._routes = self._build_routes()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def create_dataset(self, name: str) -> Dict[str, Any]:
+        """Creates a dataset, whose slug is its name in lower case, and returns it."""
+        slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+        with self._lock:
+            dataset = {
+                "id": len(self.datasets) + 1,
+                "name": name,
+                "slug": slug,
+                "num_items": 0,
+                "progress": 0,
+            }
+            self.datasets[slug] = dataset
+            self.exports[slug] = []
+        return dataset
+
+    def add_items(
+        self, dataset_slug: str, files: int, image_size: int = 256, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Adds uploaded items to a dataset, sharing one blank JPEG image, with synthetic
+        annotations.
+
+        Parameters
+        ----------
+        dataset_slug : str
+            The dataset to add the items to.
+        files : int
+            The number of items.
+        image_size : int, default: 256
+            The width and height of the image.
+        **kwargs : Any
+            The arguments of ``synthetic.darwin_json`` for the annotations of each item,
+            except its name and size.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The items added.
+        """
+        buffer = io.BytesIO()
+        Image.new("RGB", (image_size, image_size)).save(buffer, format="JPEG")
+        key = f"seeded/{image_size}.jpg"
+        self.blobs[key] = buffer.getvalue()
+
+        items = []
+        for i in range(files):
+            name = f"item_{i}.jpg"
+            data = darwin_json(name, image_size, image_size, **kwargs)
+            item = self._new_item(
+                dataset_slug, name, "/", [{"slot_name": "0", "file_name": name}]
+            )
+            slot = item["slots"][0]
+            slot.update(width=image_size, height=image_size, storage_key=key)
+            slot["size_bytes"] = len(self.blobs[key])
+            item["status"] = "new"
+            item["annotations"] = data["annotations"]
+            items.append(item)
+        return items
+
+    def create_export(self, dataset_slug: str, name: str) -> Dict[str, Any]:
+        """Creates a complete export of all the items of a dataset, marked as the latest."""
+        with self._lock:
+            exports = self.exports[dataset_slug]
+            for export in exports:
+                export["latest"] = False
+            export = {
+                "name": name,
+                "version": len(exports) + 1,
+                "status": "complete",
+                "format": "darwin_json_2",
+                "inserted_at": datetime.now(timezone.utc).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                ),
+                "latest": True,
+                "download_url": f"{self.url}/exports/{dataset_slug}/{name}.zip",
+                "metadata": {
+                    "num_images": self.datasets[dataset_slug]["num_items"],
+                    "annotation_classes": [],
+                },
+            }
+            exports.append(export)
+        return export
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the number of requests by method, route and status, and bytes transferred."""
+        with self._lock:
+            return {
+                "requests": dict(sorted(self.requests.items())),
+                "bytes_received": self.bytes_received,
+                "bytes_sent": self.bytes_sent,
+            }
+
+    def handle(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[str, Response]:
+        """Routes a request, and returns the name of its route and the response."""
+        split = urlsplit(path)
+        query = parse_qs(split.query)
+        for route_method, pattern, name, handler in self._routes:
+            match = pattern.fullmatch(split.path)
+            if match is None or route_method != method:
+                continue
+            storage = name.startswith("storage")
+            faults = self.storage_faults if storage else self.api_faults
+            if faults.latency:
+                time.sleep(faults.latency)
+            with self._lock:
+                throttled = (
+                    name != "storage export"
+                    and self._random.random() < faults.throttle_rate
+                )
+            if throttled:
+                return name, (faults.throttle_status, {"errors": "throttled"}, {})
+            if headers.get("x-darwin-payload-compression-version"):
+                body = zlib.decompress(body)
+            return name, handler(match, query, body)
+        return "unknown", (404, {"errors": f"No route for {method} {split.path}"}, {})
+
+    def _build_routes(self) -> List[Tuple[str, "re.Pattern", str, Callable]]:
+        api = "/api/"
+        v2 = f"{api}v2/teams/(?P<team>[^/]+)/"
+        routes = [
+            ("GET", f"{api}users/token_info", "token_info", self._token_info),
+            ("GET", f"{api}datasets/?", "list datasets", self._list_datasets),
+            ("POST", f"{api}datasets/?", "create dataset", self._create_dataset),
+            ("GET", f"{api}annotation_types", "annotation types", self._types),
+            (
+                "GET",
+                f"{api}teams/[^/]+/annotation_classes",
+                "list classes",
+                self._list_classes,
+            ),
+            ("POST", f"{api}annotation_classes", "create class", self._create_class),
+            (
+                "PUT",
+                f"{api}annotation_classes/(?P<id>\\d+)",
+                "update class",
+                self._update_class,
+            ),
+            ("GET", f"{api}datasets/\\d+/attributes", "attributes", self._empty_list),
+            ("GET", f"{api}teams/[^/]+/features", "features", self._empty_list),
+            ("GET", f"{v2}properties", "properties", self._properties),
+            (
+                "POST",
+                f"{v2}items/register_upload",
+                "register_upload",
+                self._register_upload,
+            ),
+            (
+                "GET",
+                f"{v2}items/uploads/(?P<upload_id>[^/]+)/sign",
+                "sign_upload",
+                self._sign_upload,
+            ),
+            (
+                "POST",
+                f"{v2}items/uploads/(?P<upload_id>[^/]+)/confirm",
+                "confirm_upload",
+                self._confirm_upload,
+            ),
+            ("GET", f"{v2}items", "list items", self._list_items),
+            (
+                "GET",
+                f"{v2}items/(?P<item_id>[^/]+)/annotations",
+                "item annotations",
+                self._item_annotations,
+            ),
+            (
+                "POST",
+                f"{v2}items/(?P<item_id>[^/]+)/import",
+                "import_annotation",
+                self._import_annotation,
+            ),
+            (
+                "GET",
+                f"{v2}datasets/(?P<slug>[^/]+)/exports",
+                "list exports",
+                self._list_exports,
+            ),
+            (
+                "POST",
+                f"{v2}datasets/(?P<slug>[^/]+)/exports",
+                "create export",
+                self._create_export,
+            ),
+            ("PUT", "/storage/(?P<key>.+)", "storage put", self._put_blob),
+            ("GET", "/storage/(?P<key>.+)", "storage get", self._get_blob),
+            (
+                "GET",
+                "/exports/(?P<slug>[^/]+)/(?P<name>[^/]+)\\.zip",
+                "storage export",
+                self._export_zip,
+            ),
+        ]
+        return [
+            (method, re.compile(pattern), name, handler)
+            for method, pattern, name, handler in routes
+        ]
+
+    def _token_info(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, {"selected_team": {"slug": self.team}}, {}
+
+    def _list_datasets(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, list(self.datasets.values()), {}
+
+    def _create_dataset(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, self.create_dataset(json.loads(body)["name"]), {}
+
+    def _types(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        types = [
+            {"id": i, "name": name} for i, name in enumerate(ANNOTATION_TYPES, start=1)
+        ]
+        return 200, types, {}
+
+    def _list_classes(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, {"annotation_classes": self.classes}, {}
+
+    def _create_class(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        payload = json.loads(body)
+        with self._lock:
+            annotation_class = {
+                "id": len(self.classes) + 1,
+                "name": payload["name"],
+                "annotation_types": [
+                    ANNOTATION_TYPES[i - 1] for i in payload["annotation_type_ids"]
+                ],
+                "datasets": payload["datasets"],
+                "metadata": payload["metadata"],
+                "description": None,
+            }
+            self.classes.append(annotation_class)
+        return 200, annotation_class, {}
+
+    def _update_class(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        with self._lock:
+            annotation_class = self.classes[int(match["id"]) - 1]
+            annotation_class.update(json.loads(body))
+        return 200, annotation_class, {}
+
+    def _empty_list(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, [], {}
+
+    def _properties(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, {"properties": []}, {}
+
+    def _register_upload(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        payload = json.loads(body)
+        dataset_slug = payload["dataset_slug"]
+        items, blocked_items = [], []
+        with self._lock:
+            existing_items = {
+                (item["name"], item["path"])
+                for item in self.items.values()
+                if item["dataset_slug"] == dataset_slug
+            }
+        for requested in payload["items"]:
+            path = requested.get("path", "/")
+            if (requested["name"], path) in existing_items:
+                blocked_items.append(
+                    {
+                        "name": requested["name"],
+                        "path": path,
+                        "slots": [
+                            {
+                                **slot,
+                                "type": _slot_type(slot),
+                                "reason": "ALREADY_EXISTS",
+                            }
+                            for slot in requested["slots"]
+                        ],
+                    }
+                )
+                continue
+            item = self._new_item(
+                dataset_slug, requested["name"], path, requested["slots"]
+            )
+            items.append(_public(item))
+        return 200, {"items": items, "blocked_items": blocked_items}, {}
+
+    def _sign_upload(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        upload_id = match["upload_id"]
+        if upload_id not in self.uploads:
+            return 404, {"errors": "Unknown upload"}, {}
+        url = f"{self.url}/storage/uploads/{upload_id}?signature={uuid.uuid4().hex}"
+        return 200, {"upload_url": url}, {}
+
+    def _confirm_upload(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        upload_id = match["upload_id"]
+        key = f"uploads/{upload_id}"
+        with self._lock:
+            if key not in self.blobs or upload_id not in self.uploads:
+                return 422, {"errors": "Nothing was uploaded"}, {}
+            item_id, slot_index = self.uploads[upload_id]
+            item = self.items[item_id]
+            slot = item["slots"][slot_index]
+            slot.update(storage_key=key, size_bytes=len(self.blobs[key]))
+            if all("storage_key" in slot for slot in item["slots"]):
+                item["status"] = "new"
+        return 200, {}, {}
+
+    def _list_items(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        size = int(query.get("page[size]", ["500"])[0])
+        start = int(query.get("page[from]", ["0"])[0])
+        dataset_ids = {int(i) for i in query.get("dataset_ids[]", [])}
+        filters = {
+            "name": set(query.get("item_names[]", [])),
+            "path": set(query.get("item_paths[]", [])),
+            "status": set(query.get("statuses[]", [])),
+        }
+        with self._lock:
+            items = [
+                item
+                for item in self.items.values()
+                if (not dataset_ids or item["dataset_id"] in dataset_ids)
+                and all(
+                    not values or item[key] in values for key, values in filters.items()
+                )
+            ]
+        page = items[start : start + size]
+        next_page = str(start + size) if start + size < len(items) else None
+        return (
+            200,
+            {"items": [_public(item) for item in page], "page": {"next": next_page}},
+            {},
+        )
+
+    def _item_annotations(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        item = self.items.get(match["item_id"])
+        if item is None:
+            return 404, {"errors": "Unknown item"}, {}
+        return 200, item["annotations"], {}
+
+    def _import_annotation(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        payload = json.loads(body)
+        with self._lock:
+            item = self.items.get(match["item_id"])
+            if item is None:
+                return 404, {"errors": "Unknown item"}, {}
+            if payload.get("overwrite") in (True, "true"):
+                item["annotations"] = []
+            item["annotations"].extend(payload["annotations"])
+        return 200, {}, {}
+
+    def _list_exports(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        if match["slug"] not in self.exports:
+            return 404, {"errors": "Unknown dataset"}, {}
+        return 200, self.exports[match["slug"]], {}
+
+    def _create_export(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        return 200, self.create_export(match["slug"], json.loads(body)["name"]), {}
+
+    def _put_blob(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        if "signature" not in query:
+            return 403, b"Missing signature", {}
+        with self._lock:
+            self.blobs[match["key"]] = body
+        return 200, b"", {}
+
+    def _get_blob(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        blob = self.blobs.get(match["key"])
+        if blob is None:
+            return 404, b"Not found", {}
+        return 200, blob, {"Content-Type": "application/octet-stream"}
+
+    def _export_zip(self, match: re.Match, query: Dict, body: bytes) -> Response:
+        slug = match["slug"]
+        buffer = io.BytesIO()
+        with self._lock:
+            items = [
+                item for item in self.items.values() if item["dataset_slug"] == slug
+            ]
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+            for item in items:
+                z.writestr(f"{item['id']}.json", json.dumps(self._darwin_json(item)))
+        return 200, buffer.getvalue(), {"Content-Type": "application/zip"}
+
+    def _new_item(
+        self, dataset_slug: str, name: str, path: str, slots: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        with self._lock:
+            dataset = self.datasets[dataset_slug]
+            item_id = str(uuid.UUID(int=self._random.getrandbits(128)))
+            item = {
+                "id": item_id,
+                "name": name,
+                "path": path,
+                "status": "uploading",
+                "archived": False,
+                "dataset_id": dataset["id"],
+                "dataset_slug": dataset_slug,
+                "slots": [],
+                "annotations": [],
+            }
+            for index, slot in enumerate(slots):
+                upload_id = str(uuid.UUID(int=self._random.getrandbits(128)))
+                self.uploads[upload_id] = (item_id, index)
+                item["slots"].append(
+                    {
+                        "slot_name": slot["slot_name"],
+                        "file_name": slot["file_name"],
+                        "type": _slot_type(slot),
+                        "upload_id": upload_id,
+                    }
+                )
+            self.items[item_id] = item
+            dataset["num_items"] += 1
+        return item
+
+    def _darwin_json(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "version": "2.0",
+            "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+            "item": {
+                "name": item["name"],
+                "path": item["path"],
+                "source_info": {
+                    "item_id": item["id"],
+                    "dataset": {
+                        "name": self.datasets[item["dataset_slug"]]["name"],
+                        "slug": item["dataset_slug"],
+                    },
+                    "team": {"name": self.team, "slug": self.team},
+                },
+                "slots": [
+                    {
+                        "type": slot["type"],
+                        "slot_name": slot["slot_name"],
+                        "width": slot.get("width"),
+                        "height": slot.get("height"),
+                        "source_files": [
+                            {
+                                "file_name": slot["file_name"],
+                                "url": f"{self.url}/storage/{slot.get('storage_key')}",
+                            }
+                        ],
+                    }
+                    for slot in item["slots"]
+                ],
+            },
+            "annotations": item["annotations"],
+        }
+
+
+def _slot_type(slot: Dict[str, Any]) -> str:
+    return SLOT_TYPES.get(PurePosixPath(slot["file_name"]).suffix.lower(), "image")
+
+
+def _public(item: Dict[str, Any]) -> Dict[str, Any]:
+    # The item as the API lists it, without the stand-in's bookkeeping
+    return {
+        **{
+            key: value
+            for key, value in item.items()
+            if key not in ("annotations", "dataset_slug")
+        },
+        "slots": [
+            {key: value for key, value in slot.items() if key != "storage_key"}
+            for slot in item["slots"]
+        ],
+        "layout": {"version": 1, "type": "simple", "slots": ["0"]},
+        "processing_status": "complete",
+    }
+
+
+def _handler_for(server: StandInServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Bodies shorter than their Content-Length fail instead of hanging
+        timeout = 30
+
+        def _serve(self) -> None:
+            body = self._read_body()
+            headers = {key.lower(): value for key, value in self.headers.items()}
+            route, (status, content, extra_headers) = server.handle(
+                self.command, self.path, headers, body
+            )
+            if not isinstance(content, bytes):
+                content = json.dumps(content)
+                extra_headers = {"Content-Type": "application/json", **extra_headers}
+            self.send_response(status)
+            for key, value in extra_headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+            with server._lock:
+                server.requests[f"{self.command} {route} {status}"] += 1
+                server.bytes_received += len(body)
+                server.bytes_sent += len(content)
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                chunks = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        return b"".join(chunks)
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--team", default="team")
+    parser.add_argument("--dataset", default="load-test", help="Dataset to create")
+    parser.add_argument("--items", type=int, default=0, help="Items to add to it")
+    parser.add_argument("--latency", type=float, default=0.0, help="API latency (s)")
+    parser.add_argument("--throttle", type=float, default=0.0, help="API 429 rate")
+    parser.add_argument("--storage-latency", type=float, default=0.0)
+    parser.add_argument("--storage-throttle", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = StandInServer(
+        team=args.team,
+        api_faults=Faults(latency=args.latency, throttle_rate=args.throttle),
+        storage_faults=Faults(
+            latency=args.storage_latency,
+            throttle_rate=args.storage_throttle,
+            throttle_status=503,
+        ),
+        port=args.port,
+    )
+    dataset = server.create_dataset(args.dataset)
+    if args.items:
+        server.add_items(dataset["slug"], args.items, polygons=10)
+        server.create_export(dataset["slug"], "latest")
+    print(f"Serving {args.team}/{dataset['slug']} on {server.url}, Ctrl+C to stop")
+    try:
+        server.start()._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Deterministic generator of synthetic Darwin JSON 2.0 files and pulled releases, used by the
+benchmarks. The same arguments always produce the same files.
+"""
+
+import uuid
+from math import cos, pi, sin
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Optional
+
+import orjson as json
+from PIL import Image
+
+SCHEMA_REF = (
+    "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json"
+)
+
+
+def darwin_json(
+    name: str = "item_0.jpg",
+    width: int = 1920,
+    height: int = 1080,
+    polygons: int = 100,
+    polygon_points: int = 50,
+    bounding_boxes: int = 0,
+    tags: int = 0,
+    masks: int = 0,
+    classes: int = 10,
+    frames: Optional[int] = None,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Returns a synthetic Darwin JSON file.
+
+    Parameters
+    ----------
+    name : str, default: "item_0.jpg"
+        The name of the item.
+    width : int, default: 1920
+        The width of the image, or of the video frames.
+    height : int, default: 1080
+        The height of the image, or of the video frames.
+    polygons : int, default: 100
+        The number of polygons, random convex-ish shapes.
+    polygon_points : int, default: 50
+        The number of points of each polygon.
+    bounding_boxes : int, default: 0
+        The number of bounding boxes.
+    tags : int, default: 0
+        The number of tags.
+    masks : int, default: 0
+        The number of masks. When there are any, a raster layer covering the whole image is
+        added, each mask painting a horizontal band of it.
+    classes : int, default: 10
+        The number of classes the annotations are spread over.
+    frames : Optional[int], default: None
+        If given, the item is a video with this number of frames, and every annotation is
+        present, as a keyframe, in all of them.
+    seed : int, default: 0
+        The seed of the random generator.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The Darwin JSON file.
+    """
+    rng = Random(f"{seed}-{name}")
+    annotations: List[Dict[str, Any]] = []
+
+    def _add(data: Dict[str, Any], index: int) -> None:
+        annotation = {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": f"class_{index % classes}",
+            "slot_names": ["0"],
+        }
+        if frames is None:
+            annotations.append({**annotation, **data})
+        else:
+            annotations.append(
+                {
+                    **annotation,
+                    "frames": {
+                        str(frame): {**data, "keyframe": True}
+                        for frame in range(frames)
+                    },
+                    "ranges": [[0, frames]],
+                    "interpolated": False,
+                    "hidden_areas": [],
+                }
+            )
+
+    for i in range(polygons):
+        _add({"polygon": {"paths": [_polygon(rng, width, height, polygon_points)]}}, i)
+    for i in range(bounding_boxes):
+        x, y = rng.uniform(0, width * 0.9), rng.uniform(0, height * 0.9)
+        w, h = rng.uniform(1, width - x), rng.uniform(1, height - y)
+        _add({"bounding_box": {"x": x, "y": y, "w": w, "h": h}}, i)
+    for i in range(tags):
+        _add({"tag": {}}, i)
+    if masks:
+        mask_ids = []
+        for i in range(masks):
+            _add({"mask": {"sparse_rle": None}}, i)
+            mask_ids.append(annotations[-1]["id"])
+        raster = {
+            "raster_layer": {
+                "dense_rle": _dense_rle(rng, width, height, masks),
+                "mask_annotation_ids_mapping": {
+                    mask_id: value for value, mask_id in enumerate(mask_ids, start=1)
+                },
+                "total_pixels": width * height,
+            }
+        }
+        _add(raster, 0)
+        annotations[-1]["name"] = "__raster_layer__"
+
+    slot: Dict[str, Any] = {
+        "type": "image" if frames is None else "video",
+        "slot_name": "0",
+        "width": width,
+        "height": height,
+        "source_files": [{"file_name": name, "url": f"https://example.com/{name}"}],
+    }
+    if frames is not None:
+        slot["frame_count"] = frames
+        slot["frame_urls"] = [
+            f"https://example.com/{name}/frames/{frame}.jpg" for frame in range(frames)
+        ]
+    return {
+        "version": "2.0",
+        "schema_ref": SCHEMA_REF,
+        "item": {
+            "name": name,
+            "path": "/",
+            "source_info": {
+                "item_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "dataset": {"name": "Synthetic", "slug": "synthetic"},
+                "team": {"name": "Team", "slug": "team"},
+            },
+            "slots": [slot],
+        },
+        "annotations": annotations,
+    }
+
+
+def write_release(
+    dataset_path: Path,
+    files: int,
+    image_size: int = 64,
+    release_name: str = "latest",
+    **kwargs: Any,
+) -> Path:
+    """
+    Writes a synthetic pulled release, with the ``annotations``, ``lists/classes_*.txt`` and
+    images that ``LocalDataset``, ``split_dataset`` and the torch datasets expect.
+
+    Parameters
+    ----------
+    dataset_path : Path
+        The folder of the dataset, created if it doesn't exist.
+    files : int
+        The number of items.
+    image_size : int, default: 64
+        The width and height of the images, which are blank.
+    release_name : str, default: "latest"
+        The name of the release.
+    **kwargs : Any
+        The arguments of ``darwin_json`` for each item, except its name and size.
+
+    Returns
+    -------
+    Path
+        The folder of the release.
+    """
+    release_path = dataset_path / "releases" / release_name
+    annotations_dir = release_path / "annotations"
+    lists_dir = release_path / "lists"
+    images_dir = dataset_path / "images"
+    for directory in (annotations_dir, lists_dir, images_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    image = Image.new("RGB", (image_size, image_size))
+    class_names = set()
+    for i in range(files):
+        data = darwin_json(
+            name=f"item_{i}.jpg", width=image_size, height=image_size, **kwargs
+        )
+        (annotations_dir / f"item_{i}.json").write_bytes(json.dumps(data))
+        image.save(images_dir / f"item_{i}.jpg")
+        class_names.update(
+            a["name"] for a in data["annotations"] if a["name"] != "__raster_layer__"
+        )
+    classes = "\n".join(sorted(class_names))
+    for annotation_type in ("polygon", "bounding_box", "tag"):
+        (lists_dir / f"classes_{annotation_type}.txt").write_text(classes)
+    return release_path
+
+
+def _polygon(rng: Random, width: int, height: int, points: int) -> List[Dict]:
+    # Points around an ellipse, with a random radius each, inside the image
+    cx, cy = rng.uniform(0, width), rng.uniform(0, height)
+    rx, ry = rng.uniform(2, width / 4), rng.uniform(2, height / 4)
+    path = []
+    for i in range(points):
+        angle = 2 * pi * i / points
+        scale = rng.uniform(0.5, 1)
+        path.append(
+            {
+                "x": min(max(cx + rx * scale * cos(angle), 0), width - 1),
+                "y": min(max(cy + ry * scale * sin(angle), 0), height - 1),
+            }
+        )
+    return path
+
+
+def _dense_rle(rng: Random, width: int, height: int, masks: int) -> List[int]:
+    # Each row is background with a run of one of the masks, of random length
+    rle: List[int] = []
+    for row in range(height):
+        value = 1 + row * masks // height
+        length = rng.randint(0, width)
+        start = rng.randint(0, width - length)
+        rle += [0, start, value, length, 0, width - start - length]
+    return rle
@@ -1,6 +1,8 @@
 import builtins
+import json
 import sys
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import ANY, call, patch
 
 import pytest
@@ -9,17 +11,20 @@ from rich.console import Console
 
 from darwin import cli
 from darwin.cli_functions import (
+    convert,
     delete_files,
     extract_video_artifacts,
     pull_dataset,
     set_file_status,
     upload_data,
+    validate_schemas,
 )
 from darwin.client import Client
 from darwin.config import Config
 from darwin.dataset import RemoteDataset
 from darwin.dataset.remote_dataset_v2 import RemoteDatasetV2
 from darwin.datatypes import AnnotatorReportGrouping
+from darwin.exporter.formats import coco, nifti
 from darwin.options import Options
 from darwin.utils import BLOCKED_UPLOAD_ERROR_ALREADY_EXISTS
 from tests.fixtures import *
@@ -549,6 +554,86 @@ class TestExtractVideo:
             )
 
 
+class TestValidateSchemas:
+    SCHEMA_REF = "https://example.com/darwin_json/test/schema.json"
+
+    @pytest.fixture(autouse=True)
+    def empty_schema_caches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("darwin.utils.utils._darwin_schema_cache", {})
+        monkeypatch.setattr("darwin.utils.utils._darwin_validator_cache", {})
+
+    @pytest.fixture
+    def files_dir(self, tmp_path: Path) -> Path:
+        files_dir = tmp_path / "files"
+        files_dir.mkdir()
+        (files_dir / "valid.json").write_text(
+            json.dumps({"schema_ref": self.SCHEMA_REF, "item": {}})
+        )
+        (files_dir / "invalid.json").write_text(
+            json.dumps({"schema_ref": self.SCHEMA_REF})
+        )
+        return files_dir
+
+    @pytest.fixture
+    def schemas_cache_dir(self, tmp_path: Path) -> Path:
+        cache_dir = tmp_path / "schemas"
+        schema_path = cache_dir / "example.com" / "darwin_json" / "test" / "schema.json"
+        schema_path.parent.mkdir(parents=True)
+        schema_path.write_text(json.dumps({"type": "object", "required": ["item"]}))
+        return cache_dir
+
+    @staticmethod
+    def _assert_report(report: Path, files_dir: Path) -> None:
+        errors = json.loads(report.read_text())
+        assert errors[str(files_dir / "valid.json")] == []
+        assert errors[str(files_dir / "invalid.json")] == [
+            {"message": "'item' is a required property", "location": "$"}
+        ]
+
+    def test_streams_report_of_files_validated(
+        self, tmp_path: Path, files_dir: Path, schemas_cache_dir: Path
+    ):
+        report = tmp_path / "report.json"
+
+        with patch("darwin.utils.utils.SCHEMAS_CACHE_DIR", schemas_cache_dir):
+            validate_schemas(str(files_dir), output=report, max_workers=1)
+
+        self._assert_report(report, files_dir)
+
+    def test_validates_files_in_processes(
+        self,
+        tmp_path: Path,
+        files_dir: Path,
+        schemas_cache_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        report = tmp_path / "report.json"
+        # Spawned workers import the module again and read the directory from the
+        # environment, forked workers inherit the patched module
+        monkeypatch.setenv("DARWIN_SCHEMAS_CACHE_DIR", str(schemas_cache_dir))
+        monkeypatch.setattr("darwin.utils.utils.SCHEMAS_CACHE_DIR", schemas_cache_dir)
+
+        validate_schemas(str(files_dir), output=report, max_workers=2)
+
+        self._assert_report(report, files_dir)
+
+
+class TestConvert:
+    def test_exports_in_processes_up_to_the_cpu_limit(self, tmp_path: Path):
+        with patch("darwin.exporter.export_annotations") as export_mock:
+            convert("nifti", [tmp_path], tmp_path, cpu_limit=4)
+
+        parser = export_mock.call_args.args[0]
+        assert parser.func is nifti.export
+        assert parser.keywords == {"max_workers": 4}
+
+    def test_ignores_cpu_limit_of_formats_exported_in_process(self, tmp_path: Path):
+        with patch("darwin.exporter.export_annotations") as export_mock:
+            convert("coco", [tmp_path], tmp_path, cpu_limit=4)
+
+        assert export_mock.call_args.args[0] is coco.export
+
+
 class TestPullDataset:
     def test_allows_override_team_when_it_mismatches_identifier_team(
         self, remote_dataset: RemoteDataset
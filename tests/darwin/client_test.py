@@ -1,4 +1,5 @@
 import logging
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional
@@ -40,6 +41,12 @@ def darwin_client(
     return Client(config)
 
 
+@pytest.fixture
+def cached_darwin_client(darwin_client: Client) -> Client:
+    darwin_client.config.put(["global", "metadata_cache_ttl"], "60")
+    return Client(darwin_client.config)
+
+
 @pytest.mark.usefixtures("file_read_write_test")
 class TestListRemoteDatasets:
     @responses.activate
@@ -280,6 +287,113 @@ class TestFetchRemoteClasses:
         assert annotation_class["datasets"] == [{"id": 215}, {"id": 265}]
         assert annotation_class["id"] == 345
 
+    @responses.activate
+    def test_does_not_cache_remote_classes_by_default(
+        self,
+        team_slug_darwin_json_v2: str,
+        darwin_client: Client,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.delenv("DARWIN_METADATA_CACHE_TTL", raising=False)
+        endpoint: str = (
+            f"/teams/{team_slug_darwin_json_v2}/annotation_classes?include_tags=true"
+        )
+        rsp = responses.add(
+            responses.GET,
+            darwin_client.url + endpoint,
+            json={"annotation_classes": [{"id": 1}]},
+            status=200,
+        )
+
+        client = Client(darwin_client.config)
+        client.fetch_remote_classes(team_slug_darwin_json_v2)
+        client.fetch_remote_classes(team_slug_darwin_json_v2)
+
+        assert rsp.call_count == 2
+
+    def test_enables_cache_from_environment(
+        self, darwin_client: Client, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("DARWIN_METADATA_CACHE_TTL", "30")
+
+        assert Client(darwin_client.config).metadata_cache.ttl == 30
+
+    @responses.activate
+    def test_serves_remote_classes_from_cache(
+        self, team_slug_darwin_json_v2: str, cached_darwin_client: Client
+    ) -> None:
+        endpoint: str = (
+            f"/teams/{team_slug_darwin_json_v2}/annotation_classes?include_tags=true"
+        )
+        rsp = responses.add(
+            responses.GET,
+            cached_darwin_client.url + endpoint,
+            json={"annotation_classes": [{"id": 1, "datasets": []}]},
+            status=200,
+        )
+
+        first = cached_darwin_client.fetch_remote_classes(team_slug_darwin_json_v2)
+        first[0]["datasets"].append({"id": 2})
+        second = cached_darwin_client.fetch_remote_classes(team_slug_darwin_json_v2)
+
+        assert rsp.call_count == 1
+        assert second == [{"id": 1, "datasets": []}]
+
+    @responses.activate
+    def test_revalidates_stale_remote_classes_with_etag(
+        self, team_slug_darwin_json_v2: str, cached_darwin_client: Client
+    ) -> None:
+        endpoint: str = (
+            f"/teams/{team_slug_darwin_json_v2}/annotation_classes?include_tags=true"
+        )
+        responses.add(
+            responses.GET,
+            cached_darwin_client.url + endpoint,
+            json={"annotation_classes": [{"id": 1}]},
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        not_modified = responses.add(
+            responses.GET,
+            cached_darwin_client.url + endpoint,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+
+        cached_darwin_client.fetch_remote_classes(team_slug_darwin_json_v2)
+        for entry in cached_darwin_client.metadata_cache._entries.values():
+            entry.fetched_at = 0
+        result = cached_darwin_client.fetch_remote_classes(team_slug_darwin_json_v2)
+
+        assert not_modified.call_count == 1
+        assert result == [{"id": 1}]
+
+    @responses.activate
+    def test_invalidates_cache_on_class_update(
+        self, team_slug_darwin_json_v2: str, cached_darwin_client: Client
+    ) -> None:
+        endpoint: str = (
+            f"/teams/{team_slug_darwin_json_v2}/annotation_classes?include_tags=true"
+        )
+        rsp = responses.add(
+            responses.GET,
+            cached_darwin_client.url + endpoint,
+            json={"annotation_classes": [{"id": 1}]},
+            status=200,
+        )
+        responses.add(
+            responses.PUT,
+            cached_darwin_client.url + "/annotation_classes/1",
+            json={"id": 1},
+            status=200,
+        )
+
+        cached_darwin_client.fetch_remote_classes(team_slug_darwin_json_v2)
+        cached_darwin_client.update_annotation_class(1, {"id": 1})
+        cached_darwin_client.fetch_remote_classes(team_slug_darwin_json_v2)
+
+        assert rsp.call_count == 2
+
 
 @pytest.mark.usefixtures("file_read_write_test")
 class TestGetTeamFeatures:
@@ -704,6 +818,34 @@ class TestClientRetry:
             assert mock_sleep.called
 
 
+@pytest.mark.usefixtures("file_read_write_test")
+class TestPostSerializedPayload:
+    @responses.activate
+    def test_posts_the_bytes_as_is(self, darwin_client: Client) -> None:
+        body = b'{"annotations":[],"overwrite":"true"}'
+        responses.add(responses.POST, "http://localhost/api/import", json={})
+
+        darwin_client._post_raw("/import", body)
+
+        assert responses.calls[0].request.body == body
+        assert (
+            "X-Darwin-Payload-Compression-Version"
+            not in responses.calls[0].request.headers
+        )
+
+    @responses.activate
+    def test_compresses_the_bytes(self, darwin_client: Client) -> None:
+        body = b'{"annotations":[],"overwrite":"true"}'
+        darwin_client.config.put(["global", "payload_compression_level"], "6")
+        responses.add(responses.POST, "http://localhost/api/import", json={})
+
+        darwin_client._post_raw("/import", body)
+
+        request = responses.calls[0].request
+        assert zlib.decompress(request.body) == body
+        assert request.headers["X-Darwin-Payload-Compression-Version"] == "1"
+
+
 @pytest.mark.usefixtures("file_read_write_test")
 class TestGetAnnotatorsReport:
     @pytest.mark.parametrize(
@@ -10,12 +10,14 @@ import pytest
 
 from darwin.dataset.split_manager import split_dataset
 from darwin.dataset.utils import (
+    chunk_items,
     compute_distributions,
     exhaust_generator,
     extract_classes,
     get_annotations,
     get_external_file_type,
     get_release_path,
+    iter_storage_keys,
     parse_external_file_path,
     sanitize_filename,
 )
@@ -86,7 +88,7 @@ def parsed_annotation_file():
     }
 
 
-@patch("orjson.loads", return_value=parsed_annotation_file())
+@patch("darwin.utils.utils.read_json", return_value=parsed_annotation_file())
 @patch("pathlib.Path.open", return_value=open_resource_file())
 def test_compute_distributions(parse_file_mock, open_mock):
     value = compute_distributions(Path("test"), Path("split"), partitions=["train"])
@@ -447,6 +449,21 @@ class TestGetExternalFileType:
         assert get_external_file_type("/path/to/file/my_video.mp4") == "video"
 
 
+class TestChunkItems:
+    def test_chunks_a_generator(self):
+        chunks = chunk_items((i for i in range(5)), chunk_size=2)
+        assert list(chunks) == [[0, 1], [2, 3], [4]]
+
+    def test_reads_storage_keys_lazily(self, tmp_path: Path):
+        listing = tmp_path / "keys.txt"
+        listing.write_text("a/1.jpg\n\n  a/2.jpg  \na/3.jpg")
+
+        assert list(chunk_items(iter_storage_keys(listing), chunk_size=2)) == [
+            ["a/1.jpg", "a/2.jpg"],
+            ["a/3.jpg"],
+        ]
+
+
 class TestParseExternalFilePath:
     def test_parse_external_file_paths(self):
         assert parse_external_file_path("my_image.png", preserve_folders=True) == "/"
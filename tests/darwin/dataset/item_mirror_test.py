@@ -0,0 +1,229 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+import responses
+
+from darwin.client import Client
+from darwin.config import Config
+from darwin.dataset.item_mirror import ItemMirror
+from darwin.dataset.remote_dataset_v2 import RemoteDatasetV2
+from tests.fixtures import *
+
+ITEMS_URL = "http://localhost/api/v2/teams/v7-darwin-json-v2/items"
+
+
+def raw_item(
+    name: str,
+    updated_at: str,
+    status: str = "new",
+    path: str = "/",
+    slot_type: str = "image",
+    size: int = 1,
+) -> Dict[str, Any]:
+    return {
+        "id": f"id-{name}",
+        "name": name,
+        "path": path,
+        "status": status,
+        "archived": False,
+        "dataset_id": 1,
+        "priority": 0,
+        "inserted_at": "2024-01-01T00:00:00Z",
+        "updated_at": updated_at,
+        "slot_types": [slot_type],
+        "slots": [{"type": slot_type, "size_bytes": size}],
+    }
+
+
+def add_items_response(items: List[Dict[str, Any]], **params: str) -> None:
+    responses.add(
+        responses.GET,
+        ITEMS_URL,
+        json={"items": items, "page": {"next": None}},
+        match=[responses.matchers.query_param_matcher(params, strict_match=False)],
+    )
+
+
+@pytest.fixture
+def darwin_client(
+    darwin_config_path: Path, darwin_datasets_path: Path, team_slug_darwin_json_v2: str
+) -> Client:
+    config = Config(darwin_config_path)
+    config.put(["global", "api_endpoint"], "http://localhost/api")
+    config.put(["global", "base_url"], "http://localhost")
+    config.put(["teams", team_slug_darwin_json_v2, "api_key"], "mock_api_key")
+    config.put(
+        ["teams", team_slug_darwin_json_v2, "datasets_dir"], str(darwin_datasets_path)
+    )
+    return Client(config)
+
+
+@pytest.fixture
+def remote_dataset(darwin_client: Client, team_slug_darwin_json_v2: str):
+    return RemoteDatasetV2(
+        client=darwin_client,
+        team=team_slug_darwin_json_v2,
+        name="test",
+        slug="test",
+        dataset_id=1,
+    )
+
+
+@pytest.fixture
+def mirror(remote_dataset: RemoteDatasetV2, tmp_path: Path):
+    mirror = ItemMirror(remote_dataset, path=tmp_path / "items.sqlite", max_age=60)
+    remote_dataset.item_mirror = mirror
+    yield mirror
+    mirror.close()
+
+
+@pytest.fixture
+def items() -> List[Dict[str, Any]]:
+    return [
+        raw_item("a.jpg", "2024-01-02T00:00:00Z", size=3),
+        raw_item("b.jpg", "2024-01-03T00:00:00.5Z", status="complete", size=1),
+        raw_item("c.mp4", "2024-01-04T00:00:00Z", path="/videos", slot_type="video"),
+    ]
+
+
+@pytest.mark.usefixtures("file_read_write_test")
+class TestItemMirror:
+    @responses.activate
+    def test_answers_queries_locally_once_synced(
+        self, mirror: ItemMirror, items: List[Dict[str, Any]]
+    ):
+        add_items_response(items)
+
+        assert [i.filename for i in mirror.query()] == ["a.jpg", "b.jpg", "c.mp4"]
+        assert [i.filename for i in mirror.query({"statuses": "complete"})] == ["b.jpg"]
+        assert [i.filename for i in mirror.query({"item_names": ["a.jpg"]})] == [
+            "a.jpg"
+        ]
+        assert [i.filename for i in mirror.query({"item_paths": ["/videos"]})] == [
+            "c.mp4"
+        ]
+        assert [i.filename for i in mirror.query({"slot_types": ["video"]})] == [
+            "c.mp4"
+        ]
+        assert [i.filename for i in mirror.query(sort="file_size:desc")] == [
+            "a.jpg",
+            "b.jpg",
+            "c.mp4",
+        ]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_incremental_sync_only_lists_recent_updates(
+        self, mirror: ItemMirror, items: List[Dict[str, Any]]
+    ):
+        add_items_response(items)
+        assert mirror.sync() == 3
+
+        updated = {
+            **items[0],
+            "status": "complete",
+            "updated_at": "2024-01-05T00:00:00Z",
+        }
+        new = raw_item("d.jpg", "2024-01-06T00:00:00Z")
+        responses.reset()
+        add_items_response(
+            # Items older than the newest mirrored update end the sync
+            [
+                new,
+                updated,
+                items[2],
+                {**items[1], "updated_at": "2024-01-01T00:00:00Z"},
+            ],
+            **{"sort[updated_at]": "desc"},
+        )
+
+        assert mirror.sync() == 3
+        assert [i.filename for i in mirror.query({"statuses": ["complete"]})] == [
+            "b.jpg",
+            "a.jpg",
+        ]
+        assert {i.filename for i in mirror.query()} == {
+            "a.jpg",
+            "b.jpg",
+            "c.mp4",
+            "d.jpg",
+        }
+
+    @responses.activate
+    def test_full_sync_when_dataset_changes(
+        self, mirror: ItemMirror, items: List[Dict[str, Any]]
+    ):
+        add_items_response(items)
+        mirror.sync()
+
+        mirror.dataset.dataset_id = 2
+        responses.reset()
+        add_items_response(items[:1])
+
+        assert mirror.sync() == 1
+        assert [i.filename for i in mirror.query()] == ["a.jpg"]
+
+
+@pytest.mark.usefixtures("file_read_write_test")
+class TestRemoteDatasetItemMirror:
+    @responses.activate
+    def test_fetch_remote_files_uses_mirror(
+        self,
+        remote_dataset: RemoteDatasetV2,
+        mirror: ItemMirror,
+        items: List[Dict[str, Any]],
+    ):
+        add_items_response(items)
+
+        first = list(remote_dataset.fetch_remote_files({"filenames": ["b.jpg"]}))
+        second = list(remote_dataset.fetch_remote_files({"item_names": ["b.jpg"]}))
+
+        assert [i.id for i in first] == [i.id for i in second] == ["id-b.jpg"]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_deleted_items_are_removed_from_mirror(
+        self,
+        remote_dataset: RemoteDatasetV2,
+        mirror: ItemMirror,
+        items: List[Dict[str, Any]],
+    ):
+        add_items_response(items)
+        item = next(remote_dataset.fetch_remote_files({"item_names": ["a.jpg"]}))
+        responses.add(responses.DELETE, ITEMS_URL, json={}, status=200)
+        add_items_response([], **{"sort[updated_at]": "desc"})
+
+        remote_dataset.delete_items([item])
+
+        assert not mirror.is_fresh()
+        assert [i.filename for i in remote_dataset.fetch_remote_files()] == [
+            "b.jpg",
+            "c.mp4",
+        ]
+
+    @responses.activate
+    def test_archived_items_are_updated_in_mirror(
+        self,
+        remote_dataset: RemoteDatasetV2,
+        mirror: ItemMirror,
+        items: List[Dict[str, Any]],
+    ):
+        add_items_response(items)
+        item = next(remote_dataset.fetch_remote_files({"item_names": ["a.jpg"]}))
+        responses.add(responses.POST, f"{ITEMS_URL}/archive", json={}, status=200)
+        responses.add(responses.POST, f"{ITEMS_URL}/restore", json={}, status=200)
+        add_items_response([], **{"sort[updated_at]": "desc"})
+
+        remote_dataset.archive([item])
+
+        assert not mirror.is_fresh()
+        (archived,) = remote_dataset.fetch_remote_files({"statuses": ["archived"]})
+        assert archived.id == "id-a.jpg"
+        assert archived.archived
+
+        remote_dataset.restore_archived([item])
+
+        assert list(remote_dataset.fetch_remote_files({"statuses": ["archived"]})) == []
+        (restored,) = remote_dataset.fetch_remote_files({"item_names": ["a.jpg"]})
+        assert not restored.archived
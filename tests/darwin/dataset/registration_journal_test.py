@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from darwin.dataset.registration_journal import RegistrationJournal
+
+
+def test_journal_is_reloaded_from_file(tmp_path: Path):
+    path = tmp_path / "journal.jsonl"
+    journal = RegistrationJournal(path)
+    journal.record_item("a", {"name": "a.mp4"})
+    journal.record_item("b", {"name": "b.mp4"})
+    journal.record_registered(
+        ["a"], {"registered": ["Item a.mp4 registered with item ID 1"]}
+    )
+
+    reloaded = RegistrationJournal(path)
+
+    assert reloaded.items == {"a": {"name": "a.mp4"}, "b": {"name": "b.mp4"}}
+    assert list(reloaded.registered) == ["a"]
+    assert reloaded.pending() == {"b": {"name": "b.mp4"}}
+    assert reloaded.results == {
+        "registered": ["Item a.mp4 registered with item ID 1"],
+        "blocked": [],
+    }
+
+
+def test_journal_ignores_truncated_entry(tmp_path: Path):
+    path = tmp_path / "journal.jsonl"
+    RegistrationJournal(path).record_item("a", {"name": "a.mp4"})
+    with open(path, "a") as f:
+        f.write('{"key": "b", "item": {"na')
+
+    journal = RegistrationJournal(path)
+    journal.record_item("c", {"name": "c.mp4"})
+
+    assert list(RegistrationJournal(path).items) == ["a", "c"]
+
+
+def test_journal_without_path_is_kept_in_memory():
+    journal = RegistrationJournal()
+    journal.record_item("a", {"name": "a.mp4"})
+
+    assert journal.pending() == {"a": {"name": "a.mp4"}}
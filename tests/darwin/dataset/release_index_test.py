@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import orjson as json
+import pytest
+
+from darwin.dataset import release_index
+from darwin.dataset.release_index import ReleaseIndex
+from darwin.dataset.utils import compute_max_density, extract_classes
+
+
+def _annotation_file(name: str, annotations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "version": "2.0",
+        "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+        "item": {
+            "name": name,
+            "path": "/",
+            "slots": [
+                {
+                    "type": "image",
+                    "slot_name": "0",
+                    "source_files": [
+                        {"file_name": name, "url": f"https://example.com/{name}"}
+                    ],
+                }
+            ],
+        },
+        "annotations": annotations,
+    }
+
+
+def _write(path: Path, payload: Dict[str, Any]) -> None:
+    path.write_bytes(json.dumps(payload))
+
+
+@pytest.fixture
+def annotations_path(tmp_path: Path) -> Path:
+    annotations_path = tmp_path / "annotations"
+    (annotations_path / "folder").mkdir(parents=True)
+    _write(
+        annotations_path / "0.json",
+        _annotation_file(
+            "0.jpg",
+            [
+                {"name": "cat", "polygon": {"paths": [[]]}},
+                {"name": "cat", "polygon": {"paths": [[]]}},
+                {"name": "box", "bounding_box": {"x": 0, "y": 0, "w": 1, "h": 1}},
+            ],
+        ),
+    )
+    _write(
+        annotations_path / "folder" / "1.json",
+        _annotation_file("1.jpg", [{"name": "dog", "tag": {}}]),
+    )
+    return annotations_path
+
+
+class TestReleaseIndex:
+    def test_parses_each_file_once(self, annotations_path: Path):
+        with patch.object(
+            release_index, "parse_path", wraps=release_index.parse_path
+        ) as parse_mock:
+            classes, indices = extract_classes(annotations_path, "polygon")
+            assert dict(classes) == {"cat": {0}}
+            classes, indices = extract_classes(annotations_path, "tag")
+            assert dict(indices) == {1: {"dog"}}
+            assert compute_max_density(annotations_path) == 2
+
+        assert parse_mock.call_count == 2
+        assert (annotations_path.parent / ".annotations.index.json").exists()
+        assert not (annotations_path / ".v7").exists()
+
+    def test_reparses_only_modified_files(self, annotations_path: Path):
+        ReleaseIndex.load(annotations_path)
+        modified = annotations_path / "folder" / "1.json"
+        _write(modified, _annotation_file("1.jpg", [{"name": "bird", "tag": {}}]))
+        stat = modified.stat()
+        os.utime(modified, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (annotations_path / "0.json").unlink()
+
+        with patch.object(
+            release_index, "parse_path", wraps=release_index.parse_path
+        ) as parse_mock:
+            index = ReleaseIndex.load(annotations_path)
+
+        assert parse_mock.call_count == 1
+        assert list(index.entries) == ["folder/1.json"]
+        assert index.extract_classes(["tag"])[0] == {"bird": {0}}
+        assert list(ReleaseIndex.load(annotations_path).entries) == ["folder/1.json"]
+
+    def test_parses_in_parallel(self, annotations_path: Path, monkeypatch):
+        monkeypatch.setattr(release_index, "PARALLEL_THRESHOLD", 1)
+
+        index = ReleaseIndex.load(annotations_path, max_workers=2)
+
+        assert index.get(annotations_path / "0.json").annotations == [  # type: ignore
+            ("cat", "polygon"),
+            ("cat", "polygon"),
+            ("box", "bounding_box"),
+        ]
+        assert index.get("folder/1.json").annotations == [("dog", "tag")]  # type: ignore
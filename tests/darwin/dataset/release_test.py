@@ -1,7 +1,7 @@
 import shutil
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 import requests
@@ -33,5 +33,7 @@ class TestRelease:
         with patch.object(requests, "get") as get:
             with patch.object(shutil, "copyfileobj") as copyfileobj:
                 release.download_zip(tmp_path / "test.zip")
-                get.assert_called_once_with("http://test.v7labs.com/", stream=True)
+                get.assert_called_once_with(
+                    "http://test.v7labs.com/", stream=True, hooks=ANY
+                )
                 copyfileobj.assert_called_once()
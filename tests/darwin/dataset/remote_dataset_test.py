@@ -4,17 +4,18 @@ import types
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
 import orjson as json
 import pytest
+import requests
 import responses
 from pydantic import ValidationError
 
 from darwin.client import Client
 from darwin.config import Config
-from darwin.dataset import RemoteDataset
+from darwin.dataset import RemoteDataset, remote_dataset_v2
 from darwin.dataset.download_manager import (
     _download_image_from_json_annotation,
     download_all_images_from_annotations,
@@ -669,6 +670,70 @@ class TestFetchRemoteFiles:
             == "example,with, comma.mp4"
         )
 
+    @responses.activate
+    def test_follows_page_cursors(
+        self, remote_dataset: RemoteDatasetV2, files_content: dict
+    ):
+        url = "http://localhost/api/v2/teams/v7-darwin-json-v2/items"
+        first_item, second_item = files_content["items"]
+        responses.add(
+            responses.GET,
+            url,
+            json={"items": [first_item], "page": {"next": "cursor-1"}},
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"page[size]": "500", "include_workflow_data": "true"},
+                    strict_match=False,
+                )
+            ],
+        )
+        responses.add(
+            responses.GET,
+            url,
+            json={"items": [second_item], "page": {"next": None}},
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"page[from]": "cursor-1"}, strict_match=False
+                )
+            ],
+        )
+
+        items = list(remote_dataset.fetch_remote_files())
+
+        assert [item.id for item in items] == [first_item["id"], second_item["id"]]
+
+    @responses.activate
+    def test_lists_status_partitions_in_parallel(
+        self, remote_dataset: RemoteDatasetV2, files_content: dict
+    ):
+        url = "http://localhost/api/v2/teams/v7-darwin-json-v2/items"
+        new_item, complete_item = files_content["items"]
+        for status, items in [
+            ("new", [new_item]),
+            ("complete", [complete_item, new_item]),
+        ]:
+            responses.add(
+                responses.GET,
+                url,
+                json={"items": items, "page": {"next": None}},
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"statuses[]": status}, strict_match=False
+                    )
+                ],
+            )
+
+        items = list(
+            remote_dataset.fetch_remote_files(
+                {"statuses": ["new", "complete"]}, max_workers=2
+            )
+        )
+
+        assert len(responses.calls) == 2
+        assert sorted(item.id for item in items) == sorted(
+            [new_item["id"], complete_item["id"]]
+        )
+
 
 @pytest.mark.usefixtures("file_read_write_test")
 class TestFetchRemoteClasses:
@@ -1721,6 +1786,157 @@ class TestRegister:
         assert len(result["registered"]) == 0
         assert len(result["blocked"]) == 1
 
+    @responses.activate
+    def test_registers_chunks_concurrently_from_a_generator(
+        self, remote_dataset: RemoteDatasetV2
+    ):
+        def register(request):
+            items = json.loads(request.body)["items"]
+            return (
+                200,
+                {},
+                json.dumps(
+                    {
+                        "items": [{"id": i["name"], "name": i["name"]} for i in items],
+                        "blocked_items": [],
+                    }
+                ),
+            )
+
+        responses.add_callback(
+            responses.POST,
+            "http://localhost/api/v2/teams/v7-darwin-json-v2/items/register_existing",
+            callback=register,
+        )
+
+        result = remote_dataset.register_single_slotted(
+            ObjectStore(
+                name="test",
+                prefix="test_prefix",
+                readonly=False,
+                provider="aws",
+                default=True,
+                bucket="test-bucket",
+            ),
+            (f"folder/{i}.jpg" for i in range(5)),
+            chunk_size=2,
+            max_workers=2,
+        )
+
+        assert len(responses.calls) == 3
+        assert result["registered"] == [
+            f"Item {i}.jpg registered with item ID {i}.jpg" for i in range(5)
+        ]
+        assert result["failed"] == []
+
+    @responses.activate
+    def test_retries_only_failed_chunks(
+        self, remote_dataset: RemoteDatasetV2, monkeypatch
+    ):
+        monkeypatch.setattr(remote_dataset_v2, "REGISTRATION_RETRY_WAIT", 0)
+        attempts: Dict[str, int] = {}
+
+        def register(request):
+            items = json.loads(request.body)["items"]
+            names = [i["name"] for i in items]
+            attempts[names[0]] = attempts.get(names[0], 0) + 1
+            if names[0] == "2.jpg" and attempts[names[0]] == 1:
+                raise requests.ConnectionError("Connection reset by peer")
+            if names[0] == "4.jpg":
+                return (400, {}, "")
+            return (
+                200,
+                {},
+                json.dumps(
+                    {
+                        "items": [{"id": n, "name": n} for n in names],
+                        "blocked_items": [],
+                    }
+                ),
+            )
+
+        responses.add_callback(
+            responses.POST,
+            "http://localhost/api/v2/teams/v7-darwin-json-v2/items/register_existing",
+            callback=register,
+        )
+
+        result = remote_dataset.register_single_slotted(
+            ObjectStore(
+                name="test",
+                prefix="test_prefix",
+                readonly=False,
+                provider="aws",
+                default=True,
+                bucket="test-bucket",
+            ),
+            [f"{i}.jpg" for i in range(5)],
+            chunk_size=2,
+        )
+
+        assert attempts == {"0.jpg": 1, "2.jpg": 2, "4.jpg": 1}
+        assert len(result["registered"]) == 4
+        assert len(result["failed"]) == 1
+        assert result["failed"][0].startswith("Item 4.jpg failed to register")
+
+    @pytest.mark.parametrize(
+        "error, attempt_count, failed_count",
+        [
+            (requests.ConnectTimeout("Connection timed out"), 2, 0),
+            (requests.ReadTimeout("Read timed out"), 1, 1),
+        ],
+    )
+    @responses.activate
+    def test_retries_chunks_only_when_not_sent(
+        self,
+        remote_dataset: RemoteDatasetV2,
+        monkeypatch,
+        error: Exception,
+        attempt_count: int,
+        failed_count: int,
+    ):
+        monkeypatch.setattr(remote_dataset_v2, "REGISTRATION_RETRY_WAIT", 0)
+        attempts: List[str] = []
+
+        def register(request):
+            names = [i["name"] for i in json.loads(request.body)["items"]]
+            attempts.append(names[0])
+            if attempts.count("0.jpg") == 1 and names[0] == "0.jpg":
+                raise error
+            return (
+                200,
+                {},
+                json.dumps(
+                    {
+                        "items": [{"id": n, "name": n} for n in names],
+                        "blocked_items": [],
+                    }
+                ),
+            )
+
+        responses.add_callback(
+            responses.POST,
+            "http://localhost/api/v2/teams/v7-darwin-json-v2/items/register_existing",
+            callback=register,
+        )
+
+        result = remote_dataset.register_single_slotted(
+            ObjectStore(
+                name="test",
+                prefix="test_prefix",
+                readonly=False,
+                provider="aws",
+                default=True,
+                bucket="test-bucket",
+            ),
+            ["0.jpg", "1.jpg"],
+            chunk_size=1,
+        )
+
+        assert attempts.count("0.jpg") == attempt_count
+        assert len(result["failed"]) == failed_count
+        assert len(result["registered"]) == 2 - failed_count
+
 
 @pytest.mark.usefixtures("file_read_write_test")
 class TestRegisterMultiSlotted:
@@ -2100,6 +2316,113 @@ class TestRegisterSingleSlottedReadonlyVideos:
         assert len(result["blocked"]) == 1
         assert "duplicate" in result["blocked"][0]
 
+    @patch("darwin.backend_v2.BackendV2.register_readonly_items")
+    def test_registers_items_in_batches_as_they_complete(
+        self,
+        mock_register,
+        remote_dataset: RemoteDatasetV2,
+        readonly_object_store,
+        tmp_path,
+    ):
+        """Test that videos are processed concurrently and registered in batches."""
+        video_files = []
+        for i in range(12):
+            video_file = tmp_path / f"video_{i}.mp4"
+            video_file.write_text("video content")
+            video_files.append(str(video_file))
+
+        def register(payload, **kwargs):
+            return {
+                "items": [
+                    {"id": item["name"], "name": item["name"]}
+                    for item in payload["items"]
+                ],
+                "blocked_items": [],
+            }
+
+        mock_register.side_effect = register
+
+        with patch.object(
+            remote_dataset,
+            "_process_video_file_for_readonly",
+            return_value={"fps": 30.0, "frame_count": 100},
+        ) as mock_process:
+            result = remote_dataset.register_single_slotted_readonly_videos(
+                object_store=readonly_object_store,
+                video_files=video_files,
+                max_workers=4,
+            )
+
+        assert mock_process.call_count == 12
+        assert [
+            len(c.kwargs["payload"]["items"]) for c in mock_register.call_args_list
+        ] == [10, 2]
+        assert len(result["registered"]) == 12
+
+    @patch("darwin.backend_v2.BackendV2.register_readonly_items")
+    def test_resumes_interrupted_registration(
+        self,
+        mock_register,
+        remote_dataset: RemoteDatasetV2,
+        readonly_object_store,
+        tmp_path,
+    ):
+        """Test that a resumed registration skips uploaded and registered videos."""
+        video_files = []
+        for i in range(12):
+            video_file = tmp_path / f"video_{i}.mp4"
+            video_file.write_text("video content")
+            video_files.append(str(video_file))
+        resume_file = tmp_path / "registration.jsonl"
+
+        def register(payload, **kwargs):
+            return {
+                "items": [
+                    {"id": item["name"], "name": item["name"]}
+                    for item in payload["items"]
+                ],
+                "blocked_items": [],
+            }
+
+        mock_register.side_effect = [
+            register({"items": [{"name": f"video_{i}.mp4"} for i in range(10)]}),
+            ConnectionError("interrupted"),
+        ]
+
+        with patch.object(
+            remote_dataset,
+            "_process_video_file_for_readonly",
+            return_value={"fps": 30.0, "frame_count": 100},
+        ):
+            with pytest.raises(ConnectionError):
+                remote_dataset.register_single_slotted_readonly_videos(
+                    object_store=readonly_object_store,
+                    video_files=video_files,
+                    max_workers=1,
+                    resume_file=resume_file,
+                )
+
+        mock_register.reset_mock()
+        mock_register.side_effect = register
+
+        with patch.object(
+            remote_dataset, "_process_video_file_for_readonly"
+        ) as mock_process:
+            result = remote_dataset.register_single_slotted_readonly_videos(
+                object_store=readonly_object_store,
+                video_files=video_files,
+                resume_file=resume_file,
+            )
+
+        mock_process.assert_not_called()
+        mock_register.assert_called_once()
+        registered_items = mock_register.call_args.kwargs["payload"]["items"]
+        assert [item["name"] for item in registered_items] == [
+            "video_10.mp4",
+            "video_11.mp4",
+        ]
+        assert len(result["registered"]) == 12
+
 
 @pytest.mark.usefixtures("file_read_write_test")
 class TestRegisterMultiSlottedReadonlyVideos:
@@ -4,24 +4,11 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from darwin.dataset.split_manager import split_dataset
+from darwin.dataset.split_manager import _stratify_samples, split_dataset
 from darwin.utils import SUPPORTED_IMAGE_EXTENSIONS
 from tests.fixtures import *
 
 
-def test_requires_scikit_learn():
-    sklearn_module = sys.modules.get("sklearn")
-    sys.modules["sklearn"] = None
-
-    try:
-        with pytest.raises(ImportError):
-            split_dataset("")
-    finally:
-        del sys.modules["sklearn"]
-        if sklearn_module:
-            sys.modules["sklearn"] = sklearn_module
-
-
 class TestClassificationDataset:
     @pytest.mark.parametrize(
         "val_percentage,test_percentage",
@@ -75,3 +62,66 @@ class TestClassificationDataset:
                 lines_len = len([line for line in f.readlines() if line.strip() != ""])
                 local_size = lines_len / tot_size, size
                 assert np.allclose(local_size, size, atol=1e-3)
+
+    def test_does_not_require_scikit_learn(
+        self,
+        team_slug_darwin_json_v2: str,
+        team_extracted_dataset_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setitem(sys.modules, "sklearn", None)
+        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "sl"
+
+        splits = split_dataset(root, release_name="latest")
+
+        assert (splits / "random_train.txt").exists()
+        assert (splits / "stratified_tag_train.txt").exists()
+
+
+class TestStratifySamples:
+    @pytest.fixture
+    def idx_to_classes(self):
+        rng = np.random.default_rng(0)
+        return {
+            idx: {f"class_{c}" for c in rng.choice(20, rng.integers(1, 4))}
+            for idx in range(1000)
+        }
+
+    def test_assigns_each_file_once(self, idx_to_classes):
+        train, val, test = _stratify_samples(idx_to_classes, 0, 700, 200, 100)
+
+        assert len(train) + len(val) + len(test) == len(idx_to_classes)
+        assert set(train) | set(val) | set(test) == set(idx_to_classes)
+        assert abs(len(train) - 700) <= 10
+        assert abs(len(val) - 200) <= 10
+
+    def test_is_deterministic_for_a_seed(self, idx_to_classes):
+        shuffled = dict(reversed(list(idx_to_classes.items())))
+
+        assert _stratify_samples(idx_to_classes, 1, 700, 200, 100) == (
+            _stratify_samples(shuffled, 1, 700, 200, 100)
+        )
+        assert _stratify_samples(idx_to_classes, 1, 700, 200, 100) != (
+            _stratify_samples(idx_to_classes, 2, 700, 200, 100)
+        )
+
+    def test_balances_classes(self, idx_to_classes):
+        splits = _stratify_samples(idx_to_classes, 0, 700, 200, 100)
+
+        for class_name in {c for v in idx_to_classes.values() for c in v}:
+            total = sum(class_name in v for v in idx_to_classes.values())
+            for split, ratio in zip(splits, (0.7, 0.2, 0.1)):
+                count = sum(class_name in idx_to_classes[idx] for idx in split)
+                assert abs(count - ratio * total) <= 0.05 * total + 1
+
+    def test_spreads_rare_classes(self):
+        idx_to_classes = {idx: {"common"} for idx in range(10)}
+        idx_to_classes.update({10: {"rare"}, 11: {"rare"}, 12: {"rare", "common"}})
+
+        train, val, test = _stratify_samples(idx_to_classes, 0, 5, 4, 4)
+
+        for split in (train, val, test):
+            assert any("rare" in idx_to_classes[idx] for idx in split)
+
+    def test_ignores_files_without_classes(self):
+        assert _stratify_samples({0: set(), 1: set()}, 0, 1, 1, 0) == ([], [], [])
@@ -870,6 +870,41 @@ class TestUploadArtifacts:
         assert "prefix/item/files/slot/metadata.json" in storage_keys
         assert "prefix/item/files/slot/segments/segment_0.ts.gz" in storage_keys
 
+    @patch("darwin.dataset.storage_uploader.create_storage_client")
+    def test_uploads_source_file_separately(self, mock_create, temp_artifacts_dir):
+        """Test that the source file can be uploaded apart from the artifacts."""
+        from darwin.dataset.storage_uploader import upload_artifacts, upload_source_file
+
+        mock_client = MagicMock()
+        mock_create.return_value = mock_client
+        object_store = ObjectStore(
+            name="test",
+            prefix="prefix",
+            readonly=True,
+            provider="aws",
+            default=False,
+            bucket="test-bucket",
+        )
+
+        upload_source_file(
+            object_store=object_store,
+            source_file=temp_artifacts_dir["source_file"],
+            storage_key_prefix="prefix/item/files/slot",
+        )
+        upload_artifacts(
+            object_store=object_store,
+            local_artifacts_dir=temp_artifacts_dir["artifacts_dir"],
+            source_file=None,
+            storage_key_prefix="prefix/item/files/slot",
+        )
+
+        storage_keys = [c[0][1] for c in mock_client.upload_file.call_args_list]
+        assert storage_keys[0] == "prefix/item/files/slot/video.mp4"
+        assert sorted(storage_keys[1:]) == [
+            "prefix/item/files/slot/metadata.json",
+            "prefix/item/files/slot/segments/segment_0.ts.gz",
+        ]
+
     @pytest.mark.skipif(
         not os.environ.get("RUN_CLOUD_STORAGE_TESTS"),
         reason="boto3 not installed; set RUN_CLOUD_STORAGE_TESTS=1 to enable",
@@ -1046,3 +1081,91 @@ class TestEdgeCases:
             assert (
                 call_args[1]["ExtraArgs"] == {}
             ), f"Should have empty ExtraArgs for {filename}"
+
+
+class TestResumableUploads:
+    """Tests for manifest based resumable uploads, against a local storage."""
+
+    @pytest.fixture
+    def object_store(self):
+        return ObjectStore(
+            name="test",
+            prefix="prefix",
+            readonly=True,
+            provider="aws",
+            default=False,
+            bucket="test-bucket",
+        )
+
+    @pytest.fixture
+    def artifacts_dir(self, tmp_path):
+        artifacts_dir = tmp_path / "artifacts"
+        (artifacts_dir / "segments").mkdir(parents=True)
+        (artifacts_dir / "metadata.json").write_text('{"test": "data"}')
+        for i in range(3):
+            (artifacts_dir / "segments" / f"{i:09d}.ts").write_text(f"segment {i}")
+        return artifacts_dir
+
+    def upload(self, object_store, artifacts_dir, client, **kwargs):
+        from darwin.dataset.storage_uploader import upload_artifacts
+
+        return upload_artifacts(
+            object_store=object_store,
+            local_artifacts_dir=str(artifacts_dir),
+            source_file=None,
+            storage_key_prefix="item/files/slot",
+            manifest_path=str(artifacts_dir / "upload_manifest.jsonl"),
+            client=client,
+            **kwargs,
+        )
+
+    def test_skips_files_already_uploaded(self, object_store, artifacts_dir, tmp_path):
+        from darwin.dataset.storage_uploader import LocalStorageClient
+
+        client = LocalStorageClient(str(tmp_path / "storage"))
+
+        uploaded = self.upload(object_store, artifacts_dir, client)
+        assert len(uploaded) == 4
+        assert not (tmp_path / "storage/item/files/slot/upload_manifest.jsonl").exists()
+        assert (
+            tmp_path / "storage/item/files/slot/segments/000000001.ts"
+        ).read_text() == "segment 1"
+
+        assert self.upload(object_store, artifacts_dir, client) == []
+
+        (artifacts_dir / "metadata.json").write_text('{"test": "changed"}')
+        assert self.upload(object_store, artifacts_dir, client) == [
+            "item/files/slot/metadata.json"
+        ]
+
+    def test_resumes_after_failures(self, object_store, artifacts_dir, tmp_path):
+        from darwin.dataset.storage_uploader import LocalStorageClient
+
+        class FailingClient(LocalStorageClient):
+            def upload_file(self, local_path, storage_key):
+                if storage_key.endswith("000000002.ts"):
+                    raise PermissionError("Access denied")
+                super().upload_file(local_path, storage_key)
+
+        with pytest.raises(PermissionError):
+            self.upload(
+                object_store, artifacts_dir, FailingClient(str(tmp_path / "storage"))
+            )
+
+        client = LocalStorageClient(str(tmp_path / "storage"))
+        assert self.upload(object_store, artifacts_dir, client) == [
+            "item/files/slot/segments/000000002.ts"
+        ]
+
+    def test_verifies_uploaded_objects(self, object_store, artifacts_dir, tmp_path):
+        from darwin.dataset.storage_uploader import LocalStorageClient
+
+        client = LocalStorageClient(str(tmp_path / "storage"))
+        self.upload(object_store, artifacts_dir, client)
+        (tmp_path / "storage/item/files/slot/segments/000000000.ts").unlink()
+
+        assert self.upload(object_store, artifacts_dir, client) == []
+        assert self.upload(
+            object_store, artifacts_dir, client, verify_uploaded=True
+        ) == ["item/files/slot/segments/000000000.ts"]
+        assert client.get_object_size("item/files/slot/missing.ts") is None
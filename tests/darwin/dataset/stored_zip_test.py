@@ -0,0 +1,75 @@
+import io
+import zipfile
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from darwin.dataset import stored_zip
+from darwin.dataset.stored_zip import StoredZip
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> List[Tuple[Path, str]]:
+    files = []
+    for i, name in enumerate(["0001.dcm", "0002.dcm", "coupe_é.dcm"]):
+        path = tmp_path / name
+        path.write_bytes(bytes(range(256)) * (i * 10 + 1))
+        files.append((path, name))
+    return files
+
+
+def _assert_archives(data: bytes, files: List[Tuple[Path, str]]) -> None:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [name for _, name in files]
+        for path, name in files:
+            assert archive.getinfo(name).compress_type == zipfile.ZIP_STORED
+            assert archive.read(name) == path.read_bytes()
+
+
+class TestStoredZip:
+    def test_archives_files_without_compression(self, files) -> None:
+        archive = StoredZip(files)
+
+        data = archive.open().read()
+
+        assert len(data) == archive.size
+        _assert_archives(data, files)
+
+    def test_size_is_known_before_reading(self, files) -> None:
+        archive = StoredZip(files)
+
+        with archive.open() as reader:
+            assert len(reader) == archive.size
+            assert reader.tell() == 0
+
+    def test_reads_again_after_seeking(self, files) -> None:
+        reader = StoredZip(files).open()
+        data = b"".join(iter(lambda: reader.read(100), b""))
+
+        reader.seek(0)
+        assert reader.read() == data
+        reader.seek(1000)
+        assert reader.read(10) == data[1000:1010]
+        assert reader.tell() == 1010
+
+    def test_uses_zip64_extensions_past_the_limits(
+        self, files, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(stored_zip, "ZIP64_LIMIT", 1000)
+        monkeypatch.setattr(stored_zip, "ZIP64_COUNT_LIMIT", 2)
+        archive = StoredZip(files)
+
+        data = archive.open().read()
+
+        assert len(data) == archive.size
+        assert b"PK\x06\x06" in data
+        _assert_archives(data, files)
+
+    def test_raises_if_a_file_changes(self, files) -> None:
+        archive = StoredZip(files)
+        files[0][0].write_bytes(b"truncated")
+
+        with pytest.raises(ValueError, match="changed"):
+            archive.open().read()
@@ -1,3 +1,5 @@
+import io
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,7 +14,9 @@ from darwin.dataset import RemoteDataset
 from darwin.dataset.identifier import DatasetIdentifier
 from darwin.dataset.remote_dataset_v2 import RemoteDatasetV2
 from darwin.dataset.upload_manager import (
+    ItemMergeMode,
     LocalFile,
+    MultiFileItem,
     UploadHandler,
     UploadHandlerV2,
     UploadStage,
@@ -416,6 +420,126 @@ def test_upload_files(dataset: RemoteDataset, request_upload_endpoint: str):
     assert upload_handler.error_count == 0
 
 
+@pytest.mark.usefixtures("file_read_write_test")
+@responses.activate
+def test_upload_files_sends_the_whole_file_again_on_503(
+    dataset: RemoteDataset, request_upload_endpoint: str
+):
+    request_upload_response = {
+        "blocked_items": [],
+        "items": [
+            {
+                "id": "3b241101-e2bb-4255-8caf-4136c566a964",
+                "name": "test.jpg",
+                "path": "/",
+                "slots": [
+                    {
+                        "type": "image",
+                        "file_name": "test.jpg",
+                        "slot_name": "0",
+                        "upload_id": "123e4567-e89b-12d3-a456-426614174000",
+                    }
+                ],
+            }
+        ],
+    }
+    upload_to_s3_endpoint = (
+        "https://darwin-data.s3.eu-west-1.amazonaws.com/test.jpg?X-Amz-Signature=abc"
+    )
+    confirm_upload_endpoint = "http://localhost/api/v2/teams/v7-darwin-json-v2/items/uploads/123e4567-e89b-12d3-a456-426614174000/confirm"
+    sign_upload_endpoint = "http://localhost/api/v2/teams/v7-darwin-json-v2/items/uploads/123e4567-e89b-12d3-a456-426614174000/sign"
+    bodies = []
+
+    def upload_to_s3(request):
+        bodies.append(request.body)
+        return (503 if len(bodies) == 1 else 201), {}, ""
+
+    responses.add(
+        responses.POST,
+        request_upload_endpoint,
+        json=request_upload_response,
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        sign_upload_endpoint,
+        json={"upload_url": upload_to_s3_endpoint},
+        status=200,
+    )
+    responses.add_callback(responses.PUT, upload_to_s3_endpoint, callback=upload_to_s3)
+    responses.add(responses.POST, confirm_upload_endpoint, status=200)
+
+    Path("test.jpg").write_bytes(b"image bytes")
+    local_file = LocalFile(local_path=Path("test.jpg"))
+    with patch.object(dataset, "fetch_remote_files", return_value=[]):
+        upload_handler = UploadHandler.build(dataset, [local_file])
+
+    upload_handler.upload()
+    with patch("darwin.dataset.upload_manager.time.sleep"):
+        for file_to_upload in upload_handler.progress:
+            file_to_upload()
+
+    assert bodies == [b"image bytes", b"image bytes"]
+    assert upload_handler.error_count == 0
+
+
+@pytest.mark.usefixtures("file_read_write_test")
+@responses.activate
+def test_upload_files_streams_dicom_series_as_a_zip(
+    dataset: RemoteDataset, request_upload_endpoint: str, tmp_path: Path
+):
+    series = tmp_path / "series"
+    series.mkdir()
+    for i in range(3):
+        (series / f"{i}.dcm").write_bytes(f"slice {i}".encode() * 100)
+    item = MultiFileItem(series, sorted(series.iterdir()), ItemMergeMode.SERIES, 0)
+    request_upload_response = {
+        "blocked_items": [],
+        "items": [
+            {
+                "id": "3b241101-e2bb-4255-8caf-4136c566a964",
+                "name": "series",
+                "path": "/",
+                "slots": [
+                    {
+                        "type": "dicom",
+                        "file_name": "series.dcm",
+                        "slot_name": "0",
+                        "upload_id": "123e4567-e89b-12d3-a456-426614174000",
+                    }
+                ],
+            }
+        ],
+    }
+    upload_to_s3_endpoint = "https://darwin-data.s3.eu-west-1.amazonaws.com/series.dcm"
+    confirm_upload_endpoint = "http://localhost/api/v2/teams/v7-darwin-json-v2/items/uploads/123e4567-e89b-12d3-a456-426614174000/confirm"
+    sign_upload_endpoint = "http://localhost/api/v2/teams/v7-darwin-json-v2/items/uploads/123e4567-e89b-12d3-a456-426614174000/sign"
+    bodies = []
+
+    def upload_to_s3(request):
+        bodies.append(request.body)
+        return 201, {}, ""
+
+    responses.add(responses.POST, request_upload_endpoint, json=request_upload_response)
+    responses.add(
+        responses.GET, sign_upload_endpoint, json={"upload_url": upload_to_s3_endpoint}
+    )
+    responses.add_callback(responses.PUT, upload_to_s3_endpoint, callback=upload_to_s3)
+    responses.add(responses.POST, confirm_upload_endpoint, status=200)
+    progress = []
+
+    upload_handler = UploadHandlerV2(dataset, item.files, [item])
+    upload_handler.upload(
+        file_upload_callback=lambda name, total, sent: progress.append((total, sent))
+    )
+
+    assert upload_handler.error_count == 0
+    with zipfile.ZipFile(io.BytesIO(bodies[0])) as archive:
+        assert archive.namelist() == ["0.dcm", "1.dcm", "2.dcm"]
+        assert archive.read("1.dcm") == b"slice 1" * 100
+    assert progress[-1] == (len(bodies[0]), len(bodies[0]))
+
+
 @pytest.mark.usefixtures("file_read_write_test")
 @responses.activate
 def test_upload_files_adds_handle_as_slices_option_to_upload_payload(
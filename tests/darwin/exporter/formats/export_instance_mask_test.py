@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from darwin import datatypes as dt
+from darwin.exporter.formats.instance_mask import export
+from darwin.utils import convert_polygons_to_mask
+
+
+def _square(x: float, y: float, size: float) -> List[dt.Point]:
+    return [
+        {"x": x, "y": y},
+        {"x": x + size, "y": y},
+        {"x": x + size, "y": y + size},
+        {"x": x, "y": y + size},
+    ]
+
+
+@pytest.fixture
+def annotation_files() -> List[dt.AnnotationFile]:
+    annotation_files = []
+    for index in range(3):
+        annotations: List[dt.AnnotationLike] = [
+            dt.make_polygon("cat", [_square(1, 1, 5), _square(2, 2, 2)]),
+            dt.make_tag("ignored"),
+            dt.make_polygon("dog", [_square(4 + index, 3, 20)]),
+        ]
+        annotation_files.append(
+            dt.AnnotationFile(
+                Path(f"{index}.json"),
+                f"{index}.jpg",
+                {a.annotation_class for a in annotations},
+                annotations,
+                image_width=16,
+                image_height=12,
+            )
+        )
+    return annotation_files
+
+
+def test_exports_in_the_current_process_by_default(
+    annotation_files: List[dt.AnnotationFile], tmp_path: Path
+) -> None:
+    with patch("darwin.utils.concurrency.ProcessPoolExecutor") as pool_mock:
+        export(annotation_files, tmp_path)
+
+    pool_mock.assert_not_called()
+    assert len(list((tmp_path / "masks").glob("*.png"))) == 6
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_exports_a_png_per_polygon(
+    annotation_files: List[dt.AnnotationFile], tmp_path: Path, max_workers: int
+) -> None:
+    export(annotation_files, tmp_path, max_workers=max_workers)
+
+    csv = (tmp_path / "instance_mask_annotations.csv").read_text().splitlines()
+    assert csv == ["image_id,mask_id,class_name"] + [
+        row
+        for index in range(3)
+        for row in [f"{index},{index}_00000,cat", f"{index},{index}_00001,dog"]
+    ]
+    for annotation_file in annotation_files:
+        image_id = Path(annotation_file.filename).stem
+        for i, annotation in enumerate(annotation_file.annotations[::2]):
+            mask = np.asarray(Image.open(tmp_path / "masks" / f"{image_id}_{i:05}.png"))
+            expected = convert_polygons_to_mask(
+                annotation.data["paths"], height=12, width=16, value=255
+            )
+            assert np.array_equal(mask, expected)
+
+
+def test_exports_a_packed_archive_per_image(
+    annotation_files: List[dt.AnnotationFile], tmp_path: Path
+) -> None:
+    export(annotation_files[:1], tmp_path, packed=True)
+
+    assert [p.name for p in (tmp_path / "masks").iterdir()] == ["0.npz"]
+    with np.load(tmp_path / "masks" / "0.npz") as masks:
+        assert sorted(masks.files) == ["0_00000", "0_00001"]
+        assert np.array_equal(
+            masks["0_00001"],
+            convert_polygons_to_mask(
+                [_square(4, 3, 20)], height=12, width=16, value=255
+            ),
+        )
@@ -1,5 +1,6 @@
 import tempfile
 from pathlib import Path
+from typing import List
 from unittest.mock import patch, MagicMock, ANY
 from zipfile import ZipFile
 
@@ -265,6 +266,140 @@ def test_shift_polygon_coords_legacy():
     assert result == expected
 
 
+def _volume(class_name: str, dims: List[int], from_raster_layer: bool = False):
+    return Volume(
+        pixel_array=None,
+        affine=np.eye(4),
+        original_affine=None,
+        dims=dims,
+        pixdims=[1.0, 1.0, 1.0],
+        class_name=class_name,
+        series_instance_uid="test_series_uid",
+        from_raster_layer=from_raster_layer,
+        primary_plane="AXIAL",
+    )
+
+
+def test_volume_keeps_only_annotated_slices():
+    output_volumes = {"test_series_uid": {"class1": _volume("class1", [4, 3, 5])}}
+    mask = np.zeros((4, 3), dtype=np.uint8)
+    mask[1, 2] = 1
+    other_mask = np.zeros((4, 3), dtype=np.uint8)
+    other_mask[0, 0] = 1
+
+    nifti.update_pixel_array(
+        output_volumes["test_series_uid"], "class1", mask, "AXIAL", 2
+    )
+    nifti.update_pixel_array(
+        output_volumes["test_series_uid"], "class1", other_mask, "AXIAL", 2
+    )
+
+    volume = output_volumes["test_series_uid"]["class1"]
+    assert volume.pixel_array is None
+    assert list(volume.slices) == [2]
+    pixel_array = volume.to_array(np.int16)
+    assert pixel_array.dtype == np.int16
+    assert pixel_array.shape == (4, 3, 5)
+    assert np.argwhere(pixel_array).tolist() == [[0, 0, 2], [1, 2, 2]]
+
+
+def test_raster_volumes_share_label_volume():
+    annotation = MagicMock(spec=dt.Annotation)
+    annotation.slot_names = ["slot1"]
+    frame_data = MagicMock()
+    frame_data.data = {
+        "dense_rle": [0, 1, 1, 1, 2, 1, 0, 1],
+        "mask_annotation_ids_mapping": {"mask_id_1": 1, "mask_id_2": 2},
+    }
+    annotation.frames = {0: frame_data}
+    slot = MagicMock()
+    slot.metadata = {"SeriesInstanceUID": "test_series_uid", "shape": [1, 2, 2, 1]}
+    slot.width = 2
+    slot.height = 2
+    output_volumes = {
+        "test_series_uid": {
+            class_name: _volume(class_name, [2, 2, 1], from_raster_layer=True)
+            for class_name in ["class1", nifti.multi_segments_name]
+        }
+    }
+
+    volumes = populate_output_volumes_from_raster_layer(
+        annotation=annotation,
+        mask_id_to_classname={
+            "mask_id_1": "class1",
+            "mask_id_2": "class1",
+            nifti.multi_segments_label: nifti.multi_segments_name,
+        },
+        slot_map={"slot1": slot},
+        output_volumes=output_volumes,
+        primary_plane="AXIAL",
+    )
+
+    assert volumes["class1"].label_volume is (
+        volumes[nifti.multi_segments_name].label_volume
+    )
+    assert volumes["class1"].to_array()[:, :, 0].tolist() == [[0, 1], [1, 0]]
+    assert volumes[nifti.multi_segments_name].to_array()[:, :, 0].tolist() == [
+        [0, 2],
+        [1, 0],
+    ]
+
+
+def test_export_in_parallel_matches_sequential_export(team_slug_darwin_json_v2: str):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with ZipFile("tests/data.zip") as zfile:
+            zfile.extractall(tmpdir)
+        annotations_dir = (
+            Path(tmpdir)
+            / team_slug_darwin_json_v2
+            / "nifti/releases/latest/annotations"
+        )
+        video_annotation_filepaths = [
+            annotations_dir / "hippocampus_001.nii.json",
+            annotations_dir / "polygon_and_mask.json",
+        ]
+        for output_dir, max_workers in [("sequential", 1), ("parallel", 2)]:
+            nifti.export(
+                darwin_to_dt_gen(video_annotation_filepaths, False),
+                output_dir=Path(tmpdir) / output_dir,
+                max_workers=max_workers,
+            )
+
+        sequential_files = sorted(
+            p.relative_to(Path(tmpdir) / "sequential")
+            for p in (Path(tmpdir) / "sequential").rglob("*.nii.gz")
+        )
+        assert len(sequential_files) == 4
+        for output_file in sequential_files:
+            assert np.array_equal(
+                nib.load(Path(tmpdir) / "sequential" / output_file).get_fdata(),
+                nib.load(Path(tmpdir) / "parallel" / output_file).get_fdata(),
+            )
+
+
+def test_exports_in_the_current_process_by_default(team_slug_darwin_json_v2: str):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with ZipFile("tests/data.zip") as zfile:
+            zfile.extractall(tmpdir)
+        annotations_dir = (
+            Path(tmpdir)
+            / team_slug_darwin_json_v2
+            / "nifti/releases/latest/annotations"
+        )
+        video_annotation_filepaths = [
+            annotations_dir / "hippocampus_001.nii.json",
+            annotations_dir / "polygon_and_mask.json",
+        ]
+        with patch("darwin.utils.concurrency.ProcessPoolExecutor") as pool_mock:
+            nifti.export(
+                darwin_to_dt_gen(video_annotation_filepaths, False),
+                output_dir=Path(tmpdir) / "output",
+            )
+
+        pool_mock.assert_not_called()
+        assert len(list((Path(tmpdir) / "output").rglob("*.nii.gz"))) == 4
+
+
 def test_global_mask_id_mapping():
     """
     Test that `populate_output_volumes_from_raster_layer` creates a global mapping
@@ -319,17 +454,10 @@ def test_global_mask_id_mapping():
         "mask_id_3": "class3",
     }
 
-    class_volume1 = MagicMock(spec=Volume)
-    class_volume1.pixel_array = np.zeros((10, 10, 2))
-    class_volume2 = MagicMock(spec=Volume)
-    class_volume2.pixel_array = np.zeros((10, 10, 2))
-    class_volume3 = MagicMock(spec=Volume)
-    class_volume3.pixel_array = np.zeros((10, 10, 2))
     output_volumes = {
         "test_series_uid": {
-            "class1": class_volume1,
-            "class2": class_volume2,
-            "class3": class_volume3,
+            class_name: _volume(class_name, [10, 10, 2], from_raster_layer=True)
+            for class_name in ["class1", "class2", "class3"]
         }
     }
 
@@ -352,20 +480,23 @@ def test_global_mask_id_mapping():
         )
 
         # Verify results
+        class_volume1, class_volume2, class_volume3 = (
+            volume.to_array() for volume in output_volumes["test_series_uid"].values()
+        )
         # Check that class1 (mask_id_1) is in frame 0 at position (0,0)
-        assert class_volume1.pixel_array[0, 0, 0] == 1
-        assert class_volume1.pixel_array[1, 1, 1] == 0  # Should not appear in frame 1
+        assert class_volume1[0, 0, 0] == 1
+        assert class_volume1[1, 1, 1] == 0  # Should not appear in frame 1
 
         # Check that class2 (mask_id_2) is in frame 1 at position (1,1) but not in frame 0
-        assert class_volume2.pixel_array[0, 0, 0] == 0  # Should not appear in frame 0
-        assert class_volume2.pixel_array[1, 1, 1] == 1
+        assert class_volume2[0, 0, 0] == 0  # Should not appear in frame 0
+        assert class_volume2[1, 1, 1] == 1
 
         # Check that class3 (mask_id_3) is in frame 1 at position (2,2) but not in frame 0
-        assert class_volume3.pixel_array[0, 0, 0] == 0  # Should not appear in frame 0
-        assert class_volume3.pixel_array[2, 2, 1] == 1
+        assert class_volume3[0, 0, 0] == 0  # Should not appear in frame 0
+        assert class_volume3[2, 2, 1] == 1
 
         # Check that no cross-contamination happened due to the shared local IDs
         # If the bug exists, class2 would appear in frame 0 because it shares local ID 1 with class1
-        assert np.sum(class_volume1.pixel_array[:, :, 1]) == 0  # class1 only in frame 0
-        assert np.sum(class_volume2.pixel_array[:, :, 0]) == 0  # class2 only in frame 1
-        assert np.sum(class_volume3.pixel_array[:, :, 0]) == 0  # class3 only in frame 1
+        assert np.sum(class_volume1[:, :, 1]) == 0  # class1 only in frame 0
+        assert np.sum(class_volume2[:, :, 0]) == 0  # class2 only in frame 1
+        assert np.sum(class_volume3[:, :, 0]) == 0  # class3 only in frame 1
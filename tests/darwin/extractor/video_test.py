@@ -1,8 +1,11 @@
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from darwin.extractor import video
 from darwin.extractor.video import extract_artifacts
 
 
@@ -426,3 +429,51 @@ class TestVideoArtifactExtraction:
 
         # Verify LQ sections key prefix is still present by default
         assert "storage_low_quality_sections_key_prefix" in payload
+
+    def test_extract_artifacts_decodes_source_once(self, data_dir, output_dir):
+        """Test that segments, frames and timestamps are extracted in a single decode"""
+        source_file = str(data_dir / "test_video_with_audio.mp4")
+
+        with patch.object(
+            video, "_get_frames_timestamps", wraps=video._get_frames_timestamps
+        ) as timestamps_mock, patch.object(
+            video.subprocess, "Popen", wraps=video.subprocess.Popen
+        ) as popen_mock:
+            result = extract_artifacts(
+                source_file=source_file,
+                output_dir=str(output_dir),
+                storage_key_prefix="test/prefix",
+                fps=15.0,
+            )
+
+        timestamps_mock.assert_not_called()
+        decodes = [
+            call.args[0]
+            for call in popen_mock.call_args_list
+            if call.args[0][0] == "ffmpeg" and "-filter_complex" in call.args[0]
+        ]
+        assert len(decodes) == 1
+        assert result["registration_payload"]["total_frames"] == 150
+        assert result["registration_payload"]["visible_frames"] == 75
+        assert len(list((output_dir / "sections" / "high").glob("*.png"))) == 75
+        assert len(list((output_dir / "sections" / "low").glob("*.jpg"))) == 75
+        assert (output_dir / "audio_peaks.gz").exists()
+
+
+def test_get_segment_frame_counts_probes_segments_concurrently(tmp_path):
+    for i in range(4):
+        (tmp_path / f"{i:09d}.ts").touch()
+
+    def count_frames(segment: str) -> int:
+        # Later segments finish first, counts must still be in segment order
+        index = int(Path(segment).stem)
+        time.sleep(0.05 * (4 - index))
+        return 10 + index
+
+    with patch.object(video, "_count_frames", side_effect=count_frames):
+        assert video._get_segment_frame_counts(str(tmp_path), max_workers=4) == [
+            10,
+            11,
+            12,
+            13,
+        ]
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["numpy", "PIL", "mpire", "jsonschema", "upolygon", "json_stream"]
+
+
+def _loaded_modules(statement: str) -> set:
+    # A fresh interpreter, as the modules are already loaded in the one running the tests
+    output = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import darwin",
+        "import darwin.cli_functions",
+        "from darwin.client import Client",
+    ],
+)
+def test_startup_does_not_load_heavy_modules(statement: str) -> None:
+    assert _loaded_modules(statement).isdisjoint(HEAVY_MODULES)
+
+
+def test_package_attributes_are_loaded_on_access() -> None:
+    assert "darwin.client" not in _loaded_modules("import darwin")
+    assert "darwin.client" in _loaded_modules("import darwin; darwin.Client")
+
+    import darwin
+    from darwin.client import Client
+
+    assert darwin.Client is Client
+    assert "Client" in dir(darwin)
+    with pytest.raises(AttributeError):
+        darwin.NotAnAttribute
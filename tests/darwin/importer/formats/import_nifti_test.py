@@ -18,7 +18,14 @@ from darwin.datatypes import (
     SubAnnotation,
     VideoAnnotation,
 )
-from darwin.importer.formats.nifti import get_new_axial_size, parse_path, process_nifti
+from darwin.importer.formats.nifti import (
+    convert_to_dense_rle,
+    get_mask_video_annotations,
+    get_new_axial_size,
+    parse_path,
+    process_class_map,
+    process_nifti,
+)
 from tests.fixtures import *
 from darwin.utils.utils import parse_darwin_json
 
@@ -267,6 +274,40 @@ def test_get_new_axial_size_with_isotropic():
     assert new_size == (20, 10)
 
 
+def test_convert_to_dense_rle():
+    raster = np.array([[0, 2], [0, 2], [1, 2]])
+
+    assert convert_to_dense_rle(raster) == [0, 2, 1, 1, 2, 3]
+    assert convert_to_dense_rle(np.zeros((2, 2))) == [0, 4]
+
+
+def test_get_mask_video_annotations():
+    volume = np.zeros((4, 3, 3))
+    volume[0, 0, 0] = 2
+    volume[1:3, 1, 1:] = 5
+    volume[3, 2, 2] = 9  # Not in the class map, imported as background
+    class_map = {"0": "background", "2": "first", "5": "second", "7": "second"}
+
+    raster, first, second = get_mask_video_annotations(
+        volume,
+        process_class_map(class_map),
+        ["0"],
+        pixdims_and_primary_planes={},
+        remote_file_path=Path("/volume.nii"),
+    )
+
+    assert list(raster.frames) == [0, 1, 2]
+    assert raster.frames[0].data["mask_annotation_ids_mapping"] == {
+        first.id: 2,
+        second.id: 3,
+    }
+    assert raster.frames[0].data["dense_rle"] == [2, 1, 0, 11]
+    assert raster.frames[1].data["dense_rle"] == [0, 5, 3, 2, 0, 5]
+    assert raster.frames[2].data["dense_rle"] == [0, 5, 3, 2, 0, 5]
+    assert list(first.frames) == [0]
+    assert list(second.frames) == [1, 2]
+
+
 def test_process_nifti_orientation_ras_to_lpi(team_slug_darwin_json_v2):
     """
     Test that an input NifTI annotation file in the RAS orientation is correctly
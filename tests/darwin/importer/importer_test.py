@@ -42,7 +42,7 @@ from darwin.importer.importer import (
     _parse_plane_map,
     _resolve_annotation_classes,
     _serialize_item_level_properties,
-    _split_payloads,
+    _serialize_payloads,
     _verify_slot_annotation_alignment,
     _warn_for_annotations_with_multiple_instance_ids,
     import_annotations,
@@ -532,7 +532,7 @@ def test_import_annotations() -> None:
         assert not errors
         assert mock_dataset.import_annotation.call_count == 1
 
-        payload = mock_dataset.import_annotation.call_args[1]["payload"]
+        payload = json.loads(mock_dataset.import_annotation.call_args[1]["payload"])
         expected_payload = {
             "annotations": [
                 {
@@ -1282,7 +1282,9 @@ def test__import_annotations() -> None:
         assert mock_dataset.import_annotation.call_args_list[0][0][0] == "test_id"
 
         # Assert assembly of payload
-        output = mock_dataset.import_annotation.call_args_list[0][1]["payload"]
+        output = json.loads(
+            mock_dataset.import_annotation.call_args_list[0][1]["payload"]
+        )
         assertion = {
             "annotations": [
                 {
@@ -3902,63 +3904,85 @@ def test_serialize_item_level_properties_multiple_properties():
     assert result == expected
 
 
-def test__split_payloads_returns_multiple_payloads():
-    payload = {
-        "annotations": [
-            {"id": "annotation_1", "data": "data1"},
-            {"id": "annotation_2", "data": "data2"},
-            {"id": "annotation_3", "data": "data3"},
-        ],
-        "overwrite": True,
-    }
+def test__serialize_payloads_returns_multiple_payloads():
+    annotations = [
+        {"id": "annotation_1", "data": "data1"},
+        {"id": "annotation_2", "data": "data2"},
+        {"id": "annotation_3", "data": "data3"},
+    ]
     max_payload_size = 100
 
-    result = _split_payloads(payload, max_payload_size)
+    result = list(_serialize_payloads(annotations, True, None, max_payload_size))
 
     assert len(result) == 3
-    assert result[0]["annotations"] == [payload["annotations"][0]]
-    assert result[1]["annotations"] == [payload["annotations"][1]]
-    assert result[2]["annotations"] == [payload["annotations"][2]]
+    assert all(len(payload) <= max_payload_size for payload in result)
+    assert json.loads(result[0])["annotations"] == [annotations[0]]
+    assert json.loads(result[1])["annotations"] == [annotations[1]]
+    assert json.loads(result[2])["annotations"] == [annotations[2]]
 
 
-def test__split_payloads_with_annotation_exceeding_size_limit():
-    payload = {
-        "annotations": [
-            {"id": "annotation_1", "data": "a" * 1000},  # Large annotation
-            {"id": "annotation_2", "data": "data2"},
-        ],
-        "overwrite": True,
-    }
+def test__serialize_payloads_fills_each_payload():
+    annotations = [{"id": f"annotation_{i}", "data": "data"} for i in range(100)]
+    max_payload_size = 200
+
+    result = list(_serialize_payloads(annotations, "true", None, max_payload_size))
+
+    chunks = [json.loads(payload)["annotations"] for payload in result]
+    assert [annotation for chunk in chunks for annotation in chunk] == annotations
+    for payload, next_chunk in zip(result, chunks[1:]):
+        # Each payload is as large as possible: the next annotation didn't fit in it
+        assert len(payload) <= max_payload_size
+        assert len(payload) + len(json.dumps(next_chunk[0])) > max_payload_size
+
+
+def test__serialize_payloads_with_annotation_exceeding_size_limit():
+    annotations = [
+        {"id": "annotation_1", "data": "a" * 1000},  # Large annotation
+        {"id": "annotation_2", "data": "data2"},
+    ]
     max_payload_size = 100
 
     with pytest.raises(
         ValueError,
         match="One or more annotations exceed the maximum allowed size",
     ):
-        _split_payloads(payload, max_payload_size)
+        list(_serialize_payloads(annotations, True, None, max_payload_size))
 
 
-def test__split_payloads_overwrites_on_first_payload_and_appends_on_the_rest():
+def test__serialize_payloads_overwrites_on_first_payload_and_appends_on_the_rest():
     """
     When importing annotations, we need to respect the overwrite behaviour defined by the user.
     However, if we need to split payloads, all payloads after the first will have to be appended
     """
-    payload = {
-        "annotations": [
-            {"id": "annotation_1", "data": "data1"},
-            {"id": "annotation_2", "data": "data2"},
-            {"id": "annotation_3", "data": "data3"},
-        ],
-        "overwrite": True,
-    }
-    max_payload_size = 100
+    annotations = [
+        {"id": "annotation_1", "data": "data1" * 10},
+        {"id": "annotation_2", "data": "data2" * 10},
+        {"id": "annotation_3", "data": "data3" * 10},
+    ]
+    properties = [{"id": "property_1"}]
+    max_payload_size = 160
 
-    result = _split_payloads(payload, max_payload_size)
+    result = [
+        json.loads(payload)
+        for payload in _serialize_payloads(
+            annotations, True, properties, max_payload_size
+        )
+    ]
 
     assert len(result) == 3
     assert result[0]["overwrite"]
+    assert result[0]["properties"] == properties
     assert not result[1]["overwrite"]
     assert not result[2]["overwrite"]
+    assert "properties" not in result[1]
+
+
+def test__serialize_payloads_without_annotations():
+    result = list(_serialize_payloads([], "true"))
+
+    assert [json.loads(payload) for payload in result] == [
+        {"annotations": [], "overwrite": "true"}
+    ]
 
 
 def test__get_remote_files_targeted_by_import_success() -> None:
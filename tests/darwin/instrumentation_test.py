@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Iterator
+
+import orjson as json
+import pytest
+import responses
+
+from darwin import instrumentation
+from darwin.client import Client
+from darwin.config import Config
+from darwin.future.core.client import ClientCore
+from darwin.future.tests.core.fixtures import *  # noqa: F401, F403
+
+
+@pytest.fixture
+def metrics_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "metrics.jsonl"
+    instrumentation.enable(path)
+    yield path
+    instrumentation.disable()
+
+
+def _read(path: Path) -> list:
+    instrumentation.write(path)
+    return [json.loads(line) for line in path.read_bytes().splitlines()]
+
+
+class TestSpans:
+    def test_records_nothing_when_disabled(self, tmp_path: Path) -> None:
+        with instrumentation.span("pull"):
+            pass
+
+        assert _read(tmp_path / "metrics.jsonl") == []
+
+    def test_records_nested_spans(self, metrics_path: Path) -> None:
+        with instrumentation.span("pull", release="latest"):
+            with instrumentation.span("pull.download_release"):
+                pass
+
+        spans = [line for line in _read(metrics_path) if line["type"] == "span"]
+
+        assert [(s["name"], s["parent"]) for s in spans] == [
+            ("pull.download_release", "pull"),
+            ("pull", None),
+        ]
+        assert spans[1]["attributes"] == {"release": "latest"}
+        assert all(s["status"] == "ok" and s["duration"] >= 0 for s in spans)
+
+    def test_records_failures(self, metrics_path: Path) -> None:
+        @instrumentation.span("export")
+        def export() -> None:
+            raise ValueError()
+
+        with pytest.raises(ValueError):
+            export()
+        export_histogram = [
+            line for line in _read(metrics_path) if line["type"] == "histogram"
+        ]
+
+        assert export_histogram[0]["name"] == "darwin_span_duration_seconds"
+        assert export_histogram[0]["labels"] == {"span": "export", "status": "error"}
+        assert export_histogram[0]["count"] == 1
+
+
+class TestHttpMetrics:
+    @responses.activate
+    def test_records_client_requests(self, metrics_path: Path) -> None:
+        config = Config()
+        config.put(["global", "api_endpoint"], "http://localhost/api")
+        config.put(["global", "payload_compression_level"], "0")
+        client = Client(config)
+        responses.add(
+            responses.GET,
+            "http://localhost/api/datasets/1/items",
+            json={},
+            headers={"Content-Length": "2"},
+        )
+        responses.add(responses.POST, "http://localhost/api/v2/teams/t/items", json={})
+
+        client._get("/datasets/1/items?page=2")
+        client._post("/v2/teams/t/items", {"a": 1})
+
+        counters = {
+            (line["name"], line["labels"]["endpoint"]): line["value"]
+            for line in _read(metrics_path)
+            if line["type"] == "counter"
+        }
+        assert counters[("darwin_http_requests_total", "datasets/:id/items")] == 1
+        assert counters[("darwin_http_requests_total", "v2/teams/:team/items")] == 1
+        assert counters[("darwin_http_response_bytes_total", "datasets/:id/items")] == 2
+        assert (
+            counters[("darwin_http_request_bytes_total", "v2/teams/:team/items")] == 8
+        )
+
+    @responses.activate
+    def test_records_client_core_requests(
+        self, metrics_path: Path, base_client: ClientCore
+    ) -> None:
+        responses.add(
+            responses.GET, "http://test_url.com/api/test", status=200, json={}
+        )
+
+        base_client.get("/test")
+
+        lines = _read(metrics_path)
+        [requests_total] = [
+            line for line in lines if line["name"] == "darwin_http_requests_total"
+        ]
+        assert requests_total["labels"] == {
+            "client": "client_core",
+            "endpoint": "test",
+            "method": "GET",
+            "status": "200",
+        }
+        assert any(
+            line["name"] == "darwin_http_request_duration_seconds" for line in lines
+        )
+
+    def test_writes_prometheus_textfiles(self, metrics_path: Path) -> None:
+        instrumentation.record_retry("storage", 503)
+        with instrumentation.span("push"):
+            pass
+
+        path = metrics_path.with_suffix(".prom")
+        instrumentation.write(path)
+        text = path.read_text()
+
+        assert "# TYPE darwin_http_retries_total counter\n" in text
+        assert 'darwin_http_retries_total{cause="503",client="storage"} 1\n' in text
+        assert "# TYPE darwin_span_duration_seconds histogram\n" in text
+        assert (
+            'darwin_span_duration_seconds_bucket{span="push",status="ok",le="+Inf"} 1\n'
+            in text
+        )
+        assert 'darwin_span_duration_seconds_count{span="push",status="ok"} 1\n' in text
+
+
+@pytest.mark.parametrize(
+    "url, label",
+    [
+        ("https://darwin.v7labs.com/api/datasets", "datasets"),
+        (
+            "https://darwin.v7labs.com/api/datasets/12/exports?x=1",
+            "datasets/:id/exports",
+        ),
+        (
+            "https://darwin.v7labs.com/api/v2/teams/v7/datasets/cars/exports/latest",
+            "v2/teams/:team/datasets/:dataset/exports/:export",
+        ),
+        (
+            "https://darwin.v7labs.com/api/v2/teams/v7/items/"
+            "0186bde3-7e4b-8d5a-4b4e-6d0a5f1e2b3c/annotations",
+            "v2/teams/:team/items/:id/annotations",
+        ),
+        ("https://bucket.s3.amazonaws.com/key/image.jpg?X-Amz=1", "storage"),
+    ],
+)
+def test_endpoint_label(url: str, label: str) -> None:
+    assert instrumentation.endpoint_label(url) == label
@@ -0,0 +1,77 @@
+import pickle
+import time
+from pathlib import Path
+
+from darwin.metadata_cache import MetadataCache
+
+
+class TestMetadataCache:
+    def test_returns_fresh_entries(self) -> None:
+        cache = MetadataCache(ttl=60)
+        cache.set("key|", [{"id": 1}], etag='"abc"')
+
+        entry = cache.get("key|")
+
+        assert entry is not None
+        assert entry.value == [{"id": 1}]
+        assert entry.etag == '"abc"'
+        assert cache.is_fresh(entry)
+
+    def test_keeps_stale_entries_for_revalidation(self) -> None:
+        cache = MetadataCache(ttl=60)
+        entry = cache.set("key|", {"a": 1}, etag='"abc"')
+        entry.fetched_at = time.time() - 120
+
+        stale_entry = cache.get("key|")
+        assert stale_entry is not None
+        assert not cache.is_fresh(stale_entry)
+
+        touched_entry = cache.touch("key|")
+        assert touched_entry is not None
+        assert cache.is_fresh(touched_entry)
+        assert touched_entry.etag == '"abc"'
+
+    def test_is_disabled_with_zero_ttl(self) -> None:
+        cache = MetadataCache(ttl=0)
+        cache.set("key|", {"a": 1})
+
+        assert cache.get("key|") is None
+
+    def test_invalidates_by_prefix(self, tmp_path: Path) -> None:
+        cache = MetadataCache(ttl=60, cache_dir=tmp_path)
+        cache.set("url|annotation_classes|team-a|", [1])
+        cache.set("url|annotation_classes|team-b|", [2])
+        cache.set("url|features|team-a|", [3])
+
+        cache.invalidate("url|annotation_classes|")
+
+        assert cache.get("url|annotation_classes|team-a|") is None
+        assert cache.get("url|annotation_classes|team-b|") is None
+        assert cache.get("url|features|team-a|") is not None
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_persists_entries_between_instances(self, tmp_path: Path) -> None:
+        MetadataCache(ttl=60, cache_dir=tmp_path).set("key|", {"a": 1}, etag='"abc"')
+
+        entry = MetadataCache(ttl=60, cache_dir=tmp_path).get("key|")
+
+        assert entry is not None
+        assert entry.value == {"a": 1}
+        assert entry.etag == '"abc"'
+
+    def test_ignores_corrupt_files(self, tmp_path: Path) -> None:
+        cache = MetadataCache(ttl=60, cache_dir=tmp_path)
+        cache.set("key|", {"a": 1})
+        for path in tmp_path.glob("*.json"):
+            path.write_text("not json")
+
+        assert MetadataCache(ttl=60, cache_dir=tmp_path).get("key|") is None
+
+    def test_can_be_pickled(self, tmp_path: Path) -> None:
+        cache = MetadataCache(ttl=60, cache_dir=tmp_path)
+        cache.set("key|", {"a": 1})
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert copy.get("key|").value == {"a": 1}
+        copy.set("other|", [1])
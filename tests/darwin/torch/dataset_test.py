@@ -67,6 +67,27 @@ class TestSemanticSegmentationDataset:
         generic_dataset_test(ds, n=20, size=(50, 50))
         assert isinstance(ds[0][1], dict)
 
+    def test_caches_masks(
+        self, team_slug_darwin_json_v2: str, team_extracted_dataset_path: Path
+    ) -> None:
+        root = team_extracted_dataset_path / team_slug_darwin_json_v2 / "coco"
+        ds = SemanticSegmentationDataset(
+            dataset_path=root, release_name="latest", cache_masks=True
+        )
+
+        _, target = ds[0]
+        target["mask"].fill_(0)
+        with patch.object(ds, "get_target") as get_target_mock:
+            _, cached_target = ds[0]
+
+        get_target_mock.assert_not_called()
+        assert torch.equal(
+            cached_target["mask"],
+            SemanticSegmentationDataset(dataset_path=root, release_name="latest")[0][1][
+                "mask"
+            ],
+        )
+
 
 class TestObjectDetectionDataset:
     def test_should_correctly_create_a_object_detection_dataset(
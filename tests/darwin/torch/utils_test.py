@@ -4,7 +4,12 @@ import numpy as np
 import pytest
 import torch
 
-from darwin.torch.utils import clamp_bbox_to_image_size, flatten_masks_by_category
+from darwin.torch.utils import (
+    clamp_bbox_to_image_size,
+    convert_segmentation_to_label_map,
+    convert_segmentation_to_mask,
+    flatten_masks_by_category,
+)
 from tests.fixtures import *
 
 
@@ -75,6 +80,53 @@ class TestFlattenMasks:
         assert torch.equal(unique, expected_unique)
         assert torch.equal(counts, expected_counts)
 
+    def test_should_handle_more_than_255_masks(self) -> None:
+        masks = torch.zeros(300, 2, 2, dtype=torch.uint8)
+        masks[:, 0, 0] = 1
+        masks[255, 1, 1] = 1
+        cats = [1] * 299 + [2]
+
+        flattened = flatten_masks_by_category(masks, cats)
+
+        assert flattened.tolist() == [[2, 0], [0, 1]]
+
+
+class TestConvertSegmentation:
+    @pytest.fixture
+    def segmentations(self) -> List[List[List[float]]]:
+        return [
+            [[0, 0, 5, 0, 5, 5, 0, 5]],
+            [[2, 2, 9, 2, 9, 9, 2, 9], [3, 3, 5, 3, 5, 5, 3, 5]],
+        ]
+
+    def test_should_draw_a_mask_per_polygon(self, segmentations) -> None:
+        masks = convert_segmentation_to_mask(segmentations, 10, 12)
+
+        assert masks.shape == (2, 10, 12)
+        assert masks.dtype == torch.uint8
+        assert masks[0, 0, 0] == 1 and masks[1, 0, 0] == 0
+        assert masks[1, 7, 7] == 1 and masks[1, 4, 4] == 0
+
+    def test_should_handle_no_polygons(self) -> None:
+        assert convert_segmentation_to_mask([], 10, 12).shape == (0, 10, 12)
+        assert convert_segmentation_to_label_map([], [], 10, 12).sum() == 0
+
+    def test_label_map_matches_flattened_masks(self, segmentations) -> None:
+        cats = [4, 7]
+
+        label_map = convert_segmentation_to_label_map(segmentations, cats, 10, 12)
+
+        assert label_map.dtype == torch.uint8
+        assert torch.equal(
+            label_map,
+            flatten_masks_by_category(
+                convert_segmentation_to_mask(segmentations, 10, 12), cats
+            ),
+        )
+        assert label_map[2, 2] == 7
+        # The hole of the second polygon shows the first one
+        assert label_map[4, 4] == 4
+
 
 class TestClampBboxToImageSize:
     def test_clamp_bbox_xyxy(self):
@@ -0,0 +1,69 @@
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+import pytest
+
+from darwin.utils.concurrency import interleave, prefetch_pages
+
+
+class TestPrefetchPages:
+    def test_yields_pages_in_order(self) -> None:
+        pages = {None: ([1, 2], 1), 1: ([3, 4], 2), 2: ([5], None)}
+
+        def fetch_page(cursor: Optional[int]) -> Tuple[List[int], Optional[int]]:
+            return pages[cursor]
+
+        assert list(prefetch_pages(fetch_page)) == [[1, 2], [3, 4], [5]]
+
+    def test_requests_next_page_before_current_one_is_consumed(self) -> None:
+        requested: List[int] = []
+        next_page_requested = threading.Event()
+
+        def fetch_page(cursor: Optional[int]) -> Tuple[List[int], Optional[int]]:
+            assert cursor is not None
+            requested.append(cursor)
+            if cursor == 1:
+                next_page_requested.set()
+            return [cursor], cursor + 1 if cursor < 1 else None
+
+        pages = prefetch_pages(fetch_page, 0)
+        assert next(pages) == [0]
+        assert next_page_requested.wait(timeout=5)
+        assert list(pages) == [[1]]
+        assert requested == [0, 1]
+
+    def test_raises_errors_of_fetch_page(self) -> None:
+        def fetch_page(cursor: Optional[int]) -> Tuple[List[int], Optional[int]]:
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            list(prefetch_pages(fetch_page))
+
+
+class TestInterleave:
+    def test_yields_all_values(self) -> None:
+        def partition(start: int) -> Iterator[int]:
+            yield from range(start, start + 100)
+
+        values = list(
+            interleave(
+                [lambda start=start: partition(start) for start in (0, 100, 200)],
+                max_workers=3,
+                buffer_size=10,
+            )
+        )
+
+        assert sorted(values) == list(range(300))
+
+    def test_raises_errors_of_partitions(self) -> None:
+        def failing_partition() -> Iterator[int]:
+            yield 1
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            list(interleave([failing_partition, lambda: iter([2])], max_workers=2))
+
+    def test_consumes_serially_with_a_single_worker(self) -> None:
+        assert list(
+            interleave([lambda: iter([1, 2]), lambda: iter([3])], max_workers=1)
+        ) == [1, 2, 3]
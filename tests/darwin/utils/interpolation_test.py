@@ -0,0 +1,116 @@
+from typing import Dict, List, Optional
+
+import pytest
+
+import darwin.datatypes as dt
+from darwin.utils.interpolation import interpolate_video_annotations
+
+
+def _track(
+    frames: Dict[int, dt.Annotation],
+    interpolated: bool = True,
+    segments: Optional[List[List[int]]] = None,
+    hidden_areas: Optional[List[List[int]]] = None,
+) -> dt.VideoAnnotation:
+    return dt.make_video_annotation(
+        frames,
+        dict.fromkeys(frames, True),
+        segments or [[min(frames), max(frames) + 1]],
+        interpolated,
+        ["0"],
+        hidden_areas=hidden_areas,
+    )
+
+
+def _polygon(*points: float) -> dt.Annotation:
+    path = [{"x": x, "y": y} for x, y in zip(points[0::2], points[1::2])]
+    return dt.make_polygon("cat", [path])
+
+
+class TestInterpolateVideoAnnotations:
+    def test_interpolates_every_track_between_keyframes(self) -> None:
+        boxes = _track(
+            {
+                0: dt.make_bounding_box("box", 0, 0, 10, 10),
+                4: dt.make_bounding_box("box", 8, 4, 10, 10),
+            }
+        )
+        points = _track(
+            {2: dt.make_keypoint("point", 0, 0), 4: dt.make_keypoint("point", 4, 2)},
+            segments=[[2, 6]],
+        )
+
+        dense_boxes, dense_points = interpolate_video_annotations([boxes, points])
+
+        assert list(dense_boxes.frames) == [0, 1, 2, 3, 4]
+        assert dense_boxes.frames[1].data == {"x": 2.0, "y": 1.0, "w": 10.0, "h": 10.0}
+        assert dense_boxes.keyframes == {0: True, 1: False, 2: False, 3: False, 4: True}
+        assert dense_points.frames[3].data == {"x": 2.0, "y": 1.0}
+        # After the last keyframe the annotation keeps its data until the end of the segment
+        assert dense_points.frames[5].data == {"x": 4, "y": 2}
+        assert boxes.frames.keys() == {0, 4}
+
+    def test_interpolates_keyframes_whose_keys_are_in_another_order(self) -> None:
+        first = dt.make_bounding_box("box", 0, 100, 10, 10)
+        second = dt.make_bounding_box("box", 0, 100, 10, 10)
+        second.data = {"h": 20, "w": 10, "y": 100, "x": 0}
+        track = _track({0: first, 2: second})
+
+        (dense,) = interpolate_video_annotations([track])
+
+        assert dense.frames[1].data == {"x": 0.0, "y": 100.0, "w": 10.0, "h": 15.0}
+
+    def test_interpolates_polygons_with_the_same_number_of_points(self) -> None:
+        track = _track({0: _polygon(0, 0, 2, 0, 2, 2), 2: _polygon(2, 0, 4, 0, 4, 4)})
+
+        (dense,) = interpolate_video_annotations([track])
+
+        assert dense.frames[1].data["paths"] == [
+            [{"x": 1.0, "y": 0.0}, {"x": 3.0, "y": 0.0}, {"x": 3.0, "y": 3.0}]
+        ]
+        assert dense.frames[1].annotation_class == track.frames[0].annotation_class
+
+    @pytest.mark.parametrize(
+        "track",
+        [
+            _track(
+                {0: _polygon(0, 0, 2, 0, 2, 2), 2: _polygon(2, 0, 4, 0, 4, 4, 0, 4)}
+            ),
+            _track(
+                {0: _polygon(0, 0, 2, 0, 2, 2), 2: _polygon(2, 0, 4, 0, 4, 4)},
+                interpolated=False,
+            ),
+        ],
+    )
+    def test_holds_previous_keyframe_when_not_interpolable(
+        self, track: dt.VideoAnnotation
+    ) -> None:
+        (dense,) = interpolate_video_annotations([track])
+
+        assert dense.frames[1].data == track.frames[0].data
+
+    def test_skips_hidden_areas_and_other_annotations(self) -> None:
+        tag = dt.make_tag("tag")
+        track = _track(
+            {0: dt.make_keypoint("point", 0, 0), 5: dt.make_keypoint("point", 5, 5)},
+            hidden_areas=[[2, 4]],
+        )
+
+        annotations = interpolate_video_annotations([tag, track])
+
+        assert annotations[0] is tag
+        assert list(annotations[1].frames) == [0, 1, 4, 5]
+        assert annotations[1].frames[4].data == {"x": 4.0, "y": 4.0}
+
+    def test_get_data_interpolates(self) -> None:
+        track = _track(
+            {0: dt.make_keypoint("point", 0, 0), 2: dt.make_keypoint("point", 2, 2)}
+        )
+
+        data = track.get_data(only_keyframes=False, interpolate=True)
+
+        assert data["frames"][1] == {
+            "keypoint": {"x": 1.0, "y": 1.0},
+            "keyframe": False,
+        }
+        assert list(track.get_data(only_keyframes=False)["frames"]) == [0, 2]
@@ -0,0 +1,110 @@
+import codecs
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson as json
+import pytest
+
+from darwin.utils import json_loading
+from darwin.utils.json_loading import detect_encoding, read_json, read_json_header
+
+DARWIN_JSON = {
+    "version": "2.0",
+    "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+    "item": {"name": 'a "quoted" [name] {x}.jpg', "path": "/", "slots": []},
+    "annotations": [{"id": "1", "name": "cat", "tag": {}}, {"id": "2"}],
+    "properties": [],
+}
+
+
+class TestDetectEncoding:
+    @pytest.mark.parametrize(
+        "encoding", ["utf-8", "utf-16-le", "utf-16-be", "utf-32-le", "utf-32-be"]
+    )
+    def test_detects_encoding_without_bom(self, encoding: str) -> None:
+        assert detect_encoding('{"a": 1}'.encode(encoding)[:4]) == (encoding, 0)
+
+    @pytest.mark.parametrize(
+        "bom, encoding",
+        [
+            (codecs.BOM_UTF8, "utf-8"),
+            (codecs.BOM_UTF16_LE, "utf-16-le"),
+            (codecs.BOM_UTF16_BE, "utf-16-be"),
+            (codecs.BOM_UTF32_LE, "utf-32-le"),
+            (codecs.BOM_UTF32_BE, "utf-32-be"),
+        ],
+    )
+    def test_detects_encoding_from_bom(self, bom: bytes, encoding: str) -> None:
+        head = bom + "{}".encode(encoding)
+        assert detect_encoding(head[:4]) == (encoding, len(bom))
+
+
+class TestReadJson:
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "utf-32"])
+    def test_reads_unicode_encodings(self, tmp_path: Path, encoding: str) -> None:
+        path = tmp_path / "file.json"
+        path.write_text('{"name": "café \U0001f408"}', encoding=encoding)
+
+        assert read_json(path) == {"name": "café \U0001f408"}
+
+    def test_falls_back_to_the_system_encoding(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        path.write_bytes('{"name": "café"}'.encode("cp1252"))
+
+        with patch.object(
+            json_loading.locale, "getpreferredencoding", return_value="cp1252"
+        ):
+            assert read_json(path) == {"name": "café"}
+        with patch.object(
+            json_loading.locale, "getpreferredencoding", return_value="utf-8"
+        ):
+            with pytest.raises(json.JSONDecodeError):
+                read_json(path)
+
+    def test_memory_maps_large_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        path.write_bytes(json.dumps(DARWIN_JSON))
+
+        with patch.object(json_loading, "MMAP_THRESHOLD", 0):
+            assert read_json(path) == DARWIN_JSON
+            assert read_json_header(path, ["item"]) == {"item": DARWIN_JSON["item"]}
+
+
+class TestReadJsonHeader:
+    @pytest.mark.parametrize("option", [0, json.OPT_INDENT_2])
+    def test_reads_the_given_keys(self, tmp_path: Path, option: int) -> None:
+        path = tmp_path / "file.json"
+        path.write_bytes(json.dumps(DARWIN_JSON, option=option))
+
+        header = read_json_header(path, ["item", "missing"], non_empty=["annotations"])
+
+        assert header == {
+            "item": DARWIN_JSON["item"],
+            "annotations": True,
+        }
+
+    def test_stops_after_the_given_keys(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        # Everything after the start of the annotations is invalid, but isn't read
+        path.write_bytes(b'{"item": {"name": "a"}, "annotations": [ {"id": 1, {{{')
+
+        assert read_json_header(path, ["item"], non_empty=["annotations"]) == {
+            "item": {"name": "a"},
+            "annotations": True,
+        }
+
+    def test_checks_empty_arrays(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        path.write_text('{"annotations": [ ], "item": null}', encoding="utf-16")
+
+        assert read_json_header(path, ["item"], non_empty=["annotations"]) == {
+            "item": None,
+            "annotations": False,
+        }
+
+    def test_raises_if_not_an_object(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.json"
+        path.write_bytes(b"[1, 2]")
+
+        with pytest.raises(ValueError):
+            read_json_header(path, ["item"])
@@ -1,6 +1,9 @@
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from jsonschema import validators
 from requests import Response
 
 import darwin.datatypes as dt
@@ -13,7 +16,9 @@ from darwin.utils import (
     is_project_dir,
     is_unix_like_os,
     parse_darwin_json,
+    split_video_annotation,
     urljoin,
+    utils,
     validate_data_against_schema,
 )
 from darwin.utils.utils import (
@@ -44,6 +49,75 @@ class TestValidation:
         assert len(validate_data_against_schema(data)) == 0
 
 
+SCHEMA_URL = "https://example.com/darwin_json/2.0/schema.json"
+
+
+class TestSchemaLoading:
+    @pytest.fixture(autouse=True)
+    def cache(self, tmp_path: Path, monkeypatch) -> Path:
+        cache = tmp_path / "cache"
+        monkeypatch.setattr(utils, "SCHEMAS_CACHE_DIR", cache)
+        monkeypatch.setattr(utils, "_darwin_schema_cache", {})
+        monkeypatch.setattr(utils, "_darwin_validator_cache", {})
+        return cache
+
+    @staticmethod
+    def _schema() -> dict:
+        return {"type": "object", "required": ["item"]}
+
+    def _write_schema(self, path: Path) -> None:
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(self._schema()))
+
+    def test_uses_cached_schema_without_network(self, cache: Path):
+        self._write_schema(
+            cache / "example.com" / "darwin_json" / "2.0" / "schema.json"
+        )
+
+        with patch.object(utils.requests, "get") as get_mock, patch.object(
+            validators,
+            "Draft202012Validator",
+            wraps=validators.Draft202012Validator,
+        ) as validator_mock:
+            assert validate_data_against_schema({"schema_ref": SCHEMA_URL}) != []
+            assert (
+                validate_data_against_schema({"schema_ref": SCHEMA_URL, "item": {}})
+                == []
+            )
+
+        get_mock.assert_not_called()
+        validator_mock.assert_called_once()
+
+    def test_cached_schemas_only_match_their_host(self, cache: Path):
+        self._write_schema(
+            cache / "example.org" / "darwin_json" / "2.0" / "schema.json"
+        )
+
+        with patch.object(
+            utils.requests, "get", side_effect=utils.requests.ConnectionError()
+        ):
+            with pytest.raises(de.MissingSchema):
+                validate_data_against_schema({"schema_ref": SCHEMA_URL})
+
+    def test_caches_downloaded_schema(self, cache: Path, monkeypatch):
+        response = MagicMock()
+        response.json.return_value = self._schema()
+
+        with patch.object(utils.requests, "get", return_value=response) as get_mock:
+            assert validate_data_against_schema({"schema_ref": SCHEMA_URL}) != []
+        get_mock.assert_called_once_with(SCHEMA_URL)
+        assert (cache / "example.com" / "darwin_json" / "2.0" / "schema.json").exists()
+
+        monkeypatch.setattr(utils, "_darwin_schema_cache", {})
+        monkeypatch.setattr(utils, "_darwin_validator_cache", {})
+        with patch.object(utils.requests, "get") as get_mock:
+            assert (
+                validate_data_against_schema({"schema_ref": SCHEMA_URL, "item": {}})
+                == []
+            )
+        get_mock.assert_not_called()
+
+
 class TestExtensions:
     def test_returns_true_for_allowed_image_extensions(self):
         assert is_file_extension_allowed(".png")
@@ -1151,6 +1225,54 @@ class TestParseDarwinJson:
         assert "hello" == get_response_content(response)
 
 
+class TestSplitVideoAnnotation:
+    @staticmethod
+    def _video(frame_count: int) -> dt.AnnotationFile:
+        def track(name: str, frames):
+            return dt.make_video_annotation(
+                {i: dt.make_tag(name) for i in frames},
+                dict.fromkeys(frames, True),
+                [[min(frames), max(frames) + 1]],
+                False,
+                ["0"],
+            )
+
+        return dt.AnnotationFile(
+            path=Path("video.json"),
+            filename="video.mp4",
+            annotation_classes=set(),
+            annotations=[track("a", [0, 2]), track("b", [2, 3]), track("c", [7])],
+            is_video=True,
+            frame_count=frame_count,
+        )
+
+    def test_yields_the_annotations_of_each_frame(self):
+        frames = list(split_video_annotation(self._video(4)))
+
+        assert [f.filename for f in frames] == [f"video/{i:07d}.png" for i in range(4)]
+        assert [[a.annotation_class.name for a in f.annotations] for f in frames] == [
+            ["a"],
+            [],
+            ["a", "b"],
+            ["b"],
+        ]
+        assert {c.name for c in frames[2].annotation_classes} == {"a", "b"}
+        assert all(not f.is_video for f in frames)
+
+    def test_is_lazy_and_quiet(self, capsys):
+        frames = split_video_annotation(self._video(100_000))
+
+        assert next(frames).filename == "video/0000000.png"
+        assert capsys.readouterr().out == ""
+
+    def test_raises_eagerly_for_non_video_annotation(self):
+        annotation = self._video(1)
+        annotation.is_video = False
+
+        with pytest.raises(AttributeError):
+            split_video_annotation(annotation)
+
+
 class TestDescribeResponseForLog:
     def test_returns_parsed_json_for_json_response(self):
         response: Response = Response()